@@ -0,0 +1,4 @@
+"""
+Benchmarks Package
+Scripts that measure framework overhead (run them with python -m benchmarks.<name>)
+"""
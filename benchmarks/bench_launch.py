@@ -0,0 +1,102 @@
+"""
+Benchmark - Chrome Launch Time
+Compares launching Chrome:
+    - on an empty profile vs. a copy of the profile template
+    - with a chromedriver per session vs. one shared chromedriver
+
+Usage:
+    python -m benchmarks.bench_launch --runs 5
+
+Each run launches Chrome with get_chrome_options(), opens about:blank
+and quits. "launch" is the time until webdriver.Chrome() returns,
+"quit" includes deleting the profile directory.
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+from utils.browser_config import get_chrome_options
+from utils.driver_factory import create_driver, quit_driver
+from utils import driver_service
+from utils.profile_manager import build_template, cleanup_profiles
+
+
+def measure_launches(runs):
+    """
+    Launch and quit Chrome `runs` times
+
+    Returns:
+        dict: Lists of launch and quit times in seconds
+    """
+    launch_times, quit_times = [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        driver = create_driver(get_chrome_options())
+        driver.get("about:blank")
+        launch_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        quit_driver(driver)
+        quit_times.append(time.perf_counter() - start)
+    return {'launch': launch_times, 'quit': quit_times}
+
+
+def run_scenario(name, runs, use_template, shared_service):
+    """Run one scenario with the feature switches set accordingly"""
+    switches = {
+        'SELENIUM_PROFILE_TEMPLATE': '1' if use_template else '0',
+        'SELENIUM_SHARED_SERVICE': '1' if shared_service else '0',
+    }
+    previous = {key: os.environ.get(key) for key in switches}
+    os.environ.update(switches)
+    try:
+        if use_template:
+            start = time.perf_counter()
+            build_template()
+            print(f"🧰 Template built in {time.perf_counter() - start:.2f}s (once per session)")
+        return name, measure_launches(runs)
+    finally:
+        driver_service.shutdown_shared_service()
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def print_results(results):
+    """Print median / mean / max per scenario"""
+    print(f"\n{'scenario':<20}{'metric':<8}{'median':>10}{'mean':>10}{'max':>10}")
+    print("-" * 58)
+    for name, timings in results:
+        for metric, values in timings.items():
+            print(f"{name:<20}{metric:<8}"
+                  f"{statistics.median(values):>9.3f}s"
+                  f"{statistics.mean(values):>9.3f}s"
+                  f"{max(values):>9.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="launches per scenario")
+    args = parser.parse_args()
+
+    print("🚀 Benchmark: Chrome launch time")
+    try:
+        results = [
+            run_scenario("empty profile", args.runs, use_template=False, shared_service=False),
+            run_scenario("profile template", args.runs, use_template=True, shared_service=False),
+            run_scenario("template + shared", args.runs, use_template=True, shared_service=True),
+        ]
+    finally:
+        cleanup_profiles()
+    print_results(results)
+    print()
+    for line in driver_service.stats.summary_lines():
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
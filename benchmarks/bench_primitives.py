@@ -0,0 +1,276 @@
+"""
+Benchmark - BasePage Primitives
+Ops/sec and latency percentiles of BasePage actions and of driver session creation
+
+Usage:
+    python -m benchmarks.bench_primitives run --iterations 50
+    python -m benchmarks.bench_primitives run --save-baseline
+    python -m benchmarks.bench_primitives compare reports/bench_primitives.json
+    python -m benchmarks.bench_primitives compare NEW.json --baseline OLD.json --threshold 15
+
+run: measures against the bundled local site (utils/local_site) in
+headless Chrome, so numbers depend on this machine and Chrome only.
+Each primitive is warmed up, then timed one call at a time. "session"
+is what the driver fixture does per test in the default fresh mode:
+create_driver() + quit_driver(). Results and machine metadata are
+written as JSON (--output); --save-baseline also stores them as the
+baseline.
+
+compare: flags a primitive as a regression when its median latency
+grew by more than --threshold percent AND by more than --min-ms, and
+exits with status 1 so CI can fail on it.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+import selenium
+from selenium.webdriver.common.by import By
+
+from pages.login_page import LoginPage
+from utils.browser_config import get_chrome_options
+from utils.command_trace import percentile
+from utils.driver_factory import create_driver, quit_driver
+from utils.local_site import LocalSite
+from utils.profile_manager import cleanup_profiles
+
+
+DEFAULT_OUTPUT = os.path.join('reports', 'bench_primitives.json')
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines', 'bench_primitives.json')
+
+CHECKBOX = (By.CSS_SELECTOR, "#checkboxes input")
+
+# name -> (page to open first, call); every call gets a LoginPage
+PRIMITIVES = {
+    "find_element": ("/login", lambda page: page.find_element(LoginPage.USERNAME_INPUT)),
+    "find_elements": ("/login", lambda page: page.find_elements((By.TAG_NAME, "input"))),
+    "type": ("/login", lambda page: page.type(LoginPage.USERNAME_INPUT, "tomsmith")),
+    "get_text": ("/login", lambda page: page.get_text(LoginPage.PAGE_HEADING)),
+    "is_displayed": ("/login", lambda page: page.is_displayed(LoginPage.LOGIN_BUTTON)),
+    "wait_for_element_visible": ("/login", lambda page: page.wait_for_element_visible(LoginPage.LOGIN_BUTTON)),
+    "wait_for_element_clickable": ("/login", lambda page: page.wait_for_element_clickable(LoginPage.LOGIN_BUTTON)),
+    "wait_for_text_present": ("/login", lambda page: page.wait_for_text_present(LoginPage.PAGE_HEADING, "Login")),
+    "wait_for_url_contains": ("/login", lambda page: page.wait_for_url_contains("/login")),
+    "take_screenshot": ("/login", lambda page: page.take_screenshot("bench_primitives.png")),
+    "click": ("/checkboxes", lambda page: page.click(CHECKBOX)),
+}
+
+
+def summarize(latencies):
+    """
+    Latency distribution of one primitive
+
+    Args:
+        latencies: Seconds per call
+
+    Returns:
+        dict: iterations, ops_per_sec and mean/stdev/min/p50/p95/p99/max in ms
+    """
+    values = sorted(seconds * 1000 for seconds in latencies)
+    total = sum(values)
+    return {
+        'iterations': len(values),
+        'ops_per_sec': round(len(values) / (total / 1000), 2) if total else 0.0,
+        'mean_ms': round(statistics.mean(values), 3),
+        'stdev_ms': round(statistics.stdev(values), 3) if len(values) > 1 else 0.0,
+        'min_ms': round(values[0], 3),
+        'p50_ms': round(percentile(values, 0.50), 3),
+        'p95_ms': round(percentile(values, 0.95), 3),
+        'p99_ms': round(percentile(values, 0.99), 3),
+        'max_ms': round(values[-1], 3),
+    }
+
+
+def time_calls(call, iterations, warmup):
+    """Call `call` warmup + iterations times; return the timed durations in seconds"""
+    for _ in range(warmup):
+        call()
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def machine_metadata(driver, profile):
+    """Where the numbers came from - compare warns when this differs"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    capabilities = driver.capabilities
+    return {
+        'hostname': platform.node(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'python': platform.python_version(),
+        'selenium': selenium.__version__,
+        'browser_version': capabilities.get('browserVersion'),
+        'chromedriver_version': capabilities.get('chrome', {}).get('chromedriverVersion', '').split(' ')[0],
+        'browser_profile': profile,
+        'commit': commit,
+    }
+
+
+def run_benchmarks(iterations, warmup, sessions, profile, only=None):
+    """
+    Measure the primitives and session creation
+
+    Returns:
+        dict: JSON-ready results with metadata
+    """
+    results = {}
+    with LocalSite() as site:
+        os.environ['SELENIUM_BASE_URL'] = site.base_url
+        driver = create_driver(get_chrome_options(profile))
+        try:
+            metadata = machine_metadata(driver, profile)
+            page = LoginPage(driver)
+            for name, (path, call) in PRIMITIVES.items():
+                if only and name not in only:
+                    continue
+                page.open(site.url(path))
+                results[name] = summarize(time_calls(lambda: call(page), iterations, warmup))
+                print(f"  {name:<28}{results[name]['p50_ms']:>9.2f}ms p50")
+        finally:
+            quit_driver(driver)
+
+        if sessions and (not only or "session" in only):
+            def session():
+                quit_driver(create_driver(get_chrome_options(profile)))
+            results["session"] = summarize(time_calls(session, sessions, warmup=1))
+            print(f"  {'session':<28}{results['session']['p50_ms']:>9.2f}ms p50")
+    cleanup_profiles()
+    return {
+        'benchmark': 'bench_primitives',
+        'created': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'metadata': metadata,
+        'settings': {'iterations': iterations, 'warmup': warmup, 'sessions': sessions},
+        'results': results,
+    }
+
+
+def compare(baseline, current, threshold=10.0, min_ms=0.5):
+    """
+    Compare median latencies of two result files
+
+    Args:
+        baseline: Parsed baseline JSON
+        current: Parsed JSON of the run to check
+        threshold: Percent slowdown that counts as a regression
+        min_ms: Ignore slowdowns smaller than this (timer noise)
+
+    Returns:
+        list: (name, baseline p50, current p50, change %, status) rows
+    """
+    rows = []
+    names = list(current['results']) + [name for name in baseline['results'] if name not in current['results']]
+    for name in names:
+        old = baseline['results'].get(name)
+        new = current['results'].get(name)
+        if old is None or new is None:
+            rows.append((name, old and old['p50_ms'], new and new['p50_ms'], None,
+                         "new" if old is None else "missing"))
+            continue
+        before, after = old['p50_ms'], new['p50_ms']
+        change = (after - before) / before * 100 if before else 0.0
+        if change > threshold and after - before > min_ms:
+            status = "REGRESSION"
+        elif change < -threshold and before - after > min_ms:
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append((name, before, after, change, status))
+    return rows
+
+
+def metadata_differences(baseline, current):
+    """Metadata keys (other than the commit) that differ between two runs"""
+    keys = set(baseline.get('metadata', {})) | set(current.get('metadata', {}))
+    keys.discard('commit')
+    return sorted(key for key in keys
+                  if baseline.get('metadata', {}).get(key) != current.get('metadata', {}).get(key))
+
+
+def print_comparison(rows):
+    print(f"\n{'primitive':<28}{'baseline':>11}{'current':>11}{'change':>9}  status")
+    print("-" * 68)
+    for name, before, after, change, status in rows:
+        before_text = f"{before:>9.2f}ms" if before is not None else f"{'-':>11}"
+        after_text = f"{after:>9.2f}ms" if after is not None else f"{'-':>11}"
+        change_text = f"{change:>+8.1f}%" if change is not None else f"{'':>9}"
+        print(f"{name:<28}{before_text}{after_text}{change_text}  {status}")
+
+
+def print_results(report):
+    print(f"\n{'primitive':<28}{'ops/s':>9}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+    print("-" * 77)
+    for name, row in report['results'].items():
+        print(f"{name:<28}{row['ops_per_sec']:>9.1f}"
+              f"{row['p50_ms']:>8.2f}ms{row['p95_ms']:>8.2f}ms{row['p99_ms']:>8.2f}ms{row['max_ms']:>8.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="measure and write a result file")
+    run.add_argument("--iterations", type=int, default=50, help="timed calls per primitive")
+    run.add_argument("--warmup", type=int, default=5, help="untimed calls per primitive first")
+    run.add_argument("--sessions", type=int, default=5, help="driver sessions to create (0 = skip)")
+    run.add_argument("--profile", default="headless-lean", help="browser profile to use")
+    run.add_argument("--only", nargs="+", choices=list(PRIMITIVES) + ["session"], help="measure only these")
+    run.add_argument("--output", default=DEFAULT_OUTPUT, help="result file")
+    run.add_argument("--save-baseline", action="store_true", help=f"also store as {DEFAULT_BASELINE}")
+
+    check = commands.add_parser("compare", help="flag regressions against a baseline")
+    check.add_argument("current", nargs="?", default=DEFAULT_OUTPUT, help="result file to check")
+    check.add_argument("--baseline", default=DEFAULT_BASELINE)
+    check.add_argument("--threshold", type=float, default=10.0, help="percent slowdown of the median")
+    check.add_argument("--min-ms", type=float, default=0.5, help="ignore smaller absolute slowdowns")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        print("🚀 Benchmark: BasePage primitives (local site, headless Chrome)")
+        report = run_benchmarks(args.iterations, args.warmup, args.sessions, args.profile, args.only)
+        print_results(report)
+        os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Results: {args.output}")
+        if args.save_baseline:
+            os.makedirs(os.path.dirname(DEFAULT_BASELINE), exist_ok=True)
+            shutil.copyfile(args.output, DEFAULT_BASELINE)
+            print(f"📌 Baseline: {DEFAULT_BASELINE}")
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    differences = metadata_differences(baseline, current)
+    if differences:
+        print(f"⚠️  Runs come from different setups ({', '.join(differences)}) - compare with care")
+    rows = compare(baseline, current, args.threshold, args.min_ms)
+    print_comparison(rows)
+    regressions = [row[0] for row in rows if row[4] == "REGRESSION"]
+    if regressions:
+        print(f"\n❌ Regressions: {', '.join(regressions)}")
+        sys.exit(1)
+    print("\n✅ No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark - Browser Option Profiles
+Measures launch time and page-load time for every profile in BROWSER_PROFILES
+
+Usage:
+    python -m benchmarks.bench_profiles --runs 5
+    python -m benchmarks.bench_profiles --profiles headless-ci headless-lean
+
+"launch" is the time until webdriver.Chrome() returns. "page load" is
+the wall time of driver.get(url) and "onload" the browser's own
+navigationStart -> loadEventEnd. Failed runs are counted so an unstable
+profile shows up even when its successful runs are fast.
+"""
+
+import argparse
+import statistics
+import time
+
+from utils.browser_config import BROWSER_PROFILES, get_chrome_options
+from utils.driver_factory import create_driver, quit_driver
+from utils.profile_manager import cleanup_profiles
+from utils.site import site_url
+
+
+DEFAULT_URL = site_url("/login")
+
+NAVIGATION_TIME_JS = (
+    "const t = performance.timing;"
+    "return t.loadEventEnd - t.navigationStart;"
+)
+
+
+def measure_profile(profile, url, runs):
+    """
+    Launch Chrome with one profile `runs` times and load `url` each time
+
+    Returns:
+        dict: launch / page load / onload times in seconds and failure count
+    """
+    results = {'launch': [], 'page load': [], 'onload': [], 'failures': 0}
+    for _ in range(runs):
+        driver = None
+        try:
+            start = time.perf_counter()
+            driver = create_driver(get_chrome_options(profile))
+            results['launch'].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            driver.get(url)
+            results['page load'].append(time.perf_counter() - start)
+            results['onload'].append(driver.execute_script(NAVIGATION_TIME_JS) / 1000)
+        except Exception as e:
+            print(f"⚠️  {profile}: run failed: {e}")
+            results['failures'] += 1
+        finally:
+            if driver is not None:
+                quit_driver(driver)
+    return results
+
+
+def print_results(results, runs):
+    """Print median / mean / max per profile and metric"""
+    print(f"\n{'profile':<16}{'metric':<11}{'median':>10}{'mean':>10}{'max':>10}  failures")
+    print("-" * 68)
+    for profile, timings in results.items():
+        failures = f"{timings['failures']}/{runs}"
+        for metric in ('launch', 'page load', 'onload'):
+            values = timings[metric]
+            if not values:
+                print(f"{profile:<16}{metric:<11}{'-':>10}{'-':>10}{'-':>10}  {failures}")
+                continue
+            print(f"{profile:<16}{metric:<11}"
+                  f"{statistics.median(values):>9.3f}s"
+                  f"{statistics.mean(values):>9.3f}s"
+                  f"{max(values):>9.3f}s  {failures}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="launches per profile")
+    parser.add_argument("--url", default=DEFAULT_URL, help="page to load in every run")
+    parser.add_argument("--profiles", nargs="+", choices=sorted(BROWSER_PROFILES),
+                        default=list(BROWSER_PROFILES), help="profiles to compare")
+    args = parser.parse_args()
+
+    print(f"🚀 Benchmark: browser profiles ({args.runs} runs each, {args.url})")
+    results = {}
+    try:
+        for profile in args.profiles:
+            print(f"⏱️  {profile}...")
+            results[profile] = measure_profile(profile, args.url, args.runs)
+    finally:
+        cleanup_profiles()
+    print_results(results, args.runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark - Batched snapshot() vs. Per-Method State Checks
+Compares reading login/secure page state one method at a time vs. one snapshot()
+
+Usage:
+    python -m benchmarks.bench_snapshot --iterations 20
+
+For each page the "per-method" variant runs the checks tests do today
+(is_*_displayed(), get_*_text(), ...), the "snapshot" variant reads the
+same information with a single page.snapshot(). Reported per iteration:
+wall time and the number of WebDriver commands sent.
+"""
+
+import argparse
+import statistics
+import time
+
+from pages.login_page import LoginPage
+from pages.secure_page import SecurePage
+from utils.browser_config import get_chrome_options
+from utils.driver_factory import create_driver, quit_driver
+from utils.profile_manager import cleanup_profiles
+
+
+class CommandCounter:
+    """Counts WebDriver commands by wrapping driver.execute"""
+
+    def __init__(self, driver):
+        self.count = 0
+        original = driver.execute
+
+        def counting_execute(command, params=None):
+            self.count += 1
+            return original(command, params)
+
+        driver.execute = counting_execute
+
+
+def login_page_per_method(page):
+    return (
+        page.get_page_heading(),
+        page.is_displayed(page.USERNAME_INPUT),
+        page.is_displayed(page.PASSWORD_INPUT),
+        page.is_displayed(page.LOGIN_BUTTON),
+    )
+
+
+def secure_page_per_method(page):
+    return (
+        page.is_success_message_displayed(),
+        page.get_success_message(),
+        page.get_page_heading(),
+        page.is_logout_button_displayed(),
+    )
+
+
+def measure(variant, counter, iterations):
+    """Run `variant` repeatedly; return per-iteration times and command counts"""
+    times, commands = [], []
+    for _ in range(iterations):
+        before = counter.count
+        start = time.perf_counter()
+        variant()
+        times.append(time.perf_counter() - start)
+        commands.append(counter.count - before)
+    return times, commands
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--profile", default="headless-lean", help="browser profile to use")
+    args = parser.parse_args()
+
+    driver = create_driver(get_chrome_options(args.profile))
+    counter = CommandCounter(driver)
+    results = []
+    try:
+        login_page = LoginPage(driver).open_login_page()
+        results.append(("login / per-method", *measure(
+            lambda: login_page_per_method(login_page), counter, args.iterations)))
+        results.append(("login / snapshot", *measure(
+            login_page.snapshot, counter, args.iterations)))
+
+        secure_page = login_page.login("tomsmith", "SuperSecretPassword!")
+        secure_page.wait_for_element_visible(SecurePage.SUCCESS_MESSAGE)
+        results.append(("secure / per-method", *measure(
+            lambda: secure_page_per_method(secure_page), counter, args.iterations)))
+        results.append(("secure / snapshot", *measure(
+            secure_page.snapshot, counter, args.iterations)))
+    finally:
+        quit_driver(driver)
+        cleanup_profiles()
+
+    print(f"\n{'variant':<22}{'median':>10}{'mean':>10}{'commands':>10}")
+    print("-" * 52)
+    for name, times, commands in results:
+        print(f"{name:<22}"
+              f"{statistics.median(times) * 1000:>8.1f}ms"
+              f"{statistics.mean(times) * 1000:>8.1f}ms"
+              f"{statistics.mean(commands):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,19 +5,405 @@ This file is automatically discovered by pytest.
 Fixtures defined here are available to all tests.
 """
 
+import base64
+import os
+import time
+
 import pytest
-from selenium import webdriver
-from utils.browser_config import get_chrome_options
+from utils.browser_config import (
+    BLOCKING_POLICIES,
+    BROWSER_PROFILES,
+    PAGE_LOAD_STRATEGIES,
+    get_blocking_policy,
+    get_page_load_strategy,
+    get_profile_name,
+)
+from utils.driver_factory import create_driver, quit_driver
+from utils.driver_pool import DriverPool, PoolStats
+from utils.driver_prewarm import DriverPrewarmer, PrewarmStats
+from utils import driver_service
+from utils.driver_service import ServiceStats
+from utils.auth_cache import AuthStateCache, AuthStats
+from pages.overlays import OverlayStats, overlays
+from utils import pacing
+from utils.pacing import PacingStats
+from utils import dom_waits
+from utils.dom_waits import WaitStats
+from utils.local_site import LocalSite
+from utils import network
+from utils import http_replay
+from utils.http_replay import ReplayStats
+from utils import resource_policy
+from utils.resource_policy import BlockStats
+from utils import readiness
+from utils.readiness import ReadinessStats
+from utils import durations
+from utils.durations import HistoryScheduling, ScheduleStats
+from utils import command_trace
+from utils.command_trace import TraceStats
+from utils import steps
+from utils.steps import StepStats
+from utils import screenshots
+from utils.screenshots import ScreenshotStats
+from utils import screencast
+from utils.screencast import ScreencastStats
+from utils import stream_report
+from utils import events
+from utils.events import EventStats
+from utils import resource_metrics
+from utils.resource_metrics import ResourceStats
+from utils import reaper
+from utils.reaper import ReaperStats
+from utils.site import get_base_url
+
+
+# Counters reported in the terminal summary: name -> (section title, stats class)
+RUN_STATS_SECTIONS = {
+    "driver_pool": ("WebDriver pool", PoolStats),
+    "driver_prewarm": ("WebDriver pre-warming", PrewarmStats),
+    "driver_service": ("Shared chromedriver service", ServiceStats),
+    "auth_cache": ("Auth state cache", AuthStats),
+    "overlays": ("Overlay handlers", OverlayStats),
+    "pacing": ("Pacing (time.sleep replacement)", PacingStats),
+    "dom_waits": ("MutationObserver waits", WaitStats),
+    "http_replay": ("Record/replay cache", ReplayStats),
+    "resource_policy": ("Blocked resources", BlockStats),
+    "readiness": ("Page readiness (navigation start -> ready)", ReadinessStats),
+    "scheduling": ("xdist scheduling: predicted vs. actual makespan", ScheduleStats),
+    "command_trace": ("WebDriver commands", TraceStats),
+    "steps": ("Page-object steps by total time", StepStats),
+    "screenshots": ("Screenshots", ScreenshotStats),
+    "screencast": ("Screencast recording", ScreencastStats),
+    "events": ("Event log", EventStats),
+    "resource_metrics": ("Browser resources per test", ResourceStats),
+    "reaper": ("Orphaned browsers and profiles", ReaperStats),
+}
+RUN_STATS = pytest.StashKey()
+LOCAL_SITE = pytest.StashKey()
+TEST_FAILED = pytest.StashKey()
+
+# Options pytest_configure exports to the environment:
+# (option, environment variable, getter that rejects a bad value or None).
+# Without an option the entry only validates the environment variable.
+EXPORTED_OPTIONS = (
+    ("browser_profile", "SELENIUM_BROWSER_PROFILE", get_profile_name),
+    ("pacing", "SELENIUM_PACING", pacing.get_pacing_mode),
+    ("page_load", "SELENIUM_PAGE_LOAD", get_page_load_strategy),
+    ("block_resources", "SELENIUM_BLOCKING", get_blocking_policy),
+    ("replay", "SELENIUM_REPLAY", http_replay.get_replay_mode),
+    ("wait_engine", "SELENIUM_WAIT_ENGINE", dom_waits.get_wait_engine),
+    ("screenshots", "SELENIUM_SCREENSHOTS", screenshots.get_screenshot_policy),
+    ("screenshot_buffer", "SELENIUM_SCREENSHOT_BUFFER", screenshots.get_buffer_size),
+    ("screenshot_format", "SELENIUM_SCREENSHOT_FORMAT", screenshots.get_screenshot_format),
+    ("screenshot_quality", "SELENIUM_SCREENSHOT_QUALITY", screenshots.get_screenshot_quality),
+    ("screenshot_scale", "SELENIUM_SCREENSHOT_SCALE", screenshots.get_screenshot_scale),
+    ("trace_commands", "SELENIUM_TRACE_COMMANDS", None),
+    ("trace_steps", "SELENIUM_TRACE_STEPS", None),
+    ("screencast", "SELENIUM_SCREENCAST", None),
+    ("screencast_fps", "SELENIUM_SCREENCAST_FPS", screencast.get_fps),
+    ("screencast_memory", "SELENIUM_SCREENCAST_MEMORY_MB", screencast.get_memory_limit),
+    (None, "SELENIUM_SCREENCAST_FORMAT", screencast.get_recording_format),
+    ("resource_metrics", "SELENIUM_RESOURCE_METRICS", resource_metrics.get_thresholds),
+    ("events", "SELENIUM_EVENTS", None),
+    ("events_console", "SELENIUM_EVENT_CONSOLE", events.get_console_mode),
+    ("report_mode", "SELENIUM_REPORT_MODE", stream_report.get_report_mode),
+    ("xdist_schedule", "SELENIUM_XDIST_SCHEDULE", durations.get_schedule),
+    ("site_url", "SELENIUM_BASE_URL", None),
+)
+
+STRICT_REPLAY_MESSAGE = "Strict replay: not in the recording:\n  "
+
+# Credentials of the-internet demo account (public site and utils/local_site)
+VALID_USERNAME = "tomsmith"
+VALID_PASSWORD = "SuperSecretPassword!"
+
+
+# ==================== COMMAND LINE OPTIONS ====================
+
+def pytest_addoption(parser):
+    """
+    Register project-specific command line options.
+
+    Every option can also be set through an environment variable,
+    which is handy in CI where the pytest command line is fixed.
+    """
+    group = parser.getgroup("selenium", "Selenium framework options")
+    group.addoption(
+        "--browser-profile",
+        choices=sorted(BROWSER_PROFILES),
+        default=None,
+        help="Chrome option profile, e.g. headless-lean for fast CI runs "
+             "[env: SELENIUM_BROWSER_PROFILE, default: headed-debug]",
+    )
+    group.addoption(
+        "--pacing",
+        choices=pacing.PACING_MODES,
+        default=None,
+        help="ci: skip demo pauses and wait only for readiness conditions, "
+             "demo: keep human-readable delays "
+             "[env: SELENIUM_PACING, default: ci when CI is set, else demo]",
+    )
+    group.addoption(
+        "--wait-engine",
+        choices=list(dom_waits.ENGINES),
+        default=None,
+        help="How BasePage waits: polling (WebDriverWait, default) or observer "
+             "(in-page MutationObserver) [env: SELENIUM_WAIT_ENGINE]",
+    )
+    group.addoption(
+        "--driver-mode",
+        choices=["fresh", "pool", "prewarm"],
+        default=os.environ.get("SELENIUM_DRIVER_MODE", "fresh"),
+        help="fresh: new browser per test (default), pool: reuse warm browsers, "
+             "prewarm: new browser per test launched in the background "
+             "[env: SELENIUM_DRIVER_MODE]",
+    )
+    group.addoption(
+        "--pool-size",
+        type=int,
+        default=int(os.environ.get("SELENIUM_POOL_SIZE", "1")),
+        help="Browsers to pre-launch per worker in pool mode [env: SELENIUM_POOL_SIZE]",
+    )
+    group.addoption(
+        "--auth-cache",
+        choices=["http", "ui", "off"],
+        default=os.environ.get("SELENIUM_AUTH_CACHE", "http"),
+        help="How logged_in_secure_page gets its session: http = POST to /authenticate "
+             "once per worker and inject cookies (default), ui = log in through the UI "
+             "once and inject its cookies, off = UI login in every test "
+             "[env: SELENIUM_AUTH_CACHE]",
+    )
+    group.addoption(
+        "--pool-max-uses",
+        type=int,
+        default=int(os.environ.get("SELENIUM_POOL_MAX_USES", "25")),
+        help="Recycle a pooled browser after this many tests, 0 = never "
+             "[env: SELENIUM_POOL_MAX_USES]",
+    )
+    group.addoption(
+        "--page-load",
+        choices=list(PAGE_LOAD_STRATEGIES),
+        default=None,
+        help="Chrome page load strategy; with eager/none BasePage.open() waits for "
+             "the page object's READY_WHEN contract instead of the load event "
+             "[env: SELENIUM_PAGE_LOAD, default: normal]",
+    )
+    group.addoption(
+        "--block-resources",
+        choices=list(BLOCKING_POLICIES),
+        default=None,
+        help="Global resource blocking preset from utils/browser_config.py; tests "
+             "and page objects can add to it or opt back in "
+             "[env: SELENIUM_BLOCKING, default: off]",
+    )
+    group.addoption(
+        "--replay",
+        choices=list(http_replay.MODES),
+        default=None,
+        help="Browser traffic cache: record responses from the real site, replay "
+             "them from disk, or strict = replay and fail on unrecorded URLs "
+             "[env: SELENIUM_REPLAY, default: off; directory: SELENIUM_REPLAY_DIR]",
+    )
+    group.addoption(
+        "--site-url",
+        default=None,
+        help="Base URL of the-internet for page objects and tests "
+             "[env: SELENIUM_BASE_URL, default: https://the-internet.herokuapp.com]",
+    )
+    group.addoption(
+        "--local-site",
+        action="store_true",
+        default=os.environ.get("SELENIUM_LOCAL_SITE") == "1",
+        help="Serve the-internet from the bundled local copy (utils/local_site) "
+             "on a free port for this run [env: SELENIUM_LOCAL_SITE=1]",
+    )
+    group.addoption(
+        "--site-latency",
+        type=int,
+        default=int(os.environ.get("SELENIUM_SITE_LATENCY_MS", "0")),
+        help="Local site: fixed delay in ms added to every response "
+             "[env: SELENIUM_SITE_LATENCY_MS]",
+    )
+    group.addoption(
+        "--site-dynamic-delay",
+        type=int,
+        default=int(os.environ.get("SELENIUM_SITE_DYNAMIC_DELAY_MS", "1000")),
+        help="Local site: ms the dynamic_loading / dynamic_controls pages take to load "
+             "[env: SELENIUM_SITE_DYNAMIC_DELAY_MS]",
+    )
+    group.addoption(
+        "--xdist-schedule",
+        choices=list(durations.SCHEDULES),
+        default=None,
+        help="With -n: history = longest tests first from recorded durations, keeping "
+             "tests with the same browser affinity on one worker; load = plain xdist "
+             "[env: SELENIUM_XDIST_SCHEDULE, default: history; store: SELENIUM_DURATIONS_FILE]",
+    )
+    group.addoption(
+        "--screenshots",
+        choices=list(screenshots.POLICIES),
+        default=None,
+        help="Which screenshots are written: always; on-failure = keep the last "
+             "--screenshot-buffer captures of a test in memory and write them only "
+             "if it fails; on-step = also write those taken inside page-object steps "
+             "[env: SELENIUM_SCREENSHOTS, default: always]",
+    )
+    group.addoption(
+        "--screenshot-buffer",
+        type=int,
+        default=None,
+        help="Captures kept per test with --screenshots on-failure/on-step "
+             "[env: SELENIUM_SCREENSHOT_BUFFER, default: 5]",
+    )
+    group.addoption(
+        "--screenshot-format",
+        choices=list(screenshots.FORMATS),
+        default=None,
+        help="Format screenshots are written in; jpeg/webp need Pillow "
+             "[env: SELENIUM_SCREENSHOT_FORMAT, default: png]",
+    )
+    group.addoption(
+        "--screenshot-quality",
+        type=int,
+        default=None,
+        help="JPEG/WebP quality 1-100 [env: SELENIUM_SCREENSHOT_QUALITY, default: 80]",
+    )
+    group.addoption(
+        "--screenshot-scale",
+        type=float,
+        default=None,
+        help="Downscale screenshots by this factor, e.g. 0.5; needs Pillow "
+             "[env: SELENIUM_SCREENSHOT_SCALE, default: 1]",
+    )
+    group.addoption(
+        "--screencast",
+        action="store_true",
+        default=screencast.recording_enabled(),
+        help="Stream fixture browsers' screens into memory (CDP screencast) and attach "
+             "an animated recording to the HTML report of failing tests "
+             "[env: SELENIUM_SCREENCAST=1]",
+    )
+    group.addoption(
+        "--screencast-fps",
+        type=float,
+        default=None,
+        help="Screencast frame rate cap [env: SELENIUM_SCREENCAST_FPS, default: 5]",
+    )
+    group.addoption(
+        "--screencast-memory",
+        type=float,
+        default=None,
+        metavar="MB",
+        help="Screencast frame buffer per browser [env: SELENIUM_SCREENCAST_MEMORY_MB, default: 20]",
+    )
+    group.addoption(
+        "--report-mode",
+        choices=list(stream_report.REPORT_MODES),
+        default=None,
+        help="html = pytest-html (pytest.ini); stream = write the report test by test "
+             "with screenshots as linked files and thumbnails, pytest-html off "
+             "[env: SELENIUM_REPORT_MODE, default: html; file: SELENIUM_STREAM_REPORT]",
+    )
+    group.addoption(
+        "--events",
+        action="store_true",
+        default=events.events_enabled(),
+        help="Structured event log instead of print(): records (page objects, fixtures and "
+             "whatever tests print) are kept per test, written to JSONL in the background and "
+             "shown for failing tests [env: SELENIUM_EVENTS=1; file: SELENIUM_EVENT_LOG]",
+    )
+    group.addoption(
+        "--events-console",
+        choices=list(events.CONSOLE_MODES),
+        default=None,
+        help="With --events: failure = show a test's records only if it fails; a level = "
+             "also echo records from that level up as they happen "
+             "[env: SELENIUM_EVENT_CONSOLE, default: failure]",
+    )
+    group.addoption(
+        "--resource-metrics",
+        action="store_true",
+        default=resource_metrics.metrics_enabled(),
+        help="Sample JS heap, DOM nodes, layouts, script time and (with psutil) Chrome/"
+             "chromedriver CPU and RSS of fixture browsers per test and step; flag tests whose "
+             "DOM nodes / heap grow past SELENIUM_LEAK_NODES / SELENIUM_LEAK_HEAP_MB "
+             "[env: SELENIUM_RESOURCE_METRICS=1; file: SELENIUM_RESOURCE_FILE]",
+    )
+    group.addoption(
+        "--trace-steps",
+        action="store_true",
+        default=steps.steps_enabled(),
+        help="Record page-object steps: step tree per test in the HTML report, Chrome trace in "
+             "SELENIUM_STEP_TRACE_FILE (default: reports/steps_trace.json) "
+             "[env: SELENIUM_TRACE_STEPS=1]",
+    )
+    group.addoption(
+        "--trace-commands",
+        action="store_true",
+        default=command_trace.tracing_enabled(),
+        help="Time every WebDriver command of fixture sessions; histograms per test in "
+             "the HTML report and in SELENIUM_TRACE_FILE (default: reports/command_trace.json) "
+             "[env: SELENIUM_TRACE_COMMANDS=1]",
+    )
 
 
 # ==================== FIXTURES ====================
 
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """
+    Provide a pool of warm Chrome sessions (one pool per xdist worker).
+    
+    Only created when a test needs it, i.e. in --driver-mode=pool.
+    """
+    config = request.config
+    pool = DriverPool(
+        size=config.getoption("pool_size"),
+        max_uses=config.getoption("pool_max_uses"),
+    )
+    events.info(f"\n🔥 Warming {pool.size} browser(s)...", size=pool.size)
+    pool.warm()
+    
+    yield pool
+    
+    pool.close()
+    config.stash.setdefault(RUN_STATS, {})["driver_pool"] = pool.stats
+
+
+@pytest.fixture(scope="session")
+def driver_prewarmer(request):
+    """
+    Provide a launcher that boots the next browser while a test runs.
+    
+    Only created when a test needs it, i.e. in --driver-mode=prewarm.
+    """
+    prewarmer = DriverPrewarmer()
+    prewarmer.start()
+    
+    yield prewarmer
+    
+    prewarmer.close()
+    request.config.stash.setdefault(RUN_STATS, {})["driver_prewarm"] = prewarmer.stats
+
+
 @pytest.fixture(scope="function")
-def driver():
+def driver(request):
     """
-    Provide a fresh Chrome WebDriver for each test.
+    Provide a Chrome WebDriver for each test.
+    
+    Scope: function (every test gets its own clean session)
+    
+    Modes (--driver-mode):
+        fresh: launch a new browser and quit it afterwards
+        pool:  borrow a warm browser from driver_pool and reset it afterwards
+        prewarm: fresh browser that was launched in the background while
+                 the previous test ran; quit happens in the background too
     
-    Scope: function (new driver for each test)
+    With --screencast the browser's frames are recorded for this test
+    only (see utils/screencast.py).
+    
+    With --resource-metrics the browser is sampled (JS heap, DOM nodes,
+    CPU/RSS) at start, after each page-object step and at the end.
     
     Usage in test:
         def test_login(driver):
@@ -28,14 +414,124 @@ def driver():
         - No need to create/quit driver in tests
         - Consistent browser configuration
     """
-    print("\n🔧 Setting up Chrome driver...")
-    driver = webdriver.Chrome(options=get_chrome_options())
+    mode = request.config.getoption("driver_mode")
+    
+    if mode == "pool":
+        pool = request.getfixturevalue("driver_pool")
+        driver = pool.acquire()
+        resource_policy.apply_test_policy(driver)
+        screencast.serve(driver, request.node.nodeid)
+        
+        with resource_metrics.monitor(driver):
+            yield driver
+        
+        # The next test gets the browser without this test's blocking rules
+        # or screencast frames
+        resource_policy.release_blocking(driver)
+        screencast.serve(driver, None)
+        pool.release(driver)
+        return
+    
+    if mode == "prewarm":
+        prewarmer = request.getfixturevalue("driver_prewarmer")
+        driver = prewarmer.acquire()
+        resource_policy.apply_test_policy(driver)
+        screencast.serve(driver, request.node.nodeid)
+        
+        with resource_metrics.monitor(driver):
+            yield driver
+        
+        prewarmer.release(driver)
+        return
     
-    yield driver  # Give driver to test
+    events.info("\n🔧 Setting up Chrome driver...")
+    driver = create_driver()
+    screencast.serve(driver, request.node.nodeid)
+    
+    with resource_metrics.monitor(driver):
+        yield driver  # Give driver to test
     
     # Cleanup (runs after test completes)
-    print("🧹 Closing browser...")
-    driver.quit()
+    events.info("🧹 Closing browser...")
+    quit_driver(driver)
+
+
+@pytest.fixture(autouse=True)
+def network_test_context(request):
+    """
+    Attribute intercepted browser traffic to the running test.
+    
+    Applies the test's block_resources / allow_resources markers and
+    reports what was blocked and replayed for the test. Strict replay
+    misses fail the test body (see pytest_runtest_call).
+    """
+    nodeid = request.node.nodeid
+    network.set_current_test(nodeid)
+    resource_policy.set_test_policy(resource_policy.policy_from_markers(request.node, BLOCKING_POLICIES))
+    
+    yield
+    
+    network.set_current_test(None)
+    resource_policy.set_test_policy(None)
+    blocked_requests, blocked_bytes = resource_policy.stats.for_test(nodeid)
+    if blocked_requests:
+        request.node.user_properties.append(
+            ("blocked", f"{blocked_requests} requests, {blocked_bytes / 1024:.0f} KiB known"))
+    hits, misses, saved = http_replay.stats.for_test(nodeid)
+    if hits or misses:
+        request.node.user_properties.append(
+            ("replay", f"{hits}/{hits + misses} from cache, {saved / 1024:.0f} KiB saved"))
+    http_replay.pop_unrecorded(nodeid)  # misses after the test body (teardown) are not its fault
+
+
+@pytest.fixture(autouse=True)
+def screenshot_barrier(request):
+    """
+    Make sure the test's screenshots are on disk when it finishes.
+    
+    Screenshots are written in the background (utils/screenshots.py);
+    this waits for them after the test and its driver are torn down.
+    Captures buffered by the on-failure/on-step policies are written
+    only if setup or the test body failed.
+    """
+    yield
+    
+    screenshots.end_test(request.node.stash.get(TEST_FAILED, False))
+    for error in screenshots.flush():
+        events.warning(f"⚠️  Screenshot not written: {error}")
+
+
+@pytest.fixture(autouse=True)
+def event_capture():
+    """
+    With --events, turn what the test prints into event records.
+    
+    Script-style tests keep their print() calls; the lines end up in the
+    event log and, if the test fails, in its report.
+    """
+    with events.capture_prints():
+        yield
+
+
+@pytest.fixture(scope="session")
+def auth_cache(request):
+    """
+    Provide the per-worker login session cache used by logged_in_secure_page.
+    """
+    from pages.login_page import LoginPage
+    from pages.secure_page import SecurePage
+    config = request.config
+    cache = AuthStateCache(
+        authenticate_url=LoginPage.AUTHENTICATE_URL,
+        secure_url=SecurePage.URL,
+        username=VALID_USERNAME,
+        password=VALID_PASSWORD,
+        method=config.getoption("auth_cache"),
+    )
+    
+    yield cache
+    
+    config.stash.setdefault(RUN_STATS, {})["auth_cache"] = cache.stats
 
 
 @pytest.fixture(scope="function")
@@ -52,36 +548,123 @@ def login_page(driver):
 
 
 @pytest.fixture(scope="function")
-def logged_in_secure_page(driver, login_page):
+def logged_in_secure_page(request, driver, login_page):
     """
     Provide a SecurePage object after successful login.
     
+    The first test of a worker logs in for real; later tests get the
+    cached session cookies injected and open the secure page directly
+    (see utils/auth_cache.py and --auth-cache).
+    
     Usage in test:
         def test_logout(logged_in_secure_page):
             # Already logged in!
             logged_in_secure_page.click_logout()
     """
+    from pages.secure_page import SecurePage
+    
+    cache = None
+    if request.config.getoption("auth_cache") != "off":
+        cache = request.getfixturevalue("auth_cache")
+        started = time.time()
+        if cache.inject(driver):
+            # inject() already navigated - finish the way BasePage.open() does
+            secure_page = SecurePage(driver)
+            secure_page.wait_until_ready(started)
+            secure_page.handle_overlays()
+            return secure_page
+    
+    # Nothing cached (or session expired) - real login through the UI
     login_page.open_login_page()
-    secure_page = login_page.login("tomsmith", "SuperSecretPassword!")
+    secure_page = login_page.login(VALID_USERNAME, VALID_PASSWORD)
     secure_page.dismiss_password_manager_popup()
+    if cache is not None:
+        cache.capture(driver)
     return secure_page
 
 
 # ==================== HOOKS ====================
 
+@pytest.hookimpl(tryfirst=True)
 def pytest_configure(config):
     """
     Called before test run starts.
-    Setup reports directory.
+    Setup reports directory and the browser profile.
+    Runs before pytest-html's configure so --report-mode stream can switch it off.
     """
-    import os
+    # Export the options so script-style tests calling the getters directly
+    # (and xdist workers) see the same settings, then validate them
+    for option, variable, validate in EXPORTED_OPTIONS:
+        value = config.getoption(option) if option else None
+        if value is True:
+            os.environ[variable] = "1"
+        elif value is not None and value is not False:
+            os.environ[variable] = str(value)
+        if validate is not None:
+            try:
+                validate()
+            except ValueError as e:
+                raise pytest.UsageError(str(e))
+    profile = get_profile_name()
+    pacing_mode = pacing.get_pacing_mode()
+    page_load = get_page_load_strategy()
+    replay_mode = http_replay.get_replay_mode()
+    wait_engine = dom_waits.get_wait_engine()
+    if stream_report.get_report_mode() == "stream":
+        config.option.htmlpath = None
+        if not hasattr(config, "workerinput"):
+            stream_report.open_report(title="Selenium Mastery Project - Test Report")
+    
+    # One local server per run: the xdist controller starts it and the
+    # workers inherit SELENIUM_BASE_URL when they are spawned
+    if config.getoption("local_site") and not hasattr(config, "workerinput"):
+        site = LocalSite(
+            latency_ms=config.getoption("site_latency"),
+            dynamic_delay_ms=config.getoption("site_dynamic_delay"),
+        ).start()
+        config.stash[LOCAL_SITE] = site
+        os.environ["SELENIUM_BASE_URL"] = site.base_url
+    
+    # Clean up after runs that were killed; on SIGTERM this run reaps its
+    # own browsers and profiles before it terminates
+    reaper.install_signal_handlers()
+    reaped = (0, 0, 0) if hasattr(config, "workerinput") else reaper.reap_stale()
+    
     os.makedirs("reports", exist_ok=True)
     os.makedirs("screenshots", exist_ok=True)
     print("\n" + "="*60)
     print("🚀 pytest Configuration Complete!")
+    print(f"🌐 Browser profile: {profile}  |  Page load: {page_load}")
+    print(f"⏱️  Pacing: {pacing_mode}  |  Wait engine: {wait_engine}")
+    print(f"🏠 Site under test: {get_base_url()}")
+    if replay_mode != "off":
+        print(f"📼 Replay: {replay_mode} ({http_replay.get_replay_dir()})")
+    if stream_report.reporter is not None:
+        print(f"📄 Streaming report: {stream_report.reporter.path}")
+    if any(reaped):
+        print(f"🧹 Reaped from earlier runs: {reaped[0]} processes, {reaped[1]} profiles "
+              f"({reaped[2] / 2**20:.1f} MiB)")
     print("="*60)
 
 
+def pytest_unconfigure(config):
+    """Stop the local site server, if this process started one"""
+    site = config.stash.get(LOCAL_SITE, None)
+    if site is not None:
+        site.stop()
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Called after collection, before the run.
+    Browser affinities travel to the duration store with the reports.
+    """
+    for item in items:
+        affinity = durations.affinity_of(item)
+        if affinity:
+            item.user_properties.append((durations.AFFINITY_PROPERTY, affinity))
+
+
 def pytest_collection_finish(session):
     """
     Called after test collection is complete.
@@ -90,6 +673,127 @@ def pytest_collection_finish(session):
     print(f"\n📊 Collected {len(session.items)} tests")
 
 
+@pytest.hookimpl(trylast=True)
+def pytest_runtest_call(item):
+    """
+    Runs after the test body passed.
+    Strict replay: fail it when the browser asked for unrecorded URLs,
+    so the call report (not teardown) carries the failure.
+    """
+    blocked = http_replay.pop_unrecorded(item.nodeid)
+    if blocked:
+        pytest.fail(STRICT_REPLAY_MESSAGE + "\n  ".join(blocked), pytrace=False)
+
+
+def pytest_runtest_logreport(report):
+    """Add up each test's setup / call / teardown time for the duration store;
+    hand finished tests to the streaming report"""
+    durations.recorder.add_report(report)
+    if stream_report.reporter is not None:
+        stream_report.reporter.add_report(report)
+
+
+def pytest_sessionfinish(session):
+    """
+    Called after the whole run finished.
+    Store test durations and write the command and step traces
+    (controller / plain run); on xdist workers, hand the framework
+    counters to the controller.
+    """
+    config = session.config
+    if not hasattr(config, "workerinput"):
+        try:
+            durations.recorder.save()
+        except OSError as e:
+            print(f"\n⚠️  Could not save test durations: {e}")
+    if driver_service.stats.sessions or driver_service.stats.lookups:
+        config.stash.setdefault(RUN_STATS, {})["driver_service"] = driver_service.stats
+    if overlays.stats.probes:
+        config.stash.setdefault(RUN_STATS, {})["overlays"] = overlays.stats
+    if pacing.stats.calls:
+        config.stash.setdefault(RUN_STATS, {})["pacing"] = pacing.stats
+    if dom_waits.stats.observer_waits or dom_waits.stats.fallbacks or dom_waits.stats.timeouts:
+        config.stash.setdefault(RUN_STATS, {})["dom_waits"] = dom_waits.stats
+    if http_replay.stats.hits or http_replay.stats.misses or http_replay.stats.recorded:
+        config.stash.setdefault(RUN_STATS, {})["http_replay"] = http_replay.stats
+    if resource_policy.stats.requests:
+        config.stash.setdefault(RUN_STATS, {})["resource_policy"] = resource_policy.stats
+    if readiness.stats.by_page:
+        config.stash.setdefault(RUN_STATS, {})["readiness"] = readiness.stats
+    if command_trace.stats.by_session:
+        config.stash.setdefault(RUN_STATS, {})["command_trace"] = command_trace.stats
+    if steps.stats.by_name:
+        config.stash.setdefault(RUN_STATS, {})["steps"] = steps.stats
+    screenshots.flush()
+    if screenshots.stats.captures:
+        config.stash.setdefault(RUN_STATS, {})["screenshots"] = screenshots.stats
+    if screencast.stats.frames:
+        config.stash.setdefault(RUN_STATS, {})["screencast"] = screencast.stats
+    if resource_metrics.stats.by_test:
+        config.stash.setdefault(RUN_STATS, {})["resource_metrics"] = resource_metrics.stats
+    events.close()
+    if events.stats.by_level:
+        config.stash.setdefault(RUN_STATS, {})["events"] = events.stats
+    reaper.account_open_resources()
+    if any(reaper.stats.as_dict().values()):
+        all_stats = config.stash.setdefault(RUN_STATS, {})
+        if "reaper" in all_stats:
+            all_stats["reaper"].merge(reaper.stats.as_dict())  # controller: workers already merged
+        else:
+            all_stats["reaper"] = reaper.stats
+    if hasattr(config, "workeroutput"):
+        for name, stats in config.stash.get(RUN_STATS, {}).items():
+            config.workeroutput[name] = stats.as_dict()
+        return
+    # Controller (worker counters were merged in pytest_testnodedown) or plain run
+    all_stats = config.stash.get(RUN_STATS, {})
+    if "command_trace" in all_stats:
+        print(f"\n🔬 Command trace: {command_trace.write_trace_file(all_stats['command_trace'])}")
+    if "steps" in all_stats:
+        print(f"\n🧭 Step timeline (Chrome trace): {steps.write_chrome_trace(all_stats['steps'])}")
+    if "resource_metrics" in all_stats:
+        print(f"\n🧠 Browser resources: {resource_metrics.write_metrics_file(all_stats['resource_metrics'])}")
+    if stream_report.reporter is not None:
+        summaries = [all_stats[name].html_summary() for name in ("command_trace", "resource_metrics")
+                     if name in all_stats]
+        stream_report.reporter.finish("".join(summaries))
+        print(f"\n📄 Streaming report: {stream_report.reporter.summary_line()}")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """xdist controller: longest tests first, using the duration store"""
+    if config.getvalue("dist") != "load" or durations.get_schedule() != "history":
+        return None
+    scheduler = HistoryScheduling(config, log)
+    config.stash.setdefault(RUN_STATS, {})["scheduling"] = scheduler.stats
+    return scheduler
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """xdist controller: collect framework counters from each finished worker;
+    reap the browsers and profiles of a worker that crashed"""
+    if error:
+        reaper.reap_stale()
+    workeroutput = getattr(node, "workeroutput", {})
+    all_stats = node.config.stash.setdefault(RUN_STATS, {})
+    for name, (_, stats_class) in RUN_STATS_SECTIONS.items():
+        if name in workeroutput:
+            all_stats.setdefault(name, stats_class()).merge(workeroutput[name])
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Print framework counters (driver pool, service, overlays...) at the end of the run"""
+    all_stats = config.stash.get(RUN_STATS, {})
+    for name, (title, _) in RUN_STATS_SECTIONS.items():
+        if name not in all_stats:
+            continue
+        terminalreporter.section(title)
+        for line in all_stats[name].summary_lines():
+            terminalreporter.write_line(line)
+
+
 # ==================== HTML REPORT CUSTOMIZATION ====================
 
 @pytest.hookimpl(tryfirst=True)
@@ -98,10 +802,68 @@ def pytest_html_report_title(report):
     report.title = "Selenium Mastery Project - Test Report"
 
 
-def pytest_html_results_summary(prefix, summary, postfix):
+def pytest_html_results_summary(prefix, summary, postfix, session):
     """Add custom content to HTML report summary"""
     prefix.extend([
         "<h2>Selenium Test Automation Report</h2>",
         "<p>Project: selenium-mastery-project</p>",
         "<p>Framework: Selenium WebDriver + pytest</p>"
-    ])
\ No newline at end of file
+    ])
+    for name in ("command_trace", "resource_metrics"):
+        stats = session.config.stash.get(RUN_STATS, {}).get(name)
+        if stats is not None:
+            postfix.append(stats.html_summary())
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Attach the test's step timeline and WebDriver command histograms to its report row;
+    remember setup/call failures for the screenshot policy, save the screencast
+    recording of a failure, add the event records to failing phases and list the
+    test's screenshots on its teardown report; browser resource samples,
+    possible leaks and strict replay misses of a failed test body go on the
+    call report"""
+    outcome = yield
+    report = outcome.get_result()
+    pytest_html = item.config.pluginmanager.getplugin("html")
+    recordings = []
+    if report.when == "teardown":
+        report.screenshots = screenshots.pop_paths(item.nodeid)
+    if report.failed and events.events_enabled():
+        records = events.records_for(item.nodeid)
+        if records:
+            report.sections.append(("Captured events", "\n".join(events.format_record(r) for r in records)))
+            if report.when != "teardown":
+                events.stats.failures_shown += 1
+    findings = None
+    if report.when == "call" or (report.when == "setup" and report.failed):
+        findings = resource_metrics.finish_test(item.nodeid)
+    if findings:
+        report.user_properties.append(("leak", ", ".join(findings)))
+        events.warning(f"⚠️  Possible browser leak: {', '.join(findings)}", test=item.nodeid)
+    if report.when == "teardown":
+        events.end_test(item.nodeid)
+    if report.when == "call" and report.failed:
+        # Test body failed on its own - still show what strict replay blocked
+        blocked = http_replay.pop_unrecorded(item.nodeid)
+        if blocked:
+            report.sections.append(("Strict replay", STRICT_REPLAY_MESSAGE + "\n  ".join(blocked)))
+    if report.when in ("setup", "call") and report.failed:
+        item.stash[TEST_FAILED] = True
+        frame_lists = screencast.recordings_for(item.nodeid)
+        for index, frames in enumerate(frame_lists):
+            name = item.nodeid if len(frame_lists) == 1 else f"{item.nodeid}-{index + 1}"
+            path, mime_type = screencast.save_recording(frames, name)
+            recordings.append((path, mime_type))
+    if pytest_html is None:
+        return
+    if report.when == "call" or (report.when == "setup" and report.failed):
+        for content in (steps.stats.html_timeline(item.nodeid), command_trace.stats.html_table(item.nodeid),
+                        resource_metrics.stats.html_table(item.nodeid)):
+            if content:
+                report.extras = getattr(report, "extras", []) + [pytest_html.extras.html(content)]
+    for path, mime_type in recordings:
+        with open(path, "rb") as f:
+            content = base64.b64encode(f.read()).decode("ascii")
+        report.extras = getattr(report, "extras", []) + [pytest_html.extras.image(
+            content, "Screencast", mime_type=mime_type, extension=os.path.splitext(path)[1][1:])]
\ No newline at end of file
@@ -14,10 +14,43 @@ INTERVIEW TIP:
     inherit. This follows DRY principle and reduces code duplication."
 """
 
-from selenium.webdriver.support.ui import WebDriverWait
+import time
+
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.common.by import By
+
+from pages.overlays import overlays
+from utils import dom_waits, events
+from utils.dom_waits import make_wait
+from utils.locator_js import LOCATOR_JS, locator_to_js
+from utils import readiness
+from utils.resource_policy import apply_page_policy
+from utils.screenshots import save_screenshot
+from utils.steps import step
+
+
+# One script that reports on MANY elements at once (see query_elements)
+QUERY_ELEMENTS_JS = LOCATOR_JS + """
+const [queries, attributes] = arguments;
+const result = {};
+for (const [name, using, value] of queries) {
+    let found = [];
+    try { found = __findAll(using, value); } catch (e) {}
+    const el = found[0];
+    const state = {present: !!el, count: found.length, visible: false, text: null, attributes: {}};
+    if (el) {
+        state.visible = __isVisible(el);
+        state.text = state.visible ? el.innerText.trim() : '';
+        for (const attr of attributes) {
+            const prop = el[attr];
+            state.attributes[attr] = ['string', 'number', 'boolean'].includes(typeof prop)
+                ? prop : el.getAttribute(attr);
+        }
+    }
+    result[name] = state;
+}
+return result;
+"""
 
 
 class BasePage:
@@ -30,8 +63,25 @@ class BasePage:
     - Typing text
     - Waiting for elements
     - Taking screenshots
+    - Batched state snapshots (many elements, one round-trip)
+    
+    Actions are recorded as timed steps with --trace-steps (see utils/steps.py).
     """
     
+    # Named locators reported by snapshot() - page objects fill this in
+    SNAPSHOT_LOCATORS = {}
+    
+    # Resource blocking adjustments while this page is in use
+    # (see utils/resource_policy.py): a BlockPolicy to block more, and
+    # resource types / URL globs to opt back in, e.g. ("Image",)
+    BLOCK_RESOURCES = None
+    ALLOW_RESOURCES = ()
+    
+    # Readiness contract checked by open() (see utils/readiness.py), e.g.
+    # (ElementReady(LOGIN_BUTTON),). Empty = document interactive, and
+    # with the "normal" page load strategy not checked at all.
+    READY_WHEN = ()
+    
     def __init__(self, driver):
         """
         Initialize BasePage with WebDriver instance
@@ -43,13 +93,46 @@ class BasePage:
                  so they can all control the same browser session.
         """
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)  # Default 10 second wait
+        self.wait = make_wait(driver, 10)  # Default 10 second wait
+        apply_page_policy(driver, type(self))
+        
+        # NOTE: make_wait() returns a WebDriverWait, or an in-page
+        #       MutationObserver wait when SELENIUM_WAIT_ENGINE=observer
+        #       (see utils/dom_waits.py). Both accept the same conditions.
     
     # ==================== NAVIGATION METHODS ====================
     
+    @step()
     def open(self, url):
-        """Navigate to a URL"""
+        """
+        Navigate to a URL, wait until the page is ready, then dismiss
+        any known overlay that showed up
+        """
+        started = time.time()
         self.driver.get(url)
+        self.wait_until_ready(started)
+        self.handle_overlays()
+    
+    @step()
+    def wait_until_ready(self, started=None, timeout=30):
+        """
+        Wait for this page's READY_WHEN contract
+        
+        Args:
+            started: time.time() from just before driver.get(); only a
+                     document loaded after it counts (None = any)
+            timeout: Seconds to wait
+        
+        Returns:
+            float: ms from navigation start to ready, or None when there
+                   was nothing to wait for
+        """
+        strategy = self.driver.capabilities.get('pageLoadStrategy', 'normal')
+        if not self.READY_WHEN and strategy == 'normal':
+            return None  # driver.get() already waited for the load event
+        return readiness.wait_until_ready(
+            self.driver, self.READY_WHEN, started, type(self).__name__, timeout
+        )
     
     def get_title(self):
         """Get current page title"""
@@ -63,28 +146,33 @@ class BasePage:
     
     def find_element(self, locator):
         """Find a single element with explicit wait"""
-        return self.wait.until(EC.presence_of_element_located(locator))
+        return self.wait.until(dom_waits.presence_of_element_located(locator))
     
     def find_elements(self, locator):
         """Find multiple elements with wait"""
-        return self.wait.until(EC.presence_of_all_elements_located(locator))
+        return self.wait.until(dom_waits.presence_of_all_elements_located(locator))
     
+    @step()
     def click(self, locator):
         """Click an element (with wait for clickability)"""
-        element = self.wait.until(EC.element_to_be_clickable(locator))
+        element = self.wait.until(dom_waits.element_to_be_clickable(locator))
         element.click()
+        self.handle_overlays()
     
+    @step()
     def type(self, locator, text):
         """Type text into an input field"""
         element = self.find_element(locator)
         element.clear()
         element.send_keys(text)
     
+    @step()
     def get_text(self, locator):
         """Get text from an element"""
         element = self.find_element(locator)
         return element.text
     
+    @step()
     def is_displayed(self, locator):
         """Check if element is displayed on page"""
         try:
@@ -98,70 +186,107 @@ class BasePage:
         element = self.find_element(locator)
         return element.is_enabled()
     
+    # ==================== BATCHED STATE QUERIES ====================
+    
+    def query_elements(self, locators, attributes=()):
+        """
+        Get the state of many elements with ONE execute_script call
+        
+        Args:
+            locators: dict of name -> (By, value)
+            attributes: Attribute/property names to read from each element
+        
+        Returns:
+            dict: name -> {
+                'present': bool, 'count': int, 'visible': bool,
+                'text': str or None, 'attributes': {name: value}
+            }
+        
+        NOTE: No waiting - this reports the page as it is right now.
+              Wait for the element you care about first if needed.
+        """
+        queries = [[name] + locator_to_js(locator) for name, locator in locators.items()]
+        return self.driver.execute_script(QUERY_ELEMENTS_JS, queries, list(attributes))
+    
+    def snapshot(self, attributes=()):
+        """
+        State of all of this page's SNAPSHOT_LOCATORS in one round-trip
+        
+        Usage:
+            state = secure_page.snapshot()
+            assert state['success_message']['visible']
+        """
+        return self.query_elements(self.SNAPSHOT_LOCATORS, attributes)
+    
     # ==================== ADVANCED WAIT METHODS ====================
     
+    @step()
     def wait_for_element_visible(self, locator, timeout=10):
         """Wait for element to be visible"""
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.visibility_of_element_located(locator))
+        wait = make_wait(self.driver, timeout)
+        return wait.until(dom_waits.visibility_of_element_located(locator))
     
+    @step()
     def wait_for_element_clickable(self, locator, timeout=10):
         """Wait for element to be clickable"""
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.element_to_be_clickable(locator))
+        wait = make_wait(self.driver, timeout)
+        return wait.until(dom_waits.element_to_be_clickable(locator))
     
+    @step()
+    def wait_for_text_present(self, locator, text, timeout=10):
+        """Wait for element text to contain specific text"""
+        wait = make_wait(self.driver, timeout)
+        return wait.until(dom_waits.text_to_be_present_in_element(locator, text))
+    
+    @step()
     def wait_for_url_contains(self, text, timeout=10):
         """Wait for URL to contain specific text"""
-        wait = WebDriverWait(self.driver, timeout)
+        wait = make_wait(self.driver, timeout)
         return wait.until(EC.url_contains(text))
     
     # ==================== UTILITY METHODS ====================
     
+    @step()
     def take_screenshot(self, filename):
-        """Take a screenshot"""
-        self.driver.save_screenshot(f"screenshots/{filename}")
+        """
+        Take a screenshot of the current viewport
+        
+        Only the capture happens here; decoding, re-encoding and the disk
+        write run in the background (see utils/screenshots.py).
+        
+        Returns:
+            str: Path of the file (extension follows SELENIUM_SCREENSHOT_FORMAT)
+        """
+        return save_screenshot(self.driver, f"screenshots/{filename}")
+    
+    def handle_overlays(self, *names):
+        """
+        Dismiss known overlays that are on screen RIGHT NOW (no waiting)
+        
+        Args:
+            *names: Handlers from pages/overlays.py to check
+                    (default: every automatic handler)
+        
+        Returns:
+            list: Names of the handlers that fired
+        """
+        return overlays.handle(self.driver, *names)
     
     def dismiss_password_manager_popup(self):
         """
-        Wait for Chrome password manager pop-up and dismiss it
+        Dismiss the Chrome password manager pop-up if it is showing
         
-        Waits up to 5 seconds for the pop-up to appear, then clicks OK.
-        Takes screenshot before and after for documentation.
+        Uses a single zero-wait probe (see pages/overlays.py) instead of
+        waiting several seconds for a pop-up that usually never appears.
+        Takes a screenshot after dismissing it for documentation.
         
         Returns:
             bool: True if pop-up was found and dismissed, False otherwise
         """
-        import time
-        
-        try:
-            print("⏳ Waiting for password manager pop-up...")
-            
-            # Wait up to 5 seconds for the OK button to appear
-            wait = WebDriverWait(self.driver, 5)
-            ok_button = wait.until(
-                EC.element_to_be_clickable((By.XPATH, "//button[text()='OK']"))
-            )
-            
-            print("✅ Pop-up detected!")
-            
-            # Take screenshot WITH pop-up visible
-            self.take_screenshot("password_popup_VISIBLE.png")
-            print("📸 Screenshot: Pop-up visible")
-            
-            # Click OK to dismiss
-            ok_button.click()
-            print("✅ Clicked OK on password manager pop-up")
-            
-            # Wait a moment for it to disappear
-            time.sleep(1)
-            
-            # Take screenshot AFTER dismissing
+        if "password_manager" in self.handle_overlays("password_manager"):
+            events.info("✅ Dismissed password manager pop-up")
             self.take_screenshot("password_popup_DISMISSED.png")
-            print("📸 Screenshot: Pop-up dismissed")
-            
             return True
-            
-        except:
-            # Pop-up didn't appear within 5 seconds
-            print("ℹ️  No password pop-up detected")
-            return False
\ No newline at end of file
+        
+        events.info("ℹ️  No password pop-up detected")
+        return False
@@ -1,17 +1,21 @@
 """
 Login Page Object
-Represents the login page at https://the-internet.herokuapp.com/login
+Represents the login page at <site>/login (see utils/site.py)
 """
 
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from utils.readiness import ElementReady
+from utils.site import SiteUrl
+from utils.steps import step
 
 
 class LoginPage(BasePage):
     """Login Page object with locators and actions"""
     
     # URL
-    URL = "https://the-internet.herokuapp.com/login"
+    URL = SiteUrl("/login")
+    AUTHENTICATE_URL = SiteUrl("/authenticate")  # form action
     
     # Locators (using tuples for easy use with WebDriverWait)
     USERNAME_INPUT = (By.ID, "username")
@@ -20,26 +24,42 @@ class LoginPage(BasePage):
     ERROR_MESSAGE = (By.CSS_SELECTOR, ".flash.error")
     PAGE_HEADING = (By.TAG_NAME, "h2")
     
+    # open() returns as soon as the form can be used
+    READY_WHEN = (ElementReady(LOGIN_BUTTON),)
+    
+    # Everything snapshot() reports in one round-trip
+    SNAPSHOT_LOCATORS = {
+        'heading': PAGE_HEADING,
+        'username': USERNAME_INPUT,
+        'password': PASSWORD_INPUT,
+        'login_button': LOGIN_BUTTON,
+        'error_message': ERROR_MESSAGE,
+    }
+    
     # Page Actions
     def open_login_page(self):
         """Navigate to login page"""
         self.open(self.URL)
         return self
     
+    @step()
     def enter_username(self, username):
         """Enter username in the username field"""
         self.type(self.USERNAME_INPUT, username)
         return self
     
+    @step()
     def enter_password(self, password):
         """Enter password in the password field"""
         self.type(self.PASSWORD_INPUT, password)
         return self
     
+    @step()
     def click_login_button(self):
         """Click the login button"""
         self.click(self.LOGIN_BUTTON)
     
+    @step()
     def login(self, username, password):
         """
         Complete login action (fluent interface)
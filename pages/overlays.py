@@ -0,0 +1,184 @@
+"""
+Overlay / Popup Handler Registry
+Known interstitials that can cover the page, handled only when present
+
+WHY:
+    dismiss_password_manager_popup() used to WAIT up to 5 seconds for a
+    popup that almost never shows up - every login test paid that.
+    Here all known overlays are checked with ONE execute_script call
+    (zero wait) and only the ones actually on screen are handled.
+
+USAGE:
+    from pages.overlays import overlays
+    fired = overlays.handle(driver, "cookie_banner")  # a specific handler
+    fired = overlays.handle(driver)                   # all automatic handlers
+
+    # Add a new one (e.g. for another site's cookie banner)
+    overlays.register(OverlayHandler("consent", (By.ID, "accept-all")))
+
+The built-in handlers are manual: their locators (an "OK" button, a
+"Close" button) also match real controls of pages under test, so
+BasePage.open()/click() never fire them on their own. Register an
+automatic handler only with a locator nothing but the overlay matches.
+"""
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from utils.locator_js import LOCATOR_JS, locator_to_js
+
+
+PROBE_JS = LOCATOR_JS + """
+const present = [];
+for (const [name, using, value] of arguments[0]) {
+    try {
+        if (__findAll(using, value).some(__isVisible)) present.push(name);
+    } catch (e) { /* bad locator on this page - treat as absent */ }
+}
+return present;
+"""
+
+
+class OverlayHandler:
+    """
+    One kind of overlay and how to get rid of it
+
+    Args:
+        name: Unique handler name (used in counters and handle(driver, name))
+        locator: (By, value) of the element to click to dismiss the overlay
+        auto: Check it automatically after every open()/click() in BasePage.
+              Only for locators that cannot match a real control of the
+              page under test - every automatic handler is probed after
+              every click.
+        description: Short human-readable note for reports
+    """
+
+    def __init__(self, name, locator, auto=True, description=""):
+        self.name = name
+        self.locator = locator
+        self.auto = auto
+        self.description = description
+
+    def dismiss(self, driver):
+        """Click the dismiss element (it is known to be present)"""
+        driver.find_element(*self.locator).click()
+
+
+class OverlayStats:
+    """How often the registry probed and how often each handler fired"""
+
+    def __init__(self):
+        self.probes = 0
+        self.fired = {}
+
+    def as_dict(self):
+        """Counters as a plain dict (safe to send between xdist workers)"""
+        return {'probes': self.probes, 'fired': dict(self.fired)}
+
+    def merge(self, data):
+        """Add counters from another OverlayStats.as_dict() (xdist aggregation)"""
+        self.probes += data['probes']
+        for name, count in data['fired'].items():
+            self.fired[name] = self.fired.get(name, 0) + count
+
+    def summary_lines(self):
+        """Human-readable lines for the terminal summary"""
+        lines = [f"Probes: {self.probes}"]
+        for name, count in sorted(self.fired.items()):
+            lines.append(f"  {name}: fired {count}x")
+        return lines
+
+
+class OverlayRegistry:
+    """Collection of OverlayHandlers checked with a single probe"""
+
+    def __init__(self):
+        self.handlers = {}
+        self.stats = OverlayStats()
+
+    def register(self, handler):
+        """Add (or replace) a handler"""
+        self.handlers[handler.name] = handler
+
+    def unregister(self, name):
+        """Remove a handler by name"""
+        self.handlers.pop(name, None)
+
+    def _select(self, names):
+        unknown = [name for name in names if name not in self.handlers]
+        if unknown:
+            raise ValueError(
+                f"Unknown overlay handler(s) {', '.join(unknown)}. Choose from: {', '.join(self.handlers)}"
+            )
+        if names:
+            return [self.handlers[name] for name in names]
+        return [handler for handler in self.handlers.values() if handler.auto]
+
+    def probe(self, driver, *names):
+        """
+        Check which overlays are on screen right now (one round-trip, no wait)
+
+        Args:
+            driver: Selenium WebDriver instance
+            *names: Handlers to check (default: all automatic handlers)
+
+        Returns:
+            list: Names of handlers whose overlay is visible
+
+        Raises:
+            ValueError: A name that is not registered
+        """
+        handlers = self._select(names)
+        if not handlers:
+            return []
+        self.stats.probes += 1
+        probes = [[handler.name] + locator_to_js(handler.locator) for handler in handlers]
+        try:
+            return driver.execute_script(PROBE_JS, probes) or []
+        except WebDriverException:
+            return []  # alert open, page navigating, ... - nothing to handle
+
+    def handle(self, driver, *names):
+        """
+        Dismiss every overlay that is currently visible
+
+        Args:
+            driver: Selenium WebDriver instance
+            *names: Handlers to check (default: all automatic handlers)
+
+        Returns:
+            list: Names of handlers that fired
+        """
+        fired = []
+        for name in self.probe(driver, *names):
+            try:
+                self.handlers[name].dismiss(driver)
+            except WebDriverException:
+                continue  # disappeared between probe and click
+            self.stats.fired[name] = self.stats.fired.get(name, 0) + 1
+            fired.append(name)
+        return fired
+
+
+# ==================== DEFAULT REGISTRY ====================
+
+overlays = OverlayRegistry()
+
+overlays.register(OverlayHandler(
+    "password_manager",
+    (By.XPATH, "//button[text()='OK']"),
+    auto=False,
+    description="Chrome password manager bubble (dismiss_password_manager_popup() only)",
+))
+overlays.register(OverlayHandler(
+    "cookie_banner",
+    (By.CSS_SELECTOR, "button.close, button[aria-label='Close'], [aria-label='Close'].close"),
+    auto=False,
+    description="Cookie / promo banners (e.g. demo.opencart.com)",
+))
+overlays.register(OverlayHandler(
+    "flash_banner",
+    (By.CSS_SELECTOR, ".flash .close"),
+    auto=False,
+    description="the-internet flash message (tests assert on it, so manual only)",
+))
@@ -5,19 +5,33 @@ Represents the secure area page after successful login
 
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from utils import events
+from utils.readiness import ElementReady
+from utils.site import SiteUrl
+from utils.steps import step
 
 
 class SecurePage(BasePage):
     """Secure Area Page object"""
     
     # URL
-    URL = "https://the-internet.herokuapp.com/secure"
+    URL = SiteUrl("/secure")
     
     # Locators
     SUCCESS_MESSAGE = (By.CSS_SELECTOR, ".flash.success")
     LOGOUT_BUTTON = (By.CSS_SELECTOR, "a[href='/logout']")
     PAGE_HEADING = (By.TAG_NAME, "h2")
     
+    # open() returns as soon as logout is possible
+    READY_WHEN = (ElementReady(LOGOUT_BUTTON),)
+    
+    # Everything snapshot() reports in one round-trip
+    SNAPSHOT_LOCATORS = {
+        'heading': PAGE_HEADING,
+        'success_message': SUCCESS_MESSAGE,
+        'logout_button': LOGOUT_BUTTON,
+    }
+    
     # Page Actions
     def get_success_message(self):
         """Get success message text"""
@@ -39,6 +53,7 @@ class SecurePage(BasePage):
         """Check if logout button is displayed"""
         return self.is_displayed(self.LOGOUT_BUTTON)
     
+    @step()
     def click_logout(self):
         """
         Click logout button - handles success banner overlay
@@ -55,34 +70,33 @@ class SecurePage(BasePage):
         Returns:
             LoginPage: Page object for the login page
         """
-        import time
+        from utils.pacing import pause
         
         # Close the success message banner if present
-        try:
-            close_button = self.driver.find_element(By.CSS_SELECTOR, ".flash .close")
-            close_button.click()
-            print("✅ Clicked X to close banner")
-            time.sleep(1)  # Wait for banner to disappear
+        if self.handle_overlays("flash_banner"):
+            events.info("✅ Clicked X to close banner")
+            pause(1, "banner fade", until=lambda: not any(  # Wait for banner to disappear
+                banner.is_displayed()
+                for banner in self.driver.find_elements(By.CSS_SELECTOR, ".flash")
+            ))
             
             # NOW capture - banner is definitely gone
             self.take_screenshot("secure_page_banner_CLOSED.png")
-            print("📸 Screenshot taken AFTER closing banner")
-            
-        except:
-            print("⚠️  Banner not found (may have auto-closed)")
-            pass
+            events.info("📸 Screenshot taken AFTER closing banner", screenshot="secure_page_banner_CLOSED.png")
+        else:
+            events.warning("⚠️  Banner not found (may have auto-closed)")
         
         # Click logout using JavaScript (more reliable)
         logout_btn = self.driver.find_element(*self.LOGOUT_BUTTON)
         self.driver.execute_script("arguments[0].click();", logout_btn)
-        print("✅ Clicked logout button")
+        events.info("✅ Clicked logout button")
         
         # Wait for navigation
-        time.sleep(2)
+        pause(2, "logout navigation", until=lambda: "/login" in self.driver.current_url)
         
         # Capture login page
         self.take_screenshot("after_logout_login_page.png")
-        print("📸 Screenshot taken - back on login page")
+        events.info("📸 Screenshot taken - back on login page", screenshot="after_logout_login_page.png")
         
         # Return LoginPage object
         from pages.login_page import LoginPage
@@ -3,31 +3,37 @@ Test 2: Search Functionality
 Learn basic element interaction, assertions, and verification.
 """
 
-from selenium import webdriver
+import sys
+import os
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-import time
+
+from utils.driver_factory import create_driver, quit_driver
+from utils.pacing import pause, page_ready
+from utils.screenshots import save_screenshot
+from utils.site import site_url
 
 def test_search():
     print("\n🚀 Starting Test 2: Search Functionality")
     
-    chrome_options = Options()
-    chrome_options.add_argument('--start-maximized')
-    driver = webdriver.Chrome(options=chrome_options)
+    driver = create_driver()
     wait = WebDriverWait(driver, 10)
     
     try:
         # Navigate to page
         print("\n📍 Step 1: Navigate to Herokuapp")
-        driver.get("https://the-internet.herokuapp.com/")
-        time.sleep(2)
+        driver.get(site_url("/"))
+        pause(2, "page load", until=page_ready(driver))
         
         print(f"✅ Page loaded: {driver.title}")
         print(f"✅ Current URL: {driver.current_url}")
         
-        driver.save_screenshot("screenshots/search_step1_homepage.png")
+        save_screenshot(driver, "screenshots/search_step1_homepage.png")
         
         # Find all available examples
         print("\n🔍 Step 2: Finding all available test pages...")
@@ -43,10 +49,10 @@ def test_search():
         print("\n🔘 Step 3: Clicking on 'Add/Remove Elements'...")
         add_remove_link = driver.find_element(By.LINK_TEXT, "Add/Remove Elements")
         add_remove_link.click()
-        time.sleep(2)
+        pause(2)
         
         print(f"✅ Navigated to: {driver.current_url}")
-        driver.save_screenshot("screenshots/search_step2_add_remove.png")
+        save_screenshot(driver, "screenshots/search_step2_add_remove.png")
         
         # Verify page heading
         heading = driver.find_element(By.TAG_NAME, "h3").text
@@ -58,27 +64,27 @@ def test_search():
         
         for i in range(3):
             add_button.click()
-            time.sleep(0.5)
+            pause(0.5)
             print(f"  ✅ Added element {i+1}")
         
         # Verify elements were added
         delete_buttons = driver.find_elements(By.CSS_SELECTOR, ".added-manually")
         print(f"✅ Total elements added: {len(delete_buttons)}")
         
-        driver.save_screenshot("screenshots/search_step3_elements_added.png")
+        save_screenshot(driver, "screenshots/search_step3_elements_added.png")
         
         # Remove one element
         print("\n➖ Step 5: Removing one element...")
         if delete_buttons:
             delete_buttons[0].click()
-            time.sleep(1)
+            pause(1)
             print("✅ Removed one element")
         
         # Verify removal
         remaining_buttons = driver.find_elements(By.CSS_SELECTOR, ".added-manually")
         print(f"✅ Elements remaining: {len(remaining_buttons)}")
         
-        driver.save_screenshot("screenshots/search_step4_element_removed.png")
+        save_screenshot(driver, "screenshots/search_step4_element_removed.png")
         
         # Test assertions
         print("\n✅ Step 6: Running assertions...")
@@ -87,8 +93,8 @@ def test_search():
         
         # Go back to home
         print("\n🔙 Step 7: Navigating back to home...")
-        driver.get("https://the-internet.herokuapp.com/")
-        time.sleep(1)
+        driver.get(site_url("/"))
+        pause(1, "page load", until=page_ready(driver))
         
         # Verify we're back
         assert "The Internet" in driver.title
@@ -110,19 +116,19 @@ def test_search():
         print("="*60)
         
         print("\n⏸️  Keeping browser open for 3 seconds...")
-        time.sleep(3)
+        pause(3, "keep browser open")
         
     except AssertionError as e:
         print(f"\n❌ ASSERTION FAILED: {e}")
-        driver.save_screenshot("screenshots/search_assertion_error.png")
+        save_screenshot(driver, "screenshots/search_assertion_error.png")
         
     except Exception as e:
         print(f"\n❌ ERROR: {e}")
-        driver.save_screenshot("screenshots/search_error.png")
+        save_screenshot(driver, "screenshots/search_error.png")
         
     finally:
         print("\n🧹 Closing browser...")
-        driver.quit()
+        quit_driver(driver)
         print("✅ Test completed!\n")
 
 if __name__ == "__main__":
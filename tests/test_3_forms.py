@@ -3,20 +3,26 @@ Test 3: Form Filling
 Learn how to fill forms, handle different input types, and validate data.
 """
 
-from selenium import webdriver
+import sys
+import os
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.select import Select
-import time
+
+from utils.driver_factory import create_driver, quit_driver
+from utils.pacing import pause, page_ready
+from utils.screenshots import save_screenshot
+from utils.site import site_url
 
 def test_forms():
     print("\n🚀 Starting Test 3: Form Filling")
     
-    chrome_options = Options()
-    chrome_options.add_argument('--start-maximized')
-    driver = webdriver.Chrome(options=chrome_options)
+    driver = create_driver()
     wait = WebDriverWait(driver, 10)
     
     try:
@@ -25,11 +31,11 @@ def test_forms():
         print("PART 1: Basic Form Input")
         print("="*60)
         
-        driver.get("https://the-internet.herokuapp.com/inputs")
-        time.sleep(2)
+        driver.get(site_url("/inputs"))
+        pause(2, "page load", until=page_ready(driver))
         
         print(f"✅ Page loaded: {driver.title}")
-        driver.save_screenshot("screenshots/forms_step1_inputs_page.png")
+        save_screenshot(driver, "screenshots/forms_step1_inputs_page.png")
         
         # Find input field
         print("\n🔍 Finding input field...")
@@ -40,19 +46,19 @@ def test_forms():
         print("\n⌨️  Typing number: 12345")
         number_input.clear()
         number_input.send_keys("12345")
-        time.sleep(1)
+        pause(1)
         
         # Get the value
         entered_value = number_input.get_attribute("value")
         print(f"✅ Value entered: {entered_value}")
         
-        driver.save_screenshot("screenshots/forms_step2_number_entered.png")
+        save_screenshot(driver, "screenshots/forms_step2_number_entered.png")
         
         # Clear and enter new value
         print("\n🔄 Clearing and entering new value: 99999")
         number_input.clear()
         number_input.send_keys("99999")
-        time.sleep(1)
+        pause(1)
         
         new_value = number_input.get_attribute("value")
         print(f"✅ New value: {new_value}")
@@ -65,11 +71,11 @@ def test_forms():
         print("PART 2: Checkboxes")
         print("="*60)
         
-        driver.get("https://the-internet.herokuapp.com/checkboxes")
-        time.sleep(2)
+        driver.get(site_url("/checkboxes"))
+        pause(2, "page load", until=page_ready(driver))
         
         print(f"✅ Page loaded")
-        driver.save_screenshot("screenshots/forms_step3_checkboxes.png")
+        save_screenshot(driver, "screenshots/forms_step3_checkboxes.png")
         
         # Find all checkboxes
         checkboxes = driver.find_elements(By.CSS_SELECTOR, "input[type='checkbox']")
@@ -86,22 +92,22 @@ def test_forms():
         for i, cb in enumerate(checkboxes, 1):
             before = cb.is_selected()
             cb.click()
-            time.sleep(0.3)
+            pause(0.3)
             after = cb.is_selected()
             print(f"  Checkbox {i}: {before} → {after}")
         
-        driver.save_screenshot("screenshots/forms_step4_checkboxes_toggled.png")
+        save_screenshot(driver, "screenshots/forms_step4_checkboxes_toggled.png")
         
         # Test 3: Dropdown
         print("\n" + "="*60)
         print("PART 3: Dropdown Selection")
         print("="*60)
         
-        driver.get("https://the-internet.herokuapp.com/dropdown")
-        time.sleep(2)
+        driver.get(site_url("/dropdown"))
+        pause(2, "page load", until=page_ready(driver))
         
         print(f"✅ Page loaded")
-        driver.save_screenshot("screenshots/forms_step5_dropdown.png")
+        save_screenshot(driver, "screenshots/forms_step5_dropdown.png")
         
         # Find dropdown
         dropdown_element = driver.find_element(By.ID, "dropdown")
@@ -116,32 +122,32 @@ def test_forms():
         # Select by visible text
         print("\n🔘 Selecting 'Option 1'...")
         dropdown.select_by_visible_text("Option 1")
-        time.sleep(1)
+        pause(1)
         
         selected = dropdown.first_selected_option.text
         print(f"✅ Selected: {selected}")
         assert selected == "Option 1"
         
-        driver.save_screenshot("screenshots/forms_step6_option1.png")
+        save_screenshot(driver, "screenshots/forms_step6_option1.png")
         
         # Select by value
         print("\n🔘 Selecting 'Option 2' by value...")
         dropdown.select_by_value("2")
-        time.sleep(1)
+        pause(1)
         
         selected = dropdown.first_selected_option.text
         print(f"✅ Selected: {selected}")
         assert selected == "Option 2"
         
-        driver.save_screenshot("screenshots/forms_step7_option2.png")
+        save_screenshot(driver, "screenshots/forms_step7_option2.png")
         
         # Test 4: Text Areas
         print("\n" + "="*60)
         print("PART 4: Key Presses (Special Keys)")
         print("="*60)
         
-        driver.get("https://the-internet.herokuapp.com/key_presses")
-        time.sleep(2)
+        driver.get(site_url("/key_presses"))
+        pause(2, "page load", until=page_ready(driver))
         
         print(f"✅ Page loaded")
         
@@ -164,13 +170,13 @@ def test_forms():
         for key_name, key_code in test_keys:
             key_input.clear()
             key_input.send_keys(key_code)
-            time.sleep(0.5)
+            pause(0.5)
             
             # Get result
             result = driver.find_element(By.ID, "result").text
             print(f"  {key_name}: {result}")
         
-        driver.save_screenshot("screenshots/forms_step8_keys.png")
+        save_screenshot(driver, "screenshots/forms_step8_keys.png")
         
         print("\n🎉 TEST 3 PASSED: All form interactions successful!")
         
@@ -189,21 +195,21 @@ def test_forms():
         print("="*60)
         
         print("\n⏸️  Keeping browser open for 3 seconds...")
-        time.sleep(3)
+        pause(3, "keep browser open")
         
     except AssertionError as e:
         print(f"\n❌ ASSERTION FAILED: {e}")
-        driver.save_screenshot("screenshots/forms_assertion_error.png")
+        save_screenshot(driver, "screenshots/forms_assertion_error.png")
         
     except Exception as e:
         print(f"\n❌ ERROR: {e}")
         import traceback
         traceback.print_exc()
-        driver.save_screenshot("screenshots/forms_error.png")
+        save_screenshot(driver, "screenshots/forms_error.png")
         
     finally:
         print("\n🧹 Closing browser...")
-        driver.quit()
+        quit_driver(driver)
         print("✅ Test completed!\n")
 
 if __name__ == "__main__":
@@ -3,27 +3,33 @@ Test 4: Element Locators
 Master all 8 locator strategies in Selenium.
 """
 
-from selenium import webdriver
+import sys
+import os
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-import time
+
+from utils.driver_factory import create_driver, quit_driver
+from utils.pacing import pause, page_ready
+from utils.screenshots import save_screenshot
+from utils.site import site_url
 
 def test_locators():
     print("\n🚀 Starting Test 4: Element Locators (8 Strategies)")
     
-    chrome_options = Options()
-    chrome_options.add_argument('--start-maximized')
-    driver = webdriver.Chrome(options=chrome_options)
+    driver = create_driver()
     wait = WebDriverWait(driver, 10)
     
     try:
-        driver.get("https://the-internet.herokuapp.com/login")
-        time.sleep(2)
+        driver.get(site_url("/login"))
+        pause(2, "page load", until=page_ready(driver))
         
         print(f"✅ Page loaded: {driver.title}")
-        driver.save_screenshot("screenshots/locators_page.png")
+        save_screenshot(driver, "screenshots/locators_page.png")
         
         print("\n" + "="*60)
         print("8 SELENIUM LOCATOR STRATEGIES")
@@ -77,8 +83,8 @@ def test_locators():
         print("   Syntax: By.LINK_TEXT")
         try:
             # Go to home page for this
-            driver.get("https://the-internet.herokuapp.com/")
-            time.sleep(1)
+            driver.get(site_url("/"))
+            pause(1, "page load", until=page_ready(driver))
             
             link = driver.find_element(By.LINK_TEXT, "Form Authentication")
             print(f"   ✅ Found link: '{link.text}'")
@@ -97,8 +103,8 @@ def test_locators():
             print(f"   ❌ Not found: {e}")
         
         # Go back to login page for CSS and XPath
-        driver.get("https://the-internet.herokuapp.com/login")
-        time.sleep(1)
+        driver.get(site_url("/login"))
+        pause(1, "page load", until=page_ready(driver))
         
         # 7. By CSS_SELECTOR
         print("\n7️⃣  BY CSS_SELECTOR - Most flexible (after XPath)")
@@ -157,16 +163,16 @@ def test_locators():
         password_field.send_keys("SuperSecretPassword!")
         print("✅ Password filled (using CSS)")
         
-        time.sleep(1)
-        driver.save_screenshot("screenshots/locators_form_filled.png")
+        pause(1)
+        save_screenshot(driver, "screenshots/locators_form_filled.png")
         
         # Button by XPath
         login_button = driver.find_element(By.XPATH, "//button[@type='submit']")
         login_button.click()
         print("✅ Login button clicked (using XPath)")
         
-        time.sleep(2)
-        driver.save_screenshot("screenshots/locators_logged_in.png")
+        pause(2)
+        save_screenshot(driver, "screenshots/locators_logged_in.png")
         
         # Verify login
         current_url = driver.current_url
@@ -191,17 +197,17 @@ def test_locators():
         print("="*60)
         
         print("\n⏸️  Keeping browser open for 3 seconds...")
-        time.sleep(3)
+        pause(3, "keep browser open")
         
     except Exception as e:
         print(f"\n❌ ERROR: {e}")
         import traceback
         traceback.print_exc()
-        driver.save_screenshot("screenshots/locators_error.png")
+        save_screenshot(driver, "screenshots/locators_error.png")
         
     finally:
         print("\n🧹 Closing browser...")
-        driver.quit()
+        quit_driver(driver)
         print("✅ Test completed!\n")
 
 if __name__ == "__main__":
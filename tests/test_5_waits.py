@@ -3,20 +3,26 @@ Test 5: Waits and Synchronization
 Master implicit waits, explicit waits, and handling dynamic content.
 """
 
-from selenium import webdriver
+import sys
+import os
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException
-import time
+
+from utils.driver_factory import create_driver, quit_driver
+from utils.pacing import pause, page_ready
+from utils.screenshots import save_screenshot
+from utils.site import site_url
 
 def test_waits():
     print("\n🚀 Starting Test 5: Waits and Synchronization")
     
-    chrome_options = Options()
-    chrome_options.add_argument('--start-maximized')
-    driver = webdriver.Chrome(options=chrome_options)
+    driver = create_driver()
     
     try:
         # Part 1: Implicit Wait
@@ -33,21 +39,21 @@ def test_waits():
         print("   certain amount of time when trying to find elements.")
         print("   It applies to ALL find_element() calls.")
         
-        driver.get("https://the-internet.herokuapp.com/dynamic_loading/1")
-        time.sleep(2)
+        driver.get(site_url("/dynamic_loading/1"))
+        pause(2, "page load", until=page_ready(driver))
         
-        driver.save_screenshot("screenshots/waits_step1_implicit.png")
+        save_screenshot(driver, "screenshots/waits_step1_implicit.png")
         
         # Part 2: Explicit Wait - Presence
         print("\n" + "="*60)
         print("PART 2: Explicit Wait - Presence of Element")
         print("="*60)
         
-        driver.get("https://the-internet.herokuapp.com/dynamic_loading/2")
-        time.sleep(2)
+        driver.get(site_url("/dynamic_loading/2"))
+        pause(2, "page load", until=page_ready(driver))
         
         print("✅ Page loaded")
-        driver.save_screenshot("screenshots/waits_step2_before_click.png")
+        save_screenshot(driver, "screenshots/waits_step2_before_click.png")
         
         # Click Start button
         print("\n🔘 Clicking Start button...")
@@ -69,7 +75,7 @@ def test_waits():
         except TimeoutException:
             print("❌ Element did not appear within 10 seconds")
         
-        driver.save_screenshot("screenshots/waits_step3_after_wait.png")
+        save_screenshot(driver, "screenshots/waits_step3_after_wait.png")
         
         # Part 3: Explicit Wait - Visibility
         print("\n" + "="*60)
@@ -80,8 +86,8 @@ def test_waits():
         print("   presence_of_element: Element exists in DOM")
         print("   visibility_of_element: Element is visible on page")
         
-        driver.get("https://the-internet.herokuapp.com/dynamic_loading/1")
-        time.sleep(2)
+        driver.get(site_url("/dynamic_loading/1"))
+        pause(2, "page load", until=page_ready(driver))
         
         # Start loading
         start_button = driver.find_element(By.CSS_SELECTOR, "#start button")
@@ -100,17 +106,17 @@ def test_waits():
         except TimeoutException:
             print("❌ Element did not become visible")
         
-        driver.save_screenshot("screenshots/waits_step4_visibility.png")
+        save_screenshot(driver, "screenshots/waits_step4_visibility.png")
         
         # Part 4: Explicit Wait - Clickability
         print("\n" + "="*60)
         print("PART 4: Explicit Wait - Element to be Clickable")
         print("="*60)
         
-        driver.get("https://the-internet.herokuapp.com/dynamic_controls")
-        time.sleep(2)
+        driver.get(site_url("/dynamic_controls"))
+        pause(2, "page load", until=page_ready(driver))
         
-        driver.save_screenshot("screenshots/waits_step5_controls.png")
+        save_screenshot(driver, "screenshots/waits_step5_controls.png")
         
         # Remove checkbox
         print("\n🔘 Clicking Remove button...")
@@ -140,8 +146,8 @@ def test_waits():
         except TimeoutException:
             print("❌ Add button not clickable")
         
-        time.sleep(2)
-        driver.save_screenshot("screenshots/waits_step6_added_back.png")
+        pause(2)
+        save_screenshot(driver, "screenshots/waits_step6_added_back.png")
         
         # Part 5: Explicit Wait - Text to be Present
         print("\n" + "="*60)
@@ -168,7 +174,7 @@ def test_waits():
         except TimeoutException:
             print("❌ Message did not appear")
         
-        driver.save_screenshot("screenshots/waits_step7_message.png")
+        save_screenshot(driver, "screenshots/waits_step7_message.png")
         
         # Part 6: Custom Wait Condition
         print("\n" + "="*60)
@@ -228,17 +234,17 @@ def test_waits():
         print("="*60)
         
         print("\n⏸️  Keeping browser open for 3 seconds...")
-        time.sleep(3)
+        pause(3, "keep browser open")
         
     except Exception as e:
         print(f"\n❌ ERROR: {e}")
         import traceback
         traceback.print_exc()
-        driver.save_screenshot("screenshots/waits_error.png")
+        save_screenshot(driver, "screenshots/waits_error.png")
         
     finally:
         print("\n🧹 Closing browser...")
-        driver.quit()
+        quit_driver(driver)
         print("✅ Test completed!\n")
 
 if __name__ == "__main__":
@@ -3,20 +3,26 @@ Selenium Test - Advanced Features (Drag & Drop, Hovers, Dynamic Content)
 Learn advanced Selenium interactions.
 """
 
-from selenium import webdriver
+import sys
+import os
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver import ActionChains
-import time
+
+from utils.driver_factory import create_driver, quit_driver
+from utils.pacing import pause, page_ready
+from utils.screenshots import save_screenshot
+from utils.site import site_url
 
 def test_advanced_features():
     print("\n🚀 Starting test: Advanced Selenium Features")
     
-    chrome_options = Options()
-    chrome_options.add_argument('--start-maximized')
-    driver = webdriver.Chrome(options=chrome_options)
+    driver = create_driver()
     wait = WebDriverWait(driver, 10)
     
     try:
@@ -25,11 +31,11 @@ def test_advanced_features():
         print("TEST 1: Drag and Drop")
         print("="*60)
         
-        driver.get("https://the-internet.herokuapp.com/drag_and_drop")
-        time.sleep(2)
+        driver.get(site_url("/drag_and_drop"))
+        pause(2, "page load", until=page_ready(driver))
         
         print(f"✅ Page loaded: {driver.title}")
-        driver.save_screenshot("screenshots/advanced_step1_dragdrop_initial.png")
+        save_screenshot(driver, "screenshots/advanced_step1_dragdrop_initial.png")
         
         # Find elements
         print("\n🔍 Finding source and target elements...")
@@ -43,10 +49,10 @@ def test_advanced_features():
         print("\n🎯 Performing drag and drop...")
         actions = ActionChains(driver)
         actions.drag_and_drop(source_element, target_element).perform()
-        time.sleep(2)
+        pause(2)
         
         print("✅ Drag and drop performed!")
-        driver.save_screenshot("screenshots/advanced_step2_dragdrop_done.png")
+        save_screenshot(driver, "screenshots/advanced_step2_dragdrop_done.png")
         
         # Verify the swap
         source_text_after = source_element.text
@@ -63,11 +69,11 @@ def test_advanced_features():
         print("TEST 2: Mouse Hover Actions")
         print("="*60)
         
-        driver.get("https://the-internet.herokuapp.com/hovers")
-        time.sleep(2)
+        driver.get(site_url("/hovers"))
+        pause(2, "page load", until=page_ready(driver))
         
         print(f"✅ Page loaded: {driver.title}")
-        driver.save_screenshot("screenshots/advanced_step3_hover_initial.png")
+        save_screenshot(driver, "screenshots/advanced_step3_hover_initial.png")
         
         # Find all user images
         print("\n🔍 Finding user images...")
@@ -79,7 +85,7 @@ def test_advanced_features():
             print(f"\n🖱️  Hovering over user {i}...")
             actions = ActionChains(driver)
             actions.move_to_element(user_image).perform()
-            time.sleep(1)
+            pause(1)
             
             # Try to find the caption that appears
             try:
@@ -87,13 +93,13 @@ def test_advanced_features():
                 if caption.is_displayed():
                     caption_text = caption.text
                     print(f"  ✅ Caption appeared: {caption_text}")
-                    driver.save_screenshot(f"screenshots/advanced_hover_user{i}.png")
+                    save_screenshot(driver, f"screenshots/advanced_hover_user{i}.png")
                 else:
                     print(f"  ⚠️  Caption not visible")
             except Exception as e:
                 print(f"  ⚠️  Could not find caption: {e}")
             
-            time.sleep(1)
+            pause(1)
         
         print("\n🎉 TEST 2 PASSED: Hover actions performed!")
         
@@ -102,11 +108,11 @@ def test_advanced_features():
         print("TEST 3: Dynamic Loading (Wait for Elements)")
         print("="*60)
         
-        driver.get("https://the-internet.herokuapp.com/dynamic_loading/2")
-        time.sleep(2)
+        driver.get(site_url("/dynamic_loading/2"))
+        pause(2, "page load", until=page_ready(driver))
         
         print(f"✅ Page loaded: {driver.title}")
-        driver.save_screenshot("screenshots/advanced_step4_dynamic_initial.png")
+        save_screenshot(driver, "screenshots/advanced_step4_dynamic_initial.png")
         
         # Click Start button
         print("\n🔘 Clicking Start button...")
@@ -116,7 +122,7 @@ def test_advanced_features():
         
         # Wait for loading bar
         print("⏳ Waiting for content to load...")
-        time.sleep(1)
+        pause(1)
         
         # Wait for the finish element to appear
         finish_element = wait.until(
@@ -129,7 +135,7 @@ def test_advanced_features():
         finish_text = finish_element.text
         print(f"✅ Dynamic content loaded: '{finish_text}'")
         
-        driver.save_screenshot("screenshots/advanced_step5_dynamic_loaded.png")
+        save_screenshot(driver, "screenshots/advanced_step5_dynamic_loaded.png")
         
         if "Hello World!" in finish_text:
             print("🎉 TEST 3 PASSED: Dynamic content handled!")
@@ -139,8 +145,8 @@ def test_advanced_features():
         print("TEST 4: Checkbox Handling")
         print("="*60)
         
-        driver.get("https://the-internet.herokuapp.com/checkboxes")
-        time.sleep(2)
+        driver.get(site_url("/checkboxes"))
+        pause(2, "page load", until=page_ready(driver))
         
         print(f"✅ Page loaded: {driver.title}")
         
@@ -155,18 +161,18 @@ def test_advanced_features():
             is_checked = checkbox.is_selected()
             print(f"  Checkbox {i}: {'✅ Checked' if is_checked else '☐ Unchecked'}")
         
-        driver.save_screenshot("screenshots/advanced_step6_checkboxes_initial.png")
+        save_screenshot(driver, "screenshots/advanced_step6_checkboxes_initial.png")
         
         # Toggle all checkboxes
         print("\n🔄 Toggling all checkboxes...")
         for i, checkbox in enumerate(checkboxes, 1):
             was_checked = checkbox.is_selected()
             checkbox.click()
-            time.sleep(0.5)
+            pause(0.5)
             is_checked = checkbox.is_selected()
             print(f"  Checkbox {i}: {was_checked} → {is_checked}")
         
-        driver.save_screenshot("screenshots/advanced_step7_checkboxes_toggled.png")
+        save_screenshot(driver, "screenshots/advanced_step7_checkboxes_toggled.png")
         
         print("🎉 TEST 4 PASSED: Checkboxes handled!")
         
@@ -175,8 +181,8 @@ def test_advanced_features():
         print("TEST 5: Dropdown Selection")
         print("="*60)
         
-        driver.get("https://the-internet.herokuapp.com/dropdown")
-        time.sleep(2)
+        driver.get(site_url("/dropdown"))
+        pause(2, "page load", until=page_ready(driver))
         
         print(f"✅ Page loaded: {driver.title}")
         
@@ -193,23 +199,23 @@ def test_advanced_features():
         for i, option in enumerate(options):
             print(f"  {i}: {option.text}")
         
-        driver.save_screenshot("screenshots/advanced_step8_dropdown_initial.png")
+        save_screenshot(driver, "screenshots/advanced_step8_dropdown_initial.png")
         
         # Select by visible text
         print("\n🔘 Selecting 'Option 1' by visible text...")
         dropdown.select_by_visible_text("Option 1")
-        time.sleep(1)
+        pause(1)
         selected = dropdown.first_selected_option
         print(f"✅ Selected: {selected.text}")
-        driver.save_screenshot("screenshots/advanced_step9_dropdown_option1.png")
+        save_screenshot(driver, "screenshots/advanced_step9_dropdown_option1.png")
         
         # Select by value
         print("\n🔘 Selecting 'Option 2' by value...")
         dropdown.select_by_value("2")
-        time.sleep(1)
+        pause(1)
         selected = dropdown.first_selected_option
         print(f"✅ Selected: {selected.text}")
-        driver.save_screenshot("screenshots/advanced_step10_dropdown_option2.png")
+        save_screenshot(driver, "screenshots/advanced_step10_dropdown_option2.png")
         
         print("🎉 TEST 5 PASSED: Dropdown handled!")
         
@@ -227,17 +233,17 @@ def test_advanced_features():
         print("="*60)
         
         print("\n⏸️  Keeping browser open for 5 seconds...")
-        time.sleep(5)
+        pause(5, "keep browser open")
         
     except Exception as e:
         print(f"\n❌ ERROR: {e}")
         import traceback
         traceback.print_exc()
-        driver.save_screenshot("screenshots/advanced_error.png")
+        save_screenshot(driver, "screenshots/advanced_error.png")
         
     finally:
         print("\n🧹 Closing browser...")
-        driver.quit()
+        quit_driver(driver)
         print("✅ Test completed!\n")
 
 if __name__ == "__main__":
@@ -3,27 +3,33 @@ Selenium Test - Handling JavaScript Alerts, Confirms, and Prompts
 Learn how to handle all types of JavaScript popups.
 """
 
-from selenium import webdriver
+import sys
+import os
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-import time
+
+from utils.driver_factory import create_driver, quit_driver
+from utils.pacing import pause, page_ready
+from utils.screenshots import save_screenshot
+from utils.site import site_url
 
 def test_alerts_handling():
     print("\n🚀 Starting test: JavaScript Alerts, Confirms, and Prompts")
     
-    chrome_options = Options()
-    chrome_options.add_argument('--start-maximized')
-    driver = webdriver.Chrome(options=chrome_options)
+    driver = create_driver()
     wait = WebDriverWait(driver, 10)
     
     try:
-        driver.get("https://the-internet.herokuapp.com/javascript_alerts")
-        time.sleep(2)
+        driver.get(site_url("/javascript_alerts"))
+        pause(2, "page load", until=page_ready(driver))
         
         print(f"✅ Page loaded: {driver.title}")
-        driver.save_screenshot("screenshots/alerts_step1_page.png")
+        save_screenshot(driver, "screenshots/alerts_step1_page.png")
         
         # Test 1: Simple Alert (OK only)
         print("\n" + "="*60)
@@ -42,12 +48,12 @@ def test_alerts_handling():
         # Accept alert BEFORE taking screenshot
         print("✅ Accepting alert (clicking OK)...")
         alert.accept()
-        time.sleep(1)
+        pause(1)
         
         result = driver.find_element(By.ID, "result").text
         print(f"✅ Result: {result}")
         
-        driver.save_screenshot("screenshots/alerts_step2_accepted.png")
+        save_screenshot(driver, "screenshots/alerts_step2_accepted.png")
         print("🎉 TEST 1 PASSED: Simple alert handled!")
         
         # Test 2: Confirm (OK or Cancel)
@@ -66,7 +72,7 @@ def test_alerts_handling():
         
         print("✅ Accepting confirm (clicking OK)...")
         confirm_alert.accept()
-        time.sleep(1)
+        pause(1)
         
         result = driver.find_element(By.ID, "result").text
         print(f"✅ Result after OK: {result}")
@@ -74,17 +80,17 @@ def test_alerts_handling():
         # Now try dismissing (Cancel)
         print("\n🔘 Testing Cancel option...")
         confirm_button.click()
-        time.sleep(0.5)
+        pause(0.5)
         
         confirm_alert = wait.until(EC.alert_is_present())
         print("❌ Dismissing confirm (clicking Cancel)...")
         confirm_alert.dismiss()
-        time.sleep(1)
+        pause(1)
         
         result = driver.find_element(By.ID, "result").text
         print(f"✅ Result after Cancel: {result}")
         
-        driver.save_screenshot("screenshots/alerts_step3_confirm.png")
+        save_screenshot(driver, "screenshots/alerts_step3_confirm.png")
         print("🎉 TEST 2 PASSED: Confirm handled (both OK and Cancel)!")
         
         # Test 3: Prompt (Input text)
@@ -105,27 +111,27 @@ def test_alerts_handling():
         test_text = "Hello from Selenium Automation!"
         print(f"⌨️  Typing: '{test_text}'")
         prompt_alert.send_keys(test_text)
-        time.sleep(0.5)
+        pause(0.5)
         
         print("✅ Accepting prompt...")
         prompt_alert.accept()
-        time.sleep(1)
+        pause(1)
         
         result = driver.find_element(By.ID, "result").text
         print(f"✅ Result: {result}")
         
-        driver.save_screenshot("screenshots/alerts_step4_prompt.png")
+        save_screenshot(driver, "screenshots/alerts_step4_prompt.png")
         print("🎉 TEST 3 PASSED: Prompt handled with text input!")
         
         # Test 4: Prompt with Cancel
         print("\n🔘 Testing prompt Cancel...")
         prompt_button.click()
-        time.sleep(0.5)
+        pause(0.5)
         
         prompt_alert = wait.until(EC.alert_is_present())
         print("❌ Dismissing prompt (Cancel)...")
         prompt_alert.dismiss()
-        time.sleep(1)
+        pause(1)
         
         result = driver.find_element(By.ID, "result").text
         print(f"✅ Result after Cancel: {result}")
@@ -143,7 +149,7 @@ def test_alerts_handling():
         print("="*60)
         
         print("\n⏸️  Keeping browser open for 3 seconds...")
-        time.sleep(3)
+        pause(3, "keep browser open")
         
     except Exception as e:
         print(f"\n❌ ERROR: {e}")
@@ -154,11 +160,11 @@ def test_alerts_handling():
             driver.switch_to.alert.dismiss()
         except:
             pass
-        driver.save_screenshot("screenshots/alerts_error.png")
+        save_screenshot(driver, "screenshots/alerts_error.png")
         
     finally:
         print("\n🧹 Closing browser...")
-        driver.quit()
+        quit_driver(driver)
         print("✅ Test completed!\n")
 
 if __name__ == "__main__":
@@ -0,0 +1,112 @@
+"""
+Auth State Cache Tests
+Checks cookie conversion, injection and the expired-session fallback without a browser
+"""
+
+import http.cookiejar
+
+import pytest
+
+from utils import auth_cache
+from utils.auth_cache import AuthStateCache, _jar_to_cdp
+
+
+SECURE_URL = "http://site.test/secure"
+
+
+def make_cookie(name, domain="site.test", domain_specified=False, secure=False, expires=None, rest=None):
+    return http.cookiejar.Cookie(
+        0, name, "value", None, False, domain, domain_specified, False, "/", True,
+        secure, expires, False, None, None, rest or {},
+    )
+
+
+class FakeDriver:
+    """Lands on `lands_on` after every get() and records CDP commands"""
+
+    def __init__(self, lands_on=SECURE_URL):
+        self.lands_on = lands_on
+        self.current_url = None
+        self.cdp = []
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        self.cdp.append(cmd)
+        return {}
+
+    def get(self, url):
+        self.current_url = self.lands_on
+
+
+def make_cache(method="ui", max_age=600):
+    cache = AuthStateCache("http://site.test/authenticate", SECURE_URL, "user", "secret",
+                           method=method, max_age=max_age)
+    cache._cookies = [{'name': 'rack.session', 'value': 'abc', 'url': SECURE_URL}]
+    cache._captured_at = auth_cache.time.time()
+    return cache
+
+
+@pytest.mark.parametrize("attribute", ["HttpOnly", "httponly"])
+def test_http_only_in_any_spelling(attribute):
+    jar = http.cookiejar.CookieJar()
+    jar.set_cookie(make_cookie("rack.session", rest={attribute: None}))
+
+    assert _jar_to_cdp(jar)[0]['httpOnly'] is True
+
+
+def test_host_only_cookies_get_a_url_domain_cookies_a_domain():
+    jar = http.cookiejar.CookieJar()
+    jar.set_cookie(make_cookie("host", secure=True, expires=2000000000))
+    jar.set_cookie(make_cookie("shared", domain=".site.test", domain_specified=True))
+
+    cookies = {cookie['name']: cookie for cookie in _jar_to_cdp(jar)}
+
+    assert cookies['host']['url'] == "https://site.test/"
+    assert cookies['host']['expires'] == 2000000000
+    assert 'domain' not in cookies['host']
+    assert cookies['shared']['domain'] == ".site.test"
+    assert cookies['shared']['httpOnly'] is False
+
+
+def test_fresh_cookies_are_injected():
+    cache = make_cache()
+    driver = FakeDriver()
+
+    assert cache.inject(driver)
+    assert driver.cdp == ["Network.setCookies"]
+    assert cache.stats.injections == 1
+
+
+def test_stale_cookies_fall_back_to_ui_login():
+    cache = make_cache(max_age=60)
+    cache._captured_at -= 61
+    driver = FakeDriver()
+
+    assert not cache.inject(driver)
+    assert driver.cdp == []
+    assert not cache.is_fresh
+
+
+def test_stale_cookies_log_in_again_over_http(monkeypatch):
+    cache = make_cache(method="http", max_age=60)
+    cache._captured_at -= 61
+    logins = []
+
+    def login_via_http():
+        logins.append(True)
+        cache._cookies, cache._captured_at = [{'name': 'new', 'value': '1'}], auth_cache.time.time()
+        return True
+
+    monkeypatch.setattr(cache, "login_via_http", login_via_http)
+
+    assert cache.inject(FakeDriver())
+    assert logins == [True]
+
+
+def test_session_rejected_by_server_is_dropped():
+    cache = make_cache()
+    driver = FakeDriver(lands_on="http://site.test/login")
+
+    assert not cache.inject(driver)
+    assert driver.cdp == ["Network.setCookies", "Network.clearBrowserCookies"]
+    assert cache.stats.expired == 1
+    assert not cache.is_fresh
@@ -0,0 +1,43 @@
+"""
+Benchmark Comparison Tests
+Checks the statistics and the regression check of benchmarks/bench_primitives.py
+"""
+
+from benchmarks.bench_primitives import compare, metadata_differences, summarize
+
+
+def make_report(metadata=None, **p50s):
+    return {
+        'metadata': metadata or {'hostname': 'ci-1', 'commit': 'abc123'},
+        'results': {name: {'p50_ms': p50} for name, p50 in p50s.items()},
+    }
+
+
+def test_summary_percentiles_and_throughput():
+    row = summarize([0.001 * ms for ms in range(1, 101)])
+
+    assert row['iterations'] == 100
+    assert (row['p50_ms'], row['p95_ms'], row['p99_ms'], row['max_ms']) == (50.0, 95.0, 99.0, 100.0)
+    assert row['ops_per_sec'] == round(100 / 5.05, 2)
+
+
+def test_compare_flags_only_real_slowdowns():
+    baseline = make_report(click=20.0, get_text=0.2, type=10.0, session=900.0)
+    current = make_report(click=25.0, get_text=0.4, type=7.0, find_element=3.0)
+
+    statuses = {row[0]: row[4] for row in compare(baseline, current, threshold=10, min_ms=0.5)}
+
+    assert statuses == {
+        'click': 'REGRESSION',      # +25%, +5ms
+        'get_text': 'ok',           # +100% but only 0.2ms: timer noise
+        'type': 'faster',
+        'find_element': 'new',
+        'session': 'missing',
+    }
+
+
+def test_commit_is_not_a_setup_difference():
+    baseline = make_report({'hostname': 'ci-1', 'browser_version': '120', 'commit': 'abc'})
+    current = make_report({'hostname': 'ci-1', 'browser_version': '121', 'commit': 'def'})
+
+    assert metadata_differences(baseline, current) == ['browser_version']
@@ -0,0 +1,65 @@
+"""
+Browser Config Tests
+Checks profile selection and the Chrome options each profile builds
+"""
+
+import pytest
+
+from utils import browser_config
+from utils.browser_config import (
+    BROWSER_PROFILES,
+    get_blocking_policy,
+    get_chrome_options,
+    get_page_load_strategy,
+    get_profile_name,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for variable in ("SELENIUM_BROWSER_PROFILE", "SELENIUM_PAGE_LOAD", "SELENIUM_BLOCKING"):
+        monkeypatch.delenv(variable, raising=False)
+    monkeypatch.setattr(browser_config, "new_profile_dir", lambda: "/tmp/profile-test")
+
+
+def test_profile_from_argument_env_or_default(monkeypatch):
+    assert get_profile_name() == "headed-debug"
+    monkeypatch.setenv("SELENIUM_BROWSER_PROFILE", "headless-ci")
+    assert get_profile_name() == "headless-ci"
+    assert get_profile_name("headless-lean") == "headless-lean"
+
+
+def test_unknown_names_are_rejected(monkeypatch):
+    with pytest.raises(ValueError, match="Unknown browser profile 'fast'"):
+        get_profile_name("fast")
+    monkeypatch.setenv("SELENIUM_PAGE_LOAD", "lazy")
+    with pytest.raises(ValueError, match="Unknown page load strategy"):
+        get_page_load_strategy()
+    with pytest.raises(ValueError, match="Unknown blocking policy"):
+        get_blocking_policy("all")
+
+
+@pytest.mark.parametrize("profile", sorted(BROWSER_PROFILES))
+def test_options_carry_profile_switches(profile):
+    options = get_chrome_options(profile)
+
+    assert "--user-data-dir=/tmp/profile-test" in options.arguments
+    assert "--disable-save-password-bubble" in options.arguments
+    for argument in BROWSER_PROFILES[profile]:
+        assert argument in options.arguments
+    assert options.experimental_options["prefs"]["credentials_enable_service"] is False
+
+
+def test_lean_profile_is_headless_and_trimmed():
+    arguments = get_chrome_options("headless-lean").arguments
+
+    assert "--headless=new" in arguments
+    assert "--window-size=1280,800" in arguments
+    assert "--disable-extensions" in arguments
+    assert "--start-maximized" not in arguments
+
+
+def test_options_use_page_load_strategy(monkeypatch):
+    monkeypatch.setenv("SELENIUM_PAGE_LOAD", "eager")
+
+    assert get_chrome_options("headless-ci").page_load_strategy == "eager"
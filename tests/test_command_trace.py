@@ -0,0 +1,77 @@
+"""
+Command Tracing Tests
+Checks the execute wrapper, histograms and xdist merging without a browser
+"""
+
+import pytest
+
+from utils import command_trace, network
+from utils.command_trace import CommandTracer, TraceStats, histogram
+
+
+class FakeElement:
+    def __init__(self, element_id):
+        self.id = element_id
+
+
+class FakeDriver:
+    """Answers find commands with one element, everything else with a string"""
+
+    session_id = "session-1"
+
+    def execute(self, driver_command, params=None):
+        if driver_command == "findElement":
+            return {"value": FakeElement("el-1")}
+        if driver_command == "clickElement" and params["id"] == "stale":
+            raise RuntimeError("stale element reference")
+        return {"value": "ok"}
+
+
+def test_histogram_percentiles():
+    row = histogram([float(ms) for ms in range(1, 101)], size=10)
+
+    assert (row["count"], row["total_ms"]) == (100, 5050.0)
+    assert (row["p50_ms"], row["p95_ms"], row["p99_ms"]) == (50.0, 95.0, 99.0)
+
+
+def test_tracer_records_commands_with_locators(monkeypatch):
+    monkeypatch.setattr(command_trace, "stats", TraceStats())
+    monkeypatch.setattr(network, "current_test", "tests/test_x.py::test_a")
+    driver = FakeDriver()
+    CommandTracer(driver)
+
+    driver.execute("findElement", {"using": "css selector", "value": "#login button"})
+    driver.execute("clickElement", {"id": "el-1"})
+    with pytest.raises(RuntimeError):
+        driver.execute("clickElement", {"id": "stale"})
+
+    commands = command_trace.stats.by_test["tests/test_x.py::test_a"]
+    assert len(commands["findElement"][0]) == 1
+    assert len(commands["clickElement"][0]) == 2
+    locators = {locator for _, _, locator in command_trace.stats.slowest["tests/test_x.py::test_a"]}
+    assert locators == {"css selector=#login button", ""}
+    assert "session-1" in command_trace.stats.by_session
+
+
+def test_disabled_tracing_leaves_driver_untouched(monkeypatch):
+    monkeypatch.delenv("SELENIUM_TRACE_COMMANDS", raising=False)
+    driver = FakeDriver()
+
+    assert command_trace.attach(driver) is None
+    assert "execute" not in vars(driver)
+
+
+def test_worker_stats_merge_into_json_and_html():
+    stats = TraceStats()
+    stats.record("t1", "s1", "findElement", "id=username", 5.0, 100)
+    worker = TraceStats()
+    worker.record("t1", "s2", "findElement", "id=password", 15.0, 100)
+
+    stats.merge(worker.as_dict())
+    report = stats.to_json()
+
+    assert report["commands"]["findElement"]["count"] == 2
+    assert report["tests"]["t1"]["slowest"][0]["locator"] == "id=password"
+    assert set(report["sessions"]) == {"s1", "s2"}
+    assert "id=password" in stats.html_table("t1")
+    assert stats.html_table("t2") == ""
@@ -0,0 +1,93 @@
+"""
+MutationObserver Wait Tests
+Checks how ObserverWait handles script results without a browser
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.common.by import By
+
+from utils.dom_waits import RECHECK_MS, ObserverWait, presence_of_element_located
+
+
+HEADING = (By.TAG_NAME, "h2")
+
+
+class FakeDriver:
+    """Answers execute_async_script with a canned result (or error)"""
+
+    def __init__(self, script_result=None, script_error=None, element="<h2>", script_timeout=30):
+        self.script_result = script_result
+        self.script_error = script_error
+        self.element = element
+        self.find_calls = 0
+        self.scripts = []
+        self.timeouts = SimpleNamespace(script=script_timeout)
+        self.script_timeouts = []
+
+    def set_script_timeout(self, seconds):
+        self.script_timeouts.append(seconds)
+        self.timeouts.script = seconds
+
+    def execute_async_script(self, script, *args):
+        self.scripts.append((script, args))
+        if self.script_error:
+            raise self.script_error
+        return self.script_result
+
+    def find_element(self, by, value):
+        self.find_calls += 1
+        return self.element
+
+
+def test_observer_result_is_returned_without_polling():
+    driver = FakeDriver(script_result={"ok": True, "value": "<h2 from page>"})
+
+    element = ObserverWait(driver, 1).until(presence_of_element_located(HEADING))
+
+    assert element == "<h2 from page>"
+    assert driver.find_calls == 0
+
+
+def test_observer_timeout_raises_timeout_exception():
+    driver = FakeDriver(script_result={"ok": False, "timeout": True})
+
+    with pytest.raises(TimeoutException):
+        ObserverWait(driver, 1).until(presence_of_element_located(HEADING))
+
+
+def test_blocked_script_falls_back_to_polling():
+    driver = FakeDriver(script_error=JavascriptException("scripts are blocked"))
+
+    element = ObserverWait(driver, 1).until(presence_of_element_located(HEADING))
+
+    assert element == "<h2>"
+    assert driver.find_calls == 1
+
+
+def test_in_page_script_never_polls_per_frame():
+    driver = FakeDriver(script_result={"ok": True, "value": "<h2 from page>"})
+
+    ObserverWait(driver, 1).until(presence_of_element_located(HEADING))
+
+    script, args = driver.scripts[0]
+    assert "requestAnimationFrame" not in script
+    assert args[-1] == RECHECK_MS    # coarse re-check, visibility/clickable only
+
+
+def test_session_script_timeout_is_never_lowered():
+    driver = FakeDriver(script_result={"ok": True, "value": "<h2 from page>"})
+
+    ObserverWait(driver, 10).until(presence_of_element_located(HEADING))
+
+    assert driver.script_timeouts == []
+
+
+def test_raised_script_timeout_is_restored():
+    driver = FakeDriver(script_error=JavascriptException("scripts are blocked"), script_timeout=5)
+
+    ObserverWait(driver, 10).until(presence_of_element_located(HEADING))
+
+    assert driver.script_timeouts == [12, 5]
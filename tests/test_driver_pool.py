@@ -0,0 +1,113 @@
+"""
+Driver Pool Tests
+Checks the pool and pre-warm bookkeeping without a real browser
+"""
+
+from utils.driver_pool import DriverPool
+from utils.driver_prewarm import DriverPrewarmer
+
+
+class FakeDriver:
+    """Stand-in for a WebDriver - only quit() is used by the pool"""
+
+    def __init__(self):
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+def make_pool(size=1, max_uses=0, reset=lambda driver: None):
+    launched = []
+
+    def factory():
+        driver = FakeDriver()
+        launched.append(driver)
+        return driver
+
+    return DriverPool(factory=factory, size=size, max_uses=max_uses, reset=reset), launched
+
+
+def test_warm_pool_serves_hits():
+    pool, launched = make_pool(size=1)
+    pool.warm()
+
+    for _ in range(3):
+        driver = pool.acquire()
+        pool.release(driver)
+
+    assert len(launched) == 1
+    assert pool.stats.hits == 3
+    assert pool.stats.misses == 0
+    assert pool.stats.resets == 3
+
+
+def test_empty_pool_counts_miss():
+    pool, launched = make_pool(size=1)
+
+    driver = pool.acquire()
+
+    assert driver is launched[0]
+    assert pool.stats.misses == 1
+
+
+def test_browser_recycled_after_max_uses():
+    pool, launched = make_pool(size=1, max_uses=2)
+    pool.warm()
+
+    for _ in range(3):
+        pool.release(pool.acquire())
+
+    assert launched[0].quit_called
+    assert len(launched) == 2
+    assert pool.stats.recycled == 1
+
+
+def test_failed_reset_recycles_browser():
+    def broken_reset(driver):
+        raise RuntimeError("session is gone")
+
+    pool, launched = make_pool(size=1, reset=broken_reset)
+    pool.warm()
+
+    pool.release(pool.acquire())
+
+    assert launched[0].quit_called
+    assert pool.stats.reset_failures == 1
+    assert pool.stats.recycled == 1
+
+    pool.acquire()
+    assert pool.stats.misses == 1
+
+
+def test_close_quits_idle_browsers():
+    pool, launched = make_pool(size=2)
+    pool.warm()
+
+    pool.close()
+
+    assert all(driver.quit_called for driver in launched)
+
+
+def test_prewarmer_launches_next_browser_ahead():
+    launched = []
+    disposed = []
+
+    def factory():
+        driver = FakeDriver()
+        launched.append(driver)
+        return driver
+
+    prewarmer = DriverPrewarmer(factory=factory, dispose=disposed.append)
+    prewarmer.start()
+
+    first = prewarmer.acquire()
+    prewarmer.release(first)
+    second = prewarmer.acquire()
+    prewarmer.release(second)
+    prewarmer.close()
+
+    assert first is not second
+    assert len(launched) == 3  # two handed out + one launched ahead
+    assert set(map(id, disposed)) == set(map(id, launched))
+    assert prewarmer.stats.handed_out == 2
@@ -0,0 +1,124 @@
+"""
+Shared chromedriver Service Tests
+Checks spawn reuse, shutdown, the driver path cache and its invalidation without chromedriver
+"""
+
+import os
+
+import pytest
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.chrome.options import Options
+
+from utils import driver_factory, driver_service
+from utils.driver_service import ServiceStats, SharedService, resolve_driver_path
+
+
+class FakeProcess:
+    def __init__(self):
+        self.running = True
+
+    def poll(self):
+        return None if self.running else 0
+
+
+class FakeSeleniumManager:
+    """Hands out a new executable driver path on every lookup"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.lookups = 0
+
+    def __call__(self):
+        return self
+
+    def driver_location(self, options):
+        self.lookups += 1
+        path = self.directory / f"chromedriver-{self.lookups}"
+        path.write_text("")
+        path.chmod(0o755)
+        return str(path)
+
+
+@pytest.fixture(autouse=True)
+def fake_service(tmp_path, monkeypatch):
+    """Service.start()/stop() only flip a fake process; lookups are counted"""
+    def start(self):
+        self.process = FakeProcess()
+
+    def stop(self):
+        self.process.running = False
+
+    monkeypatch.setattr(driver_service.Service, "start", start)
+    monkeypatch.setattr(driver_service.Service, "stop", stop)
+    monkeypatch.setattr(driver_service.Service, "is_connectable", lambda self: True)
+    monkeypatch.setattr(driver_service, "stats", ServiceStats())
+    monkeypatch.setattr(driver_service, "_shared_service", None)
+    monkeypatch.setenv("SELENIUM_DRIVER_CACHE", str(tmp_path / "drivers.json"))
+    monkeypatch.delenv("SELENIUM_CHROMEDRIVER", raising=False)
+    manager = FakeSeleniumManager(tmp_path)
+    monkeypatch.setattr(driver_service, "SeleniumManager", manager)
+    return manager
+
+
+def test_sessions_reuse_the_running_service():
+    service = SharedService(executable_path="chromedriver")
+
+    for _ in range(3):
+        service.start()
+        service.stop()    # driver.quit() must not stop the shared process
+
+    assert service.process.running
+    assert driver_service.stats.sessions == 3
+    assert driver_service.stats.spawns == 1
+
+
+def test_shutdown_stops_and_next_start_respawns():
+    service = SharedService(executable_path="chromedriver")
+    service.start()
+
+    service.shutdown()
+    assert not service.process.running
+    service.start()
+
+    assert service.process.running
+    assert driver_service.stats.spawns == 2
+
+
+def test_driver_path_is_cached_on_disk(fake_service):
+    options = Options()
+
+    first = resolve_driver_path(options)
+    second = resolve_driver_path(options)
+
+    assert first == second
+    assert fake_service.lookups == 1
+    assert driver_service.stats.cache_hits == 1
+    assert resolve_driver_path(options, refresh=True) != first
+
+
+def test_explicit_driver_path_skips_lookup(fake_service, monkeypatch):
+    monkeypatch.setenv("SELENIUM_CHROMEDRIVER", "/opt/chromedriver")
+
+    assert resolve_driver_path(None) == "/opt/chromedriver"
+    assert fake_service.lookups == 0
+
+
+def test_session_not_created_refreshes_driver_path(fake_service, monkeypatch):
+    options = Options()
+    stale = resolve_driver_path(options)
+    services = []
+
+    def chrome(options, service):
+        services.append(service)
+        if len(services) == 1:
+            raise SessionNotCreatedException("This version of ChromeDriver only supports Chrome 120")
+        return "driver"
+
+    monkeypatch.setattr(driver_factory.webdriver, "Chrome", chrome)
+    monkeypatch.setenv("SELENIUM_SHARED_SERVICE", "1")
+
+    assert driver_factory._launch(options) == "driver"
+    assert services[0].path == stale
+    assert services[1].path != stale
+    assert fake_service.lookups == 2
+    assert os.path.basename(resolve_driver_path(options)) == "chromedriver-2"
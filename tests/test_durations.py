@@ -0,0 +1,102 @@
+"""
+Duration Store and Scheduler Tests
+Checks the history, the LPT plan and the xdist scheduler without workers
+"""
+
+from types import SimpleNamespace
+
+from utils.durations import DurationRecorder, DurationStore, HistoryScheduling, plan_units, predict_makespan
+
+
+def make_report(nodeid, when, duration, skipped=False, user_properties=()):
+    return SimpleNamespace(nodeid=nodeid, when=when, duration=duration,
+                           skipped=skipped, user_properties=list(user_properties))
+
+
+class FakeConfig:
+    def getvalue(self, name):
+        return ["2*popen"]
+
+    def getoption(self, name):
+        return None
+
+
+class FakeNode:
+    """Records what the scheduler sends to one xdist worker"""
+
+    def __init__(self, name):
+        self.gateway = SimpleNamespace(id=name)
+        self.shutting_down = False
+        self.sent = []
+
+    def send_runtest_some(self, indices):
+        self.sent.extend(indices)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+def make_store(tmp_path, tests):
+    store = DurationStore(str(tmp_path / "durations.json"))
+    for nodeid, seconds, affinity in tests:
+        store.record(nodeid, seconds, affinity)
+    return store
+
+
+def test_recorder_sums_phases_and_skips_skipped_tests(tmp_path):
+    recorder = DurationRecorder()
+    for when, duration in (("setup", 1.0), ("call", 5.0), ("teardown", 0.5)):
+        recorder.add_report(make_report("t::a", when, duration, user_properties=[("browser_affinity", "logged-in")]))
+    recorder.add_report(make_report("t::b", "setup", 0.1, skipped=True))
+    recorder.add_report(make_report("t::b", "teardown", 0.0))
+
+    assert recorder.save(str(tmp_path / "durations.json")) == 1
+
+    store = DurationStore(str(tmp_path / "durations.json"))
+    assert store.predict("t::a") == 6.5
+    assert store.affinity("t::a") == "logged-in"
+    assert store.predict("t::b") is None
+
+
+def test_durations_are_smoothed_over_runs(tmp_path):
+    store = make_store(tmp_path, [("t::a", 10.0, None), ("t::a", 20.0, None)])
+
+    assert store.predict("t::a") == 15.0
+    assert store.tests["t::a"]["runs"] == 2
+
+
+def test_plan_is_longest_first_and_keeps_affinity_groups_within_a_share(tmp_path):
+    store = make_store(tmp_path, [
+        ("t::short", 2.0, None),
+        ("t::long", 30.0, None),
+        ("t::login1", 4.0, "logged-in"),
+        ("t::login2", 4.0, "logged-in"),
+        ("t::login3", 30.0, "logged-in"),
+    ])
+    nodeids = ["t::short", "t::long", "t::login1", "t::login2", "t::login3", "t::new"]
+
+    units = plan_units(nodeids, store, workers=2)
+
+    # share = (2 + 30 + 4 + 4 + 30 + 4 for the unknown test at the median) / 2 = 37
+    assert [indices for _, indices in units] == [[1], [4], [2, 3], [5], [0]]
+    assert predict_makespan(units, 2) == [38.0, 36.0]
+
+
+def test_scheduler_hands_out_whole_units_longest_first(tmp_path):
+    store = make_store(tmp_path, [("t::a", 1.0, None), ("t::b", 9.0, None), ("t::c", 5.0, None),
+                                  ("t::d", 3.0, "shop"), ("t::e", 3.0, "shop")])
+    scheduler = HistoryScheduling(FakeConfig(), store=store)
+    gw0, gw1 = FakeNode("gw0"), FakeNode("gw1")
+    for node in (gw0, gw1):
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, ["t::a", "t::b", "t::c", "t::d", "t::e"])
+
+    scheduler.schedule()
+
+    assert gw0.sent == [1, 3, 4]          # t::b, then the "shop" unit
+    assert gw1.sent == [2, 0]             # t::c, t::a
+    assert scheduler.stats.predicted == [11.0, 10.0]
+
+    scheduler.mark_test_complete(gw0, 1, 9.0)
+    assert gw0.shutting_down and gw1.shutting_down
+    assert scheduler.stats.by_worker["gw0"][:2] == [1, 9.0]
@@ -0,0 +1,71 @@
+"""
+Event Log Tests
+Checks per-test buffering, the JSONL writer and print capture
+"""
+
+import json
+import sys
+
+import pytest
+
+from utils import events, network
+from utils.events import EventStats
+
+
+@pytest.fixture
+def enabled(monkeypatch, tmp_path):
+    monkeypatch.setenv("SELENIUM_EVENTS", "1")
+    monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+    monkeypatch.setenv("SELENIUM_EVENT_LOG", str(tmp_path / "events.jsonl"))
+    monkeypatch.setattr(events, "stats", EventStats())
+    monkeypatch.setattr(events, "_buffers", {})
+    monkeypatch.setattr(network, "current_test", "tests/test_x.py::test_a")
+    yield tmp_path / "events.jsonl"
+    events.close()
+
+
+def test_disabled_events_are_plain_prints(monkeypatch, capsys):
+    monkeypatch.delenv("SELENIUM_EVENTS", raising=False)
+
+    events.info("✅ Clicked logout button", locator="#logout")
+    events.debug("not shown")
+
+    assert capsys.readouterr().out == "✅ Clicked logout button\n"
+
+
+def test_records_are_buffered_per_test_and_written_as_jsonl(enabled, capsys):
+    events.info("\n🔧 Setting up Chrome driver...")
+    events.warning("⚠️  Banner not found", locator="flash")
+    events.close()
+
+    assert capsys.readouterr().out == ""
+    lines = [json.loads(line) for line in enabled.read_text().splitlines()]
+    assert [line["message"] for line in lines] == ["🔧 Setting up Chrome driver...", "⚠️  Banner not found"]
+    assert lines[1]["fields"] == {"locator": "flash"}
+    assert [r["level"] for r in events.records_for("tests/test_x.py::test_a")] == ["info", "warning"]
+    events.end_test("tests/test_x.py::test_a")
+    assert events.records_for("tests/test_x.py::test_a") == []
+    assert events.stats.by_level == {"info": 1, "warning": 1}
+
+
+def test_prints_become_records(enabled):
+    original = sys.stdout
+    with events.capture_prints():
+        print("📍 Step 1", "done")
+        print("partial", end="")
+
+    assert sys.stdout is original
+    records = events.records_for("tests/test_x.py::test_a")
+    assert [(r["message"], r["fields"]) for r in records] == [
+        ("📍 Step 1 done", {"source": "print"}), ("partial", {"source": "print"})]
+
+
+def test_console_echo_from_the_chosen_level(enabled, monkeypatch, capsys):
+    monkeypatch.setenv("SELENIUM_EVENT_CONSOLE", "warning")
+    monkeypatch.setattr(sys, "__stdout__", sys.stdout)
+
+    events.info("quiet")
+    events.error("❌ loud", code=3)
+
+    out = capsys.readouterr().out
+    assert "quiet" not in out and "ERROR   ❌ loud  [code=3]" in out
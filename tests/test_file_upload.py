@@ -3,20 +3,26 @@ Selenium Test - File Upload
 Learn how to upload files using Selenium.
 """
 
-from selenium import webdriver
+import sys
+import os
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 import time
-import os
+
+from utils.driver_factory import create_driver, quit_driver
+from utils.pacing import pause, page_ready
+from utils.screenshots import save_screenshot
+from utils.site import site_url
 
 def test_file_upload():
     print("\n🚀 Starting test: File Upload")
     
-    chrome_options = Options()
-    chrome_options.add_argument('--start-maximized')
-    driver = webdriver.Chrome(options=chrome_options)
+    driver = create_driver()
     wait = WebDriverWait(driver, 10)
     
     try:
@@ -40,13 +46,13 @@ def test_file_upload():
         print("TEST 1: Simple File Upload")
         print("="*60)
         
-        driver.get("https://the-internet.herokuapp.com/upload")
-        time.sleep(2)
+        driver.get(site_url("/upload"))
+        pause(2, "page load", until=page_ready(driver))
         
         print(f"✅ Page loaded: {driver.title}")
         print(f"📍 URL: {driver.current_url}")
         
-        driver.save_screenshot("screenshots/upload_step1_page.png")
+        save_screenshot(driver, "screenshots/upload_step1_page.png")
         
         # Find file input element
         print("\n🔍 Finding file input element...")
@@ -58,17 +64,17 @@ def test_file_upload():
         file_input.send_keys(test_file_path)
         print("✅ File path sent to input!")
         
-        time.sleep(1)
-        driver.save_screenshot("screenshots/upload_step2_file_selected.png")
+        pause(1)
+        save_screenshot(driver, "screenshots/upload_step2_file_selected.png")
         
         # Click upload button
         print("\n🔘 Clicking Upload button...")
         upload_button = driver.find_element(By.ID, "file-submit")
         upload_button.click()
-        time.sleep(2)
+        pause(2)
         
         print("✅ Upload button clicked!")
-        driver.save_screenshot("screenshots/upload_step3_uploaded.png")
+        save_screenshot(driver, "screenshots/upload_step3_uploaded.png")
         
         # Verify upload success
         print("\n✅ Verifying upload...")
@@ -126,15 +132,15 @@ def test_file_upload():
         for file_type, file_path in test_files:
             print(f"\n📤 Uploading {file_type} file...")
             
-            driver.get("https://the-internet.herokuapp.com/upload")
-            time.sleep(1)
+            driver.get(site_url("/upload"))
+            pause(1, "page load", until=page_ready(driver))
             
             file_input = driver.find_element(By.ID, "file-upload")
             file_input.send_keys(file_path)
             
             upload_button = driver.find_element(By.ID, "file-submit")
             upload_button.click()
-            time.sleep(2)
+            pause(2)
             
             uploaded_file = driver.find_element(By.ID, "uploaded-files")
             filename = os.path.basename(file_path)
@@ -144,7 +150,7 @@ def test_file_upload():
             else:
                 print(f"  ⚠️  {file_type} upload verification failed")
             
-            driver.save_screenshot(f"screenshots/upload_{file_type.lower()}.png")
+            save_screenshot(driver, f"screenshots/upload_{file_type.lower()}.png")
         
         print("\n🎉 TEST 2 PASSED: Multiple file types uploaded!")
         
@@ -153,8 +159,8 @@ def test_file_upload():
         print("TEST 3: File Input Element Properties")
         print("="*60)
         
-        driver.get("https://the-internet.herokuapp.com/upload")
-        time.sleep(1)
+        driver.get(site_url("/upload"))
+        pause(1, "page load", until=page_ready(driver))
         
         file_input = driver.find_element(By.ID, "file-upload")
         
@@ -187,17 +193,17 @@ def test_file_upload():
         print("  • Some sites restrict file types")
         
         print("\n⏸️  Keeping browser open for 5 seconds...")
-        time.sleep(5)
+        pause(5, "keep browser open")
         
     except Exception as e:
         print(f"\n❌ ERROR: {e}")
         import traceback
         traceback.print_exc()
-        driver.save_screenshot("screenshots/upload_error.png")
+        save_screenshot(driver, "screenshots/upload_error.png")
         
     finally:
         print("\n🧹 Closing browser...")
-        driver.quit()
+        quit_driver(driver)
         print("✅ Test completed!\n")
 
 if __name__ == "__main__":
@@ -3,20 +3,26 @@
 Selenium Test - Handling iFrames (Fixed)
 """
 
-from selenium import webdriver
+import sys
+import os
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-import time
+
+from utils.driver_factory import create_driver, quit_driver
+from utils.pacing import pause, page_ready
+from utils.screenshots import save_screenshot
+from utils.site import site_url
 
 def test_iframe_handling():
     print("\n🚀 Starting test: iFrame Handling")
     
-    chrome_options = Options()
-    chrome_options.add_argument('--start-maximized')
-    driver = webdriver.Chrome(options=chrome_options)
+    driver = create_driver()
     wait = WebDriverWait(driver, 10)
     
     try:
@@ -25,11 +31,11 @@ def test_iframe_handling():
         print("TEST 1: Simple iFrame")
         print("="*60)
         
-        driver.get("https://the-internet.herokuapp.com/iframe")
-        time.sleep(2)
+        driver.get(site_url("/iframe"))
+        pause(2, "page load", until=page_ready(driver))
         
         print(f"✅ Page loaded: {driver.title}")
-        driver.save_screenshot("screenshots/iframe_step1_page.png")
+        save_screenshot(driver, "screenshots/iframe_step1_page.png")
         
         # Switch to iframe
         print("\n🔄 Switching to iframe...")
@@ -50,13 +56,13 @@ def test_iframe_handling():
         print("⌨️  Setting new text using JavaScript...")
         new_text = "Hello from Selenium! This is inside an iframe!"
         driver.execute_script(f"arguments[0].innerHTML = '{new_text}'", text_editor)
-        time.sleep(1)
+        pause(1)
         
         # Verify text was set
         updated_text = text_editor.text
         print(f"✅ Updated text: '{updated_text}'")
         
-        driver.save_screenshot("screenshots/iframe_step2_typed.png")
+        save_screenshot(driver, "screenshots/iframe_step2_typed.png")
         
         # Switch back to main content
         print("\n🔄 Switching back to main content...")
@@ -74,11 +80,11 @@ def test_iframe_handling():
         print("TEST 2: Nested Frames")
         print("="*60)
         
-        driver.get("https://the-internet.herokuapp.com/nested_frames")
-        time.sleep(2)
+        driver.get(site_url("/nested_frames"))
+        pause(2, "page load", until=page_ready(driver))
         
         print(f"✅ Page loaded: {driver.title}")
-        driver.save_screenshot("screenshots/iframe_step3_nested.png")
+        save_screenshot(driver, "screenshots/iframe_step3_nested.png")
         
         # Switch to top frame
         print("\n🔄 Switching to TOP frame...")
@@ -117,7 +123,7 @@ def test_iframe_handling():
         bottom_text = driver.find_element(By.TAG_NAME, "body").text
         print(f"✅ Text in BOTTOM frame: '{bottom_text}'")
         
-        driver.save_screenshot("screenshots/iframe_step4_all_frames.png")
+        save_screenshot(driver, "screenshots/iframe_step4_all_frames.png")
         
         print("\n🎉 TEST 2 PASSED: All nested frames accessed!")
         
@@ -133,15 +139,15 @@ def test_iframe_handling():
         print("="*60)
         
         print("\n⏸️  Keeping browser open for 5 seconds...")
-        time.sleep(5)
+        pause(5, "keep browser open")
         
     except Exception as e:
         print(f"\n❌ ERROR: {e}")
-        driver.save_screenshot("screenshots/iframe_error.png")
+        save_screenshot(driver, "screenshots/iframe_error.png")
         
     finally:
         print("\n🧹 Closing browser...")
-        driver.quit()
+        quit_driver(driver)
         print("✅ Test completed!\n")
 
 if __name__ == "__main__":
@@ -3,34 +3,39 @@ Selenium Test - Login on Herokuapp (No Cloudflare!)
 This site is perfect for learning Selenium!
 """
 
-from selenium import webdriver
+import sys
+import os
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-import time
+
+from utils.driver_factory import create_driver, quit_driver
+from utils.pacing import pause, page_ready
+from utils.screenshots import save_screenshot
+from utils.site import site_url
 
 def test_herokuapp_login():
     print("\n🚀 Starting test: Herokuapp Login")
     
     # Setup Chrome
     print("📝 Setting up Chrome driver...")
-    chrome_options = Options()
-    chrome_options.add_argument('--start-maximized')
-    
-    driver = webdriver.Chrome(options=chrome_options)
+    driver = create_driver()
     wait = WebDriverWait(driver, 10)
     
     try:
         # Step 1: Open the test site
         print("\n🌐 Opening Herokuapp login page...")
-        driver.get("https://the-internet.herokuapp.com/login")
-        time.sleep(2)
+        driver.get(site_url("/login"))
+        pause(2, "page load", until=page_ready(driver))
         
         print(f"✅ Page loaded! Title: {driver.title}")
         print(f"📍 URL: {driver.current_url}")
         
-        driver.save_screenshot("screenshots/login_step1_page.png")
+        save_screenshot(driver, "screenshots/login_step1_page.png")
         print("📸 Screenshot: login_step1_page.png")
         
         # Step 2: Find username field
@@ -52,8 +57,8 @@ def test_herokuapp_login():
         password_field.clear()
         password_field.send_keys("SuperSecretPassword!")
         
-        time.sleep(1)
-        driver.save_screenshot("screenshots/login_step2_credentials.png")
+        pause(1)
+        save_screenshot(driver, "screenshots/login_step2_credentials.png")
         print("📸 Screenshot: login_step2_credentials.png")
         
         # Step 5: Click login button
@@ -62,8 +67,8 @@ def test_herokuapp_login():
         login_button.click()
         print("✅ Clicked login button!")
         
-        time.sleep(2)
-        driver.save_screenshot("screenshots/login_step3_result.png")
+        pause(2)
+        save_screenshot(driver, "screenshots/login_step3_result.png")
         print("📸 Screenshot: login_step3_result.png")
         
         # Step 6: Verify successful login
@@ -94,19 +99,19 @@ def test_herokuapp_login():
             print("⚠️  Logout button not found")
         
         print("\n⏸️  Keeping browser open for 5 seconds...")
-        time.sleep(5)
+        pause(5, "keep browser open")
         
     except Exception as e:
         print(f"\n❌ ERROR: {e}")
         try:
-            driver.save_screenshot("screenshots/error.png")
+            save_screenshot(driver, "screenshots/error.png")
             print("📸 Error screenshot saved")
         except:
             pass
         
     finally:
         print("\n🧹 Closing browser...")
-        driver.quit()
+        quit_driver(driver)
         print("✅ Test completed!")
         print("\n💡 Check screenshots/ folder to see the test execution!\n")
 
@@ -0,0 +1,92 @@
+"""
+Record/Replay Cache Tests
+Exercises the on-disk cache and the handler decisions without a browser
+"""
+
+import os
+
+from utils import http_replay, network
+from utils.http_replay import ReplayCache, ReplayHandler, ReplayStats
+from utils.network import BLOCK, InterceptedRequest, InterceptedResponse
+
+
+def make_request(url, test="tests/test_x.py::test_a"):
+    return InterceptedRequest(url, "GET", resource_type="Document", test=test)
+
+
+def test_store_and_load_round_trip(tmp_path):
+    cache = ReplayCache(str(tmp_path))
+    response = InterceptedResponse(200, [("Content-Type", "text/html"), ("Content-Encoding", "gzip")], b"<h2>Login</h2>")
+
+    cache.store("GET", "https://example.test/login", None, response)
+    loaded = cache.load("GET", "https://example.test/login")
+
+    assert loaded.status == 200
+    assert loaded.body == b"<h2>Login</h2>"
+    assert loaded.headers == [("Content-Type", "text/html")]   # body is stored decoded
+    assert cache.load("POST", "https://example.test/login") is None
+
+
+def test_identical_bodies_are_stored_once(tmp_path):
+    cache = ReplayCache(str(tmp_path))
+    logo = InterceptedResponse(200, [], b"\x89PNG same bytes")
+
+    cache.store("GET", "https://example.test/a/logo.png", None, logo)
+    cache.store("GET", "https://example.test/b/logo.png", None, logo)
+
+    bodies = [name for _, _, files in os.walk(tmp_path / "bodies") for name in files]
+    assert len(bodies) == 1
+    assert len(os.listdir(tmp_path / "entries")) == 2
+
+
+def test_replay_serves_hits_and_passes_misses(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_replay, "stats", ReplayStats())
+    cache = ReplayCache(str(tmp_path))
+    cache.store("GET", "https://example.test/", None, InterceptedResponse(200, [], b"home"))
+    handler = ReplayHandler("replay", cache)
+
+    assert handler.on_request(make_request("https://example.test/")).body == b"home"
+    assert handler.on_request(make_request("https://example.test/new")) is None
+    assert http_replay.stats.for_test("tests/test_x.py::test_a") == (1, 1, 4)
+
+
+def test_strict_mode_blocks_and_remembers_unrecorded_urls(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_replay, "stats", ReplayStats())
+    handler = ReplayHandler("strict", ReplayCache(str(tmp_path)))
+
+    assert handler.on_request(make_request("https://example.test/missing")) is BLOCK
+    assert http_replay.pop_unrecorded("tests/test_x.py::test_a") == ["https://example.test/missing"]
+    assert http_replay.pop_unrecorded("tests/test_x.py::test_a") == []
+
+
+def test_record_mode_stores_responses(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_replay, "stats", ReplayStats())
+    cache = ReplayCache(str(tmp_path))
+    handler = ReplayHandler("record", cache)
+
+    assert handler.wants_responses and not handler.wants_requests
+    handler.on_response(make_request("https://example.test/"), InterceptedResponse(200, [], b"home"))
+
+    assert cache.load("GET", "https://example.test/").body == b"home"
+    assert http_replay.stats.recorded == 1
+
+
+def test_stats_merge_per_test():
+    stats = ReplayStats()
+    stats.record_lookup("t1", True, 100)
+    other = ReplayStats()
+    other.record_lookup("t1", False)
+    other.record_lookup("t2", True, 50)
+
+    stats.merge(other.as_dict())
+
+    assert stats.for_test("t1") == (1, 1, 100)
+    assert stats.for_test("t2") == (1, 0, 50)
+    assert stats.hit_rate == 2 / 3
+
+
+def test_nothing_is_attached_when_features_are_off(monkeypatch):
+    monkeypatch.delenv("SELENIUM_REPLAY", raising=False)
+
+    assert http_replay.replay_handler() is None
+    assert network.attach(object(), [None]) is None
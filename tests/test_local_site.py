@@ -0,0 +1,101 @@
+"""
+Local Site Tests
+Talks to the bundled the-internet copy over plain HTTP (no browser)
+"""
+
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from pages.login_page import LoginPage
+from pages.secure_page import SecurePage
+from utils.auth_cache import AuthStateCache
+from utils.local_site import LocalSite
+from utils.site import site_url
+
+
+@pytest.fixture(scope="module")
+def site():
+    with LocalSite(dynamic_delay_ms=250) as site:
+        yield site
+
+
+def fetch(url, data=None, headers=None):
+    """GET (or POST `data`) like a browser would: follow redirects, keep cookies"""
+    opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor())
+    request = urllib.request.Request(url, data=data, headers=headers or {})
+    with opener.open(request, timeout=5) as response:
+        return response.geturl(), response.read().decode("utf-8")
+
+
+def test_site_url_follows_base_url_setting(monkeypatch):
+    monkeypatch.setenv("SELENIUM_BASE_URL", "http://127.0.0.1:9999/")
+
+    assert site_url("/checkboxes") == "http://127.0.0.1:9999/checkboxes"
+    assert LoginPage.URL == "http://127.0.0.1:9999/login"
+    assert SecurePage.URL == "http://127.0.0.1:9999/secure"
+
+
+def test_pages_keep_the_ids_tests_rely_on(site):
+    _, login = fetch(site.url("/login"))
+    assert 'id="username"' in login and 'id="password"' in login
+    assert '<title>The Internet</title>' in login
+
+    _, dynamic = fetch(site.url("/dynamic_loading/1"))
+    assert "startLoading(250," in dynamic
+
+
+def test_http_login_with_auth_cache(site):
+    cache = AuthStateCache(site.url("/authenticate"), site.url("/secure"),
+                           "tomsmith", "SuperSecretPassword!")
+
+    assert cache.login_via_http()
+    assert cache.is_fresh
+    assert cache.stats.http_logins == 1
+
+
+def test_wrong_password_shows_error_flash(site):
+    landed, body = fetch(site.url("/authenticate"), data=b"username=tomsmith&password=nope")
+
+    assert landed.endswith("/login")
+    assert 'class="flash error"' in body
+    assert "Your password is invalid!" in body
+
+
+def test_secure_page_requires_login(site):
+    landed, body = fetch(site.url("/secure"))
+
+    assert landed.endswith("/login")
+    assert "You must login to view the secure area!" in body
+
+
+def test_upload_echoes_file_name(site):
+    boundary = "----selenium-mastery"
+    body = (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="test_upload.txt"\r\n'
+        "Content-Type: text/plain\r\n\r\n"
+        "hello\r\n"
+        f"--{boundary}--\r\n"
+    ).encode("utf-8")
+
+    _, page = fetch(site.url("/upload"), data=body,
+                    headers={"Content-Type": f"multipart/form-data; boundary={boundary}"})
+
+    assert "File Uploaded!" in page
+    assert "test_upload.txt" in page
+
+
+def test_latency_is_added_to_every_response():
+    with LocalSite(latency_ms=150) as slow_site:
+        start = time.perf_counter()
+        fetch(slow_site.url("/"))
+        assert time.perf_counter() - start >= 0.15
+
+
+def test_unknown_page_is_404(site):
+    with pytest.raises(urllib.error.HTTPError) as error:
+        fetch(site.url("/does-not-exist"))
+    assert error.value.code == 404
@@ -9,13 +9,12 @@ import os
 # Add project root to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from selenium import webdriver
-import time
-
 # Import page objects
 from pages.login_page import LoginPage
 from pages.secure_page import SecurePage
-from utils.browser_config import get_chrome_options
+from utils.driver_factory import create_driver, quit_driver
+from utils.pacing import pause
+from utils.screenshots import save_screenshot
 
 
 def test_successful_login_with_pom():
@@ -24,7 +23,7 @@ def test_successful_login_with_pom():
     print("\n🚀 Starting Test: Login with POM")
     
     # Setup - use configured Chrome options
-    driver = webdriver.Chrome(options=get_chrome_options())
+    driver = create_driver()
     
     try:
         # Step 1: Navigate to login page
@@ -49,7 +48,7 @@ def test_successful_login_with_pom():
         print("\n🔍 Checking for password manager pop-up...")
         secure_page.dismiss_password_manager_popup()
         
-        time.sleep(2)
+        pause(2)
         
         # Step 3: Verify successful login
         print("\n✅ Step 3: Verifying login success...")
@@ -78,7 +77,7 @@ def test_successful_login_with_pom():
         print("\n🔍 Checking for password manager pop-up after logout...")
         login_page.dismiss_password_manager_popup()
         
-        time.sleep(2)
+        pause(2)
         
         # Verify we're back on login page
         assert "Login Page" in login_page.get_page_heading()
@@ -88,23 +87,23 @@ def test_successful_login_with_pom():
         
         print("\n🎉 TEST PASSED! POM makes tests so clean!")
         
-        time.sleep(3)
+        pause(3)
         
     except AssertionError as e:
         print(f"\n❌ ASSERTION FAILED: {e}")
-        driver.save_screenshot("screenshots/pom_assertion_error.png")
+        save_screenshot(driver, "screenshots/pom_assertion_error.png")
         raise
         
     except Exception as e:
         print(f"\n❌ ERROR: {e}")
         import traceback
         traceback.print_exc()
-        driver.save_screenshot("screenshots/pom_error.png")
+        save_screenshot(driver, "screenshots/pom_error.png")
         raise
         
     finally:
         print("\n🧹 Closing browser...")
-        driver.quit()
+        quit_driver(driver)
         print("✅ Test completed!\n")
 
 
@@ -114,7 +113,7 @@ def test_failed_login_with_pom():
     print("\n🚀 Starting Test: Failed Login with POM")
     
     # Setup - use configured Chrome options
-    driver = webdriver.Chrome(options=get_chrome_options())
+    driver = create_driver()
     
     try:
         # Navigate and attempt login with wrong credentials
@@ -131,7 +130,7 @@ def test_failed_login_with_pom():
         print("\n🔍 Checking for password manager pop-up...")
         login_page.dismiss_password_manager_popup()
         
-        time.sleep(2)
+        pause(2)
         
         # Verify error message
         print("\n✅ Verifying error message...")
@@ -145,17 +144,17 @@ def test_failed_login_with_pom():
         
         print("\n🎉 TEST PASSED! Error handling works!")
         
-        time.sleep(3)
+        pause(3)
         
     except Exception as e:
         print(f"\n❌ ERROR: {e}")
         import traceback
         traceback.print_exc()
-        driver.save_screenshot("screenshots/pom_failed_error.png")
+        save_screenshot(driver, "screenshots/pom_failed_error.png")
         raise
         
     finally:
-        driver.quit()
+        quit_driver(driver)
 
 
 if __name__ == "__main__":
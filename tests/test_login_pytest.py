@@ -4,7 +4,8 @@ Demonstrates pytest fixtures and markers
 """
 
 import pytest
-import time
+
+from utils.pacing import pause
 
 
 @pytest.mark.smoke
@@ -29,7 +30,7 @@ class TestLogin:
         
         # Dismiss popup
         secure_page.dismiss_password_manager_popup()
-        time.sleep(2)
+        pause(2)
         
         # Verify success
         assert secure_page.is_on_secure_page()
@@ -57,7 +58,7 @@ class TestLogin:
         login_page.click_login_button()
         
         login_page.dismiss_password_manager_popup()
-        time.sleep(2)
+        pause(2)
         
         # Verify error
         assert login_page.is_error_displayed()
@@ -80,7 +81,7 @@ class TestLogin:
         login_page = logged_in_secure_page.click_logout()
         
         login_page.dismiss_password_manager_popup()
-        time.sleep(2)
+        pause(2)
         
         assert "Login Page" in login_page.get_page_heading()
         print("✅ Logged out successfully")
@@ -107,7 +108,7 @@ def test_invalid_credentials(login_page, username, password):
     
     login_page.click_login_button()
     login_page.dismiss_password_manager_popup()
-    time.sleep(1)
+    pause(1)
     
     assert login_page.is_error_displayed()
     print("✅ Error message shown correctly")
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""
+Overlay Registry Tests
+Checks probing, dismissing and handler selection with a fake browser
+"""
+
+import pytest
+from selenium.common.exceptions import JavascriptException, WebDriverException
+from selenium.webdriver.common.by import By
+
+from pages.overlays import OverlayHandler, OverlayRegistry, overlays
+
+
+class FakeElement:
+    def __init__(self, driver, locator):
+        self.driver = driver
+        self.locator = locator
+
+    def click(self):
+        if self.locator in self.driver.broken:
+            raise WebDriverException("element is not attached to the page document")
+        self.driver.clicked.append(self.locator)
+
+
+class FakeDriver:
+    """Reports the handlers named in `visible` as on screen"""
+
+    def __init__(self, visible=(), broken=()):
+        self.visible = visible
+        self.broken = broken
+        self.probes = []
+        self.clicked = []
+
+    def execute_script(self, script, probes):
+        self.probes.append([name for name, _, _ in probes])
+        return [name for name, _, _ in probes if name in self.visible]
+
+    def find_element(self, by, value):
+        return FakeElement(self, (by, value))
+
+
+def make_registry():
+    registry = OverlayRegistry()
+    registry.register(OverlayHandler("consent", (By.ID, "accept-all")))
+    registry.register(OverlayHandler("promo", (By.CSS_SELECTOR, ".promo .close")))
+    registry.register(OverlayHandler("flash", (By.CSS_SELECTOR, ".flash .close"), auto=False))
+    return registry
+
+
+def test_one_probe_for_all_automatic_handlers():
+    registry = make_registry()
+    driver = FakeDriver(visible=("promo", "flash"))
+
+    assert registry.probe(driver) == ["promo"]
+    assert driver.probes == [["consent", "promo"]]
+    assert registry.stats.probes == 1
+
+
+def test_handle_clicks_only_visible_overlays():
+    registry = make_registry()
+    driver = FakeDriver(visible=("consent",))
+
+    assert registry.handle(driver) == ["consent"]
+    assert driver.clicked == [(By.ID, "accept-all")]
+    assert registry.stats.fired == {"consent": 1}
+
+
+def test_manual_handler_only_when_named():
+    registry = make_registry()
+    driver = FakeDriver(visible=("flash",))
+
+    assert registry.handle(driver) == []
+    assert registry.handle(driver, "flash") == ["flash"]
+
+
+def test_overlay_gone_before_click_is_not_counted():
+    registry = make_registry()
+    driver = FakeDriver(visible=("consent",), broken=((By.ID, "accept-all"),))
+
+    assert registry.handle(driver) == []
+    assert registry.stats.fired == {}
+
+
+def test_failed_probe_means_nothing_to_handle():
+    class AlertOpenDriver(FakeDriver):
+        def execute_script(self, script, probes):
+            raise JavascriptException("unexpected alert open")
+
+    assert make_registry().handle(AlertOpenDriver(visible=("consent",))) == []
+
+
+def test_unknown_handler_name_is_rejected():
+    with pytest.raises(ValueError, match="Unknown overlay handler.*cookies.*Choose from"):
+        make_registry().handle(FakeDriver(), "cookies")
+
+
+def test_default_handlers_never_run_on_their_own():
+    driver = FakeDriver(visible=tuple(overlays.handlers))
+
+    assert overlays.probe(driver) == []
+    assert driver.probes == []    # no round-trip after open()/click()
@@ -0,0 +1,60 @@
+"""
+Pacing Tests
+Checks the pause() modes and the savings report without a browser
+"""
+
+import time
+
+import pytest
+
+from utils import pacing
+from utils.pacing import pause
+
+
+def test_ci_mode_skips_demo_pause(monkeypatch):
+    monkeypatch.setenv("SELENIUM_PACING", "ci")
+    monkeypatch.setattr(pacing, "stats", pacing.PacingStats())
+
+    start = time.perf_counter()
+    pause(5, "keep browser open")
+
+    assert time.perf_counter() - start < 0.5
+    assert pacing.stats.calls == 1
+    assert pacing.stats.saved > 4.5
+
+
+def test_ci_mode_waits_for_readiness_condition(monkeypatch):
+    monkeypatch.setenv("SELENIUM_PACING", "ci")
+    monkeypatch.setattr(pacing, "stats", pacing.PacingStats())
+    ready_at = time.monotonic() + 0.2
+
+    assert pause(2, "page load", until=lambda: time.monotonic() >= ready_at)
+    assert time.monotonic() >= ready_at
+
+
+def test_condition_that_never_holds_returns_false(monkeypatch):
+    monkeypatch.setenv("SELENIUM_PACING", "ci")
+    monkeypatch.setattr(pacing, "stats", pacing.PacingStats())
+
+    def broken():
+        raise RuntimeError("element went stale")
+
+    assert not pause(1, until=broken, timeout=0.1)
+
+
+def test_demo_mode_sleeps(monkeypatch):
+    monkeypatch.setenv("SELENIUM_PACING", "demo")
+    monkeypatch.setattr(pacing, "stats", pacing.PacingStats())
+
+    start = time.perf_counter()
+    pause(0.1)
+
+    assert time.perf_counter() - start >= 0.1
+    assert "test_pacing.test_demo_mode_sleeps" in pacing.stats.by_reason
+
+
+def test_unknown_mode_is_rejected(monkeypatch):
+    monkeypatch.setenv("SELENIUM_PACING", "Demo")
+
+    with pytest.raises(ValueError, match="Unknown pacing mode 'Demo'"):
+        pacing.get_pacing_mode()
@@ -0,0 +1,95 @@
+"""
+Profile Manager Tests
+Checks template copies, release and cleanup without launching Chrome
+"""
+
+import json
+import os
+
+import pytest
+
+from utils import profile_manager, reaper
+from utils.profile_manager import (
+    build_template,
+    cleanup_profiles,
+    new_profile_dir,
+    release_profile_dir,
+)
+
+
+@pytest.fixture(autouse=True)
+def profile_root(tmp_path, monkeypatch):
+    root = tmp_path / "profiles"
+    monkeypatch.setenv("SELENIUM_PROFILE_ROOT", str(root))
+    monkeypatch.setenv("SELENIUM_REAPER_DIR", str(tmp_path / "ledgers"))
+    monkeypatch.delenv("SELENIUM_PROFILE_TEMPLATE", raising=False)
+    monkeypatch.setattr(profile_manager, "_template_dir", None)
+    monkeypatch.setattr(profile_manager, "_handed_out", set())
+    monkeypatch.setattr(profile_manager, "_initialize_template", lambda path: None)
+    monkeypatch.setattr(reaper, "_ledger", None)
+    return root
+
+
+def test_copies_carry_the_template_prefs():
+    path = new_profile_dir()
+
+    with open(os.path.join(path, "Default", "Preferences")) as f:
+        prefs = json.load(f)
+    assert prefs["credentials_enable_service"] is False
+    assert prefs["profile"]["password_manager_enabled"] is False
+    assert os.path.exists(os.path.join(path, "First Run"))
+    assert path != build_template()
+
+
+def test_locks_and_caches_are_not_copied():
+    template = build_template()
+    os.makedirs(os.path.join(template, "Default", "Cache"))
+    open(os.path.join(template, "SingletonLock"), "w").close()
+
+    path = new_profile_dir()
+
+    assert not os.path.exists(os.path.join(path, "SingletonLock"))
+    assert not os.path.exists(os.path.join(path, "Default", "Cache"))
+
+
+def test_template_is_built_once(monkeypatch):
+    launches = []
+    monkeypatch.setattr(profile_manager, "_initialize_template", launches.append)
+
+    new_profile_dir()
+    new_profile_dir()
+
+    assert len(launches) == 1
+
+
+def test_empty_profiles_without_template(monkeypatch):
+    monkeypatch.setenv("SELENIUM_PROFILE_TEMPLATE", "0")
+
+    path = new_profile_dir()
+
+    assert os.listdir(path) == []
+    assert profile_manager._template_dir is None
+
+
+def test_release_only_deletes_own_profiles(tmp_path):
+    path = new_profile_dir()
+    foreign = tmp_path / "my-profile"
+    foreign.mkdir()
+
+    assert release_profile_dir(path)
+    assert not os.path.exists(path)
+    assert not release_profile_dir(path)
+    assert not release_profile_dir(str(foreign))
+    assert foreign.exists()
+
+
+def test_cleanup_removes_copies_template_and_ledger_entries():
+    paths = [new_profile_dir() for _ in range(3)]
+    template = build_template()
+    assert set(reaper.get_ledger().profiles) == set(paths) | {template}
+
+    cleanup_profiles()
+
+    assert not any(os.path.exists(path) for path in paths + [template])
+    assert profile_manager._handed_out == set()
+    assert reaper.get_ledger().profiles == set()
@@ -0,0 +1,82 @@
+"""
+Readiness Contract Tests
+Checks contract scripts, waiting and timing records without a browser
+"""
+
+import pytest
+from selenium.common.exceptions import JavascriptException
+from selenium.webdriver.common.by import By
+
+from pages.base_page import BasePage
+from utils import readiness
+from utils.browser_config import get_page_load_strategy
+from utils.readiness import DocumentReady, ElementReady, ReadinessStats, ScriptReady, build_ready_script
+
+
+class FakeDriver:
+    """Returns the queued results of the readiness script one poll at a time"""
+
+    def __init__(self, results, strategy="eager"):
+        self.results = list(results)
+        self.capabilities = {"pageLoadStrategy": strategy}
+        self.scripts = 0
+
+    def execute_script(self, script, *args):
+        self.scripts += 1
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class ReadyPage(BasePage):
+    READY_WHEN = (ElementReady((By.ID, "username")),)
+
+
+def test_contracts_are_checked_in_one_script():
+    script = build_ready_script([
+        ElementReady((By.CSS_SELECTOR, "button[type='submit']")),
+        ScriptReady("window.appReady"),
+        DocumentReady("complete"),
+    ])
+
+    assert '__findAll("css selector", "button[type=\'submit\']").some(__isVisible)' in script
+    assert "Boolean(window.appReady)" in script
+    assert '["complete"].includes(document.readyState)' in script
+
+
+def test_unknown_ready_state_is_rejected():
+    with pytest.raises(ValueError):
+        DocumentReady("loaded")
+
+
+def test_wait_polls_through_navigation_and_records_timing(monkeypatch):
+    monkeypatch.setattr(readiness, "stats", ReadinessStats())
+    driver = FakeDriver([
+        JavascriptException("document unloaded while waiting"),
+        None,                   # old document / contract not met yet
+        [420.0, None],          # ready 420ms after navigation start, load still running
+    ])
+
+    ready_ms = ReadyPage(driver).wait_until_ready(started=None)
+
+    assert ready_ms == 420.0
+    assert driver.scripts == 3
+    opens, total_ready, _, _, loads = readiness.stats.by_page["ReadyPage"]
+    assert (opens, total_ready, loads) == (1, 420.0, 0)
+
+
+def test_normal_strategy_without_contract_does_not_wait():
+    driver = FakeDriver([], strategy="normal")
+
+    assert BasePage(driver).wait_until_ready() is None
+    assert driver.scripts == 0
+
+
+def test_page_load_strategy_from_environment(monkeypatch):
+    monkeypatch.setenv("SELENIUM_PAGE_LOAD", "eager")
+    assert get_page_load_strategy() == "eager"
+
+    monkeypatch.setenv("SELENIUM_PAGE_LOAD", "lazy")
+    with pytest.raises(ValueError):
+        get_page_load_strategy()
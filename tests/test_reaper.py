@@ -0,0 +1,179 @@
+"""
+Reaper Tests
+Checks that ledgers of dead processes are reaped and live ones are left alone
+"""
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+from utils import reaper
+from utils.reaper import Ledger, ReaperStats, find_processes
+
+
+@pytest.fixture
+def ledger_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "ledgers"
+    directory.mkdir()
+    monkeypatch.setenv("SELENIUM_REAPER_DIR", str(directory))
+    monkeypatch.setattr(reaper, "stats", ReaperStats())
+    return directory
+
+
+def dead_pid():
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_profile(tmp_path, name, size):
+    path = tmp_path / name
+    (path / "Default").mkdir(parents=True)
+    (path / "Default" / "Cache").write_bytes(b"x" * size)
+    return str(path)
+
+
+def write_ledger(directory, owner, profiles):
+    path = directory / f"{owner[0]}.json"
+    path.write_text(json.dumps({'owner': owner, 'profiles': profiles, 'drivers': []}))
+    return path
+
+
+def test_reaps_profiles_of_a_dead_owner(tmp_path, ledger_dir):
+    profile = make_profile(tmp_path, "profile-abc", 4096)
+    unrelated = make_profile(tmp_path, "my-data", 10)
+    ledger = write_ledger(ledger_dir, [dead_pid(), None], [profile, unrelated])
+
+    killed, profiles, freed = reaper.reap_stale()
+
+    assert (profiles, freed) == (1, 4096)
+    assert not os.path.exists(profile)
+    assert os.path.exists(unrelated)   # not named like profile_manager's
+    assert not ledger.exists()
+    assert reaper.stats.reaped_ledgers == 1
+    assert reaper.stats.reaped_bytes == 4096
+
+
+def test_leaves_live_owners_alone(tmp_path, ledger_dir):
+    profile = make_profile(tmp_path, "profile-live", 100)
+    ledger = write_ledger(ledger_dir, [os.getppid(), None], [profile])
+
+    assert reaper.reap_stale() == (0, 0, 0)
+    assert os.path.exists(profile) and ledger.exists()
+
+
+def test_own_ledger_is_removed_at_close(tmp_path, ledger_dir):
+    profile = make_profile(tmp_path, "profile-mine", 100)
+    ledger = Ledger()
+    ledger.add_profile(profile)
+    assert os.path.exists(ledger.path)
+
+    ledger.close()
+
+    assert not os.path.exists(profile)
+    assert not os.path.exists(ledger.path)
+
+
+def test_finds_drivers_browsers_and_their_children():
+    processes = [
+        (100, 1, 5.0, "chromedriver --port=1234"),
+        (101, 100, 6.0, "chrome --user-data-dir=/tmp/a"),
+        (200, 1, 7.0, "chrome --user-data-dir=/tmp/profile-x --headless"),
+        (201, 200, 8.0, "chrome --type=renderer"),
+        (300, 1, 9.0, "chrome --user-data-dir=/tmp/other"),
+        (400, 1, 4.0, "chromedriver --port=99"),   # pid 400 reused: different start time
+    ]
+    ledger = {'drivers': [[100, 5.0], [400, 1.0]], 'profiles': ["/tmp/profile-x"]}
+
+    assert find_processes(ledger, processes) == {100, 101, 200, 201}
+
+
+def test_stats_merge_and_summary():
+    total = ReaperStats()
+    worker = ReaperStats()
+    worker.reaped_profiles, worker.reaped_bytes, worker.open_processes = 2, 3 * 2**20, 1
+    total.merge(worker.as_dict())
+    total.merge(worker.as_dict())
+
+    assert total.reaped_profiles == 4
+    assert "6.0 MiB" in total.summary_lines()[0]
+    assert "2 browser processes" in total.summary_lines()[1]
+
+
+def test_ledger_updates_do_not_list_processes(tmp_path, ledger_dir, monkeypatch):
+    monkeypatch.setattr(reaper, "_processes", lambda: pytest.fail("process table scanned"))
+    ledger = Ledger()
+
+    ledger.add_profile(make_profile(tmp_path, "profile-a", 10))
+    ledger.add_driver_process(os.getpid())
+    ledger.remove_driver_process(os.getpid())   # still running: kept
+
+    saved = json.loads(open(ledger.path).read())
+    assert saved['clock'] == reaper._clock()
+    assert saved['drivers'] == [[os.getpid(), reaper._start_time(os.getpid())]]
+
+
+def test_ledger_from_another_clock_is_judged_by_pid(tmp_path, ledger_dir):
+    live = make_profile(tmp_path, "profile-live", 100)
+    dead = make_profile(tmp_path, "profile-dead", 100)
+    # Start times on the other clock never match ours
+    (ledger_dir / "live.json").write_text(json.dumps(
+        {'owner': [os.getppid(), -1.0], 'clock': 'other', 'profiles': [live], 'drivers': []}))
+    (ledger_dir / "dead.json").write_text(json.dumps(
+        {'owner': [dead_pid(), -1.0], 'clock': 'other', 'profiles': [dead], 'drivers': []}))
+
+    reaper.reap_stale()
+
+    assert os.path.exists(live) and (ledger_dir / "live.json").exists()
+    assert not os.path.exists(dead)
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGKILL"), reason="POSIX signals")
+def test_sigterm_stops_the_run_and_reaps_its_profiles(tmp_path, ledger_dir):
+    profile = make_profile(tmp_path, "profile-run", 100)
+    ready, later = tmp_path / "ready", tmp_path / "later"
+    (tmp_path / "conftest.py").write_text(textwrap.dedent("""
+        from utils import reaper
+
+        def pytest_configure(config):
+            reaper.install_signal_handlers()
+    """))
+    (tmp_path / "test_run.py").write_text(textwrap.dedent(f"""
+        import time
+        from utils import reaper
+
+        def test_a():
+            reaper.track_profile({profile!r})
+            open({str(ready)!r}, "w").close()
+            time.sleep(30)
+
+        def test_b():
+            open({str(later)!r}, "w").close()
+    """))
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    run = subprocess.Popen([sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "test_run.py"],
+                           cwd=tmp_path, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + 30
+        while not ready.exists() and run.poll() is None and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert ready.exists()
+        run.send_signal(signal.SIGTERM)
+        returncode = run.wait(timeout=30)
+    finally:
+        if run.poll() is None:
+            run.kill()
+
+    assert returncode == -signal.SIGTERM
+    assert not later.exists()
+    assert not os.path.exists(profile)
+    assert list(ledger_dir.iterdir()) == []
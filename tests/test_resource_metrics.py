@@ -0,0 +1,83 @@
+"""
+Resource Metrics Tests
+Checks sampling around steps, leak flags and xdist merging with a fake browser
+"""
+
+import pytest
+
+from utils import network, resource_metrics, steps
+from utils.resource_metrics import ResourceStats, leaks
+from utils.steps import measure
+
+
+class FakeDriver:
+    """Grows the DOM by 600 nodes and the heap by 6 MB per metrics call"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        if cmd == "Performance.enable":
+            return {}
+        self.calls += 1
+        return {"metrics": [
+            {"name": "Nodes", "value": 600 * self.calls},
+            {"name": "JSHeapUsedSize", "value": 6 * 2**20 * self.calls},
+            {"name": "Timestamp", "value": 1.0},
+        ]}
+
+
+@pytest.fixture(autouse=True)
+def enabled(monkeypatch):
+    monkeypatch.setenv("SELENIUM_RESOURCE_METRICS", "1")
+    monkeypatch.setattr(resource_metrics, "stats", ResourceStats())
+    monkeypatch.setattr(steps, "stats", steps.StepStats())
+    monkeypatch.setattr(resource_metrics, "psutil", None)
+    monkeypatch.setattr(network, "current_test", "tests/test_x.py::test_a")
+
+
+def test_samples_at_start_after_steps_and_at_the_end():
+    with resource_metrics.monitor(FakeDriver()):
+        with measure("LoginPage.login"):
+            with measure("BasePage.type"):
+                pass
+        findings = resource_metrics.finish_test("tests/test_x.py::test_a")
+
+    samples = resource_metrics.stats.by_test["tests/test_x.py::test_a"]
+    assert [sample["label"] for sample in samples] == ["start", "LoginPage.login", "end"]
+    assert samples[-1]["nodes"] == 1800 and samples[-1]["js_heap_mb"] == 18.0
+    assert findings == ["DOM nodes +1200", "JS heap +12.0 MB"]
+
+
+def test_thresholds(monkeypatch):
+    samples = [{"nodes": 100, "js_heap_mb": 5.0}, {"nodes": 600, "js_heap_mb": 30.0}]
+
+    assert leaks(samples, (1000, 10.0)) == ["JS heap +25.0 MB"]
+    assert leaks(samples[:1], (1, 1.0)) == []
+    monkeypatch.setenv("SELENIUM_LEAK_NODES", "0")
+    with pytest.raises(ValueError):
+        resource_metrics.get_thresholds()
+
+
+def test_disabled_does_not_touch_the_browser(monkeypatch):
+    monkeypatch.delenv("SELENIUM_RESOURCE_METRICS")
+    driver = FakeDriver()
+
+    with resource_metrics.monitor(driver) as resource_monitor:
+        pass
+
+    assert resource_monitor is None and driver.calls == 0
+
+
+def test_worker_samples_merge_into_summary():
+    stats = ResourceStats()
+    worker = ResourceStats()
+    worker.record("t1", [{"label": "start", "time": 1.0, "worker": "gw0", "nodes": 10, "driver_rss_mb": 20.0},
+                         {"label": "end", "time": 2.0, "worker": "gw0", "nodes": 5000, "driver_rss_mb": 25.0}])
+
+    stats.merge(worker.as_dict())
+
+    assert stats.flagged == {"t1": ["DOM nodes +4990"]}
+    lines = "\n".join(stats.summary_lines())
+    assert "gw0 20 -> 25 MB" in lines and "t1: DOM nodes +4990" in lines
+    assert "DOM nodes +4990" in stats.html_table("t1")
@@ -0,0 +1,200 @@
+"""
+Resource Blocking Policy Tests
+Checks policy decisions, markers and page-object opt-ins without a browser
+"""
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from utils import network, resource_policy
+from utils.browser_config import BLOCKING_POLICIES, get_blocking_policy
+from utils.network import BLOCK, InterceptedRequest
+from utils.resource_policy import BlockPolicy, BlockStats, ResourceBlocker, policy_from_markers
+
+
+def make_request(url, resource_type):
+    return InterceptedRequest(url, resource_type=resource_type, test=network.current_test)
+
+
+class FakeItem:
+    """Just enough of a pytest item for policy_from_markers()"""
+
+    def __init__(self, *markers):
+        self.markers = markers
+
+    def iter_markers(self, name):
+        return [marker for marker in self.markers if marker.name == name]
+
+
+def test_lean_preset_blocks_media_trackers_and_third_party_scripts():
+    policy = get_blocking_policy("lean")
+    host = "demo.opencart.com"
+
+    assert policy.blocks(make_request("https://demo.opencart.com/logo.png", "Image"), host)
+    assert policy.blocks(make_request("https://www.google-analytics.com/analytics.js", "Script"), host)
+    assert policy.blocks(make_request("https://cdn.example.net/widget.js", "Script"), host)
+    assert not policy.blocks(make_request("https://demo.opencart.com/app.js", "Script"), host)
+    assert not policy.blocks(make_request("https://demo.opencart.com/", "Document"), host)
+
+
+def test_unknown_preset_is_rejected(monkeypatch):
+    monkeypatch.setenv("SELENIUM_BLOCKING", "everything")
+
+    with pytest.raises(ValueError):
+        get_blocking_policy()
+
+
+def test_markers_combine_and_opt_back_in():
+    item = FakeItem(
+        pytest.mark.block_resources("media", patterns=["*ads*"]).mark,
+        pytest.mark.allow_resources("Image").mark,
+    )
+
+    policy = policy_from_markers(item, BLOCKING_POLICIES)
+
+    assert policy.resource_types == {"Media", "Font"}
+    assert policy.url_patterns == ("*ads*",)
+    assert policy_from_markers(FakeItem(), BLOCKING_POLICIES) is None
+
+
+def test_page_object_can_opt_back_in(monkeypatch):
+    monkeypatch.setattr(resource_policy, "stats", BlockStats())
+    monkeypatch.setattr(network, "current_test", "tests/test_x.py::test_a")
+
+    class GalleryPage:
+        BLOCK_RESOURCES = BlockPolicy(url_patterns=["*.woff2"])
+        ALLOW_RESOURCES = ("Image",)
+
+    blocker = ResourceBlocker(BLOCKING_POLICIES["media"], size_lookup=lambda method, url: 2048)
+    image = make_request("https://site.test/a.png", "Image")
+    font = make_request("https://site.test/a.woff2", "Other")
+
+    assert blocker.on_request(image) is BLOCK
+    assert blocker.on_request(font) is None
+
+    blocker.set_page(GalleryPage)
+    assert blocker.on_request(image) is None
+    assert blocker.on_request(font) is BLOCK
+    assert resource_policy.stats.for_test("tests/test_x.py::test_a") == (2, 4096)
+
+
+def test_page_opt_in_does_not_leak_into_the_next_test(monkeypatch):
+    monkeypatch.setattr(resource_policy, "stats", BlockStats())
+
+    class GalleryPage:
+        BLOCK_RESOURCES = None
+        ALLOW_RESOURCES = ("Image",)
+
+    blocker = ResourceBlocker(BLOCKING_POLICIES["media"])
+    monkeypatch.setattr(network, "current_test", "test_a")
+    blocker.set_page(GalleryPage)
+    monkeypatch.setattr(network, "current_test", "test_b")
+
+    assert blocker.on_request(make_request("https://site.test/a.png", "Image")) is BLOCK
+
+
+class FakeDriver:
+    """Interception "starts" without a browser"""
+
+
+@pytest.fixture
+def no_devtools(monkeypatch):
+    monkeypatch.setattr(network.NetworkInterceptor, "start", lambda self: self)
+    monkeypatch.setattr(resource_policy, "_test_policy", None)
+
+
+def test_blocker_only_for_global_preset_or_test_policy(no_devtools):
+    assert resource_policy.blocking_handler(None) is None
+    assert isinstance(resource_policy.blocking_handler(BLOCKING_POLICIES["lean"]), ResourceBlocker)
+
+    resource_policy.set_test_policy(BLOCKING_POLICIES["media"])
+    blocker = resource_policy.blocking_handler(None)
+
+    assert blocker.on_demand
+
+
+def test_page_policy_intercepts_until_released(no_devtools):
+    class GalleryPage:
+        BLOCK_RESOURCES = None
+        ALLOW_RESOURCES = ("Image",)
+
+    class PlainPage:
+        BLOCK_RESOURCES = None
+        ALLOW_RESOURCES = ()
+
+    driver = FakeDriver()
+    resource_policy.apply_page_policy(driver, PlainPage)
+    assert network.get_interceptor(driver) is None
+
+    resource_policy.apply_page_policy(driver, GalleryPage)
+    blocker, = network.get_interceptor(driver).handlers
+    assert blocker._page[0] is GalleryPage
+
+    resource_policy.release_blocking(driver)
+    assert network.get_interceptor(driver) is None
+
+
+def test_pooled_browser_follows_the_running_test(no_devtools):
+    global_blocker = ResourceBlocker(BLOCKING_POLICIES["lean"])
+    driver, plain = FakeDriver(), FakeDriver()
+    network.attach(plain, [global_blocker])
+
+    resource_policy.set_test_policy(BLOCKING_POLICIES["media"])
+    resource_policy.apply_test_policy(driver)
+    assert network.get_interceptor(driver).handlers[0].on_demand
+
+    resource_policy.set_test_policy(None)
+    resource_policy.apply_test_policy(driver)
+    resource_policy.apply_test_policy(plain)
+    assert network.get_interceptor(driver) is None
+    assert network.get_interceptor(plain).handlers == [global_blocker]   # preset stays
+
+
+def test_page_policy_without_devtools_warns(monkeypatch, capsys):
+    def start(self):
+        raise WebDriverException("no DevTools")
+
+    monkeypatch.setattr(network.NetworkInterceptor, "start", start)
+
+    class GalleryPage:
+        BLOCK_RESOURCES = BlockPolicy(resource_types=["Image"])
+        ALLOW_RESOURCES = ()
+
+    resource_policy.apply_page_policy(FakeDriver(), GalleryPage)
+
+    assert "GalleryPage: resource policy not applied" in capsys.readouterr().out
+
+
+def test_frames_do_not_change_the_page_host(monkeypatch):
+    monkeypatch.setattr(resource_policy, "stats", BlockStats())
+    blocker = ResourceBlocker(BLOCKING_POLICIES["lean"])
+    blocker.on_request(InterceptedRequest("https://shop.test/", resource_type="Document"))
+    blocker.on_request(InterceptedRequest("https://video.test/embed", resource_type="Document",
+                                          main_frame=False))
+
+    assert blocker.page_host == "shop.test"
+    assert blocker.on_request(make_request("https://video.test/player.js", "Script")) is BLOCK
+    assert blocker.on_request(make_request("https://shop.test/app.js", "Script")) is None
+
+
+def test_off_marker_intercepts_nothing_without_a_preset(no_devtools):
+    policy = policy_from_markers(FakeItem(pytest.mark.block_resources("off").mark), BLOCKING_POLICIES)
+    resource_policy.set_test_policy(policy)
+    driver = FakeDriver()
+
+    assert not policy and policy.replaces_global
+    assert resource_policy.blocking_handler(None) is None
+    resource_policy.apply_test_policy(driver)
+    assert network.get_interceptor(driver) is None
+    assert policy_from_markers(FakeItem(pytest.mark.allow_resources("Image").mark), BLOCKING_POLICIES) is None
+
+
+def test_off_marker_switches_off_the_global_preset(no_devtools, monkeypatch):
+    monkeypatch.setattr(resource_policy, "stats", BlockStats())
+    blocker = ResourceBlocker(BLOCKING_POLICIES["lean"])
+    image = make_request("https://site.test/a.png", "Image")
+    resource_policy.set_test_policy(policy_from_markers(
+        FakeItem(pytest.mark.block_resources("off", patterns=["*ads*"]).mark), BLOCKING_POLICIES))
+
+    assert blocker.on_request(image) is None
+    assert blocker.on_request(make_request("https://site.test/ads/x.png", "Image")) is BLOCK
@@ -0,0 +1,83 @@
+"""
+Screencast Recorder Tests
+Checks the per-test frame buffer and recording files without a browser
+"""
+
+import io
+
+import pytest
+
+from utils import screencast, screenshots
+from utils.screencast import ScreencastRecorder, ScreencastStats
+
+
+@pytest.fixture(autouse=True)
+def fresh_stats(monkeypatch, tmp_path):
+    monkeypatch.setattr(screencast, "stats", ScreencastStats())
+    monkeypatch.setenv("SELENIUM_SCREENCAST_DIR", str(tmp_path))
+
+
+def make_jpeg(shade):
+    Image = pytest.importorskip("PIL.Image")
+    output = io.BytesIO()
+    Image.new("RGB", (8, 6), (shade, shade, shade)).save(output, format="JPEG")
+    return output.getvalue()
+
+
+def test_buffer_keeps_only_the_served_test_within_the_memory_cap():
+    recorder = ScreencastRecorder(driver=None, fps=5, memory_limit=25)
+    recorder.serve("t1")
+    recorder.add_frame(b"a" * 10, 1.0)
+    recorder.add_frame(b"b" * 10, 2.0)
+
+    recorder.serve("t2")
+    for second in range(3, 6):
+        recorder.add_frame(b"c" * 10, float(second))
+
+    assert [timestamp for timestamp, _ in recorder.frames("t2")] == [4.0, 5.0]
+    assert screencast.stats.evicted == 2    # the carried-over t1 frame, then 3.0
+    assert recorder.frames("t1") == []
+
+
+def test_static_page_starts_with_the_frame_from_before_the_test():
+    recorder = ScreencastRecorder(driver=None, fps=5, memory_limit=100)
+    recorder.add_frame(b"idle", 1.0)
+
+    recorder.serve("t1")
+
+    assert recorder.frames("t1") == [(1.0, b"idle")]
+
+
+def test_only_browsers_that_served_the_test_are_recorded(monkeypatch):
+    used, idle = ScreencastRecorder(driver=None), ScreencastRecorder(driver=None)
+    monkeypatch.setattr(screencast, "_recorders", [used, idle])
+    used.add_frame(b"used", 1.0)
+    idle.add_frame(b"idle", 1.0)
+    used.serve("t1")
+    idle.add_frame(b"prewarm", 2.0)
+
+    assert screencast.recordings_for("t1") == [[(1.0, b"used")]]
+    used.serve(None)
+    assert screencast.recordings_for("t1") == []
+
+
+def test_recording_is_an_animation():
+    Image = pytest.importorskip("PIL.Image")
+    frames = [(1.0, make_jpeg(0)), (1.2, make_jpeg(128)), (30.0, make_jpeg(255))]
+
+    path, mime_type = screencast.save_recording(frames, "tests/test_x.py::test_a", "gif")
+
+    assert path.endswith("tests_test_x.py_test_a.gif") and mime_type == "image/gif"
+    with Image.open(path) as image:
+        assert image.n_frames == 3
+    assert screencast.stats.recordings == 1
+
+
+def test_frames_are_written_as_jpegs_without_pillow(monkeypatch, tmp_path):
+    monkeypatch.setattr(screenshots, "_pillow", False)
+
+    path, mime_type = screencast.save_recording([(1.0, b"one"), (2.0, b"two")], "test_a")
+
+    assert mime_type == "image/jpeg"
+    assert sorted(p.name for p in (tmp_path / "test_a").iterdir()) == ["frame-0000.jpg", "frame-0001.jpg"]
+    assert open(path, "rb").read() == b"two"
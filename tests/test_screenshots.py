@@ -0,0 +1,126 @@
+"""
+Screenshot Service Tests
+Checks background writes, the flush barrier and re-encoding without a browser
+"""
+
+import base64
+import struct
+import zlib
+
+import pytest
+
+from utils import screenshots, steps
+from utils.screenshots import ScreenshotService, ScreenshotStats
+
+
+def make_png(width=4, height=2):
+    """Solid grey RGB PNG, built by hand so the tests do not need Pillow"""
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+    rows = b"".join(b"\x00" + b"\x80\x80\x80" * width for _ in range(height))
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(rows))
+            + chunk(b"IEND", b""))
+
+
+class FakeDriver:
+    def __init__(self, png):
+        self.png = png
+
+    def get_screenshot_as_base64(self):
+        return base64.b64encode(self.png).decode()
+
+
+@pytest.fixture(autouse=True)
+def fresh_stats(monkeypatch):
+    monkeypatch.setattr(screenshots, "stats", ScreenshotStats())
+    monkeypatch.setattr(steps, "stats", steps.StepStats())
+
+
+def test_files_exist_after_flush(tmp_path):
+    service = ScreenshotService("png", workers=2)
+    png = make_png()
+
+    paths = [service.save(FakeDriver(png), str(tmp_path / f"shot{i}.png")) for i in range(5)]
+
+    assert service.flush() == []
+    assert all(open(path, "rb").read() == png for path in paths)
+    assert screenshots.stats.captures == 5
+    assert screenshots.stats.written_bytes == 5 * len(png)
+    service.close()
+
+
+def test_failed_write_is_reported_by_flush(tmp_path):
+    service = ScreenshotService("png", workers=1)
+    (tmp_path / "taken").write_text("a file, not a directory")
+
+    service.save(FakeDriver(make_png()), str(tmp_path / "taken" / "shot.png"))
+
+    [error] = service.flush()
+    assert "shot.png" in error
+    assert screenshots.stats.errors == 1
+    service.close()
+
+
+def test_jpeg_downscaled_with_pillow(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    service = ScreenshotService("jpeg", quality=70, scale=0.5, workers=0)
+
+    path = service.save(FakeDriver(make_png(8, 4)), str(tmp_path / "shot.png"))
+
+    assert path.endswith("shot.jpg")
+    with Image.open(path) as image:
+        assert (image.format, image.size) == ("JPEG", (4, 2))
+
+
+def test_png_fallback_without_pillow(tmp_path, monkeypatch):
+    monkeypatch.setattr(screenshots, "_pillow", False)
+
+    service = ScreenshotService("webp", scale=0.5, workers=0)
+
+    assert (service.image_format, service.scale) == ("png", 1.0)
+    assert service.path_for("screenshots/a.png") == "screenshots/a.png"
+
+
+def test_on_failure_writes_only_the_last_frames_of_failing_tests(tmp_path):
+    service = ScreenshotService("png", workers=0, policy="on-failure", buffer_size=2)
+    png = make_png()
+
+    service.save(FakeDriver(png), str(tmp_path / "passed.png"))
+    assert service.end_test(failed=False) == 0
+    paths = [service.save(FakeDriver(png), str(tmp_path / f"failed{i}.png")) for i in range(3)]
+    assert service.end_test(failed=True) == 2
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["failed1.png", "failed2.png"]
+    assert paths[0].endswith("failed0.png")
+    assert (screenshots.stats.captures, screenshots.stats.discarded) == (4, 2)
+    assert screenshots.stats.discarded_bytes == 2 * len(png)
+    assert screenshots.stats.failure_writes == 2
+    assert screenshots.stats.saved_ms is not None
+
+
+def test_on_step_writes_captures_taken_inside_steps(tmp_path):
+    service = ScreenshotService("png", workers=0, policy="on-step")
+
+    with steps.measure("Open login"):
+        service.save(FakeDriver(make_png()), str(tmp_path / "step.png"))
+    service.save(FakeDriver(make_png()), str(tmp_path / "loose.png"))
+    service.end_test(failed=False)
+
+    assert [p.name for p in tmp_path.iterdir()] == ["step.png"]
+    assert screenshots.stats.discarded == 1
+
+
+def test_invalid_settings_are_rejected(monkeypatch):
+    monkeypatch.setenv("SELENIUM_SCREENSHOT_FORMAT", "gif")
+    with pytest.raises(ValueError):
+        screenshots.get_screenshot_format()
+
+    monkeypatch.setenv("SELENIUM_SCREENSHOT_SCALE", "2")
+    with pytest.raises(ValueError):
+        screenshots.get_screenshot_scale()
+
+    monkeypatch.setenv("SELENIUM_SCREENSHOTS", "never")
+    with pytest.raises(ValueError):
+        screenshots.get_screenshot_policy()
@@ -2,47 +2,50 @@
 Selenium Test - OpenCart Search (Fixed for popups/overlays)
 """
 
-from selenium import webdriver
+import sys
+import os
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-import time
+
+from pages.overlays import overlays
+from utils.browser_config import get_chrome_options
+from utils.driver_factory import create_driver, quit_driver
+from utils.pacing import pause, page_ready
+from utils.screenshots import save_screenshot
 
 def test_opencart_search():
     print("\n🚀 Starting test: OpenCart Search")
     
     # Setup Chrome
     print("📝 Setting up Chrome driver...")
-    chrome_options = Options()
+    chrome_options = get_chrome_options()
     chrome_options.add_argument('--no-sandbox')
     chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--start-maximized')
     
-    driver = webdriver.Chrome(options=chrome_options)
+    driver = create_driver(chrome_options)
     wait = WebDriverWait(driver, 15)
     
     try:
         # Step 1: Open OpenCart
         print("🌐 Opening OpenCart website...")
         driver.get("https://demo.opencart.com/")
-        time.sleep(3)  # Wait for any popups/overlays
+        pause(3, "page load", until=page_ready(driver))  # Wait for any popups/overlays
         
         print(f"✅ Page loaded! Title: {driver.title}")
         
-        # Handle cookie banner or any overlay (if present)
-        try:
-            # Try to close cookie banner if it exists
-            close_buttons = driver.find_elements(By.CSS_SELECTOR, "button.close, .close, [aria-label='Close']")
-            if close_buttons:
-                close_buttons[0].click()
-                print("✅ Closed overlay/banner")
-                time.sleep(1)
-        except:
-            pass
+        # Handle the cookie banner (if present) - one zero-wait probe
+        if overlays.handle(driver, "cookie_banner"):
+            print("✅ Closed overlay/banner")
+            pause(1)
         
-        driver.save_screenshot("screenshots/step1_page_loaded.png")
+        save_screenshot(driver, "screenshots/step1_page_loaded.png")
         print("📸 Screenshot: step1_page_loaded.png")
         
         # Step 2: Find and use search box
@@ -52,23 +55,23 @@ def test_opencart_search():
         
         # Scroll to search box to make sure it's visible
         driver.execute_script("arguments[0].scrollIntoView(true);", search_box)
-        time.sleep(0.5)
+        pause(0.5)
         
         print("⌨️  Typing 'MacBook'...")
         search_box.clear()
         search_box.send_keys("MacBook")
-        time.sleep(1)
+        pause(1)
         
-        driver.save_screenshot("screenshots/step2_typed_search.png")
+        save_screenshot(driver, "screenshots/step2_typed_search.png")
         print("📸 Screenshot: step2_typed_search.png")
         
         # Step 3: Submit search using ENTER key (more reliable than button click)
         print("\n🔍 Submitting search (pressing Enter)...")
         search_box.send_keys(Keys.RETURN)
         
-        time.sleep(3)  # Wait for results to load
+        pause(3)  # Wait for results to load
         
-        driver.save_screenshot("screenshots/step3_search_results.png")
+        save_screenshot(driver, "screenshots/step3_search_results.png")
         print("📸 Screenshot: step3_search_results.png")
         
         # Step 4: Verify results
@@ -103,19 +106,19 @@ def test_opencart_search():
             print(f"Expected 'search=' in URL, got: {driver.current_url}")
         
         print("\n⏸️  Keeping browser open for 5 seconds...")
-        time.sleep(5)
+        pause(5, "keep browser open")
         
     except Exception as e:
         print(f"\n❌ ERROR: {e}")
         try:
-            driver.save_screenshot("screenshots/error.png")
+            save_screenshot(driver, "screenshots/error.png")
             print("📸 Error screenshot saved")
         except:
             pass
         
     finally:
         print("\n🧹 Closing browser...")
-        driver.quit()
+        quit_driver(driver)
         print("✅ Test completed!")
         print("\n💡 Check screenshots/ folder to see the test execution!\n")
 
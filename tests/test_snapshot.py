@@ -0,0 +1,93 @@
+"""
+Batched State Query Tests
+Checks query_elements()/snapshot() and their round-trip count with a fake browser
+"""
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from benchmarks.bench_snapshot import login_page_per_method, secure_page_per_method
+from pages.base_page import QUERY_ELEMENTS_JS
+from pages.login_page import LoginPage
+from pages.secure_page import SecurePage
+from utils import steps
+
+
+class FakeElement:
+    def __init__(self, driver):
+        self.driver = driver
+
+    @property
+    def text(self):
+        self.driver.commands += 1
+        return "Login Page"
+
+    def is_displayed(self):
+        self.driver.commands += 1
+        return True
+
+
+class FakeDriver:
+    """Counts WebDriver commands; execute_script answers with `state`"""
+
+    capabilities = {'pageLoadStrategy': 'normal'}
+
+    def __init__(self, state=None):
+        self.state = state or {}
+        self.commands = 0
+        self.scripts = []
+
+    def find_element(self, by, value):
+        self.commands += 1
+        return FakeElement(self)
+
+    def execute_script(self, script, *args):
+        self.commands += 1
+        self.scripts.append((script, args))
+        return self.state
+
+
+@pytest.fixture(autouse=True)
+def fresh_steps(monkeypatch):
+    monkeypatch.setenv("SELENIUM_WAIT_ENGINE", "polling")
+    monkeypatch.setattr(steps, "stats", steps.StepStats())
+
+
+def test_query_elements_sends_every_locator_in_one_script():
+    driver = FakeDriver(state={'heading': {'present': True}})
+    page = LoginPage(driver)
+
+    state = page.query_elements({'heading': (By.TAG_NAME, "h2"), 'error': (By.ID, "flash")},
+                                attributes=("value",))
+
+    assert state == {'heading': {'present': True}}
+    assert driver.commands == 1
+    script, (queries, attributes) = driver.scripts[0]
+    assert script == QUERY_ELEMENTS_JS
+    assert [query[0] for query in queries] == ['heading', 'error']
+    assert attributes == ["value"]
+
+
+@pytest.mark.parametrize("page_class", [LoginPage, SecurePage])
+def test_snapshot_queries_the_page_locators(page_class):
+    driver = FakeDriver()
+
+    page_class(driver).snapshot()
+
+    _, (queries, _) = driver.scripts[0]
+    assert [query[0] for query in queries] == list(page_class.SNAPSHOT_LOCATORS)
+
+
+@pytest.mark.parametrize("page_class, per_method", [
+    (LoginPage, login_page_per_method),
+    (SecurePage, secure_page_per_method),
+])
+def test_snapshot_replaces_per_method_round_trips(page_class, per_method):
+    """The command counts bench_snapshot reports, without a browser"""
+    per_method_driver, snapshot_driver = FakeDriver(), FakeDriver()
+
+    per_method(page_class(per_method_driver))
+    page_class(snapshot_driver).snapshot()
+
+    assert per_method_driver.commands == 8
+    assert snapshot_driver.commands == 1
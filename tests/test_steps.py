@@ -0,0 +1,85 @@
+"""
+Step Timing Tests
+Checks nesting, redaction and the trace export without a browser
+"""
+
+import pytest
+
+from utils import network, steps
+from utils.steps import StepStats, measure, step
+
+
+class DemoPage:
+    """Page-object shaped class with the same kind of nested steps as LoginPage"""
+
+    @step()
+    def type(self, locator, text):
+        pass
+
+    @step()
+    def login(self, username, password):
+        self.type(("id", "username"), username)
+        self.type(("id", "password"), password)
+
+    @step("Open broken page")
+    def open_broken(self):
+        raise TimeoutError("page did not load")
+
+
+@pytest.fixture
+def step_stats(monkeypatch):
+    monkeypatch.setenv("SELENIUM_TRACE_STEPS", "1")
+    monkeypatch.setattr(steps, "stats", StepStats())
+    monkeypatch.setattr(network, "current_test", "tests/test_x.py::test_a")
+    return steps.stats
+
+
+def test_steps_nest_and_redact_secrets(step_stats):
+    DemoPage().login("tomsmith", "SuperSecretPassword!")
+
+    [root] = step_stats.by_test["tests/test_x.py::test_a"]
+    assert root["name"] == "DemoPage.login"
+    assert root["args"] == {"username": "'tomsmith'", "password": "***"}
+    assert [child["args"]["text"] for child in root["children"]] == ["'tomsmith'", "***"]
+    assert step_stats.by_name["DemoPage.type"][0] == 2
+    assert "SuperSecretPassword" not in step_stats.html_timeline("tests/test_x.py::test_a")
+
+
+def test_failed_step_records_outcome(step_stats):
+    with pytest.raises(TimeoutError):
+        with measure("Checkout", order_id=7):
+            DemoPage().open_broken()
+
+    [root] = step_stats.by_test["tests/test_x.py::test_a"]
+    assert root["outcome"] == "failed: TimeoutError"
+    assert root["children"][0]["name"] == "Open broken page"
+    assert root["args"] == {"order_id": "7"}
+
+
+def test_chrome_trace_has_one_track_per_test(step_stats, monkeypatch):
+    DemoPage().login("tomsmith", "secret")
+    monkeypatch.setattr(network, "current_test", "tests/test_x.py::test_b")
+    DemoPage().type(("id", "q"), "selenium")
+    worker = StepStats()
+    worker.merge(step_stats.as_dict())
+
+    events = worker.chrome_trace()["traceEvents"]
+
+    spans = [event for event in events if event["ph"] == "X"]
+    tracks = {event["args"]["name"]: event["tid"] for event in events if event["name"] == "thread_name"}
+    assert len(spans) == 4
+    assert set(tracks) == {"tests/test_x.py::test_a", "tests/test_x.py::test_b"}
+    assert all(span["dur"] >= 0 and span["args"]["outcome"] == "passed" for span in spans)
+
+
+def test_disabled_steps_only_mark_that_they_run(step_stats, monkeypatch):
+    monkeypatch.delenv("SELENIUM_TRACE_STEPS")
+    finished, running = [], []
+    monkeypatch.setattr(steps, "_listeners", [finished.append])
+    monkeypatch.setattr(DemoPage, "type", step()(lambda self, locator, text: running.append(steps.in_step())))
+
+    DemoPage().login("tomsmith", "secret")
+
+    assert step_stats.by_test == {} and step_stats.by_name == {}
+    assert running == [True, True]
+    assert [(done["name"], done["args"], done["children"]) for done in finished] == [("DemoPage.login", {}, [])]
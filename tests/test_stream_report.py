@@ -0,0 +1,64 @@
+"""
+Streaming Report Tests
+Checks rows, attachments as files and thumbnails with fake test reports
+"""
+
+import base64
+from types import SimpleNamespace
+
+import pytest
+
+from utils.stream_report import StreamReport, outcome_of
+
+
+def phase(when, outcome="passed", **extra):
+    values = dict(nodeid="tests/test_x.py::test_a", when=when, duration=0.5, user_properties=[],
+                  failed=outcome == "failed", skipped=outcome == "skipped",
+                  longreprtext="AssertionError: boom" if outcome == "failed" else "")
+    values.update(extra)
+    return SimpleNamespace(**values)
+
+
+def test_outcome_from_phases():
+    assert outcome_of([phase("setup"), phase("call"), phase("teardown")]) == "passed"
+    assert outcome_of([phase("setup"), phase("call", "failed"), phase("teardown")]) == "failed"
+    assert outcome_of([phase("setup", "failed"), phase("teardown")]) == "error"
+    assert outcome_of([phase("setup", "skipped"), phase("teardown")]) == "skipped"
+
+
+def test_rows_are_written_as_tests_finish(tmp_path):
+    report = StreamReport(str(tmp_path / "index.html")).start()
+    image = base64.b64encode(b"GIF89a fake").decode()
+
+    for when in ("setup", "call", "teardown"):
+        outcome = "failed" if when == "call" else "passed"
+        extras = [{"format_type": "image", "content": image, "name": "Screencast", "extension": "gif"},
+                  {"format_type": "html", "content": "<div class='steps'>steps</div>"}] if when == "call" else []
+        report.add_report(phase(when, outcome, extras=extras))
+    report.finish()
+
+    page = (tmp_path / "index.html").read_text()
+    assert page.count("class='test failed'") == 1
+    assert "AssertionError: boom" in page and "<div class='steps'>steps</div>" in page
+    assert "base64" not in page
+    assert (tmp_path / "artifacts" / "1-0.gif").read_bytes() == b"GIF89a fake"
+    assert "src='artifacts/1-0.gif'" in page     # not an image Pillow can read: no thumbnail
+    assert page.rstrip().endswith("</html>")
+    assert report.counts == {"failed": 1}
+
+
+def test_screenshots_get_lazy_thumbnails(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    shot = tmp_path / "shots" / "login.png"
+    shot.parent.mkdir()
+    Image.new("RGB", (1280, 800)).save(shot)
+    report = StreamReport(str(tmp_path / "report" / "index.html")).start()
+
+    report.add_report(phase("setup"))
+    report.add_report(phase("teardown", screenshots=[str(shot)]))
+    report.finish()
+
+    page = (tmp_path / "report" / "index.html").read_text()
+    assert "<a href='../shots/login.png'><img loading='lazy' src='thumbs/1-s0.jpg'" in page
+    with Image.open(tmp_path / "report" / "thumbs" / "1-s0.jpg") as thumbnail:
+        assert thumbnail.size == (320, 200)
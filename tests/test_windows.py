@@ -3,19 +3,25 @@ Selenium Test - Handling Multiple Windows/Tabs
 Learn how to switch between browser windows and tabs.
 """
 
-from selenium import webdriver
+import sys
+import os
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-import time
+
+from utils.driver_factory import create_driver, quit_driver
+from utils.pacing import pause, page_ready
+from utils.screenshots import save_screenshot
+from utils.site import site_url
 
 def test_multiple_windows():
     print("\n🚀 Starting test: Multiple Windows/Tabs Handling")
     
-    chrome_options = Options()
-    chrome_options.add_argument('--start-maximized')
-    driver = webdriver.Chrome(options=chrome_options)
+    driver = create_driver()
     wait = WebDriverWait(driver, 10)
     
     try:
@@ -24,8 +30,8 @@ def test_multiple_windows():
         print("TEST 1: Opening and Switching to New Window")
         print("="*60)
         
-        driver.get("https://the-internet.herokuapp.com/windows")
-        time.sleep(2)
+        driver.get(site_url("/windows"))
+        pause(2, "page load", until=page_ready(driver))
         
         print(f"✅ Main page loaded: {driver.title}")
         print(f"📍 Main window URL: {driver.current_url}")
@@ -37,13 +43,13 @@ def test_multiple_windows():
         # Get all windows before clicking
         print(f"📊 Number of windows open: {len(driver.window_handles)}")
         
-        driver.save_screenshot("screenshots/windows_step1_main.png")
+        save_screenshot(driver, "screenshots/windows_step1_main.png")
         
         # Click to open new window
         print("\n🔘 Clicking 'Click Here' to open new window...")
         new_window_link = driver.find_element(By.LINK_TEXT, "Click Here")
         new_window_link.click()
-        time.sleep(2)
+        pause(2)
         
         # Wait for new window to open
         wait.until(EC.number_of_windows_to_be(2))
@@ -62,7 +68,7 @@ def test_multiple_windows():
                 print(f"✅ Switched to new window: {window}")
                 break
         
-        time.sleep(2)
+        pause(2)
         print(f"📄 New window title: {driver.title}")
         print(f"📍 New window URL: {driver.current_url}")
         
@@ -73,7 +79,7 @@ def test_multiple_windows():
         except:
             pass
         
-        driver.save_screenshot("screenshots/windows_step2_new_window.png")
+        save_screenshot(driver, "screenshots/windows_step2_new_window.png")
         
         # Close new window
         print("\n❌ Closing new window...")
@@ -86,7 +92,7 @@ def test_multiple_windows():
         print(f"✅ Back to main window!")
         print(f"📄 Main window title: {driver.title}")
         
-        driver.save_screenshot("screenshots/windows_step3_back_to_main.png")
+        save_screenshot(driver, "screenshots/windows_step3_back_to_main.png")
         
         print("🎉 TEST 1 PASSED: Window switching successful!")
         
@@ -95,8 +101,8 @@ def test_multiple_windows():
         print("TEST 2: Handling Multiple Windows at Once")
         print("="*60)
         
-        driver.get("https://the-internet.herokuapp.com/windows")
-        time.sleep(1)
+        driver.get(site_url("/windows"))
+        pause(1, "page load", until=page_ready(driver))
         
         main_window = driver.current_window_handle
         
@@ -104,7 +110,7 @@ def test_multiple_windows():
         print("\n🔘 Opening 3 new windows...")
         for i in range(3):
             driver.find_element(By.LINK_TEXT, "Click Here").click()
-            time.sleep(1)
+            pause(1)
             print(f"  ✅ Opened window {i+1}")
         
         wait.until(EC.number_of_windows_to_be(4))
@@ -117,7 +123,7 @@ def test_multiple_windows():
             print(f"  🪟 Window {i+1}:")
             print(f"     Title: {driver.title}")
             print(f"     URL: {driver.current_url}")
-            time.sleep(1)
+            pause(1)
         
         # Close all windows except main
         print("\n❌ Closing all windows except main...")
@@ -132,7 +138,7 @@ def test_multiple_windows():
         print("✅ Only main window remains!")
         print(f"📊 Windows remaining: {len(driver.window_handles)}")
         
-        driver.save_screenshot("screenshots/windows_step4_cleanup.png")
+        save_screenshot(driver, "screenshots/windows_step4_cleanup.png")
         
         print("🎉 TEST 2 PASSED: Multiple windows handled!")
         
@@ -145,8 +151,8 @@ def test_multiple_windows():
         
         # Open new tab using JavaScript
         print("\n🔘 Opening new tab with JavaScript...")
-        driver.execute_script("window.open('https://the-internet.herokuapp.com/', '_blank');")
-        time.sleep(2)
+        driver.execute_script(f"window.open('{site_url()}', '_blank');")
+        pause(2)
         
         wait.until(EC.number_of_windows_to_be(2))
         print("✅ New tab opened!")
@@ -159,7 +165,7 @@ def test_multiple_windows():
         print(f"✅ Switched to new tab")
         print(f"📄 New tab title: {driver.title}")
         
-        driver.save_screenshot("screenshots/windows_step5_new_tab.png")
+        save_screenshot(driver, "screenshots/windows_step5_new_tab.png")
         
         # Close new tab
         driver.close()
@@ -181,15 +187,15 @@ def test_multiple_windows():
         print("="*60)
         
         print("\n⏸️  Keeping browser open for 5 seconds...")
-        time.sleep(5)
+        pause(5, "keep browser open")
         
     except Exception as e:
         print(f"\n❌ ERROR: {e}")
-        driver.save_screenshot("screenshots/windows_error.png")
+        save_screenshot(driver, "screenshots/windows_error.png")
         
     finally:
         print("\n🧹 Closing browser...")
-        driver.quit()
+        quit_driver(driver)
         print("✅ Test completed!\n")
 
 if __name__ == "__main__":
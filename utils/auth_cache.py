@@ -0,0 +1,187 @@
+"""
+Authentication State Cache
+Log in once per worker, then reuse the session cookies in every test
+
+WHY:
+    Logging in through the UI costs a page load, two text inputs, a
+    click, a redirect and the password-popup check - in EVERY test that
+    only needs to start on the secure page. The session cookie is all
+    the server actually looks at.
+
+HOW:
+    1. First use: log in with a direct HTTP POST to /authenticate
+       (method="http") or let the fixture log in through the UI and
+       capture() the browser's cookies (method="ui")
+    2. Every later test: inject() sets the cookies through CDP
+       (no extra navigation needed) and opens the secure page directly
+    3. If the server sends us back to /login the session expired:
+       the cache is dropped and the caller falls back to a real login
+"""
+
+import http.cookiejar
+import time
+import urllib.parse
+import urllib.request
+
+
+class AuthStats:
+    """Counters for the auth cache"""
+
+    def __init__(self):
+        self.http_logins = 0    # logins done with a direct POST
+        self.ui_logins = 0      # logins captured from the browser
+        self.injections = 0     # tests that started logged-in via cookies
+        self.expired = 0        # cached sessions the server rejected
+
+    def as_dict(self):
+        """Counters as a plain dict (safe to send between xdist workers)"""
+        return dict(vars(self))
+
+    def merge(self, data):
+        """Add counters from another AuthStats.as_dict() (xdist aggregation)"""
+        for key, value in data.items():
+            setattr(self, key, getattr(self, key) + value)
+
+    def summary_lines(self):
+        """Human-readable lines for the terminal summary"""
+        return [
+            f"Logins: {self.http_logins} via HTTP, {self.ui_logins} via UI",
+            f"Cookie injections: {self.injections}  expired sessions: {self.expired}",
+        ]
+
+
+def _jar_to_cdp(jar):
+    """Convert http.cookiejar cookies to CDP Network.setCookies params"""
+    cookies = []
+    for cookie in jar:
+        entry = {
+            'name': cookie.name,
+            'value': cookie.value,
+            'path': cookie.path,
+            'secure': cookie.secure,
+            # cookiejar keeps unknown attributes as the server spelled them
+            'httpOnly': cookie.has_nonstandard_attr('HttpOnly') or cookie.has_nonstandard_attr('httponly'),
+        }
+        if cookie.domain_specified:
+            entry['domain'] = cookie.domain
+        else:
+            # Host-only cookie: CDP wants a URL instead of a domain
+            scheme = 'https' if cookie.secure else 'http'
+            entry['url'] = f"{scheme}://{cookie.domain}{cookie.path}"
+        if cookie.expires:
+            entry['expires'] = cookie.expires
+        cookies.append(entry)
+    return cookies
+
+
+def _selenium_to_cdp(cookies):
+    """Convert driver.get_cookies() dicts to CDP Network.setCookies params"""
+    converted = []
+    for cookie in cookies:
+        entry = {key: cookie[key] for key in
+                 ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite')
+                 if key in cookie}
+        if 'expiry' in cookie:
+            entry['expires'] = cookie['expiry']
+        converted.append(entry)
+    return converted
+
+
+class AuthStateCache:
+    """
+    Cached login session for one set of credentials
+
+    Args:
+        authenticate_url: Form action the login page posts to
+        secure_url: Page that requires a logged-in session
+        username: Login username
+        password: Login password
+        method: "http" to log in with a direct POST, "ui" to only reuse
+                cookies captured from a real browser login
+        max_age: Seconds after which cached cookies are considered stale
+    """
+
+    def __init__(self, authenticate_url, secure_url, username, password,
+                 method="http", max_age=600):
+        self.authenticate_url = authenticate_url
+        self.secure_url = secure_url
+        self.username = username
+        self.password = password
+        self.method = method
+        self.max_age = max_age
+        self.stats = AuthStats()
+        self._cookies = None
+        self._captured_at = 0.0
+
+    @property
+    def is_fresh(self):
+        """True when cookies are cached and younger than max_age"""
+        return bool(self._cookies) and time.time() - self._captured_at < self.max_age
+
+    def invalidate(self):
+        """Forget the cached session"""
+        self._cookies = None
+        self._captured_at = 0.0
+
+    def login_via_http(self):
+        """
+        Log in with a direct POST to the authenticate URL
+
+        Returns:
+            bool: True if the server redirected us to the secure page
+        """
+        jar = http.cookiejar.CookieJar()
+        opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(jar))
+        form = urllib.parse.urlencode({
+            'username': self.username,
+            'password': self.password,
+        }).encode()
+        try:
+            with opener.open(self.authenticate_url, data=form, timeout=15) as response:
+                landed = urllib.parse.urlsplit(response.geturl()).path
+        except OSError:
+            return False
+
+        if landed != urllib.parse.urlsplit(self.secure_url).path or not len(jar):
+            return False
+        self._cookies = _jar_to_cdp(jar)
+        self._captured_at = time.time()
+        self.stats.http_logins += 1
+        return True
+
+    def capture(self, driver):
+        """Remember the cookies of a browser that just logged in through the UI"""
+        self._cookies = _selenium_to_cdp(driver.get_cookies())
+        self._captured_at = time.time()
+        self.stats.ui_logins += 1
+
+    def inject(self, driver):
+        """
+        Start `driver` logged-in on the secure page using cached cookies
+
+        Logs in over HTTP first when nothing is cached and method="http".
+
+        Args:
+            driver: Selenium WebDriver instance
+
+        Returns:
+            bool: True if the browser is now on the secure page.
+                  False means the caller must log in through the UI.
+        """
+        if not self.is_fresh:
+            self.invalidate()
+            if self.method != "http" or not self.login_via_http():
+                return False
+
+        driver.execute_cdp_cmd("Network.setCookies", {'cookies': self._cookies})
+        driver.get(self.secure_url)
+
+        if urllib.parse.urlsplit(driver.current_url).path != urllib.parse.urlsplit(self.secure_url).path:
+            # Server bounced us to /login - the session is no longer valid
+            self.stats.expired += 1
+            self.invalidate()
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            return False
+
+        self.stats.injections += 1
+        return True
@@ -1,32 +1,186 @@
 """
 Browser Configuration Utilities
 Provides pre-configured browser options for test automation
+
+PROFILES (pick one with SELENIUM_BROWSER_PROFILE or pytest --browser-profile):
+    headed-debug   Visible, maximized window - watch the test run (default)
+    headless-ci    New headless mode at desktop size, safe defaults for CI
+    headless-lean  New headless mode tuned for speed: small fixed viewport,
+                   no GPU, no background throttling, no extensions and
+                   no component updates
+
+Measure them with: python -m benchmarks.bench_profiles
+
+BLOCKING POLICIES (SELENIUM_BLOCKING or pytest --block-resources):
+    off      Download everything (default)
+    media    No images, video/audio or web fonts
+    lean     media + third-party scripts + known analytics/ad hosts
+See utils/resource_policy.py for per-test and per-page-object rules.
+
+PAGE LOAD STRATEGY (SELENIUM_PAGE_LOAD or pytest --page-load):
+    normal   driver.get() waits for the load event (default)
+    eager    driver.get() returns at DOMContentLoaded
+    none     driver.get() returns right after navigation starts
+With eager/none, BasePage.open() waits for the page object's
+readiness contract instead (see utils/readiness.py).
 """
 
-from selenium.webdriver.chrome.options import Options
-import tempfile
 import os
 
+from selenium.webdriver.chrome.options import Options
+from utils.profile_manager import PROFILE_PREFS, new_profile_dir
+from utils.resource_policy import BlockPolicy
+
+
+DEFAULT_PROFILE = 'headed-debug'
+
+# Extra command line switches per profile (on top of the common ones)
+BROWSER_PROFILES = {
+    'headed-debug': [
+        '--start-maximized',
+    ],
+    'headless-ci': [
+        '--headless=new',
+        '--window-size=1920,1080',
+        '--disable-gpu',
+        '--no-sandbox',
+        '--disable-dev-shm-usage',
+    ],
+    'headless-lean': [
+        '--headless=new',
+        '--window-size=1280,800',
+        '--disable-gpu',
+        '--no-sandbox',
+        '--disable-dev-shm-usage',
+        '--disable-background-timer-throttling',
+        '--disable-backgrounding-occluded-windows',
+        '--disable-renderer-backgrounding',
+        '--disable-extensions',
+        '--disable-component-update',
+        '--disable-default-apps',
+        '--disable-sync',
+        '--mute-audio',
+    ],
+}
+
+
+DEFAULT_PAGE_LOAD = 'normal'
+PAGE_LOAD_STRATEGIES = ('normal', 'eager', 'none')
 
-def get_chrome_options():
+DEFAULT_BLOCKING = 'off'
+
+# Analytics / ads / tag managers - never asserted on
+TRACKER_PATTERNS = (
+    '*google-analytics.com/*',
+    '*googletagmanager.com/*',
+    '*doubleclick.net/*',
+    '*connect.facebook.net/*',
+    '*hotjar.com/*',
+)
+
+# Resource blocking presets (enforced through network interception)
+BLOCKING_POLICIES = {
+    'off': None,
+    'media': BlockPolicy(resource_types=('Image', 'Media', 'Font')),
+    'lean': BlockPolicy(
+        resource_types=('Image', 'Media', 'Font'),
+        url_patterns=TRACKER_PATTERNS,
+        third_party_types=('Script',),
+    ),
+}
+
+
+def get_profile_name(profile=None):
+    """
+    Resolve which browser profile to use
+
+    Args:
+        profile: Explicit profile name, or None to read SELENIUM_BROWSER_PROFILE
+
+    Returns:
+        str: A key of BROWSER_PROFILES
+
+    Raises:
+        ValueError: If the profile name is unknown
+    """
+    name = profile or os.environ.get('SELENIUM_BROWSER_PROFILE') or DEFAULT_PROFILE
+    if name not in BROWSER_PROFILES:
+        raise ValueError(
+            f"Unknown browser profile '{name}'. Choose from: {', '.join(BROWSER_PROFILES)}"
+        )
+    return name
+
+
+def get_blocking_policy(name=None):
+    """
+    Resolve the global resource blocking preset
+
+    Args:
+        name: Preset name, or None to read SELENIUM_BLOCKING
+
+    Returns:
+        BlockPolicy or None when blocking is off
+
+    Raises:
+        ValueError: If the preset name is unknown
+    """
+    name = name or os.environ.get('SELENIUM_BLOCKING') or DEFAULT_BLOCKING
+    if name not in BLOCKING_POLICIES:
+        raise ValueError(
+            f"Unknown blocking policy '{name}'. Choose from: {', '.join(BLOCKING_POLICIES)}"
+        )
+    return BLOCKING_POLICIES[name]
+
+
+def get_page_load_strategy(strategy=None):
+    """
+    Resolve the page load strategy
+
+    Args:
+        strategy: Explicit strategy, or None to read SELENIUM_PAGE_LOAD
+
+    Returns:
+        str: One of PAGE_LOAD_STRATEGIES
+
+    Raises:
+        ValueError: If the strategy is unknown
+    """
+    strategy = strategy or os.environ.get('SELENIUM_PAGE_LOAD') or DEFAULT_PAGE_LOAD
+    if strategy not in PAGE_LOAD_STRATEGIES:
+        raise ValueError(
+            f"Unknown page load strategy '{strategy}'. Choose from: {', '.join(PAGE_LOAD_STRATEGIES)}"
+        )
+    return strategy
+
+
+def get_chrome_options(profile=None):
     """
     Get Chrome options configured for test automation
     
-    Uses a temporary user profile to completely avoid password manager prompts.
+    Uses a throw-away copy of a prepared profile template to completely
+    avoid password manager prompts (see utils/profile_manager.py).
+    The copy is deleted when the driver is quit through
+    utils.driver_factory.quit_driver(), or at interpreter exit.
+    
+    Args:
+        profile: Name from BROWSER_PROFILES (default: SELENIUM_BROWSER_PROFILE
+                 environment variable, falling back to 'headed-debug')
     
     Returns:
         Options: Configured Chrome options
     """
+    profile_arguments = BROWSER_PROFILES[get_profile_name(profile)]
     chrome_options = Options()
+    chrome_options.page_load_strategy = get_page_load_strategy()
     
-    # Create temporary directory for Chrome profile
-    temp_dir = tempfile.mkdtemp()
-    
-    # Use temporary profile (completely fresh, no password manager history)
-    chrome_options.add_argument(f'--user-data-dir={temp_dir}')
+    # Fresh copy of the golden profile (no password manager history)
+    chrome_options.add_argument(f'--user-data-dir={new_profile_dir()}')
+    chrome_options.add_argument('--no-first-run')
+    chrome_options.add_argument('--no-default-browser-check')
     
-    # Window settings
-    chrome_options.add_argument('--start-maximized')
+    # Window / headless settings of the selected profile
+    for argument in profile_arguments:
+        chrome_options.add_argument(argument)
     
     # Disable password save bubble
     chrome_options.add_argument('--disable-save-password-bubble')
@@ -34,15 +188,8 @@ def get_chrome_options():
     chrome_options.add_argument('--disable-infobars')
     
     # Disable various browser prompts via preferences
-    prefs = {
-        'credentials_enable_service': False,
-        'profile.password_manager_enabled': False,
-        'autofill.profile_enabled': False,
-        'profile.default_content_setting_values.notifications': 2,
-    }
-    
-    chrome_options.add_experimental_option('prefs', prefs)
+    chrome_options.add_experimental_option('prefs', dict(PROFILE_PREFS))
     chrome_options.add_experimental_option('excludeSwitches', ['enable-automation', 'enable-logging'])
     chrome_options.add_experimental_option('useAutomationExtension', False)
     
-    return chrome_options
\ No newline at end of file
+    return chrome_options
@@ -0,0 +1,287 @@
+"""
+WebDriver Command Tracing
+Where does a slow test spend its time: find_element, execute_script, screenshots?
+
+WHY:
+    Everything BasePage does ends up as WebDriver commands (one HTTP
+    round trip to chromedriver each). Test durations alone do not say
+    whether a test is slow because of 200 findElement polls, one huge
+    screenshot or a slow script.
+
+HOW:
+    With SELENIUM_TRACE_COMMANDS=1 (or pytest --trace-commands) every
+    session from create_driver() - so every driver the fixtures hand out -
+    gets a CommandTracer wrapping driver.execute. Per command it records
+    the name, the locator (for find* commands and for commands on an
+    element found by locator), the duration and the payload size
+    (request params + response value, as JSON).
+
+    Results are histograms (count, total, p50/p95/p99) per test and per
+    browser session:
+        - pytest-html: a table in each test's row (setup + test body)
+        - SELENIUM_TRACE_FILE (default: reports/command_trace.json)
+        - terminal summary: all commands of the run
+
+    Disabled (the default) nothing is wrapped, so there is no overhead.
+"""
+
+import heapq
+import html
+import json
+import math
+import os
+import threading
+import time
+
+from utils import network
+
+
+# Slowest individual commands kept per test
+SLOWEST_PER_TEST = 5
+
+# Element id -> locator entries kept per session before starting over
+MAX_ELEMENTS = 5000
+
+_FIND_COMMANDS = {"findElement", "findElements", "findChildElement", "findChildElements"}
+
+
+def tracing_enabled():
+    return os.environ.get('SELENIUM_TRACE_COMMANDS') == '1'
+
+
+def get_trace_file():
+    return os.environ.get('SELENIUM_TRACE_FILE', os.path.join('reports', 'command_trace.json'))
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def histogram(durations_ms, size=0):
+    """count / total / p50 / p95 / p99 (ms) and bytes of one command"""
+    values = sorted(durations_ms)
+    return {
+        'count': len(values),
+        'total_ms': round(sum(values), 3),
+        'p50_ms': round(percentile(values, 0.50), 3),
+        'p95_ms': round(percentile(values, 0.95), 3),
+        'p99_ms': round(percentile(values, 0.99), 3),
+        'bytes': size,
+    }
+
+
+def _payload_size(value):
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        return len(value)
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+class TraceStats:
+    """Command durations and payload sizes per test and per browser session"""
+
+    def __init__(self):
+        self.by_test = {}          # nodeid -> {command: [[ms, ...], bytes]}
+        self.by_session = {}       # session id -> {command: [[ms, ...], bytes]}
+        self.slowest = {}          # nodeid -> heap of its slowest (ms, command, locator)
+        self._lock = threading.Lock()
+
+    def record(self, test, session, command, locator, ms, size):
+        test = test or "(no test)"
+        with self._lock:
+            for table, key in ((self.by_test, test), (self.by_session, session)):
+                entry = table.setdefault(key, {}).setdefault(command, [[], 0])
+                entry[0].append(ms)
+                entry[1] += size
+            slowest = self.slowest.setdefault(test, [])
+            item = (ms, command, locator or "")
+            if len(slowest) < SLOWEST_PER_TEST:
+                heapq.heappush(slowest, item)
+            elif ms > slowest[0][0]:
+                heapq.heapreplace(slowest, item)
+
+    def commands(self):
+        """{command: [[ms, ...], bytes]} over the whole run"""
+        combined = {}
+        for commands in self.by_session.values():
+            for command, (durations, size) in commands.items():
+                entry = combined.setdefault(command, [[], 0])
+                entry[0].extend(durations)
+                entry[1] += size
+        return combined
+
+    def histograms(self, commands):
+        """Histograms of one {command: [[ms, ...], bytes]} table, slowest total first"""
+        rows = {command: histogram(durations, size) for command, (durations, size) in commands.items()}
+        return dict(sorted(rows.items(), key=lambda row: -row[1]['total_ms']))
+
+    def as_dict(self):
+        """Counters as a plain dict (safe to send between xdist workers)"""
+        return {
+            'by_test': {test: {command: [list(d), s] for command, (d, s) in commands.items()}
+                        for test, commands in self.by_test.items()},
+            'by_session': {session: {command: [list(d), s] for command, (d, s) in commands.items()}
+                           for session, commands in self.by_session.items()},
+            'slowest': {test: [list(item) for item in items] for test, items in self.slowest.items()},
+        }
+
+    def merge(self, data):
+        """Add counters from another TraceStats.as_dict() (xdist aggregation)"""
+        for name in ('by_test', 'by_session'):
+            table = getattr(self, name)
+            for key, commands in data[name].items():
+                for command, (durations, size) in commands.items():
+                    entry = table.setdefault(key, {}).setdefault(command, [[], 0])
+                    entry[0].extend(durations)
+                    entry[1] += size
+        for test, items in data['slowest'].items():
+            merged = self.slowest.get(test, []) + [tuple(item) for item in items]
+            self.slowest[test] = heapq.nlargest(SLOWEST_PER_TEST, merged)
+            heapq.heapify(self.slowest[test])
+
+    def to_json(self):
+        """Machine-readable histograms per test, per session and for the run"""
+        return {
+            'commands': self.histograms(self.commands()),
+            'tests': {test: {
+                'commands': self.histograms(commands),
+                'slowest': [{'ms': round(ms, 3), 'command': command, 'locator': locator}
+                            for ms, command, locator in sorted(self.slowest.get(test, []), reverse=True)],
+            } for test, commands in sorted(self.by_test.items())},
+            'sessions': {session: self.histograms(commands)
+                         for session, commands in sorted(self.by_session.items())},
+        }
+
+    def _html(self, title, commands, slowest=()):
+        rows = "".join(
+            f"<tr><td>{html.escape(command)}</td><td>{row['count']}</td><td>{row['total_ms']:.0f}</td>"
+            f"<td>{row['p50_ms']:.1f}</td><td>{row['p95_ms']:.1f}</td><td>{row['p99_ms']:.1f}</td>"
+            f"<td>{row['bytes'] / 1024:.1f}</td></tr>"
+            for command, row in self.histograms(commands).items()
+        )
+        items = "".join(
+            f"<li>{ms:.0f} ms {html.escape(command)} {html.escape(locator)}</li>"
+            for ms, command, locator in sorted(slowest, reverse=True)
+        )
+        return (
+            f"<div class='command-trace'><b>{html.escape(title)}</b>"
+            "<table><tr><th>command</th><th>count</th><th>total ms</th><th>p50</th>"
+            f"<th>p95</th><th>p99</th><th>KiB</th></tr>{rows}</table>"
+            + (f"<b>Slowest</b><ul>{items}</ul>" if items else "") + "</div>"
+        )
+
+    def html_table(self, test):
+        """Histogram table of one test for the pytest-html report ('' if no commands)"""
+        commands = self.by_test.get(test)
+        if not commands:
+            return ""
+        return self._html("WebDriver commands", commands, self.slowest.get(test, []))
+
+    def html_summary(self):
+        """Histogram table of the whole run, one line per browser session"""
+        sessions = "".join(
+            f"<li>{html.escape(str(session))}: {sum(len(d) for d, _ in commands.values())} commands, "
+            f"{sum(sum(d) for d, _ in commands.values()) / 1000:.1f}s</li>"
+            for session, commands in sorted(self.by_session.items(), key=lambda item: str(item[0]))
+        )
+        return (self._html(f"WebDriver commands ({len(self.by_session)} browser sessions)", self.commands())
+                + f"<ul>{sessions}</ul>")
+
+    def summary_lines(self):
+        """Human-readable lines for the terminal summary"""
+        lines = [f"{'command':<28}{'count':>7}{'total':>10}{'p50':>9}{'p95':>9}{'p99':>9}{'KiB':>9}"]
+        for command, row in self.histograms(self.commands()).items():
+            lines.append(f"{command:<28}{row['count']:>7}{row['total_ms'] / 1000:>9.1f}s"
+                         f"{row['p50_ms']:>7.1f}ms{row['p95_ms']:>7.1f}ms{row['p99_ms']:>7.1f}ms"
+                         f"{row['bytes'] / 1024:>9.1f}")
+        lines.append(f"{len(self.by_test)} tests, {len(self.by_session)} browser sessions "
+                     f"(per-test histograms: {get_trace_file()})")
+        return lines
+
+
+stats = TraceStats()
+
+
+class CommandTracer:
+    """
+    Times every command of one driver by wrapping driver.execute
+
+    Element commands are reported with the locator the element was
+    found by, when it was found through this driver.
+    """
+
+    def __init__(self, driver):
+        self.session = driver.session_id
+        self._execute = driver.execute
+        self._locators = {}        # element id -> "using=value"
+        driver.execute = self.execute
+
+    def execute(self, driver_command, params=None):
+        locator = self._locator_of(driver_command, params)
+        start = time.perf_counter()
+        try:
+            response = self._execute(driver_command, params)
+        except Exception:
+            self._record(driver_command, locator, start, params, None)
+            raise
+        value = response.get('value') if isinstance(response, dict) else None
+        self._record(driver_command, locator, start, params, value)
+        if driver_command in _FIND_COMMANDS and locator:
+            self._remember(value, locator)
+        return response
+
+    def _record(self, command, locator, start, params, value):
+        ms = (time.perf_counter() - start) * 1000
+        size = _payload_size(params) + _payload_size(value)
+        stats.record(network.current_test, self.session, command, locator, ms, size)
+
+    def _locator_of(self, command, params):
+        if not params:
+            return None
+        if command in _FIND_COMMANDS:
+            return f"{params.get('using')}={params.get('value')}"
+        element_id = params.get('id')
+        return self._locators.get(element_id) if isinstance(element_id, str) else None
+
+    def _remember(self, value, locator):
+        elements = value if isinstance(value, list) else [value]
+        if len(self._locators) > MAX_ELEMENTS:
+            self._locators.clear()
+        for element in elements:
+            element_id = getattr(element, 'id', None)
+            if element_id:
+                self._locators[element_id] = locator
+
+
+def attach(driver):
+    """
+    Trace `driver`'s commands when tracing is enabled
+
+    Returns:
+        CommandTracer or None when disabled
+    """
+    if not tracing_enabled():
+        return None
+    return CommandTracer(driver)
+
+
+def write_trace_file(trace_stats, path=None):
+    """
+    Write the histograms as JSON
+
+    Returns:
+        str: Path written
+    """
+    path = path or get_trace_file()
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(trace_stats.to_json(), f, indent=2)
+    return path
@@ -0,0 +1,281 @@
+"""
+MutationObserver Wait Engine
+Waits that resolve INSIDE the page instead of polling from Python
+
+WHY:
+    WebDriverWait asks the browser "is it there yet?" every 500 ms -
+    one HTTP round-trip per poll, and up to 500 ms of extra latency
+    after the element actually appears. This engine sends ONE async
+    script that watches the DOM and answers the moment the condition
+    holds. The condition is only evaluated when something changed:
+    MutationObserver callbacks, plus - for visibility/clickable, which
+    CSS can change without a mutation - transition/animation ends and a
+    coarse RECHECK_MS timer. Nothing runs per frame in the page.
+
+CONDITIONS mirror selenium's expected_conditions and stay usable with a
+plain WebDriverWait (they are callables taking the driver):
+
+    presence_of_element_located(locator)
+    presence_of_all_elements_located(locator)
+    visibility_of_element_located(locator)
+    element_to_be_clickable(locator)
+    text_to_be_present_in_element(locator, text)
+
+USAGE:
+    wait = make_wait(driver, 10)          # engine picked by SELENIUM_WAIT_ENGINE
+    element = wait.until(visibility_of_element_located((By.ID, "finish")))
+
+If the script cannot run (alert open, page navigating away, scripts
+blocked) the wait falls back to normal WebDriverWait polling.
+"""
+
+import contextlib
+import os
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from utils.locator_js import LOCATOR_JS, locator_to_js
+
+
+OBSERVE_JS = LOCATOR_JS + r"""
+const [using, value, condition, text, timeoutMs, recheckMs] = arguments;
+const done = arguments[arguments.length - 1];
+
+function check() {
+    const found = __findAll(using, value);
+    const first = found[0];
+    switch (condition) {
+        case 'presence':     return first ? first : null;
+        case 'presence_all': return found.length ? found : null;
+        case 'visibility':   return __isVisible(first) ? first : null;
+        case 'clickable':    return __isVisible(first) && !first.disabled ? first : null;
+        case 'text':         return first && first.innerText.includes(text) ? true : null;
+    }
+    throw new Error('Unknown condition: ' + condition);
+}
+
+let finished = false;
+let observer = null;
+let recheck = null;
+const styleEvents = ['transitionend', 'animationend'];
+function finish(payload) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    if (recheck) clearInterval(recheck);
+    for (const name of styleEvents) document.removeEventListener(name, evaluate, true);
+    done(payload);
+}
+function evaluate() {
+    if (finished) return;
+    try {
+        const result = check();
+        if (result !== null) finish({ok: true, value: result});
+    } catch (e) {
+        finish({ok: false, error: String(e)});
+    }
+}
+
+evaluate();
+if (!finished) {
+    observer = new MutationObserver(evaluate);
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    if (condition === 'visibility' || condition === 'clickable') {
+        // CSS (transitions, media queries, stylesheet rules) can change
+        // visibility without any DOM mutation
+        for (const name of styleEvents) document.addEventListener(name, evaluate, true);
+        recheck = setInterval(evaluate, recheckMs);
+    }
+    setTimeout(() => finish({ok: false, timeout: true}), timeoutMs);
+}
+"""
+
+ENGINES = ("polling", "observer")
+
+# How often visibility/clickable waits re-check for CSS-only changes
+RECHECK_MS = 250
+
+
+class WaitStats:
+    """How the observer engine resolved its waits"""
+
+    def __init__(self):
+        self.observer_waits = 0   # resolved in-page
+        self.fallbacks = 0        # script could not run -> polled instead
+        self.timeouts = 0
+        self.wait_time_total = 0.0
+
+    def as_dict(self):
+        """Counters as a plain dict (safe to send between xdist workers)"""
+        return dict(vars(self))
+
+    def merge(self, data):
+        """Add counters from another WaitStats.as_dict() (xdist aggregation)"""
+        for key, value in data.items():
+            setattr(self, key, getattr(self, key) + value)
+
+    def summary_lines(self):
+        """Human-readable lines for the terminal summary"""
+        avg = self.wait_time_total / self.observer_waits if self.observer_waits else 0.0
+        return [
+            f"Observer waits: {self.observer_waits} (avg {avg * 1000:.0f}ms)  "
+            f"timeouts: {self.timeouts}  polling fallbacks: {self.fallbacks}",
+        ]
+
+
+stats = WaitStats()
+
+
+# ==================== CONDITIONS ====================
+
+class DomCondition:
+    """
+    An expected condition the observer engine can evaluate in the page
+
+    Calling it with a driver behaves exactly like the matching
+    selenium expected_condition, which is what the polling fallback uses.
+    """
+
+    def __init__(self, kind, locator, polling_condition, text=None):
+        self.kind = kind
+        self.locator = locator
+        self.text = text
+        self._polling_condition = polling_condition
+
+    def __call__(self, driver):
+        return self._polling_condition(driver)
+
+    def __repr__(self):
+        return f"{self.kind}{self.locator}"
+
+
+def presence_of_element_located(locator):
+    return DomCondition('presence', locator, EC.presence_of_element_located(locator))
+
+
+def presence_of_all_elements_located(locator):
+    return DomCondition('presence_all', locator, EC.presence_of_all_elements_located(locator))
+
+
+def visibility_of_element_located(locator):
+    return DomCondition('visibility', locator, EC.visibility_of_element_located(locator))
+
+
+def element_to_be_clickable(locator):
+    return DomCondition('clickable', locator, EC.element_to_be_clickable(locator))
+
+
+def text_to_be_present_in_element(locator, text):
+    return DomCondition('text', locator, EC.text_to_be_present_in_element(locator, text), text=text)
+
+
+# ==================== ENGINES ====================
+
+class ObserverWait:
+    """
+    Drop-in for WebDriverWait(driver, timeout) using the in-page observer
+
+    Conditions that are not DomConditions (e.g. EC.url_contains) are
+    simply polled with WebDriverWait.
+    """
+
+    def __init__(self, driver, timeout):
+        self.driver = driver
+        self.timeout = timeout
+        self._session_script_timeout = None   # read from the session on first use
+
+    @contextlib.contextmanager
+    def _script_timeout(self):
+        """
+        Let the async script run longer than the wait itself
+
+        The session's script timeout is only ever raised, and put back
+        when the wait is over.
+        """
+        if self._session_script_timeout is None:
+            self._session_script_timeout = self.driver.timeouts.script
+        needed = self.timeout + 2
+        if self._session_script_timeout >= needed:
+            yield
+            return
+        self.driver.set_script_timeout(needed)
+        try:
+            yield
+        finally:
+            self.driver.set_script_timeout(self._session_script_timeout)
+
+    def _poll(self, condition, timeout, message):
+        return WebDriverWait(self.driver, max(timeout, 0)).until(condition, message)
+
+    def until(self, condition, message=""):
+        """
+        Wait until `condition` holds
+
+        Returns:
+            Whatever the condition returns (element, list of elements or True)
+
+        Raises:
+            TimeoutException: Condition not met within the timeout
+        """
+        if not isinstance(condition, DomCondition):
+            return self._poll(condition, self.timeout, message)
+
+        start = time.perf_counter()
+        try:
+            with self._script_timeout():
+                result = self.driver.execute_async_script(
+                    OBSERVE_JS,
+                    *locator_to_js(condition.locator),
+                    condition.kind,
+                    condition.text,
+                    int(self.timeout * 1000),
+                    RECHECK_MS,
+                )
+        except WebDriverException:
+            stats.fallbacks += 1
+            return self._poll(condition, self.timeout - (time.perf_counter() - start), message)
+
+        elapsed = time.perf_counter() - start
+        if result.get('ok'):
+            stats.observer_waits += 1
+            stats.wait_time_total += elapsed
+            return result['value']
+        if result.get('timeout'):
+            stats.timeouts += 1
+            raise TimeoutException(message or f"Timed out after {self.timeout}s waiting for {condition!r}")
+
+        # The script itself failed (e.g. unsupported locator) - let polling decide
+        stats.fallbacks += 1
+        return self._poll(condition, self.timeout - elapsed, message)
+
+
+def get_wait_engine():
+    """
+    Selected wait engine
+
+    Returns:
+        str: "polling" (default) or "observer", from SELENIUM_WAIT_ENGINE
+    """
+    engine = os.environ.get('SELENIUM_WAIT_ENGINE', 'polling')
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown wait engine '{engine}'. Choose from: {', '.join(ENGINES)}")
+    return engine
+
+
+def make_wait(driver, timeout):
+    """
+    Create a wait object for the selected engine
+
+    Args:
+        driver: Selenium WebDriver instance
+        timeout: Seconds to wait
+
+    Returns:
+        WebDriverWait or ObserverWait (both offer .until(condition))
+    """
+    if get_wait_engine() == 'observer':
+        return ObserverWait(driver, timeout)
+    return WebDriverWait(driver, timeout)
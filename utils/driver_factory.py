@@ -0,0 +1,108 @@
+"""
+Driver Factory
+Single place where the framework launches Chrome WebDriver sessions
+"""
+
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+from utils.browser_config import get_blocking_policy, get_chrome_options
+from utils.driver_service import (
+    get_shared_service,
+    invalidate_shared_service,
+    shared_service_enabled,
+)
+from utils.profile_manager import release_profile_dir
+from utils import command_trace, network, reaper, screencast
+from utils.http_replay import replay_handler
+from utils.resource_policy import blocking_handler
+
+
+def create_driver(options=None):
+    """
+    Launch a new Chrome WebDriver session
+
+    Fixtures and pools call this instead of ``webdriver.Chrome(...)`` so
+    that every browser the framework starts is configured the same way.
+    Sessions are opened against the worker's shared chromedriver
+    (see utils/driver_service.py) unless SELENIUM_SHARED_SERVICE=0.
+    Enabled network features (resource blocking, record/replay) are attached before
+    the driver is returned, see utils/network.py, and so are the command
+    tracer (utils/command_trace.py) when SELENIUM_TRACE_COMMANDS=1 and
+    the screencast recorder (utils/screencast.py) when SELENIUM_SCREENCAST=1.
+
+    Args:
+        options: Chrome options to use (defaults to get_chrome_options())
+
+    Returns:
+        WebDriver: A freshly started Chrome session
+    """
+    if options is None:
+        options = get_chrome_options()
+    driver = _launch(options)
+    reaper.track_driver(driver)
+    try:
+        network.attach(driver, network_handlers())
+    except Exception:
+        quit_driver(driver)
+        raise
+    command_trace.attach(driver)
+    screencast.attach(driver)
+    return driver
+
+
+def _launch(options):
+    if not shared_service_enabled():
+        return webdriver.Chrome(options=options)
+
+    try:
+        return webdriver.Chrome(options=options, service=get_shared_service(options))
+    except SessionNotCreatedException:
+        # Usually a cached chromedriver that no longer matches Chrome
+        invalidate_shared_service(options)
+        return webdriver.Chrome(options=options, service=get_shared_service(options))
+
+
+def network_handlers():
+    """
+    Network interception features enabled for new sessions
+
+    Returns:
+        list: NetworkHandlers (None for disabled features), highest priority first
+    """
+    return [blocking_handler(get_blocking_policy()), replay_handler()]
+
+
+def get_profile_dir(driver):
+    """
+    Get the --user-data-dir Chrome is running with
+
+    chromedriver reports it in the session capabilities, so this works
+    for any session no matter which options built it.
+
+    Returns:
+        str: Profile directory path, or None if unknown
+    """
+    try:
+        return driver.capabilities.get('chrome', {}).get('userDataDir')
+    except Exception:
+        return None
+
+
+def quit_driver(driver):
+    """
+    Quit a session AND delete its temporary Chrome profile
+
+    Only profiles handed out by utils.profile_manager are deleted.
+
+    Args:
+        driver: Selenium WebDriver instance
+    """
+    profile_dir = get_profile_dir(driver)
+    screencast.detach(driver)
+    network.detach(driver)
+    try:
+        driver.quit()
+    finally:
+        reaper.untrack_driver(driver)
+        if profile_dir:
+            release_profile_dir(profile_dir)
@@ -0,0 +1,199 @@
+"""
+Warm WebDriver Pool
+Keeps pre-launched Chrome sessions alive and hands them out to tests
+
+WHY:
+    Launching Chrome + chromedriver costs far more than most of our
+    login tests take to run. The pool launches browsers once per
+    pytest (or xdist worker) session and resets them between tests
+    instead of quitting and relaunching.
+
+RESET between tests:
+    - accept/dismiss any open alert
+    - close extra windows and tabs
+    - leave any frame (back to default content)
+    - clear cookies, localStorage and sessionStorage
+    - navigate to about:blank
+"""
+
+import time
+
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+
+from utils.driver_factory import create_driver, quit_driver
+
+
+def reset_session(driver):
+    """
+    Return a browser session to a clean state for the next test
+
+    Args:
+        driver: Selenium WebDriver instance
+
+    Raises:
+        WebDriverException: If the session can no longer be reset
+    """
+    # 1. Alerts block every other command, so they go first
+    try:
+        driver.switch_to.alert.dismiss()
+    except NoAlertPresentException:
+        pass
+
+    # 2. Close every window except the first one
+    handles = driver.window_handles
+    main_window = handles[0]
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(main_window)
+
+    # 3. Leave any iframe the test switched into
+    driver.switch_to.default_content()
+
+    # 4. Storage for the current origin + cookies for ALL origins
+    try:
+        driver.execute_script(
+            "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+        )
+    except WebDriverException:
+        pass  # about:blank / data: pages have no storage
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+
+    # 5. Blank page so the next test starts from nothing
+    driver.get("about:blank")
+
+
+class PoolStats:
+    """Counters describing how well the pool is doing"""
+
+    def __init__(self):
+        self.hits = 0              # acquire() served by a warm browser
+        self.misses = 0            # acquire() had to launch a browser
+        self.resets = 0            # successful resets
+        self.reset_failures = 0    # resets that raised (browser recycled)
+        self.recycled = 0          # browsers quit because of max_uses or failure
+        self.reset_time_total = 0.0
+
+    @property
+    def reset_time_avg(self):
+        """Average reset time in seconds"""
+        return self.reset_time_total / self.resets if self.resets else 0.0
+
+    def as_dict(self):
+        """Counters as a plain dict (safe to send between xdist workers)"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'resets': self.resets,
+            'reset_failures': self.reset_failures,
+            'recycled': self.recycled,
+            'reset_time_total': self.reset_time_total,
+        }
+
+    def merge(self, data):
+        """Add counters from another PoolStats.as_dict() (xdist aggregation)"""
+        for key, value in data.items():
+            setattr(self, key, getattr(self, key) + value)
+
+    def summary_lines(self):
+        """Human-readable lines for the terminal summary"""
+        return [
+            f"Pool hits: {self.hits}  misses: {self.misses}",
+            f"Resets: {self.resets}  failed: {self.reset_failures}  recycled: {self.recycled}",
+            f"Reset time: total {self.reset_time_total:.2f}s  avg {self.reset_time_avg * 1000:.0f}ms",
+        ]
+
+
+class DriverPool:
+    """
+    Pool of warm Chrome sessions
+
+    Usage:
+        pool = DriverPool(size=1, max_uses=25)
+        pool.warm()
+        driver = pool.acquire()
+        ...                      # run the test
+        pool.release(driver)     # reset + return to pool (or recycle)
+        pool.close()
+
+    Args:
+        factory: Callable that launches a new driver (default: create_driver)
+        size: Number of browsers to pre-launch in warm()
+        max_uses: Recycle a browser after this many tests (0 = never)
+        reset: Callable used to clean a session between tests
+    """
+
+    def __init__(self, factory=create_driver, size=1, max_uses=25, reset=reset_session):
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.reset = reset
+        self.stats = PoolStats()
+        self._idle = []
+        self._uses = {}
+
+    def _launch(self):
+        driver = self.factory()
+        self._uses[id(driver)] = 0
+        return driver
+
+    def warm(self):
+        """Pre-launch browsers until `size` sessions are idle"""
+        while len(self._idle) < self.size:
+            self._idle.append(self._launch())
+
+    def acquire(self):
+        """
+        Hand out a browser session for one test
+
+        Returns:
+            WebDriver: A warm session (hit) or a newly launched one (miss)
+        """
+        if self._idle:
+            self.stats.hits += 1
+            driver = self._idle.pop()
+        else:
+            self.stats.misses += 1
+            driver = self._launch()
+        self._uses[id(driver)] += 1
+        return driver
+
+    def release(self, driver):
+        """
+        Give a session back after a test
+
+        The session is reset and returned to the pool. It is quit instead
+        when it reached max_uses or when the reset failed.
+        """
+        if self.max_uses and self._uses.get(id(driver), 0) >= self.max_uses:
+            self._discard(driver)
+            return
+
+        start = time.perf_counter()
+        try:
+            self.reset(driver)
+        except Exception:
+            self.stats.reset_failures += 1
+            self._discard(driver)
+            return
+        self.stats.resets += 1
+        self.stats.reset_time_total += time.perf_counter() - start
+        self._idle.append(driver)
+
+    def _discard(self, driver):
+        self.stats.recycled += 1
+        self._uses.pop(id(driver), None)
+        try:
+            quit_driver(driver)
+        except Exception:
+            pass
+
+    def close(self):
+        """Quit every idle browser (call at session end)"""
+        while self._idle:
+            driver = self._idle.pop()
+            self._uses.pop(id(driver), None)
+            try:
+                quit_driver(driver)
+            except Exception:
+                pass
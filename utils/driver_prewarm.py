@@ -0,0 +1,134 @@
+"""
+Pipelined Browser Launcher
+Starts the NEXT Chrome session in the background while the current test runs
+
+WHY:
+    Some suites must keep a fresh browser per test. Without pipelining
+    each test pays "launch Chrome" before and "quit Chrome" after.
+    Here both happen on background threads:
+
+        test N runs      |=========|
+        launch for N+1   |=====|
+        quit of N-1      |===|
+
+    so the fixture only waits when a launch takes longer than a test.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.driver_factory import create_driver, quit_driver
+
+
+class PrewarmStats:
+    """Counters for the pipelined launcher"""
+
+    def __init__(self):
+        self.launches = 0          # browsers started in the background
+        self.handed_out = 0        # sessions given to tests
+        self.wait_time_total = 0.0 # time tests waited for a launch to finish
+        self.failed_launches = 0
+
+    def as_dict(self):
+        """Counters as a plain dict (safe to send between xdist workers)"""
+        return {
+            'launches': self.launches,
+            'handed_out': self.handed_out,
+            'wait_time_total': self.wait_time_total,
+            'failed_launches': self.failed_launches,
+        }
+
+    def merge(self, data):
+        """Add counters from another PrewarmStats.as_dict() (xdist aggregation)"""
+        for key, value in data.items():
+            setattr(self, key, getattr(self, key) + value)
+
+    def summary_lines(self):
+        """Human-readable lines for the terminal summary"""
+        avg = self.wait_time_total / self.handed_out if self.handed_out else 0.0
+        return [
+            f"Sessions: {self.handed_out}  background launches: {self.launches}  "
+            f"failed: {self.failed_launches}",
+            f"Fixture wait: total {self.wait_time_total:.2f}s  avg {avg * 1000:.0f}ms",
+        ]
+
+
+class DriverPrewarmer:
+    """
+    Launch-ahead / quit-behind driver source
+
+    Usage:
+        prewarmer = DriverPrewarmer()
+        prewarmer.start()              # begin launching the first browser
+        driver = prewarmer.acquire()   # get it, next launch starts at once
+        ...                            # run the test
+        prewarmer.release(driver)      # quit + profile cleanup in background
+        prewarmer.close()
+
+    Args:
+        factory: Callable that launches a new driver (default: create_driver)
+        dispose: Callable that quits a driver (default: quit_driver)
+    """
+
+    def __init__(self, factory=create_driver, dispose=quit_driver):
+        self.factory = factory
+        self.dispose = dispose
+        self.stats = PrewarmStats()
+        self._launcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prewarm")
+        self._reaper = ThreadPoolExecutor(max_workers=2, thread_name_prefix="quit")
+        self._next = None
+
+    def _launch(self):
+        self.stats.launches += 1
+        return self.factory()
+
+    def start(self):
+        """Start launching the first browser in the background"""
+        if self._next is None:
+            self._next = self._launcher.submit(self._launch)
+
+    def acquire(self):
+        """
+        Hand out the pre-launched session and start launching the next one
+
+        Returns:
+            WebDriver: A freshly launched session
+
+        Raises:
+            Exception: Whatever the launch raised (after one direct retry)
+        """
+        self.start()
+        start = time.perf_counter()
+        future, self._next = self._next, None
+        try:
+            driver = future.result()
+        except Exception:
+            # A background launch failed - try once more on this thread
+            self.stats.failed_launches += 1
+            driver = self._launch()
+        self.stats.wait_time_total += time.perf_counter() - start
+        self.stats.handed_out += 1
+
+        self.start()  # pipeline: next browser boots while this test runs
+        return driver
+
+    def release(self, driver):
+        """Quit a used session (and delete its profile) off the critical path"""
+        self._reaper.submit(self._dispose_quietly, driver)
+
+    def _dispose_quietly(self, driver):
+        try:
+            self.dispose(driver)
+        except Exception:
+            pass
+
+    def close(self):
+        """Quit the unused pre-launched browser and wait for pending quits"""
+        future, self._next = self._next, None
+        if future is not None:
+            try:
+                self.release(future.result())
+            except Exception:
+                pass
+        self._launcher.shutdown(wait=True)
+        self._reaper.shutdown(wait=True)
@@ -0,0 +1,226 @@
+"""
+Shared chromedriver Service
+One long-lived chromedriver process per worker, shared by every session
+
+WHY:
+    webdriver.Chrome(options=...) normally (1) asks Selenium Manager
+    where chromedriver is and (2) spawns a new chromedriver process,
+    for every single session. chromedriver can serve many sessions,
+    so each pytest / xdist worker process starts it ONCE and opens all
+    sessions against it. The resolved driver path is cached on disk,
+    so later runs skip Selenium Manager entirely.
+
+Environment:
+    SELENIUM_SHARED_SERVICE  "0" to spawn a chromedriver per session again
+    SELENIUM_CHROMEDRIVER    Explicit chromedriver path (skips resolution)
+    SELENIUM_DRIVER_CACHE    Cache file (default: ~/.cache/selenium-mastery/drivers.json)
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.selenium_manager import SeleniumManager
+
+
+DEFAULT_CACHE_FILE = os.path.join(
+    os.path.expanduser('~'), '.cache', 'selenium-mastery', 'drivers.json'
+)
+
+_lock = threading.Lock()
+_shared_service = None
+
+
+class ServiceStats:
+    """Counters for driver resolution and chromedriver process spawns"""
+
+    def __init__(self):
+        self.sessions = 0          # sessions opened against the shared service
+        self.spawns = 0            # chromedriver processes actually started
+        self.spawn_time_total = 0.0
+        self.lookups = 0           # Selenium Manager runs
+        self.lookup_time_total = 0.0
+        self.cache_hits = 0        # driver path served from the disk cache
+
+    @property
+    def spawn_time_saved(self):
+        """Spawn time NOT paid because sessions reused the running service"""
+        if not self.spawns:
+            return 0.0
+        return (self.sessions - self.spawns) * (self.spawn_time_total / self.spawns)
+
+    def as_dict(self):
+        """Counters as a plain dict (safe to send between xdist workers)"""
+        return dict(vars(self))
+
+    def merge(self, data):
+        """Add counters from another ServiceStats.as_dict() (xdist aggregation)"""
+        for key, value in data.items():
+            setattr(self, key, getattr(self, key) + value)
+
+    def summary_lines(self):
+        """Human-readable lines for the terminal summary"""
+        avg_spawn = self.spawn_time_total / self.spawns if self.spawns else 0.0
+        per_session = self.spawn_time_saved / self.sessions if self.sessions else 0.0
+        return [
+            f"Sessions: {self.sessions}  chromedriver spawns: {self.spawns}  "
+            f"(avg spawn {avg_spawn * 1000:.0f}ms)",
+            f"Spawn time saved: {self.spawn_time_saved:.2f}s total, "
+            f"{per_session * 1000:.0f}ms per session",
+            f"Driver lookups: {self.lookups} ({self.lookup_time_total:.2f}s)  "
+            f"disk cache hits: {self.cache_hits}",
+        ]
+
+
+stats = ServiceStats()
+
+
+def shared_service_enabled():
+    """True unless SELENIUM_SHARED_SERVICE=0"""
+    return os.environ.get('SELENIUM_SHARED_SERVICE', '1') != '0'
+
+
+def _cache_file():
+    return os.environ.get('SELENIUM_DRIVER_CACHE', DEFAULT_CACHE_FILE)
+
+
+def _cache_key(options):
+    return '|'.join([
+        options.capabilities.get('browserName', 'chrome'),
+        options.browser_version or 'stable',
+        getattr(options, 'binary_location', '') or 'default',
+    ])
+
+
+def _read_cache():
+    try:
+        with open(_cache_file()) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(cache):
+    path = _cache_file()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(cache, f, indent=2)
+    os.replace(tmp_path, path)  # atomic - several workers may write at once
+
+
+def resolve_driver_path(options, refresh=False):
+    """
+    Find the chromedriver binary, using the on-disk cache when possible
+
+    Args:
+        options: Chrome options (browser version / binary decide the driver)
+        refresh: Ignore the cache and ask Selenium Manager again
+
+    Returns:
+        str: Path of the chromedriver executable
+    """
+    explicit = os.environ.get('SELENIUM_CHROMEDRIVER')
+    if explicit:
+        return explicit
+
+    key = _cache_key(options)
+    cache = _read_cache()
+    cached = cache.get(key)
+    if not refresh and cached and os.access(cached, os.X_OK):
+        stats.cache_hits += 1
+        return cached
+
+    start = time.perf_counter()
+    path = SeleniumManager().driver_location(options)
+    stats.lookups += 1
+    stats.lookup_time_total += time.perf_counter() - start
+
+    cache[key] = path
+    try:
+        _write_cache(cache)
+    except OSError:
+        pass  # read-only home - just resolve again next run
+    return path
+
+
+class SharedService(Service):
+    """
+    chromedriver Service that survives driver.quit()
+
+    ChromiumDriver calls service.start() in __init__ and service.stop()
+    in quit(). Here start() only spawns chromedriver when it is not
+    already running, and stop() is a no-op - shutdown() really stops it.
+    """
+
+    def start(self):
+        with _lock:
+            stats.sessions += 1
+            process = getattr(self, 'process', None)
+            if process is not None and process.poll() is None and self.is_connectable():
+                return
+            start = time.perf_counter()
+            super().start()
+            stats.spawns += 1
+            stats.spawn_time_total += time.perf_counter() - start
+
+    def stop(self):
+        pass  # sessions come and go, the service stays
+
+    def shutdown(self):
+        """Stop the chromedriver process for good (no-op if it never started)"""
+        if getattr(self, 'process', None) is not None:
+            super().stop()
+
+    def __del__(self):
+        try:
+            self.shutdown()
+        except Exception:
+            pass
+
+
+def get_shared_service(options):
+    """
+    Get this process's shared chromedriver Service (created on first use)
+
+    Args:
+        options: Chrome options used to resolve the driver binary
+
+    Returns:
+        SharedService: The service all sessions in this worker share
+    """
+    global _shared_service
+    with _lock:
+        if _shared_service is None:
+            _shared_service = SharedService(executable_path=resolve_driver_path(options))
+        return _shared_service
+
+
+def invalidate_shared_service(options):
+    """
+    Throw away the shared service and the cached driver path
+
+    Used when session creation fails, e.g. because Chrome was updated
+    and the cached chromedriver no longer matches it.
+    """
+    global _shared_service
+    with _lock:
+        service, _shared_service = _shared_service, None
+    if service is not None:
+        service.shutdown()
+    resolve_driver_path(options, refresh=True)
+
+
+def shutdown_shared_service():
+    """Stop the shared chromedriver (registered to run at exit)"""
+    global _shared_service
+    with _lock:
+        service, _shared_service = _shared_service, None
+    if service is not None:
+        service.shutdown()
+
+
+atexit.register(shutdown_shared_service)
@@ -0,0 +1,358 @@
+"""
+Test Durations and History-Based xdist Scheduling
+Give every xdist worker about the same amount of work, using past run times
+
+WHY:
+    Script-style tests take anywhere from a few seconds
+    (test_invalid_credentials cases) to 30+ s (test_advanced_features.py,
+    test_windows.py). xdist's "load" distribution hands tests out in
+    collection order, so a long test often starts last and the other
+    workers sit idle until it is done.
+
+HOW:
+    1. Every run stores how long each test took (setup + call + teardown,
+       smoothed over runs) in a small JSON file, together with the
+       test's browser affinity.
+    2. With -n, HistoryScheduling replaces xdist's LoadScheduling:
+       - tests with the same browser affinity are kept together in
+         chunks of at most one worker's fair share, so they run on a
+         worker whose browser / cached login is already warm
+       - chunks go out longest first to whichever worker is free
+         (longest-processing-time-first list scheduling)
+    3. The terminal summary compares the predicted makespan (time until
+       the last worker finishes) with the real one.
+
+    Browser affinity: @pytest.mark.browser_affinity("name"), or
+    "logged-in" for tests using logged_in_secure_page. xdist's controller
+    never collects tests itself, so affinities (like durations) are
+    learned from the previous run. Tests the store has never seen are
+    predicted at the median known duration.
+
+Environment:
+    SELENIUM_DURATIONS_FILE   Store (default: ~/.cache/selenium-mastery/durations.json)
+    SELENIUM_XDIST_SCHEDULE   history (default) | load (plain xdist scheduling)
+"""
+
+import heapq
+import json
+import os
+import statistics
+import tempfile
+import time
+
+from xdist.scheduler import LoadScheduling
+
+
+SCHEDULES = ("history", "load")
+
+DEFAULT_STORE_FILE = os.path.join(
+    os.path.expanduser('~'), '.cache', 'selenium-mastery', 'durations.json'
+)
+
+# Prediction for unknown tests when the store is still empty
+DEFAULT_DURATION = 10.0
+
+# Weight of the newest run in the smoothed duration
+SMOOTHING = 0.5
+
+AFFINITY_PROPERTY = "browser_affinity"
+
+
+def get_schedule():
+    """
+    Scheduler for xdist runs from SELENIUM_XDIST_SCHEDULE
+
+    Raises:
+        ValueError: Unknown scheduler name
+    """
+    schedule = os.environ.get('SELENIUM_XDIST_SCHEDULE', 'history')
+    if schedule not in SCHEDULES:
+        raise ValueError(f"Unknown xdist schedule '{schedule}'. Choose from: {', '.join(SCHEDULES)}")
+    return schedule
+
+
+def get_store_file():
+    return os.environ.get('SELENIUM_DURATIONS_FILE', DEFAULT_STORE_FILE)
+
+
+def affinity_of(item):
+    """
+    Browser affinity of a pytest item (None = can run anywhere)
+
+    Args:
+        item: pytest item
+    """
+    marker = item.get_closest_marker("browser_affinity")
+    if marker is not None and marker.args:
+        return str(marker.args[0])
+    if "logged_in_secure_page" in getattr(item, "fixturenames", ()):
+        return "logged-in"
+    return None
+
+
+class DurationStore:
+    """
+    Smoothed duration and browser affinity per test nodeid, on disk
+
+    Args:
+        path: JSON file (default: SELENIUM_DURATIONS_FILE)
+    """
+
+    def __init__(self, path=None):
+        self.path = path or get_store_file()
+        self.tests = {}            # nodeid -> {"duration": s, "runs": n, "affinity": name}
+        try:
+            with open(self.path) as f:
+                self.tests = json.load(f).get('tests', {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def predict(self, nodeid):
+        """Expected duration in seconds, or None for a test never seen"""
+        entry = self.tests.get(nodeid)
+        return entry['duration'] if entry else None
+
+    def affinity(self, nodeid):
+        entry = self.tests.get(nodeid)
+        return entry.get('affinity') if entry else None
+
+    def default_duration(self):
+        """Prediction for tests the store does not know"""
+        known = [entry['duration'] for entry in self.tests.values()]
+        return statistics.median(known) if known else DEFAULT_DURATION
+
+    def record(self, nodeid, duration, affinity=None):
+        entry = self.tests.get(nodeid)
+        if entry is None:
+            entry = self.tests[nodeid] = {'duration': duration, 'runs': 0}
+        else:
+            entry['duration'] = SMOOTHING * duration + (1 - SMOOTHING) * entry['duration']
+        entry['runs'] += 1
+        entry['affinity'] = affinity
+
+    def save(self):
+        """Write the store atomically (safe against runs finishing at once)"""
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'version': 1, 'tests': self.tests}, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+
+class DurationRecorder:
+    """Adds up the setup / call / teardown reports of each test"""
+
+    def __init__(self):
+        self.finished = {}         # nodeid -> (seconds, affinity)
+        self._running = {}         # nodeid -> [seconds so far, skipped]
+
+    def add_report(self, report):
+        entry = self._running.setdefault(report.nodeid, [0.0, False])
+        entry[0] += report.duration
+        entry[1] = entry[1] or report.skipped
+        if report.when != "teardown":
+            return
+        seconds, skipped = self._running.pop(report.nodeid)
+        if not skipped:
+            affinity = dict(report.user_properties).get(AFFINITY_PROPERTY)
+            self.finished[report.nodeid] = (seconds, affinity)
+
+    def save(self, path=None):
+        """
+        Merge this run's durations into the store
+
+        Returns:
+            int: Number of tests recorded
+        """
+        if not self.finished:
+            return 0
+        store = DurationStore(path)
+        for nodeid, (seconds, affinity) in self.finished.items():
+            store.record(nodeid, seconds, affinity)
+        store.save()
+        return len(self.finished)
+
+
+recorder = DurationRecorder()
+
+
+def plan_units(nodeids, store, workers):
+    """
+    Split a collection into scheduling units, longest first
+
+    Tests with the same affinity share a unit until it would exceed one
+    worker's fair share of the predicted total; every other test is a
+    unit of its own.
+
+    Args:
+        nodeids: Collected test ids (xdist collection order)
+        store: DurationStore to predict from
+        workers: Number of xdist workers
+
+    Returns:
+        list: [predicted seconds, [collection indices]] per unit
+    """
+    default = store.default_duration()
+    predicted = []
+    for nodeid in nodeids:
+        seconds = store.predict(nodeid)
+        predicted.append(default if seconds is None else seconds)
+    share = sum(predicted) / max(workers, 1)
+
+    units = []
+    open_units = {}                # affinity -> unit still being filled
+    for index, nodeid in enumerate(nodeids):
+        affinity = store.affinity(nodeid)
+        unit = open_units.get(affinity) if affinity else None
+        if unit is None or unit[0] + predicted[index] > share:
+            unit = [0.0, []]
+            units.append(unit)
+            if affinity:
+                open_units[affinity] = unit
+        unit[0] += predicted[index]
+        unit[1].append(index)
+    units.sort(key=lambda unit: -unit[0])
+    return units
+
+
+def predict_makespan(units, workers):
+    """
+    Simulate LPT list scheduling: each unit goes to the least loaded worker
+
+    Returns:
+        list: Predicted busy seconds per worker
+    """
+    loads = [0.0] * max(workers, 1)
+    heapq.heapify(loads)
+    for seconds, _ in units:
+        heapq.heapreplace(loads, loads[0] + seconds)
+    return sorted(loads, reverse=True)
+
+
+class ScheduleStats:
+    """Predicted vs. actual makespan of an xdist run"""
+
+    def __init__(self):
+        self.tests = 0
+        self.known = 0             # tests predicted from history
+        self.units = 0
+        self.predicted = []        # busy seconds per worker, LPT simulation
+        self.by_worker = {}        # worker id -> [tests, busy seconds, finished after seconds]
+
+    @property
+    def actual_makespan(self):
+        return max((entry[2] for entry in self.by_worker.values()), default=0.0)
+
+    def as_dict(self):
+        """Counters as a plain dict (safe to send between xdist workers)"""
+        return {
+            'tests': self.tests,
+            'known': self.known,
+            'units': self.units,
+            'predicted': list(self.predicted),
+            'by_worker': {worker: list(entry) for worker, entry in self.by_worker.items()},
+        }
+
+    def merge(self, data):
+        """Add counters from another ScheduleStats.as_dict()"""
+        self.tests += data['tests']
+        self.known += data['known']
+        self.units += data['units']
+        self.predicted = self.predicted or list(data['predicted'])
+        for worker, values in data['by_worker'].items():
+            self.by_worker.setdefault(worker, list(values))
+
+    def summary_lines(self):
+        """Human-readable lines for the terminal summary"""
+        predicted = max(self.predicted, default=0.0)
+        actual = self.actual_makespan
+        workers = len(self.predicted) or len(self.by_worker)
+        lines = [
+            f"Predicted makespan: {predicted:.1f}s  |  actual: {actual:.1f}s  ({workers} workers)",
+            f"Known durations: {self.known}/{self.tests} tests, {self.units} scheduling units",
+        ]
+        if self.predicted:
+            lines.append("Predicted worker loads: " + ", ".join(f"{load:.1f}s" for load in self.predicted))
+        for worker, (tests, busy, finished) in sorted(self.by_worker.items()):
+            lines.append(f"  {worker:<6} {tests:>4} tests  busy {busy:7.1f}s  "
+                         f"done after {finished:7.1f}s  idle tail {actual - finished:6.1f}s")
+        return lines
+
+
+class HistoryScheduling(LoadScheduling):
+    """
+    xdist scheduler: affinity units, longest predicted first
+
+    Every worker keeps at least two tests queued (a worker needs to know
+    its next test before it can run the current one); a unit is always
+    sent to one worker as a whole.
+
+    Args:
+        config: pytest config
+        log: xdist log producer
+        store: DurationStore (default: the configured file)
+    """
+
+    def __init__(self, config, log=None, store=None):
+        super().__init__(config, log)
+        self.store = store if store is not None else DurationStore()
+        self.stats = ScheduleStats()
+        self._unit_of = {}         # collection index -> unit number
+        self._started = None
+
+    def schedule(self):
+        assert self.collection_is_completed
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+        self.collection = list(self.node2collection.values())[0]
+        if not self.collection:
+            return
+
+        workers = len(self.nodes)
+        units = plan_units(self.collection, self.store, workers)
+        for number, (_, indices) in enumerate(units):
+            for index in indices:
+                self._unit_of[index] = number
+        self.pending[:] = [index for _, indices in units for index in indices]
+        self.stats.tests = len(self.collection)
+        self.stats.known = sum(1 for nodeid in self.collection if self.store.predict(nodeid) is not None)
+        self.stats.units = len(units)
+        self.stats.predicted = predict_makespan(units, workers)
+
+        self._started = time.monotonic()
+        for node in self.nodes:
+            self.check_schedule(node)
+
+    def check_schedule(self, node, duration=0):
+        if node.shutting_down:
+            return
+        while self.pending and len(self.node2pending[node]) < 2:
+            self._send_unit(node)
+        if not self.pending:
+            node.shutdown()
+
+    def mark_test_complete(self, node, item_index, duration=0):
+        entry = self.stats.by_worker.setdefault(node.gateway.id, [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += duration
+        entry[2] = time.monotonic() - self._started
+        super().mark_test_complete(node, item_index, duration)
+
+    def _send_unit(self, node):
+        """Send the tests of the next pending unit to `node`"""
+        unit = self._unit_of.get(self.pending[0])
+        count = 1
+        while count < len(self.pending) and unit is not None and self._unit_of.get(self.pending[count]) == unit:
+            count += 1
+        self._send_tests(node, count)
@@ -0,0 +1,299 @@
+"""
+Structured Event Log - Buffered Instead of print()
+Progress messages with a level and fields, kept per test and written in the background
+
+WHY:
+    Page objects and fixtures print emoji progress lines straight to
+    stdout (pytest runs with -s). Every line is a synchronous console
+    write, xdist workers interleave them, and on a passing run nobody
+    reads them anyway.
+
+HOW:
+    Page objects and fixtures call
+
+        events.info("✅ Clicked logout button")
+        events.warning("⚠️  Banner not found", locator="flash")
+
+    Disabled (the default) this is a plain print(), exactly as before.
+    With SELENIUM_EVENTS=1 (or pytest --events):
+        - every record (time, level, test, worker, message, fields) goes
+          to a queue; a background thread appends it to a JSONL file,
+          one per xdist worker
+        - records are also kept per test; when the test fails they are
+          added to its report as "Captured events" (terminal + HTML)
+        - whatever the tests themselves print() while running becomes an
+          info record too (source=print), so script-style tests need no
+          changes
+        - the console shows records only for failing tests, or
+          immediately from a chosen level up (SELENIUM_EVENT_CONSOLE)
+
+Environment:
+    SELENIUM_EVENTS         1 = structured, buffered events (default: plain print)
+    SELENIUM_EVENT_CONSOLE  failure (default) | debug | info | warning | error
+    SELENIUM_EVENT_LOG      JSONL file (default: reports/events.jsonl,
+                            reports/events-gw0.jsonl on xdist worker gw0)
+"""
+
+import contextlib
+import io
+import json
+import os
+import queue
+import sys
+import threading
+import time
+
+from utils import network
+
+
+LEVELS = {"debug": 10, "info": 20, "warning": 30, "error": 40}
+
+CONSOLE_MODES = ("failure",) + tuple(LEVELS)
+
+# Records written per batch by the background writer
+WRITE_BATCH = 500
+
+
+def events_enabled():
+    return os.environ.get('SELENIUM_EVENTS') == '1'
+
+
+def get_console_mode():
+    """
+    When records reach the console, from SELENIUM_EVENT_CONSOLE
+
+    Raises:
+        ValueError: Unknown mode
+    """
+    mode = os.environ.get('SELENIUM_EVENT_CONSOLE', 'failure')
+    if mode not in CONSOLE_MODES:
+        raise ValueError(f"Unknown event console mode '{mode}'. Choose from: {', '.join(CONSOLE_MODES)}")
+    return mode
+
+
+def get_log_file():
+    """JSONL file of this process (xdist workers get their own)"""
+    path = os.environ.get('SELENIUM_EVENT_LOG', os.path.join('reports', 'events.jsonl'))
+    worker = os.environ.get('PYTEST_XDIST_WORKER')
+    if worker:
+        root, extension = os.path.splitext(path)
+        path = f"{root}-{worker}{extension}"
+    return path
+
+
+def format_record(record):
+    """One console line: time, level, message, fields"""
+    fields = " ".join(f"{name}={value}" for name, value in record.get('fields', {}).items())
+    clock = time.strftime("%H:%M:%S", time.localtime(record['ts'])) + f".{int(record['ts'] % 1 * 1000):03d}"
+    return f"{clock} {record['level'].upper():<7} {record['message']}" + (f"  [{fields}]" if fields else "")
+
+
+class EventStats:
+    """Records per level and what writing them cost"""
+
+    def __init__(self):
+        self.by_level = {}
+        self.bytes_written = 0
+        self.write_ms = 0.0        # background writer
+        self.failures_shown = 0    # failing tests whose records went to the report
+        self._lock = threading.Lock()
+
+    def record_event(self, level):
+        with self._lock:
+            self.by_level[level] = self.by_level.get(level, 0) + 1
+
+    def record_write(self, size, ms):
+        with self._lock:
+            self.bytes_written += size
+            self.write_ms += ms
+
+    def as_dict(self):
+        """Counters as a plain dict (safe to send between xdist workers)"""
+        return {
+            'by_level': dict(self.by_level),
+            'bytes_written': self.bytes_written,
+            'write_ms': self.write_ms,
+            'failures_shown': self.failures_shown,
+        }
+
+    def merge(self, data):
+        """Add counters from another EventStats.as_dict() (xdist aggregation)"""
+        for level, count in data['by_level'].items():
+            self.by_level[level] = self.by_level.get(level, 0) + count
+        self.bytes_written += data['bytes_written']
+        self.write_ms += data['write_ms']
+        self.failures_shown += data['failures_shown']
+
+    def summary_lines(self):
+        """Human-readable lines for the terminal summary"""
+        levels = ", ".join(f"{self.by_level[level]} {level}" for level in LEVELS if level in self.by_level)
+        return [
+            f"Events: {sum(self.by_level.values())} ({levels})",
+            f"Written: {self.bytes_written / 1024:.0f} KiB in {self.write_ms / 1000:.2f}s (background)"
+            f"  |  shown for {self.failures_shown} failing tests  |  {get_log_file()}",
+        ]
+
+
+stats = EventStats()
+
+
+class EventWriter:
+    """Appends records to a JSONL file from a background thread"""
+
+    def __init__(self, path):
+        self.path = path
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="event-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, record):
+        self._queue.put(record)
+
+    def _run(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            while True:
+                batch = [self._queue.get()]
+                while len(batch) < WRITE_BATCH:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                start = time.perf_counter()
+                text = "".join(json.dumps(record, default=str) + "\n" for record in batch if record is not None)
+                f.write(text)
+                f.flush()
+                stats.record_write(len(text), (time.perf_counter() - start) * 1000)
+                for _ in batch:
+                    self._queue.task_done()
+                if None in batch:
+                    return
+
+    def flush(self):
+        """Wait until everything queued so far is in the file"""
+        self._queue.join()
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+
+_writer = None
+_writer_lock = threading.Lock()
+_buffers = {}                      # test -> its records
+_buffers_lock = threading.Lock()
+
+
+def _get_writer():
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = EventWriter(get_log_file())
+        return _writer
+
+
+def emit(level, message, **fields):
+    """
+    Record an event (print it when events are disabled)
+
+    Args:
+        level: Key of LEVELS
+        message: Human-readable text
+        **fields: Structured values written with it
+    """
+    if not events_enabled():
+        if LEVELS[level] >= LEVELS["info"]:
+            print(message)
+        return
+    test = network.current_test
+    record = {
+        'ts': time.time(),
+        'level': level,
+        'test': test,
+        'worker': os.environ.get('PYTEST_XDIST_WORKER', 'main'),
+        'message': message.strip(),
+        'fields': fields,
+    }
+    stats.record_event(level)
+    if test is not None:
+        with _buffers_lock:
+            _buffers.setdefault(test, []).append(record)
+    _get_writer().put(record)
+    console = get_console_mode()
+    if console != "failure" and LEVELS[level] >= LEVELS[console]:
+        sys.__stdout__.write(format_record(record) + "\n")
+
+
+def debug(message, **fields):
+    emit("debug", message, **fields)
+
+
+def info(message, **fields):
+    emit("info", message, **fields)
+
+
+def warning(message, **fields):
+    emit("warning", message, **fields)
+
+
+def error(message, **fields):
+    emit("error", message, **fields)
+
+
+def records_for(test):
+    """Records of `test` so far"""
+    with _buffers_lock:
+        return list(_buffers.get(test, []))
+
+
+def end_test(test):
+    """Forget `test`'s records (they are in the file)"""
+    with _buffers_lock:
+        _buffers.pop(test, None)
+
+
+class _PrintCapture(io.TextIOBase):
+    """sys.stdout replacement turning printed lines into info records"""
+
+    def __init__(self):
+        self._partial = ""
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            if line.strip():
+                emit("info", line, source="print")
+        return len(text)
+
+    def flush(self):
+        if self._partial.strip():
+            emit("info", self._partial, source="print")
+        self._partial = ""
+
+
+@contextlib.contextmanager
+def capture_prints():
+    """Turn print() output in the with-block into events (no-op when disabled)"""
+    if not events_enabled():
+        yield
+        return
+    capture = _PrintCapture()
+    original, sys.stdout = sys.stdout, capture
+    try:
+        yield
+    finally:
+        sys.stdout = original
+        capture.flush()
+
+
+def close():
+    """Write out everything queued (end of the run)"""
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        writer.close()
@@ -0,0 +1,285 @@
+"""
+Record / Replay Cache for Browser Traffic
+Serve pages the browser already fetched once from disk instead of the network
+
+MODES (SELENIUM_REPLAY or pytest --replay):
+    off     Normal network traffic (default)
+    record  Go to the real site and store every response the browser gets
+    replay  Answer recorded requests from disk, fetch the rest normally
+    strict  Like replay, but unrecorded requests are blocked and the test
+            fails, listing the URLs that are missing from the recording
+
+HOW:
+    Every Chrome session from create_driver() gets a ReplayHandler on its
+    network interceptor (utils/network.py). Recordings are content
+    addressed, so identical bodies (logos, CSS shared by every page) are
+    stored once and xdist workers can record into the same directory:
+
+        <dir>/entries/<sha256 of method+url+body>.json   status, headers, body hash
+        <dir>/bodies/<ab>/<sha256 of body>               raw bytes
+
+Environment:
+    SELENIUM_REPLAY       off | record | replay | strict
+    SELENIUM_REPLAY_DIR   Recording directory (default: test_data/replay)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+from utils.network import BLOCK, InterceptedResponse, NetworkHandler
+
+
+MODES = ("off", "record", "replay", "strict")
+
+DEFAULT_REPLAY_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'test_data', 'replay'
+)
+
+# These describe the original (compressed) transfer, not the decoded body we store
+_DROP_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding'}
+
+
+class ReplayStats:
+    """Cache hits / misses and bytes served from disk, per test and in total"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+        self.bytes_saved = 0      # bodies served from disk instead of the network
+        self.bytes_recorded = 0
+        self.by_test = {}         # nodeid -> [hits, misses, bytes_saved]
+        self._lock = threading.Lock()
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def record_lookup(self, test, hit, size=0):
+        with self._lock:
+            entry = self.by_test.setdefault(test or "(no test)", [0, 0, 0])
+            if hit:
+                self.hits += 1
+                self.bytes_saved += size
+                entry[0] += 1
+                entry[2] += size
+            else:
+                self.misses += 1
+                entry[1] += 1
+
+    def record_store(self, size):
+        with self._lock:
+            self.recorded += 1
+            self.bytes_recorded += size
+
+    def for_test(self, test):
+        """(hits, misses, bytes_saved) of one test"""
+        return tuple(self.by_test.get(test, (0, 0, 0)))
+
+    def as_dict(self):
+        """Counters as a plain dict (safe to send between xdist workers)"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'recorded': self.recorded,
+            'bytes_saved': self.bytes_saved,
+            'bytes_recorded': self.bytes_recorded,
+            'by_test': {test: list(entry) for test, entry in self.by_test.items()},
+        }
+
+    def merge(self, data):
+        """Add counters from another ReplayStats.as_dict() (xdist aggregation)"""
+        for key in ('hits', 'misses', 'recorded', 'bytes_saved', 'bytes_recorded'):
+            setattr(self, key, getattr(self, key) + data[key])
+        for test, (hits, misses, saved) in data['by_test'].items():
+            entry = self.by_test.setdefault(test, [0, 0, 0])
+            entry[0] += hits
+            entry[1] += misses
+            entry[2] += saved
+
+    def summary_lines(self):
+        """Human-readable lines for the terminal summary"""
+        lines = [f"Mode: {get_replay_mode()}"]
+        if self.recorded:
+            lines.append(f"Recorded {self.recorded} responses ({self.bytes_recorded / 1024:.0f} KiB)")
+        if self.hits or self.misses:
+            lines.append(f"Hit rate {self.hit_rate:.0%} ({self.hits} hits, {self.misses} misses), "
+                         f"{self.bytes_saved / 1024:.0f} KiB served from disk")
+            for test, (hits, misses, saved) in sorted(self.by_test.items()):
+                rate = hits / (hits + misses) if hits + misses else 0.0
+                lines.append(f"  {test:<60} {rate:>4.0%}  {saved / 1024:7.0f} KiB saved")
+        return lines
+
+
+stats = ReplayStats()
+
+# nodeid -> URLs strict mode blocked because they were not recorded
+# (filled from the drivers' interceptor threads, read by the test thread)
+unrecorded = {}
+_unrecorded_lock = threading.Lock()
+
+
+def get_replay_mode():
+    """
+    Selected record/replay mode
+
+    Returns:
+        str: One of MODES, from SELENIUM_REPLAY (default "off")
+
+    Raises:
+        ValueError: Unknown mode
+    """
+    mode = os.environ.get('SELENIUM_REPLAY', 'off')
+    if mode not in MODES:
+        raise ValueError(f"Unknown replay mode '{mode}'. Choose from: {', '.join(MODES)}")
+    return mode
+
+
+def get_replay_dir():
+    """Directory holding the recording"""
+    return os.environ.get('SELENIUM_REPLAY_DIR', DEFAULT_REPLAY_DIR)
+
+
+def request_key(method, url, post_data=None):
+    """Content address of a request: same method, URL and body -> same key"""
+    digest = hashlib.sha256()
+    for part in (method.upper(), url, post_data or ""):
+        digest.update(part.encode('utf-8'))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _atomic_write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class ReplayCache:
+    """
+    On-disk recording of responses
+
+    Args:
+        root: Recording directory (default: get_replay_dir())
+    """
+
+    def __init__(self, root=None):
+        self.root = root or get_replay_dir()
+
+    def _entry_path(self, key):
+        return os.path.join(self.root, 'entries', key + '.json')
+
+    def _body_path(self, digest):
+        return os.path.join(self.root, 'bodies', digest[:2], digest)
+
+    def store(self, method, url, post_data, response):
+        """
+        Save one response (body is deduplicated by its hash)
+
+        Returns:
+            str: The request key
+        """
+        digest = hashlib.sha256(response.body).hexdigest()
+        body_path = self._body_path(digest)
+        if not os.path.exists(body_path):
+            _atomic_write(body_path, response.body)
+        key = request_key(method, url, post_data)
+        entry = {
+            'method': method,
+            'url': url,
+            'status': response.status,
+            'headers': [[name, value] for name, value in response.headers
+                        if name.lower() not in _DROP_HEADERS],
+            'body': digest,
+            'size': len(response.body),
+        }
+        _atomic_write(self._entry_path(key), json.dumps(entry, indent=1).encode('utf-8'))
+        return key
+
+    def size_of(self, method, url, post_data=None):
+        """
+        Body size of a recorded response without reading the body
+
+        Returns:
+            int or None when the request was never recorded
+        """
+        try:
+            with open(self._entry_path(request_key(method, url, post_data)), encoding='utf-8') as f:
+                return json.load(f)['size']
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def load(self, method, url, post_data=None):
+        """
+        Look up a recorded response
+
+        Returns:
+            InterceptedResponse or None when the request was never recorded
+        """
+        try:
+            with open(self._entry_path(request_key(method, url, post_data)), encoding='utf-8') as f:
+                entry = json.load(f)
+            with open(self._body_path(entry['body']), 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError, KeyError):
+            return None
+        return InterceptedResponse(entry['status'], [tuple(header) for header in entry['headers']], body)
+
+
+class ReplayHandler(NetworkHandler):
+    """
+    Records or replays one driver's traffic
+
+    Args:
+        mode: "record", "replay" or "strict"
+        cache: ReplayCache to use
+    """
+
+    def __init__(self, mode, cache):
+        self.mode = mode
+        self.cache = cache
+        self.wants_requests = mode in ("replay", "strict")
+        self.wants_responses = mode == "record"
+
+    def on_request(self, request):
+        response = self.cache.load(request.method, request.url, request.post_data)
+        stats.record_lookup(request.test, response is not None,
+                            len(response.body) if response else 0)
+        if response is not None:
+            return response
+        if self.mode == "strict":
+            with _unrecorded_lock:
+                unrecorded.setdefault(request.test, []).append(request.url)
+            return BLOCK
+        return None
+
+    def on_response(self, request, response):
+        if request.url.startswith("data:"):
+            return
+        self.cache.store(request.method, request.url, request.post_data, response)
+        stats.record_store(len(response.body))
+
+
+def replay_handler():
+    """
+    Handler for a new driver according to SELENIUM_REPLAY
+
+    Returns:
+        ReplayHandler or None when record/replay is off
+    """
+    mode = get_replay_mode()
+    if mode == "off":
+        return None
+    return ReplayHandler(mode, ReplayCache())
+
+
+def pop_unrecorded(test):
+    """URLs strict mode had to block during `test` (and forget them)"""
+    with _unrecorded_lock:
+        return unrecorded.pop(test, [])
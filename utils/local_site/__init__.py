@@ -0,0 +1,23 @@
+"""
+Local Stand-In for the-internet.herokuapp.com
+
+WHY:
+    Every page object and script test used to hit the public free-tier
+    host: runs were as slow and flaky as that host, and impossible on
+    isolated CI agents. This package serves local copies of the pages
+    the suite uses, with fixed (configurable) latency so wait-related
+    tests behave the same on every run.
+
+USAGE:
+    pytest --local-site                         # whole suite, local copy
+    pytest --local-site --site-latency 200      # simulate a slow network
+    python -m utils.local_site --port 8000      # browse it by hand
+
+    from utils.local_site import LocalSite
+    with LocalSite(latency_ms=50) as site:
+        driver.get(site.url("/login"))
+"""
+
+from utils.local_site.server import LocalSite
+
+__all__ = ["LocalSite"]
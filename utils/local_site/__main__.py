@@ -0,0 +1,36 @@
+"""
+Run the local the-internet copy by hand
+
+Usage:
+    python -m utils.local_site --port 8000 --latency 100
+"""
+
+import argparse
+import time
+
+from utils.local_site import LocalSite
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the local copy of the-internet")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000, help="0 = any free port")
+    parser.add_argument("--latency", type=int, default=0, help="ms added to every response")
+    parser.add_argument("--dynamic-delay", type=int, default=1000,
+                        help="ms the dynamic_loading / dynamic_controls pages take to load")
+    args = parser.parse_args()
+
+    site = LocalSite(args.host, args.port, args.latency, args.dynamic_delay).start()
+    print(f"🌐 Serving the-internet copy at {site.base_url} (Ctrl+C to stop)")
+    print(f"   export SELENIUM_BASE_URL={site.base_url}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        site.stop()
+
+
+if __name__ == "__main__":
+    main()
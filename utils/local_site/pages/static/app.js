@@ -0,0 +1,34 @@
+// Behaviour shared by the local copies of the-internet pages
+
+// Flash messages can be closed, like on the real site
+document.addEventListener('click', function (event) {
+  var close = event.target.closest && event.target.closest('.flash .close');
+  if (close) {
+    event.preventDefault();
+    close.parentNode.style.display = 'none';
+  }
+});
+
+// /key_presses reports keys the way the original server does (e.g. SHIFT, ENTER)
+var KEY_NAMES = {' ': 'SPACE', 'Escape': 'ESCAPE', 'ArrowUp': 'UP', 'ArrowDown': 'DOWN',
+                 'ArrowLeft': 'LEFT', 'ArrowRight': 'RIGHT', 'Control': 'CONTROL'};
+function keyName(key) {
+  if (KEY_NAMES[key]) return KEY_NAMES[key];
+  return key.toUpperCase();
+}
+
+// /dynamic_loading: Start -> "Loading..." for delayMs -> reveal the result
+function startLoading(delayMs, reveal) {
+  var start = document.querySelector('#start button');
+  start.addEventListener('click', function () {
+    document.getElementById('start').style.display = 'none';
+    var loading = document.createElement('div');
+    loading.id = 'loading';
+    loading.innerHTML = 'Loading... ';
+    document.querySelector('.example').appendChild(loading);
+    setTimeout(function () {
+      loading.remove();
+      reveal();
+    }, delayMs);
+  });
+}
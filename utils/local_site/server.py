@@ -0,0 +1,284 @@
+"""
+Local the-internet Server
+Serves the pages from utils/local_site/pages with the same URLs, ids and
+behaviour the suite relies on, using only the standard library
+
+Timing is deterministic:
+    latency_ms        added to EVERY response (pages, assets, form posts)
+    dynamic_delay_ms  how long /dynamic_loading and /dynamic_controls
+                      "load" (the public site takes ~5s, randomly slower)
+"""
+
+import email.parser
+import email.policy
+import html
+import mimetypes
+import os
+import secrets
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pages')
+
+USERNAME = "tomsmith"
+PASSWORD = "SuperSecretPassword!"
+
+SESSION_COOKIE = "rack.session"
+FLASH_COOKIE = "flash"
+
+# path -> (template file, wrap in the shared layout?)
+PAGES = {
+    '/': ('index.html', True),
+    '/login': ('login.html', True),
+    '/secure': ('secure.html', True),
+    '/checkboxes': ('checkboxes.html', True),
+    '/dropdown': ('dropdown.html', True),
+    '/inputs': ('inputs.html', True),
+    '/key_presses': ('key_presses.html', True),
+    '/frames': ('frames.html', True),
+    '/iframe': ('iframe.html', True),
+    '/nested_frames': ('nested_frames.html', False),
+    '/frame_top': ('frame_top.html', False),
+    '/frame_left': ('frame_left.html', False),
+    '/frame_middle': ('frame_middle.html', False),
+    '/frame_right': ('frame_right.html', False),
+    '/frame_bottom': ('frame_bottom.html', False),
+    '/javascript_alerts': ('javascript_alerts.html', True),
+    '/windows': ('windows.html', True),
+    '/windows/new': ('windows_new.html', False),
+    '/upload': ('upload.html', True),
+    '/dynamic_loading': ('dynamic_loading.html', True),
+    '/dynamic_loading/1': ('dynamic_loading_1.html', True),
+    '/dynamic_loading/2': ('dynamic_loading_2.html', True),
+    '/dynamic_controls': ('dynamic_controls.html', True),
+    '/hovers': ('hovers.html', True),
+    '/drag_and_drop': ('drag_and_drop.html', True),
+    '/add_remove_elements/': ('add_remove_elements.html', True),
+}
+
+
+def _read_page(name):
+    with open(os.path.join(PAGES_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+class LocalSiteHandler(BaseHTTPRequestHandler):
+    """Request handler; `self.server` is a LocalSiteServer"""
+
+    server_version = "LocalSite/1.0"
+
+    # ---------- plumbing ----------
+
+    def log_message(self, format, *args):
+        pass  # keep the pytest output clean
+
+    def _cookies(self):
+        cookies = {}
+        for part in self.headers.get('Cookie', '').split(';'):
+            name, _, value = part.strip().partition('=')
+            if name:
+                cookies[name] = urllib.parse.unquote(value)
+        return cookies
+
+    def _send(self, status, body=b"", content_type="text/html; charset=utf-8", headers=()):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _redirect(self, path, flash=None, headers=()):
+        headers = [('Location', path), *headers]
+        if flash:
+            kind, message = flash
+            value = urllib.parse.quote(f"{kind}|{message}")
+            headers.append(('Set-Cookie', f"{FLASH_COOKIE}={value}; Path=/; HttpOnly"))
+        self._send(302, headers=headers)
+
+    def _render(self, name, layout=True, replacements=None, status=200):
+        body = _read_page(name)
+        replacements = dict(replacements or {})
+        replacements.setdefault('{{delay_ms}}', str(self.server.dynamic_delay_ms))
+
+        # Flash messages survive exactly one page view, like on the real site
+        headers = []
+        flash = self._cookies().get(FLASH_COOKIE) if layout else None
+        flash_html = ""
+        if flash:
+            kind, _, message = flash.partition('|')
+            flash_html = (f'<div id="flash" class="flash {html.escape(kind)}">\n'
+                          f'            {html.escape(message)}\n'
+                          f'            <a href="#" class="close">×</a>\n'
+                          f'          </div>')
+            headers.append(('Set-Cookie', f"{FLASH_COOKIE}=; Path=/; Max-Age=0"))
+        replacements['{{flash}}'] = flash_html
+
+        if layout:
+            body = _read_page('_layout.html').replace('{{content}}', body)
+        for placeholder, value in replacements.items():
+            body = body.replace(placeholder, value)
+        self._send(status, body.encode('utf-8'), headers=headers)
+
+    def _logged_in(self):
+        return self._cookies().get(SESSION_COOKIE) in self.server.sessions
+
+    # ---------- routes ----------
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        self.server.delay()
+        path = urllib.parse.urlsplit(self.path).path
+
+        if path == '/add_remove_elements':
+            return self._redirect('/add_remove_elements/')
+        if path == '/secure' and not self._logged_in():
+            return self._redirect('/login', ('error', "You must login to view the secure area!"))
+        if path == '/logout':
+            self.server.sessions.discard(self._cookies().get(SESSION_COOKIE))
+            return self._redirect('/login', ('success', "You logged out of the secure area!"),
+                                  [('Set-Cookie', f"{SESSION_COOKIE}=; Path=/; Max-Age=0")])
+        if path.startswith('/static/'):
+            return self._static(path[len('/static/'):])
+        if path in PAGES:
+            return self._render(*PAGES[path])
+        return self._render('not_found.html', layout=False, status=404)
+
+    def do_POST(self):
+        self.server.delay()
+        path = urllib.parse.urlsplit(self.path).path
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length)
+
+        if path == '/authenticate':
+            return self._authenticate(urllib.parse.parse_qs(body.decode('utf-8')))
+        if path == '/upload':
+            return self._upload(body)
+        return self._render('not_found.html', layout=False, status=404)
+
+    def _authenticate(self, form):
+        username = form.get('username', [''])[0]
+        password = form.get('password', [''])[0]
+        if username != USERNAME:
+            return self._redirect('/login', ('error', "Your username is invalid!"))
+        if password != PASSWORD:
+            return self._redirect('/login', ('error', "Your password is invalid!"))
+
+        token = secrets.token_hex(16)
+        self.server.sessions.add(token)
+        return self._redirect('/secure', ('success', "You logged into a secure area!"),
+                              [('Set-Cookie', f"{SESSION_COOKIE}={token}; Path=/; HttpOnly")])
+
+    def _upload(self, body):
+        # multipart/form-data is a MIME document - let the email parser split it
+        header = f"Content-Type: {self.headers.get('Content-Type', '')}\r\n\r\n".encode('latin-1')
+        message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(header + body)
+        filename = None
+        if message.is_multipart():
+            for part in message.iter_parts():
+                if part.get_param('name', header='content-disposition') == 'file':
+                    filename = part.get_filename()
+        if not filename:
+            return self._render('upload_error.html', status=500)
+        return self._render('uploaded.html', replacements={'{{filename}}': html.escape(filename)})
+
+    def _static(self, name):
+        file_path = os.path.normpath(os.path.join(PAGES_DIR, 'static', name))
+        if not file_path.startswith(os.path.join(PAGES_DIR, 'static')) or not os.path.isfile(file_path):
+            return self._render('not_found.html', layout=False, status=404)
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        content_type = mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
+        self._send(200, data, content_type=content_type)
+
+
+class LocalSiteServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer that also holds the site's state and timings"""
+
+    daemon_threads = True
+
+    def __init__(self, address, latency_ms=0, dynamic_delay_ms=1000):
+        super().__init__(address, LocalSiteHandler)
+        self.latency_ms = latency_ms
+        self.dynamic_delay_ms = dynamic_delay_ms
+        self.sessions = set()
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def delay(self):
+        """Count the request and apply the configured fixed latency"""
+        with self._lock:
+            self.requests += 1
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+
+
+class LocalSite:
+    """
+    The local server running in a background thread
+
+    Args:
+        host: Interface to bind (default loopback only)
+        port: Port to listen on, 0 = any free port
+        latency_ms: Fixed delay added to every response
+        dynamic_delay_ms: Loading time of the dynamic_* pages
+
+    Usage:
+        with LocalSite(latency_ms=50) as site:
+            driver.get(site.url("/login"))
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency_ms=0, dynamic_delay_ms=1000):
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.dynamic_delay_ms = dynamic_delay_ms
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def requests(self):
+        """Requests served so far"""
+        return self._server.requests if self._server else 0
+
+    def url(self, path="/"):
+        return self.base_url + path
+
+    def start(self):
+        """Bind the port and serve in a daemon thread (idempotent)"""
+        if self._server is not None:
+            return self
+        self._server = LocalSiteServer((self.host, self.port), self.latency_ms, self.dynamic_delay_ms)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name="local-site", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the port"""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,66 @@
+"""
+Locator Helpers for In-Page JavaScript
+Lets execute_script() code resolve the same (By, value) tuples page objects use
+
+WHY:
+    Some checks are much cheaper as ONE script that looks at many
+    elements than as many find_element() round-trips. Those scripts
+    need to understand our locator tuples, so the lookup logic lives
+    here once. Prepend LOCATOR_JS to a script and call:
+
+        __findAll(using, value)   -> array of matching elements
+        __isVisible(element)      -> roughly what WebElement.is_displayed() says
+"""
+
+LOCATOR_JS = r"""
+function __findAll(using, value, root) {
+    root = root || document;
+    switch (using) {
+        case 'id':
+            return Array.from(root.querySelectorAll('#' + CSS.escape(value)));
+        case 'name':
+            return Array.from(root.querySelectorAll('[name="' + CSS.escape(value) + '"]'));
+        case 'class name':
+            return Array.from(root.querySelectorAll('.' + CSS.escape(value)));
+        case 'tag name':
+            return Array.from(root.getElementsByTagName(value));
+        case 'css selector':
+            return Array.from(root.querySelectorAll(value));
+        case 'xpath': {
+            const result = document.evaluate(value, root, null,
+                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            const nodes = [];
+            for (let i = 0; i < result.snapshotLength; i++) nodes.push(result.snapshotItem(i));
+            return nodes;
+        }
+        case 'link text':
+            return Array.from(root.querySelectorAll('a'))
+                .filter(a => a.innerText.trim() === value);
+        case 'partial link text':
+            return Array.from(root.querySelectorAll('a'))
+                .filter(a => a.innerText.includes(value));
+        default:
+            throw new Error('Unsupported locator strategy: ' + using);
+    }
+}
+
+function __isVisible(el) {
+    if (!el || !el.isConnected) return false;
+    const style = window.getComputedStyle(el);
+    if (style.display === 'none' || style.visibility === 'hidden' || style.opacity === '0') {
+        return false;
+    }
+    return el.getClientRects().length > 0;
+}
+"""
+
+
+def locator_to_js(locator):
+    """
+    Turn a (By, value) tuple into JSON-friendly [using, value]
+
+    By.* constants already are the W3C strategy strings
+    ('css selector', 'xpath', ...), so this is mostly a type check.
+    """
+    using, value = locator
+    return [using, value]
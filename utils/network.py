@@ -0,0 +1,310 @@
+"""
+Network Interception - Chrome DevTools Fetch Domain
+Lets framework features see, answer or block the browser's requests
+
+WHY:
+    Replaying recorded responses, blocking images/fonts/analytics, ...
+    all need the same thing: pause every request inside Chrome, decide
+    what to do with it, and let it go. Doing that through CDP needs an
+    event loop (Selenium's bidi_connection() is async/trio), so each
+    intercepted driver gets one background thread running that loop.
+
+HANDLERS:
+    Features subclass NetworkHandler and are attached per driver:
+
+        on_request(request)   -> None (continue), BLOCK, or an
+                                 InterceptedResponse to answer with
+        on_response(request, response)  observe the real response
+                                        (only if wants_responses)
+
+    The first handler that returns something other than None wins.
+
+USAGE:
+    interceptor = attach(driver, [SomeHandler()])   # None if no handlers
+    add_handler(driver, OtherHandler())             # later, e.g. for one test
+    remove_handler(driver, handler)
+    ...
+    detach(driver)
+
+Drivers without handlers are never intercepted, so a disabled feature
+costs nothing.
+"""
+
+import base64
+import threading
+
+import trio
+from selenium.common.exceptions import WebDriverException
+
+
+# Selenium drops CDP events when a listener's buffer is full - and a
+# dropped Fetch.requestPaused means a request that hangs forever
+EVENT_BUFFER = 10000
+
+BLOCK = "block"   # on_request() result: fail the request (net::ERR_BLOCKED_BY_CLIENT)
+
+# Test the browser is currently working for (set by conftest, read by handlers)
+current_test = None
+
+
+def set_current_test(nodeid):
+    """Attribute intercepted traffic to `nodeid` (None between tests)"""
+    global current_test
+    current_test = nodeid
+
+
+class InterceptedRequest:
+    """What the browser is about to fetch"""
+
+    def __init__(self, url, method="GET", headers=None, post_data=None, resource_type="Other", test=None,
+                 main_frame=True):
+        self.url = url
+        self.method = method
+        self.headers = headers or {}
+        self.post_data = post_data
+        self.resource_type = resource_type   # CDP ResourceType: Document, Image, Font, Script, ...
+        self.test = test
+        self.main_frame = main_frame         # False for requests of (i)frames
+
+    def __repr__(self):
+        return f"<{self.method} {self.url} ({self.resource_type})>"
+
+
+class InterceptedResponse:
+    """A response: recorded from the network or served by a handler"""
+
+    def __init__(self, status, headers=None, body=b""):
+        self.status = status
+        self.headers = list(headers or [])   # [(name, value), ...] - names may repeat
+        self.body = body
+
+
+class NetworkHandler:
+    """Base class for interception features; override what you need"""
+
+    wants_requests = True
+    wants_responses = False
+
+    def on_request(self, request):
+        return None
+
+    def on_response(self, request, response):
+        pass
+
+    def close(self):
+        """Driver is going away"""
+
+
+class NetworkInterceptor:
+    """
+    Fetch-domain interception loop for one driver, in a background thread
+
+    Args:
+        driver: Chrome WebDriver instance
+        handlers: NetworkHandler instances, in priority order
+    """
+
+    def __init__(self, driver, handlers):
+        self.driver = driver
+        self.handlers = list(handlers)
+        self._thread = None
+        self._ready = threading.Event()
+        self._error = None
+        self._cancel_scope = None
+        self._trio_token = None
+        self._main_frame_id = None
+
+    def start(self, timeout=10):
+        """
+        Start intercepting; returns once Fetch.enable is in effect
+
+        Raises:
+            WebDriverException: DevTools connection could not be set up
+        """
+        self._thread = threading.Thread(target=trio.run, args=(self._run,),
+                                        name="network-interceptor", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout):
+            raise WebDriverException(f"Network interception not ready after {timeout}s")
+        if self._error is not None:
+            raise WebDriverException(f"Network interception failed: {self._error}")
+        return self
+
+    def stop(self, close_handlers=True):
+        """Stop the loop and (unless told otherwise) let the handlers clean up"""
+        if self._trio_token is not None:
+            try:
+                trio.from_thread.run_sync(self._cancel_scope.cancel, trio_token=self._trio_token)
+            except trio.RunFinishedError:
+                pass  # loop already ended (browser gone)
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        if close_handlers:
+            for handler in self.handlers:
+                handler.close()
+
+    def _patterns(self, fetch):
+        patterns = []
+        if any(handler.wants_requests for handler in self.handlers):
+            patterns.append(fetch.RequestPattern(url_pattern="*", request_stage=fetch.RequestStage.REQUEST))
+        if any(handler.wants_responses for handler in self.handlers):
+            patterns.append(fetch.RequestPattern(url_pattern="*", request_stage=fetch.RequestStage.RESPONSE))
+        return patterns
+
+    async def _run(self):
+        try:
+            async with self.driver.bidi_connection() as connection:
+                session, devtools = connection.session, connection.devtools
+                with trio.CancelScope() as scope:
+                    self._cancel_scope = scope
+                    self._trio_token = trio.lowlevel.current_trio_token()
+                    events = session.listen(devtools.fetch.RequestPaused, buffer_size=EVENT_BUFFER)
+                    # The top frame keeps its id across navigations
+                    tree = await session.execute(devtools.page.get_frame_tree())
+                    self._main_frame_id = tree.frame.id_
+                    await session.execute(devtools.fetch.enable(patterns=self._patterns(devtools.fetch)))
+                    self._ready.set()
+                    async with trio.open_nursery() as nursery:
+                        async for event in events:
+                            nursery.start_soon(self._handle, session, devtools, event)
+        except Exception as e:
+            # Before ready: start() reports it. After: the browser went away.
+            self._error = e
+        finally:
+            self._ready.set()
+
+    async def _handle(self, session, devtools, event):
+        fetch = devtools.fetch
+        request = InterceptedRequest(
+            url=event.request.url,
+            method=event.request.method,
+            headers=dict(event.request.headers or {}),
+            post_data=event.request.post_data,
+            resource_type=event.resource_type.value,
+            test=current_test,
+            main_frame=event.frame_id == self._main_frame_id,
+        )
+        try:
+            if event.response_status_code is None and event.response_error_reason is None:
+                await self._handle_request(session, devtools, event, request)
+            else:
+                await self._handle_response(session, fetch, event, request)
+        except Exception:
+            pass  # tab closed, request cancelled by navigation, browser quitting, ...
+
+    async def _handle_request(self, session, devtools, event, request):
+        fetch = devtools.fetch
+        for handler in self.handlers:
+            if not handler.wants_requests:
+                continue
+            decision = handler.on_request(request)
+            if decision is None:
+                continue
+            if decision is BLOCK:
+                await session.execute(fetch.fail_request(
+                    event.request_id, devtools.network.ErrorReason.BLOCKED_BY_CLIENT))
+            else:
+                await session.execute(fetch.fulfill_request(
+                    event.request_id,
+                    response_code=decision.status,
+                    response_headers=[fetch.HeaderEntry(name=name, value=value)
+                                      for name, value in decision.headers],
+                    body=base64.b64encode(decision.body).decode("ascii"),
+                ))
+            return
+        await session.execute(fetch.continue_request(event.request_id))
+
+    async def _handle_response(self, session, fetch, event, request):
+        body = b""
+        if event.response_error_reason is None:
+            try:
+                text, is_base64 = await session.execute(fetch.get_response_body(event.request_id))
+                body = base64.b64decode(text) if is_base64 else text.encode("utf-8")
+            except Exception:
+                pass  # redirects and some errors have no body
+        response = InterceptedResponse(
+            event.response_status_code or 0,
+            [(header.name, header.value) for header in event.response_headers or []],
+            body,
+        )
+        for handler in self.handlers:
+            if handler.wants_responses:
+                handler.on_response(request, response)
+        await session.execute(fetch.continue_request(event.request_id))
+
+
+def attach(driver, handlers):
+    """
+    Start intercepting `driver`'s traffic with the given handlers
+
+    Args:
+        driver: Chrome WebDriver instance
+        handlers: NetworkHandlers; None entries (disabled features) are skipped
+
+    Returns:
+        NetworkInterceptor or None when there is nothing to intercept
+    """
+    handlers = [handler for handler in handlers if handler is not None]
+    if not handlers:
+        return None
+    interceptor = NetworkInterceptor(driver, handlers).start()
+    driver._network_interceptor = interceptor
+    return interceptor
+
+
+def get_interceptor(driver):
+    """The NetworkInterceptor attached to `driver`, if any"""
+    return getattr(driver, "_network_interceptor", None)
+
+
+def _restart(driver, handlers):
+    """Intercept with a new handler list (Fetch.enable patterns are fixed per loop)"""
+    interceptor = get_interceptor(driver)
+    if interceptor is not None:
+        driver._network_interceptor = None
+        interceptor.stop(close_handlers=False)
+    try:
+        return attach(driver, handlers)
+    except WebDriverException:
+        if interceptor is not None:
+            attach(driver, interceptor.handlers)  # keep the features it had
+        raise
+
+
+def add_handler(driver, handler):
+    """
+    Intercept `driver` with one more handler, ahead of the others
+
+    Starts interception if the driver had none, otherwise restarts the
+    loop with the combined handlers.
+
+    Returns:
+        NetworkInterceptor
+
+    Raises:
+        WebDriverException: DevTools connection could not be set up
+    """
+    interceptor = get_interceptor(driver)
+    return _restart(driver, [handler] + (interceptor.handlers if interceptor else []))
+
+
+def remove_handler(driver, handler):
+    """
+    Stop intercepting with `handler`; interception ends with the last one
+
+    Returns:
+        NetworkInterceptor or None when no handler is left
+    """
+    interceptor = get_interceptor(driver)
+    if interceptor is None or handler not in interceptor.handlers:
+        return interceptor
+    handler.close()
+    return _restart(driver, [other for other in interceptor.handlers if other is not handler])
+
+
+def detach(driver):
+    """Stop intercepting `driver` (no-op if it never was)"""
+    interceptor = get_interceptor(driver)
+    if interceptor is not None:
+        driver._network_interceptor = None
+        interceptor.stop()
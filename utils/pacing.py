@@ -0,0 +1,158 @@
+"""
+Pacing - One Place for Every Intentional Pause
+Replaces scattered time.sleep() calls in tests and page objects
+
+MODES (SELENIUM_PACING or pytest --pacing):
+    demo  Sleep as written, so a human can follow the browser (default locally)
+    ci    Never sleep just for show (default when the CI variable is set).
+          If the pause has a readiness condition, wait for THAT instead.
+
+USAGE:
+    from utils.pacing import pause, page_ready
+
+    driver.get(url)
+    pause(2, "page load", until=page_ready(driver))   # real condition
+    pause(5, "keep browser open")                      # demo only
+
+Every call is counted, so the run can report how much sleeping was saved.
+"""
+
+import os
+import sys
+import time
+
+
+PACING_MODES = ("ci", "demo")
+
+DEFAULT_TIMEOUT = 10     # longest a readiness condition is waited for
+POLL_INTERVAL = 0.05
+
+
+class PacingStats:
+    """Requested vs. actually spent pause time, per reason"""
+
+    def __init__(self):
+        self.calls = 0
+        self.requested = 0.0   # seconds the code asked to sleep
+        self.spent = 0.0       # seconds really spent in pause()
+        self.by_reason = {}    # reason -> [calls, requested, spent]
+
+    @property
+    def saved(self):
+        return self.requested - self.spent
+
+    def record(self, reason, requested, spent):
+        self.calls += 1
+        self.requested += requested
+        self.spent += spent
+        entry = self.by_reason.setdefault(reason, [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += requested
+        entry[2] += spent
+
+    def as_dict(self):
+        """Counters as a plain dict (safe to send between xdist workers)"""
+        return {
+            'calls': self.calls,
+            'requested': self.requested,
+            'spent': self.spent,
+            'by_reason': {reason: list(entry) for reason, entry in self.by_reason.items()},
+        }
+
+    def merge(self, data):
+        """Add counters from another PacingStats.as_dict() (xdist aggregation)"""
+        self.calls += data['calls']
+        self.requested += data['requested']
+        self.spent += data['spent']
+        for reason, (calls, requested, spent) in data['by_reason'].items():
+            entry = self.by_reason.setdefault(reason, [0, 0.0, 0.0])
+            entry[0] += calls
+            entry[1] += requested
+            entry[2] += spent
+
+    def summary_lines(self):
+        """Human-readable lines for the terminal summary"""
+        lines = [
+            f"Mode: {get_pacing_mode()}  pauses: {self.calls}",
+            f"Requested {self.requested:.1f}s, spent {self.spent:.1f}s, "
+            f"saved {self.saved:.1f}s",
+        ]
+        top = sorted(self.by_reason.items(), key=lambda item: item[1][1] - item[1][2], reverse=True)
+        for reason, (calls, requested, spent) in top[:10]:
+            lines.append(f"  {reason:<40} {calls:>4}x  saved {requested - spent:6.1f}s")
+        return lines
+
+
+stats = PacingStats()
+
+
+def get_pacing_mode():
+    """
+    Current pacing mode
+
+    Returns:
+        str: "ci" or "demo"
+
+    Raises:
+        ValueError: Unknown mode in SELENIUM_PACING
+    """
+    mode = os.environ.get('SELENIUM_PACING')
+    if not mode:
+        return 'ci' if os.environ.get('CI') else 'demo'
+    if mode not in PACING_MODES:
+        raise ValueError(f"Unknown pacing mode '{mode}'. Choose from: {', '.join(PACING_MODES)}")
+    return mode
+
+
+def page_ready(driver):
+    """
+    Readiness condition: the current document finished loading
+
+    Returns:
+        callable: For use as pause(..., until=page_ready(driver))
+    """
+    return lambda: driver.execute_script("return document.readyState") == "complete"
+
+
+def _caller():
+    frame = sys._getframe(2)
+    module = os.path.splitext(os.path.basename(frame.f_code.co_filename))[0]
+    return f"{module}.{frame.f_code.co_name}"
+
+
+def _wait_until(condition, timeout):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if condition():
+                return True
+        except Exception:
+            pass  # stale element, navigation in progress, ... -> not ready yet
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(POLL_INTERVAL)
+
+
+def pause(seconds, reason=None, until=None, timeout=DEFAULT_TIMEOUT):
+    """
+    Pause the test - or don't, depending on the pacing mode
+
+    Args:
+        seconds: How long the pause is in demo mode
+        reason: Label for the savings report (default: calling function)
+        until: Optional readiness condition (callable returning truthy).
+               In ci mode it replaces the sleep; in demo mode it is
+               still checked after sleeping.
+        timeout: Longest time to wait for `until`
+
+    Returns:
+        bool: False only if `until` was given and never became true
+    """
+    start = time.perf_counter()
+    ready = True
+    if get_pacing_mode() == 'demo':
+        time.sleep(seconds)
+    if until is not None:
+        ready = _wait_until(until, timeout)
+    stats.record(reason or _caller(), seconds, time.perf_counter() - start)
+    return ready
@@ -0,0 +1,192 @@
+"""
+Chrome Profile Manager
+Builds a "golden" Chrome profile once and hands out throw-away copies of it
+
+WHY:
+    An empty --user-data-dir makes Chrome run its first-run profile
+    initialization on EVERY launch, and the directories were never
+    deleted, so /tmp filled up on long CI runs.
+
+HOW:
+    1. build_template() creates one prepared profile per session
+       (password manager off, prefs applied, first-run already done)
+    2. new_profile_dir() copies it for each browser - on tmpfs
+       (/dev/shm) when available, so the copy is a memory copy
+    3. Every directory handed out is tracked and deleted by
+       release_profile_dir() / cleanup_profiles() (also run at exit),
+       and listed in the process's reaper ledger so the next run can
+       delete it if this one gets killed (utils/reaper.py)
+
+Environment:
+    SELENIUM_PROFILE_ROOT      Where profiles live (default: /dev/shm or temp dir)
+    SELENIUM_PROFILE_TEMPLATE  "0" to hand out empty profiles instead of copies
+"""
+
+import atexit
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from utils import reaper
+from utils.driver_service import get_shared_service, shared_service_enabled
+
+
+# Same preferences get_chrome_options() passes on the command line,
+# baked into the template so Chrome starts with them already applied
+PROFILE_PREFS = {
+    'credentials_enable_service': False,
+    'profile.password_manager_enabled': False,
+    'autofill.profile_enabled': False,
+    'profile.default_content_setting_values.notifications': 2,
+}
+
+# Files Chrome must not find in a copied profile (locks, crash data, caches)
+_COPY_IGNORE = shutil.ignore_patterns(
+    'Singleton*', 'lockfile', 'Crashpad', 'Cache', 'Code Cache', 'GPUCache', '*.log',
+)
+
+_lock = threading.Lock()
+_template_dir = None
+_handed_out = set()
+
+
+def get_profile_root():
+    """
+    Directory under which all profiles are created
+
+    Prefers /dev/shm (tmpfs) so copying the template never touches disk.
+    """
+    root = os.environ.get('SELENIUM_PROFILE_ROOT')
+    if not root:
+        shm = '/dev/shm'
+        base = shm if os.path.isdir(shm) and os.access(shm, os.W_OK) else tempfile.gettempdir()
+        root = os.path.join(base, 'selenium-profiles')
+    os.makedirs(root, exist_ok=True)
+    return root
+
+
+def template_enabled():
+    """True unless SELENIUM_PROFILE_TEMPLATE=0"""
+    return os.environ.get('SELENIUM_PROFILE_TEMPLATE', '1') != '0'
+
+
+def _expand_prefs(prefs):
+    """Turn {'a.b': 1} into {'a': {'b': 1}} like Chrome's Preferences file"""
+    tree = {}
+    for dotted, value in prefs.items():
+        node = tree
+        *parents, leaf = dotted.split('.')
+        for key in parents:
+            node = node.setdefault(key, {})
+        node[leaf] = value
+    return tree
+
+
+def _initialize_template(path):
+    """Launch Chrome once on the template so first-run setup is done there"""
+    options = Options()
+    options.add_argument('--headless=new')
+    options.add_argument(f'--user-data-dir={path}')
+    options.add_argument('--no-first-run')
+    options.add_argument('--no-default-browser-check')
+    if shared_service_enabled():
+        driver = webdriver.Chrome(options=options, service=get_shared_service(options))
+    else:
+        driver = webdriver.Chrome(options=options)
+    driver.quit()
+
+
+def build_template(initialize=True):
+    """
+    Create the golden profile (once per process)
+
+    Args:
+        initialize: Also launch Chrome once on it to finish first-run setup.
+                    If that fails the prefs-only template is still used.
+
+    Returns:
+        str: Path of the template profile
+    """
+    global _template_dir
+    with _lock:
+        if _template_dir and os.path.isdir(_template_dir):
+            return _template_dir
+
+        path = tempfile.mkdtemp(prefix=f'template-{os.getpid()}-', dir=get_profile_root())
+        reaper.track_profile(path)
+        os.makedirs(os.path.join(path, 'Default'), exist_ok=True)
+        with open(os.path.join(path, 'Default', 'Preferences'), 'w') as f:
+            json.dump(_expand_prefs(PROFILE_PREFS), f)
+        with open(os.path.join(path, 'Local State'), 'w') as f:
+            json.dump({'browser': {'has_seen_welcome_page': True}}, f)
+        open(os.path.join(path, 'First Run'), 'w').close()
+
+        if initialize:
+            try:
+                _initialize_template(path)
+            except Exception as e:
+                print(f"⚠️  Could not pre-initialize profile template: {e}")
+
+        _template_dir = path
+        return path
+
+
+def new_profile_dir():
+    """
+    Get a fresh profile directory for one browser
+
+    Returns:
+        str: Path of a copy of the template (or an empty directory
+             when SELENIUM_PROFILE_TEMPLATE=0). Always tracked for cleanup.
+    """
+    root = get_profile_root()
+    if template_enabled():
+        template = build_template()
+        path = tempfile.mkdtemp(prefix='profile-', dir=root)
+        shutil.copytree(template, path, ignore=_COPY_IGNORE, dirs_exist_ok=True)
+    else:
+        path = tempfile.mkdtemp(prefix='profile-', dir=root)
+    with _lock:
+        _handed_out.add(path)
+    reaper.track_profile(path)
+    return path
+
+
+def release_profile_dir(path):
+    """
+    Delete a profile directory handed out by new_profile_dir()
+
+    Paths this module did not create are left alone.
+
+    Returns:
+        bool: True if the directory was ours and has been removed
+    """
+    with _lock:
+        if path not in _handed_out:
+            return False
+        _handed_out.discard(path)
+    shutil.rmtree(path, ignore_errors=True)
+    reaper.release_profile(path)
+    return True
+
+
+def cleanup_profiles():
+    """Delete every profile still handed out, plus the template"""
+    global _template_dir
+    with _lock:
+        paths = list(_handed_out)
+        _handed_out.clear()
+        template, _template_dir = _template_dir, None
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
+        reaper.release_profile(path)
+    if template:
+        shutil.rmtree(template, ignore_errors=True)
+        reaper.release_profile(template)
+
+
+atexit.register(cleanup_profiles)
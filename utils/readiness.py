@@ -0,0 +1,201 @@
+"""
+Readiness Contracts - When Is a Page Usable?
+Page objects say what "loaded" means for them instead of waiting for every sub-resource
+
+WHY:
+    driver.get() with the default "normal" page-load strategy blocks until
+    the load event: every image, font and analytics script. Tests then
+    sleep on top of that. With the "eager" or "none" strategy
+    (SELENIUM_PAGE_LOAD / --page-load) get() returns early and
+    BasePage.open() waits for the page object's READY_WHEN contract:
+
+        ElementReady(locator)            element present (and visible)
+        ScriptReady("window.appReady")   JS expression is truthy
+        NetworkIdle(idle_ms=500)         no resource finished loading for idle_ms
+        DocumentReady("interactive")     document.readyState reached
+
+    All contracts of a page are checked in ONE script per poll.
+
+TIMING:
+    Every open() records navigation start -> ready (the page's own clock)
+    per page object, plus the load event time when it is already known,
+    so the terminal summary shows what waiting for "load" would cost.
+"""
+
+import json
+import time
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from utils.locator_js import LOCATOR_JS, locator_to_js
+
+
+POLL_INTERVAL = 0.05
+
+# Document readyState levels, in order
+_READY_STATES = ("loading", "interactive", "complete")
+
+
+class ElementReady:
+    """Ready once `locator` matches an element (a visible one by default)"""
+
+    def __init__(self, locator, visible=True):
+        self.locator = locator
+        self.visible = visible
+
+    @property
+    def js(self):
+        using, value = locator_to_js(self.locator)
+        check = "__isVisible" if self.visible else "Boolean"
+        return f"__findAll({json.dumps(using)}, {json.dumps(value)}).some({check})"
+
+    def __repr__(self):
+        return f"ElementReady{self.locator}"
+
+
+class ScriptReady:
+    """Ready once the JavaScript expression `expression` is truthy"""
+
+    def __init__(self, expression):
+        self.expression = expression
+
+    @property
+    def js(self):
+        return f"Boolean({self.expression})"
+
+    def __repr__(self):
+        return f"ScriptReady({self.expression!r})"
+
+
+class NetworkIdle:
+    """
+    Ready once no resource has finished loading for `idle_ms`
+
+    Based on the Resource Timing entries the page can see, so requests
+    that are still in flight are only noticed once they complete.
+    """
+
+    def __init__(self, idle_ms=500):
+        self.idle_ms = idle_ms
+
+    @property
+    def js(self):
+        return (
+            "(document.readyState !== 'loading' && (() => {"
+            " const ends = performance.getEntriesByType('resource').map(e => e.responseEnd);"
+            f" return performance.now() - Math.max(0, ...ends) >= {int(self.idle_ms)};"
+            " })())"
+        )
+
+    def __repr__(self):
+        return f"NetworkIdle({self.idle_ms}ms)"
+
+
+class DocumentReady:
+    """Ready once document.readyState is at least `state`"""
+
+    def __init__(self, state="interactive"):
+        if state not in _READY_STATES:
+            raise ValueError(f"Unknown readyState '{state}'. Choose from: {', '.join(_READY_STATES)}")
+        self.state = state
+
+    @property
+    def js(self):
+        accepted = json.dumps(list(_READY_STATES[_READY_STATES.index(self.state):]))
+        return f"{accepted}.includes(document.readyState)"
+
+    def __repr__(self):
+        return f"DocumentReady({self.state})"
+
+
+def build_ready_script(contracts):
+    """
+    One script checking all `contracts` in the CURRENT document
+
+    The script gets the navigation start (epoch ms) as argument and
+    returns null while an older document is still showing or a
+    contract does not hold; otherwise [ready_ms, load_ms or null],
+    both measured from the document's own navigation start.
+    """
+    checks = " && ".join(f"({contract.js})" for contract in contracts) or "true"
+    return LOCATOR_JS + f"""
+if (location.href === 'about:blank' || performance.timeOrigin < arguments[0]) return null;
+if (!({checks})) return null;
+const nav = performance.getEntriesByType('navigation')[0];
+return [performance.now(), nav && nav.loadEventEnd > 0 ? nav.loadEventEnd : null];
+"""
+
+
+class ReadinessStats:
+    """Navigation start -> ready time per page object"""
+
+    def __init__(self):
+        self.by_page = {}   # page name -> [opens, ready_ms, wall_ms, load_ms, loads_known]
+
+    def record(self, page, ready_ms, wall_ms, load_ms=None):
+        entry = self.by_page.setdefault(page, [0, 0.0, 0.0, 0.0, 0])
+        entry[0] += 1
+        entry[1] += ready_ms
+        entry[2] += wall_ms
+        if load_ms is not None:
+            entry[3] += load_ms
+            entry[4] += 1
+
+    def as_dict(self):
+        """Counters as a plain dict (safe to send between xdist workers)"""
+        return {'by_page': {page: list(entry) for page, entry in self.by_page.items()}}
+
+    def merge(self, data):
+        """Add counters from another ReadinessStats.as_dict() (xdist aggregation)"""
+        for page, values in data['by_page'].items():
+            entry = self.by_page.setdefault(page, [0, 0.0, 0.0, 0.0, 0])
+            for i, value in enumerate(values):
+                entry[i] += value
+
+    def summary_lines(self):
+        """Human-readable lines for the terminal summary"""
+        lines = [f"{'page':<24}{'opens':>6}{'ready':>10}{'open()':>10}{'load':>10}"]
+        for page, (opens, ready_ms, wall_ms, load_ms, loads) in sorted(self.by_page.items()):
+            load = f"{load_ms / loads:>8.0f}ms" if loads else f"{'-':>10}"
+            lines.append(f"{page:<24}{opens:>6}{ready_ms / opens:>8.0f}ms{wall_ms / opens:>8.0f}ms{load}")
+        lines.append("ready/load: from navigation start (page clock); open(): wall time incl. driver.get")
+        return lines
+
+
+stats = ReadinessStats()
+
+
+def wait_until_ready(driver, contracts, started, page="page", timeout=30):
+    """
+    Wait until the document navigated to after `started` meets `contracts`
+
+    Args:
+        driver: Selenium WebDriver instance
+        contracts: Readiness contracts (empty = document interactive)
+        started: time.time() taken just before driver.get(), or None
+                 to accept the current document whenever it loaded
+        page: Name the timing is recorded under
+        timeout: Seconds to wait
+
+    Returns:
+        float: Milliseconds from navigation start to ready
+
+    Raises:
+        TimeoutException: Contract not met within `timeout`
+    """
+    script = build_ready_script(contracts or [DocumentReady("interactive")])
+    if started is None:
+        started, since_ms = time.time(), 0
+    else:
+        # Small allowance: the page clock and time.time() are rounded differently
+        since_ms = started * 1000 - 50
+
+    def ready(driver):
+        return driver.execute_script(script, since_ms)
+
+    wait = WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL,
+                         ignored_exceptions=(WebDriverException,))
+    ready_ms, load_ms = wait.until(ready, f"{page} not ready: {contracts}")
+    stats.record(page, ready_ms, (time.time() - started) * 1000, load_ms)
+    return ready_ms
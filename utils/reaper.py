@@ -0,0 +1,419 @@
+"""
+Browser Reaper - Orphaned Chrome, chromedriver and Profiles
+Whatever a killed run leaves behind is cleaned up by the next one
+
+WHY:
+    Profiles are deleted by quit_driver() / at exit and browsers are quit
+    in finally blocks and fixture teardowns - none of which runs when a
+    worker is killed (OOM killer, CI timeout, kill -9). Orphaned Chrome
+    processes and profile copies then pile up until the box runs out of
+    memory.
+
+HOW:
+    Every process keeps a ledger file (one JSON per process in
+    SELENIUM_REAPER_DIR) listing what it started:
+        - profile directories handed out by utils/profile_manager.py
+        - chromedriver processes of create_driver() sessions
+    Chrome processes are found through their --user-data-dir, so browsers
+    started by script-style tests are covered too. Updating the ledger
+    never lists processes; only reaping and the end-of-session count do.
+
+    reap_stale() kills the processes and deletes the profiles of ledgers
+    whose owner is gone. conftest calls it when a run starts and when an
+    xdist worker crashes. Abnormal exits that still run Python
+    (KeyboardInterrupt, errors) clean up after themselves at exit; SIGTERM
+    cleans up in its handler and then terminates the process as usual.
+
+    The summary reports what was reaped from earlier runs and what this
+    run still had open when the session ended.
+
+    Processes are listed with psutil when it is installed, otherwise from
+    /proc (Linux). Elsewhere only the profile directories are cleaned.
+    The two report start times on different clocks, so a ledger records
+    which one it used; a ledger from the other clock is judged by its
+    owner's pid alone and left alone while that pid exists.
+
+Environment:
+    SELENIUM_REAPER_DIR   Ledger directory (default: ~/.cache/selenium-mastery/ledgers)
+"""
+
+import atexit
+import json
+import os
+import shutil
+import signal
+import tempfile
+import threading
+import time
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+DEFAULT_LEDGER_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'selenium-mastery', 'ledgers')
+
+# Only directories named like profile_manager's are ever deleted
+PROFILE_PREFIXES = ('profile-', 'template-')
+
+
+def get_ledger_dir():
+    return os.environ.get('SELENIUM_REAPER_DIR', DEFAULT_LEDGER_DIR)
+
+
+def _clock():
+    """Which clock _processes() start times are on"""
+    return 'psutil' if psutil is not None else 'proc'
+
+
+def _processes():
+    """[(pid, ppid, start time, command line)] of every process we can see"""
+    if psutil is not None:
+        rows = []
+        for process in psutil.process_iter(['pid', 'ppid', 'create_time', 'cmdline']):
+            info = process.info
+            rows.append((info['pid'], info['ppid'], info['create_time'], " ".join(info['cmdline'] or [])))
+        return rows
+    if not os.path.isdir('/proc'):
+        return []
+    rows = []
+    for name in os.listdir('/proc'):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f'/proc/{name}/stat') as f:
+                fields = f.read().rsplit(')', 1)[1].split()
+            with open(f'/proc/{name}/cmdline', 'rb') as f:
+                cmdline = f.read().replace(b'\0', b' ').decode(errors='replace').strip()
+        except OSError:
+            continue
+        rows.append((int(name), int(fields[1]), float(fields[19]), cmdline))
+    return rows
+
+
+def _start_time(pid):
+    """Start time of `pid` as _processes() reports it, None if not running"""
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).create_time()
+        except psutil.Error:
+            return None
+    try:
+        with open(f'/proc/{pid}/stat') as f:
+            return float(f.read().rsplit(')', 1)[1].split()[19])
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def _descendants(pids, processes):
+    children = {}
+    for pid, ppid, _, _ in processes:
+        children.setdefault(ppid, []).append(pid)
+    found, stack = set(), list(pids)
+    while stack:
+        for child in children.get(stack.pop(), []):
+            if child not in found:
+                found.add(child)
+                stack.append(child)
+    return found
+
+
+def dir_size(path):
+    """Bytes in a directory tree (0 if it is gone)"""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                continue
+    return total
+
+
+def find_processes(ledger, processes=None):
+    """
+    Live processes belonging to a ledger
+
+    Its chromedriver processes (same pid and start time), Chrome processes
+    using one of its profiles, and everything those started.
+
+    Returns:
+        set: pids
+    """
+    processes = _processes() if processes is None else processes
+    drivers = {(pid, start) for pid, start in ledger.get('drivers', [])}
+    profiles = [f"--user-data-dir={path}" for path in ledger.get('profiles', [])]
+    roots = {pid for pid, _, start, cmdline in processes
+             if (pid, start) in drivers or any(profile in cmdline for profile in profiles)}
+    roots.discard(os.getpid())
+    return roots | _descendants(roots, processes)
+
+
+class ReaperStats:
+    """What was reaped from earlier runs and what this run left open"""
+
+    def __init__(self):
+        self.reaped_ledgers = 0
+        self.reaped_processes = 0
+        self.reaped_profiles = 0
+        self.reaped_bytes = 0
+        self.open_processes = 0    # still running at session end
+        self.open_profiles = 0
+        self.open_bytes = 0
+
+    def as_dict(self):
+        """Counters as a plain dict (safe to send between xdist workers)"""
+        return {name: value for name, value in vars(self).items()}
+
+    def merge(self, data):
+        """Add counters from another ReaperStats.as_dict() (xdist aggregation)"""
+        for name, value in data.items():
+            setattr(self, name, getattr(self, name) + value)
+
+    def summary_lines(self):
+        """Human-readable lines for the terminal summary"""
+        return [
+            f"Reaped from killed runs/workers: {self.reaped_processes} processes, {self.reaped_profiles} "
+            f"profiles ({self.reaped_bytes / 2**20:.1f} MiB) from {self.reaped_ledgers} ledgers",
+            f"Still open at session end: {self.open_processes} browser processes, {self.open_profiles} "
+            f"profiles ({self.open_bytes / 2**20:.1f} MiB) - removed at exit",
+        ]
+
+
+stats = ReaperStats()
+
+
+class Ledger:
+    """
+    What this process started, mirrored to its ledger file
+
+    Args:
+        directory: Ledger directory (default: SELENIUM_REAPER_DIR)
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory or get_ledger_dir()
+        self.pid = os.getpid()
+        self.path = os.path.join(self.directory, f"{self.pid}.json")
+        self.profiles = set()
+        self.drivers = set()       # (pid, start time) of chromedriver processes
+        # Reentrant: the SIGTERM handler may close() while the main thread holds it
+        self._lock = threading.RLock()
+        self._registered = False
+
+    def add_profile(self, path):
+        with self._lock:
+            self.profiles.add(path)
+            self._save()
+
+    def remove_profile(self, path):
+        with self._lock:
+            if path in self.profiles:
+                self.profiles.discard(path)
+                self._save()
+
+    def add_driver_process(self, pid):
+        start = _start_time(pid)
+        if start is None:
+            return
+        with self._lock:
+            self.drivers.add((pid, start))
+            self._save()
+
+    def remove_driver_process(self, pid):
+        """Forget `pid` once it has exited (a shared chromedriver keeps running)"""
+        start = _start_time(pid)
+        with self._lock:
+            ended = {(driver_pid, driver_start) for driver_pid, driver_start in self.drivers
+                     if driver_pid == pid and driver_start != start}
+            if ended:
+                self.drivers -= ended
+                self._save()
+
+    def as_dict(self):
+        return {
+            'owner': [self.pid, _start_time(self.pid)],
+            'clock': _clock(),
+            'updated': time.time(),
+            'profiles': sorted(self.profiles),
+            'drivers': sorted(self.drivers),
+        }
+
+    def _save(self):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self.as_dict(), f)
+            os.replace(tmp, self.path)
+        except OSError:
+            return  # best effort: a missing ledger only means no reaping
+        if not self._registered:
+            self._registered = True
+            atexit.register(self.close)
+
+    def open_resources(self):
+        """(live pids, existing profile dirs, their bytes) this process still holds"""
+        with self._lock:
+            ledger = {'profiles': sorted(self.profiles), 'drivers': []}
+        pids = find_processes(ledger)
+        profiles = [path for path in ledger['profiles'] if os.path.isdir(path)]
+        return pids, profiles, sum(dir_size(path) for path in profiles)
+
+    def close(self):
+        """At exit: kill what is left, delete the profiles, drop the ledger"""
+        with self._lock:
+            ledger = {'profiles': sorted(self.profiles), 'drivers': []}
+            self.profiles.clear()
+        reap(ledger)
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+_ledger = None
+_ledger_lock = threading.Lock()
+
+
+def get_ledger():
+    """This process's Ledger (created on first use)"""
+    global _ledger
+    with _ledger_lock:
+        if _ledger is None or _ledger.pid != os.getpid():
+            _ledger = Ledger()
+        return _ledger
+
+
+def track_profile(path):
+    get_ledger().add_profile(path)
+
+
+def release_profile(path):
+    get_ledger().remove_profile(path)
+
+
+def track_driver(driver):
+    """Record the chromedriver process of a session, if it has one"""
+    try:
+        pid = driver.service.process.pid
+    except AttributeError:
+        return
+    get_ledger().add_driver_process(pid)
+
+
+def untrack_driver(driver):
+    """Drop the chromedriver process of a quit session from the ledger"""
+    try:
+        pid = driver.service.process.pid
+    except AttributeError:
+        return
+    get_ledger().remove_driver_process(pid)
+
+
+def reap(ledger, processes=None):
+    """
+    Kill a ledger's processes and delete its profile directories
+
+    Returns:
+        tuple: (processes killed, profiles deleted, bytes freed)
+    """
+    killed = 0
+    for pid in find_processes(ledger, processes):
+        try:
+            os.kill(pid, getattr(signal, 'SIGKILL', signal.SIGTERM))
+            killed += 1
+        except OSError:
+            continue
+    profiles = freed = 0
+    for path in ledger.get('profiles', []):
+        if not os.path.basename(path).startswith(PROFILE_PREFIXES) or not os.path.isdir(path):
+            continue
+        freed += dir_size(path)
+        shutil.rmtree(path, ignore_errors=True)
+        profiles += 1
+    return killed, profiles, freed
+
+
+def _owner_alive(owner, processes, same_clock=True):
+    pid, start = owner
+    if not same_clock:
+        start = None  # not comparable with ours: go by pid only
+    if pid is None:
+        return False
+    if pid == os.getpid():
+        return True
+    if not processes:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except OSError:
+            pass
+        return True
+    return any(row_pid == pid and (start is None or row_start == start)
+               for row_pid, _, row_start, _ in processes)
+
+
+def reap_stale():
+    """
+    Reap the ledgers of processes that are gone (killed runs and workers)
+
+    Returns:
+        tuple: (processes killed, profiles deleted, bytes freed)
+    """
+    directory = get_ledger_dir()
+    if not os.path.isdir(directory):
+        return 0, 0, 0
+    processes = _processes()
+    totals = [0, 0, 0]
+    for name in os.listdir(directory):
+        if not name.endswith('.json'):
+            continue
+        path = os.path.join(directory, name)
+        try:
+            with open(path) as f:
+                ledger = json.load(f)
+        except (OSError, ValueError):
+            continue
+        same_clock = ledger.get('clock') == _clock()
+        if _owner_alive(ledger.get('owner', [None, None]), processes, same_clock):
+            continue
+        for index, value in enumerate(reap(ledger, processes)):
+            totals[index] += value
+        stats.reaped_ledgers += 1
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    stats.reaped_processes += totals[0]
+    stats.reaped_profiles += totals[1]
+    stats.reaped_bytes += totals[2]
+    return tuple(totals)
+
+
+def account_open_resources():
+    """Count what this process still holds (end of session) into stats"""
+    pids, profiles, size = get_ledger().open_resources()
+    stats.open_processes += len(pids)
+    stats.open_profiles += len(profiles)
+    stats.open_bytes += size
+
+
+def _on_sigterm(signum, frame):
+    # Raising here (sys.exit) would only fail the running test - pytest
+    # catches SystemExit - so clean up and let the signal kill us after all
+    ledger = _ledger
+    if ledger is not None and ledger.pid == os.getpid():
+        ledger.close()
+    signal.signal(signum, signal.SIG_DFL)
+    os.kill(os.getpid(), signum)
+
+
+def install_signal_handlers():
+    """Reap this process's browsers and profiles on SIGTERM (CI cancel, timeout), then terminate"""
+    if threading.current_thread() is not threading.main_thread():
+        return
+    if signal.getsignal(signal.SIGTERM) is signal.SIG_DFL:
+        signal.signal(signal.SIGTERM, _on_sigterm)
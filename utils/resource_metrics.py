@@ -0,0 +1,345 @@
+"""
+Browser Resource Metrics - Heap, DOM Nodes, CPU and Memory per Test
+Which tests leave the browser bigger than they found it?
+
+WHY:
+    Workers get slower after long sessions and nothing says why: a page
+    that leaks DOM nodes, a JS heap that keeps growing, Chrome or
+    chromedriver piling up memory.
+
+HOW:
+    With SELENIUM_RESOURCE_METRICS=1 (or pytest --resource-metrics) the
+    driver fixture samples its browser when the test gets it, after
+    every top-level page-object step (utils/steps.py) and when the test
+    is done. A sample holds:
+        - Chrome's Performance.getMetrics: JS heap used/total, DOM nodes,
+          documents, event listeners, layout count, script time
+        - with psutil installed: RSS and CPU time of the session's Chrome
+          process tree and of chromedriver
+
+    A test is flagged when DOM nodes or JS heap grew by more than the
+    thresholds from its first to its last sample. Samples go to
+    SELENIUM_RESOURCE_FILE; the terminal summary and the HTML report show
+    the largest tests and the flagged ones. Nothing fails because of it.
+
+Environment:
+    SELENIUM_RESOURCE_METRICS       1 = sample (default: off)
+    SELENIUM_RESOURCE_FILE          JSON file (default: reports/resource_metrics.json)
+    SELENIUM_LEAK_NODES             DOM node growth that flags a test (default 1000)
+    SELENIUM_LEAK_HEAP_MB           JS heap growth that flags a test (default 10)
+"""
+
+import contextlib
+import html
+import json
+import os
+import threading
+import time
+
+from utils import network, steps
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+# Performance.getMetrics name -> (sample key, scale)
+CDP_METRICS = {
+    'JSHeapUsedSize': ('js_heap_mb', 1 / 2**20),
+    'JSHeapTotalSize': ('js_heap_total_mb', 1 / 2**20),
+    'Nodes': ('nodes', 1),
+    'Documents': ('documents', 1),
+    'JSEventListeners': ('listeners', 1),
+    'LayoutCount': ('layouts', 1),
+    'ScriptDuration': ('script_s', 1),
+}
+
+DEFAULT_LEAK_NODES = 1000
+DEFAULT_LEAK_HEAP_MB = 10.0
+
+
+def metrics_enabled():
+    return os.environ.get('SELENIUM_RESOURCE_METRICS') == '1'
+
+
+def get_metrics_file():
+    return os.environ.get('SELENIUM_RESOURCE_FILE', os.path.join('reports', 'resource_metrics.json'))
+
+
+def get_thresholds():
+    """
+    (DOM nodes, JS heap MB) growth that flags a test
+
+    Raises:
+        ValueError: Not a positive number
+    """
+    nodes = int(os.environ.get('SELENIUM_LEAK_NODES', DEFAULT_LEAK_NODES))
+    heap_mb = float(os.environ.get('SELENIUM_LEAK_HEAP_MB', DEFAULT_LEAK_HEAP_MB))
+    if nodes <= 0 or heap_mb <= 0:
+        raise ValueError(f"Leak thresholds must be positive, got {nodes} nodes / {heap_mb} MB")
+    return nodes, heap_mb
+
+
+def leaks(samples, thresholds=None):
+    """
+    Growth over the thresholds between the first and the last sample
+
+    Returns:
+        list: Human-readable findings (empty when nothing grew too much)
+    """
+    if len(samples) < 2:
+        return []
+    node_limit, heap_limit = thresholds or get_thresholds()
+    first, last = samples[0], samples[-1]
+    findings = []
+    if 'nodes' in first and 'nodes' in last and last['nodes'] - first['nodes'] > node_limit:
+        findings.append(f"DOM nodes +{last['nodes'] - first['nodes']:.0f}")
+    if 'js_heap_mb' in first and 'js_heap_mb' in last and last['js_heap_mb'] - first['js_heap_mb'] > heap_limit:
+        findings.append(f"JS heap +{last['js_heap_mb'] - first['js_heap_mb']:.1f} MB")
+    return findings
+
+
+class ResourceStats:
+    """Samples per test and the tests flagged as leaking"""
+
+    def __init__(self):
+        self.by_test = {}          # nodeid -> [sample dicts]
+        self.flagged = {}          # nodeid -> [findings]
+        self._lock = threading.Lock()
+
+    def record(self, test, samples):
+        test = test or "(no test)"
+        findings = leaks(samples)
+        with self._lock:
+            self.by_test.setdefault(test, []).extend(samples)
+            if findings:
+                self.flagged[test] = findings
+        return findings
+
+    def as_dict(self):
+        """Counters as a plain dict (safe to send between xdist workers)"""
+        return {
+            'by_test': {test: list(samples) for test, samples in self.by_test.items()},
+            'flagged': dict(self.flagged),
+        }
+
+    def merge(self, data):
+        """Add counters from another ResourceStats.as_dict() (xdist aggregation)"""
+        for test, samples in data['by_test'].items():
+            self.by_test.setdefault(test, []).extend(samples)
+        self.flagged.update(data['flagged'])
+
+    def peaks(self, key):
+        """(test, highest value of `key`) per test, highest first"""
+        rows = [(test, max(sample[key] for sample in samples if key in sample))
+                for test, samples in self.by_test.items() if any(key in sample for sample in samples)]
+        return sorted(rows, key=lambda row: -row[1])
+
+    def to_json(self):
+        return {
+            'thresholds': dict(zip(('nodes', 'js_heap_mb'), get_thresholds())),
+            'flagged': self.flagged,
+            'tests': self.by_test,
+        }
+
+    def html_table(self, test):
+        """Samples of one test for the pytest-html report ('' if none)"""
+        samples = self.by_test.get(test)
+        if not samples:
+            return ""
+        keys = [key for key in ('js_heap_mb', 'nodes', 'listeners', 'layouts', 'script_s',
+                                'chrome_rss_mb', 'chrome_cpu_s', 'driver_rss_mb')
+                if any(key in sample for sample in samples)]
+        header = "".join(f"<th>{key}</th>" for key in keys)
+        rows = "".join(
+            f"<tr><td>{html.escape(sample['label'])}</td>"
+            + "".join(f"<td>{sample[key]:.1f}</td>" if key in sample else "<td></td>" for key in keys)
+            + "</tr>"
+            for sample in samples
+        )
+        findings = self.flagged.get(test)
+        return ("<div class='resource-metrics'><b>Browser resources</b>"
+                + (f" <b style='color:#c33'>{html.escape(', '.join(findings))}</b>" if findings else "")
+                + f"<table><tr><th>sample</th>{header}</tr>{rows}</table></div>")
+
+    def html_summary(self):
+        """Flagged tests for the pytest-html summary ('' if none)"""
+        if not self.flagged:
+            return ""
+        items = "".join(f"<li>{html.escape(test)}: {html.escape(', '.join(findings))}</li>"
+                        for test, findings in sorted(self.flagged.items()))
+        return f"<div class='resource-metrics'><b>Possible browser leaks</b><ul>{items}</ul></div>"
+
+    def summary_lines(self):
+        """Human-readable lines for the terminal summary"""
+        lines = [f"{len(self.by_test)} tests sampled  |  {get_metrics_file()}"]
+        for key, label, unit in (('js_heap_mb', 'JS heap', 'MB'), ('nodes', 'DOM nodes', ''),
+                                 ('chrome_rss_mb', 'Chrome RSS', 'MB')):
+            peaks = self.peaks(key)
+            if peaks:
+                test, value = peaks[0]
+                lines.append(f"Peak {label}: {value:.1f}{unit} ({test})")
+        drift = self._driver_drift()
+        if drift:
+            lines.append("chromedriver RSS first -> last sample: " + ", ".join(
+                f"{worker} {first:.0f} -> {last:.0f} MB" for worker, (first, last) in sorted(drift.items())))
+        if self.flagged:
+            lines.append(f"Possible leaks ({len(self.flagged)} tests):")
+            lines.extend(f"  {test}: {', '.join(findings)}" for test, findings in sorted(self.flagged.items()))
+        return lines
+
+    def _driver_drift(self):
+        by_worker = {}
+        for samples in self.by_test.values():
+            for sample in samples:
+                if 'driver_rss_mb' in sample:
+                    by_worker.setdefault(sample['worker'], []).append((sample['time'], sample['driver_rss_mb']))
+        return {worker: (min(values)[1], max(values)[1]) for worker, values in by_worker.items()}
+
+
+stats = ResourceStats()
+
+
+def _process_tree(driver):
+    """(chromedriver process, Chrome processes of this session) or (None, [])"""
+    try:
+        driver_process = psutil.Process(driver.service.process.pid)
+    except Exception:
+        return None, []
+    profile_dir = driver.capabilities.get('chrome', {}).get('userDataDir')
+    browsers = []
+    for child in driver_process.children():
+        try:
+            if profile_dir is None or any(profile_dir in arg for arg in child.cmdline()):
+                browsers.append(child)
+        except psutil.Error:
+            continue
+    tree = []
+    for browser in browsers:
+        tree.append(browser)
+        try:
+            tree.extend(browser.children(recursive=True))
+        except psutil.Error:
+            continue
+    return driver_process, tree
+
+
+def _os_metrics(driver):
+    if psutil is None:
+        return {}
+    driver_process, tree = _process_tree(driver)
+    if driver_process is None:
+        return {}
+    rss = cpu = 0.0
+    for process in tree:
+        try:
+            rss += process.memory_info().rss
+            times = process.cpu_times()
+            cpu += times.user + times.system
+        except psutil.Error:
+            continue
+    metrics = {'chrome_rss_mb': rss / 2**20, 'chrome_cpu_s': cpu}
+    try:
+        metrics['driver_rss_mb'] = driver_process.memory_info().rss / 2**20
+    except psutil.Error:
+        pass
+    return metrics
+
+
+class ResourceMonitor:
+    """
+    Samples of one fixture driver during one test
+
+    Args:
+        driver: Chrome WebDriver instance
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.test = network.current_test
+        self.samples = []
+        self._cdp_ready = False
+
+    def sample(self, label):
+        """Take a sample now; a browser that cannot answer gives a partial one"""
+        sample = {'label': label, 'time': time.time(),
+                  'worker': os.environ.get('PYTEST_XDIST_WORKER', 'main')}
+        try:
+            if not self._cdp_ready:
+                self.driver.execute_cdp_cmd("Performance.enable", {})
+                self._cdp_ready = True
+            result = self.driver.execute_cdp_cmd("Performance.getMetrics", {})
+            for metric in result.get('metrics', []):
+                if metric['name'] in CDP_METRICS:
+                    key, scale = CDP_METRICS[metric['name']]
+                    sample[key] = metric['value'] * scale
+        except Exception:
+            pass  # browser crashed or quitting: keep what the OS says
+        sample.update(_os_metrics(self.driver))
+        self.samples.append(sample)
+        return sample
+
+    def on_step(self, step):
+        self.sample(step['name'])
+
+
+_warned = False
+_active = {}                       # test -> its ResourceMonitor
+
+
+@contextlib.contextmanager
+def monitor(driver):
+    """
+    Sample `driver` around the with-block (the test) and after each step
+
+    No-op unless SELENIUM_RESOURCE_METRICS=1.
+    """
+    global _warned
+    if not metrics_enabled():
+        yield None
+        return
+    if psutil is None and not _warned:
+        print("⚠️  psutil is not installed - resource metrics without CPU/RSS (pip install psutil)")
+        _warned = True
+    resource_monitor = ResourceMonitor(driver)
+    resource_monitor.sample("start")
+    steps.add_listener(resource_monitor.on_step)
+    _active[resource_monitor.test] = resource_monitor
+    try:
+        yield resource_monitor
+    finally:
+        finish_test(resource_monitor.test)
+
+
+def finish_test(test):
+    """
+    Take `test`'s last sample and record its samples (once)
+
+    conftest calls this when the test body is done, so the results make
+    it into the test's report; the driver fixture calls it again at
+    teardown as a fallback.
+
+    Returns:
+        list: Leak findings, or None when the test was not (or no longer) sampled
+    """
+    resource_monitor = _active.pop(test, None)
+    if resource_monitor is None:
+        return None
+    steps.remove_listener(resource_monitor.on_step)
+    resource_monitor.sample("end")
+    return stats.record(test, resource_monitor.samples)
+
+
+def write_metrics_file(resource_stats, path=None):
+    """
+    Write all samples and the flagged tests as JSON
+
+    Returns:
+        str: Path written
+    """
+    path = path or get_metrics_file()
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(resource_stats.to_json(), f, indent=2)
+    return path
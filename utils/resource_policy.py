@@ -0,0 +1,368 @@
+"""
+Resource Blocking Policy
+Keep the browser from downloading what no assertion looks at
+
+WHY:
+    demo.opencart.com, the hover and upload pages, ... pull in images,
+    fonts and analytics. Tests wait for all of it (the load event) and
+    never check any of it. A BlockPolicy says what to skip; the
+    ResourceBlocker handler fails those requests inside Chrome
+    (utils/network.py), so they never reach the network.
+
+WHERE POLICIES COME FROM (combined, in this order):
+    1. Global preset      BLOCKING_POLICIES in utils/browser_config.py,
+                          picked with SELENIUM_BLOCKING / --block-resources
+    2. Test marker        @pytest.mark.block_resources("lean")
+                          @pytest.mark.block_resources(types=["Image"], patterns=["*ads*"])
+                          @pytest.mark.allow_resources("Image")    # opt back in
+                          @pytest.mark.block_resources("off")      # ignore the global preset
+    3. Page object        BLOCK_RESOURCES = BlockPolicy(...)      # block more
+                          ALLOW_RESOURCES = ("Image",)            # opt back in,
+                          e.g. when a screenshot needs the pictures
+
+WHICH SESSIONS ARE INTERCEPTED:
+    Every request of an intercepted session makes a round-trip through
+    Python, so only sessions that need it get a ResourceBlocker:
+        - all sessions when a global preset is on
+        - otherwise only while a test or page object declares a policy:
+          sessions launched during such a test get one at launch,
+          pooled browsers and page objects add it with enable_blocking()
+          and the driver fixture removes it again after the test
+          (release_blocking()), before the browser serves the next test
+
+Resource types are Chrome DevTools names: Document, Stylesheet, Image,
+Media, Font, Script, XHR, Fetch, ... Patterns are fnmatch globs on the URL.
+"""
+
+import fnmatch
+import threading
+import urllib.parse
+
+from selenium.common.exceptions import WebDriverException
+
+from utils import events, network
+from utils.http_replay import ReplayCache
+from utils.network import BLOCK, NetworkHandler
+
+
+RESOURCE_TYPES = (
+    "Document", "Stylesheet", "Image", "Media", "Font", "Script", "TextTrack",
+    "XHR", "Fetch", "Prefetch", "EventSource", "WebSocket", "Manifest",
+    "SignedExchange", "Ping", "CSPViolationReport", "Preflight", "Other",
+)
+
+# Never blocked, whatever a policy says - pages would not load at all
+_ALWAYS_ALLOWED = {"Document"}
+
+
+class BlockPolicy:
+    """
+    What to block
+
+    Args:
+        resource_types: Block every request of these types
+        url_patterns: Block URLs matching any of these globs
+        third_party_types: Block these types only when they come from
+                           another host than the page (e.g. "Script"
+                           for analytics and tag managers)
+        replaces_global: Used instead of the global preset, not on top of
+                         it (a test's block_resources("off"))
+    """
+
+    def __init__(self, resource_types=(), url_patterns=(), third_party_types=(), replaces_global=False):
+        self.resource_types = frozenset(resource_types)
+        self.url_patterns = tuple(url_patterns)
+        self.third_party_types = frozenset(third_party_types)
+        self.replaces_global = replaces_global
+
+    def __bool__(self):
+        return bool(self.resource_types or self.url_patterns or self.third_party_types)
+
+    def __repr__(self):
+        return (f"BlockPolicy(types={sorted(self.resource_types)}, patterns={list(self.url_patterns)}, "
+                f"third_party={sorted(self.third_party_types)})")
+
+    def combine(self, other):
+        """Policy blocking everything either policy blocks"""
+        if other is None:
+            return self
+        return BlockPolicy(
+            self.resource_types | other.resource_types,
+            self.url_patterns + tuple(p for p in other.url_patterns if p not in self.url_patterns),
+            self.third_party_types | other.third_party_types,
+            self.replaces_global or other.replaces_global,
+        )
+
+    def allowing(self, entries):
+        """
+        Policy with some resources opted back in
+
+        Args:
+            entries: Resource type names and/or URL globs to allow again
+        """
+        types = {entry for entry in entries if entry in RESOURCE_TYPES}
+        patterns = set(entries) - types
+        return BlockPolicy(
+            self.resource_types - types,
+            tuple(p for p in self.url_patterns if p not in patterns),
+            self.third_party_types - types,
+            self.replaces_global,
+        )
+
+    def blocks(self, request, page_host=None):
+        """
+        Should `request` be blocked?
+
+        Args:
+            request: utils.network.InterceptedRequest
+            page_host: Host of the current top-level page (for third_party_types)
+        """
+        if request.resource_type in _ALWAYS_ALLOWED or request.url.startswith("data:"):
+            return False
+        if request.resource_type in self.resource_types:
+            return True
+        if request.resource_type in self.third_party_types and page_host:
+            host = urllib.parse.urlsplit(request.url).hostname
+            if host and host != page_host and not host.endswith("." + page_host):
+                return True
+        return any(fnmatch.fnmatchcase(request.url, pattern) for pattern in self.url_patterns)
+
+
+EMPTY_POLICY = BlockPolicy()
+
+
+class BlockStats:
+    """Requests (and known bytes) blocked, per resource type and per test"""
+
+    def __init__(self):
+        self.requests = 0
+        self.bytes = 0             # only sizes known from a replay recording
+        self.by_type = {}          # resource type -> requests
+        self.by_test = {}          # nodeid -> [requests, bytes]
+        self._lock = threading.Lock()
+
+    def record(self, test, resource_type, size):
+        with self._lock:
+            self.requests += 1
+            self.bytes += size
+            self.by_type[resource_type] = self.by_type.get(resource_type, 0) + 1
+            entry = self.by_test.setdefault(test or "(no test)", [0, 0])
+            entry[0] += 1
+            entry[1] += size
+
+    def for_test(self, test):
+        """(requests, bytes) blocked during one test"""
+        return tuple(self.by_test.get(test, (0, 0)))
+
+    def as_dict(self):
+        """Counters as a plain dict (safe to send between xdist workers)"""
+        return {
+            'requests': self.requests,
+            'bytes': self.bytes,
+            'by_type': dict(self.by_type),
+            'by_test': {test: list(entry) for test, entry in self.by_test.items()},
+        }
+
+    def merge(self, data):
+        """Add counters from another BlockStats.as_dict() (xdist aggregation)"""
+        self.requests += data['requests']
+        self.bytes += data['bytes']
+        for resource_type, count in data['by_type'].items():
+            self.by_type[resource_type] = self.by_type.get(resource_type, 0) + count
+        for test, (requests, size) in data['by_test'].items():
+            entry = self.by_test.setdefault(test, [0, 0])
+            entry[0] += requests
+            entry[1] += size
+
+    def summary_lines(self):
+        """Human-readable lines for the terminal summary"""
+        types = ", ".join(f"{name} {count}" for name, count in
+                          sorted(self.by_type.items(), key=lambda item: -item[1]))
+        lines = [f"Blocked {self.requests} requests ({types})"]
+        if self.bytes:
+            lines.append(f"At least {self.bytes / 1024:.0f} KiB not downloaded (sizes from the replay recording)")
+        for test, (requests, size) in sorted(self.by_test.items()):
+            lines.append(f"  {test:<60} {requests:>5} requests  {size / 1024:7.0f} KiB")
+        return lines
+
+
+stats = BlockStats()
+
+# Policy of the running test (from its markers) - set by conftest
+_test_policy = None
+
+
+def set_test_policy(policy):
+    """Blocking rules of the test that is about to run (None = none)"""
+    global _test_policy
+    _test_policy = policy
+
+
+def get_test_policy():
+    return _test_policy
+
+
+class ResourceBlocker(NetworkHandler):
+    """
+    Fails requests the effective policy blocks
+
+    Args:
+        global_policy: Preset from utils/browser_config (may be empty)
+        size_lookup: Optional callable(method, url) -> bytes or None, used
+                     to estimate what a blocked request would have cost
+        on_demand: Added for one test's policy, removed by release_blocking()
+    """
+
+    def __init__(self, global_policy=None, size_lookup=None, on_demand=False):
+        self.global_policy = global_policy or EMPTY_POLICY
+        self.size_lookup = size_lookup
+        self.on_demand = on_demand
+        self.page_host = None
+        self._page = None          # (page object class, test) that last opted in/out
+
+    def set_page(self, page_class):
+        """Apply a page object's BLOCK_RESOURCES / ALLOW_RESOURCES"""
+        self._page = (page_class, network.current_test)
+
+    def effective_policy(self):
+        if _test_policy is not None and _test_policy.replaces_global:
+            policy = _test_policy
+        else:
+            policy = self.global_policy.combine(_test_policy)
+        page_class, test = self._page or (None, None)
+        if page_class is not None and test == network.current_test:
+            policy = policy.combine(page_class.BLOCK_RESOURCES).allowing(page_class.ALLOW_RESOURCES)
+        return policy
+
+    def on_request(self, request):
+        if request.resource_type == "Document":
+            # Frames of other hosts must not change what counts as third party
+            if request.main_frame and request.url.startswith("http"):
+                self.page_host = urllib.parse.urlsplit(request.url).hostname
+            return None
+        if not self.effective_policy().blocks(request, self.page_host):
+            return None
+        size = 0
+        if self.size_lookup is not None:
+            size = self.size_lookup(request.method, request.url) or 0
+        stats.record(request.test, request.resource_type, size)
+        return BLOCK
+
+
+def blocking_handler(global_policy):
+    """
+    Handler for a new driver
+
+    Args:
+        global_policy: Preset selected in utils/browser_config (None = off)
+
+    Returns:
+        ResourceBlocker, or None when there is no global preset and the
+        running test declares no policy
+    """
+    if global_policy:
+        return ResourceBlocker(global_policy, size_lookup=ReplayCache().size_of)
+    if _test_policy:
+        return ResourceBlocker(size_lookup=ReplayCache().size_of, on_demand=True)
+    return None
+
+
+def _blocker_of(driver):
+    interceptor = network.get_interceptor(driver)
+    for handler in interceptor.handlers if interceptor else ():
+        if isinstance(handler, ResourceBlocker):
+            return handler
+    return None
+
+
+def enable_blocking(driver):
+    """
+    Make sure `driver` has a ResourceBlocker (for a test or page policy)
+
+    Returns:
+        ResourceBlocker: The driver's blocker
+
+    Raises:
+        WebDriverException: Interception could not be set up
+    """
+    blocker = _blocker_of(driver)
+    if blocker is None:
+        blocker = ResourceBlocker(size_lookup=ReplayCache().size_of, on_demand=True)
+        network.add_handler(driver, blocker)
+    return blocker
+
+
+def release_blocking(driver):
+    """Remove a blocker added for one test (the global preset's stays)"""
+    blocker = _blocker_of(driver)
+    if blocker is not None and blocker.on_demand:
+        network.remove_handler(driver, blocker)
+
+
+def apply_test_policy(driver):
+    """
+    Intercept a browser launched earlier (pool, pre-warm) exactly when
+    the running test declares a policy
+    """
+    if _test_policy:
+        enable_blocking(driver)
+    else:
+        release_blocking(driver)
+
+
+def policy_from_markers(node, presets):
+    """
+    Combine a test's block_resources / allow_resources markers
+
+    "off" (a preset that blocks nothing) means: no global preset for this
+    test - only what its other marker arguments block.
+
+    Args:
+        node: pytest item
+        presets: Named policies (utils.browser_config.BLOCKING_POLICIES)
+
+    Returns:
+        BlockPolicy, or None when the markers change nothing (no markers,
+        or nothing blocked and no global preset overridden)
+
+    Raises:
+        ValueError: Unknown preset name in a marker
+    """
+    policy = None
+    for marker in node.iter_markers("block_resources"):
+        for name in marker.args:
+            if name not in presets:
+                raise ValueError(f"Unknown blocking policy '{name}'. Choose from: {', '.join(presets)}")
+            policy = (presets[name] or BlockPolicy(replaces_global=True)).combine(policy)
+        if marker.kwargs:
+            policy = BlockPolicy(
+                marker.kwargs.get("types", ()),
+                marker.kwargs.get("patterns", ()),
+                marker.kwargs.get("third_party", ()),
+            ).combine(policy)
+    allowed = [entry for marker in node.iter_markers("allow_resources") for entry in marker.args]
+    if allowed:
+        policy = (policy or EMPTY_POLICY).allowing(allowed)
+    if policy is None or not (policy or policy.replaces_global):
+        return None
+    return policy
+
+
+def apply_page_policy(driver, page_class):
+    """
+    Let a page object adjust blocking for the driver it works with
+
+    Called by BasePage.__init__; no-op when the page object declares
+    nothing. A driver without a blocker gets one (removed again after the
+    test by the driver fixture); if that is not possible the policy is
+    not applied and a warning says so.
+    """
+    if page_class.BLOCK_RESOURCES is None and not page_class.ALLOW_RESOURCES:
+        return
+    try:
+        blocker = enable_blocking(driver)
+    except WebDriverException as e:
+        events.warning(f"⚠️  {page_class.__name__}: resource policy not applied, "
+                       f"network interception unavailable ({e})", page=page_class.__name__)
+        return
+    blocker.set_page(page_class)
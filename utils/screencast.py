@@ -0,0 +1,385 @@
+"""
+Screencast Recording - What Did the Browser Show Before the Test Failed?
+Chrome streams frames into memory; only failing tests get a file
+
+WHY:
+    Screenshot checkpoints cost a capture and a write each, on every run,
+    and still tend to miss the moment that matters. Chrome can stream its
+    own frames (CDP Page.startScreencast) as small JPEGs whenever the page
+    repaints, which costs the test almost nothing.
+
+HOW:
+    With SELENIUM_SCREENCAST=1 (or pytest --screencast) every session from
+    create_driver() gets a ScreencastRecorder: a background thread (same
+    trio/bidi_connection setup as utils/network.py) that keeps the
+    frames of the test it serves in a memory-capped buffer. The driver
+    fixture tells the recorder which test that is (serve()); idle pooled
+    or pre-warmed browsers serve no test, so their frames never end up in
+    another test's recording. The frame rate
+    is limited by acknowledging frames no faster than the configured fps,
+    so Chrome does not even encode the others.
+
+    When a test fails (setup or body), conftest encodes its frames into an
+    animated WebP/GIF in SELENIUM_SCREENCAST_DIR and attaches it to the
+    pytest-html report. Passing tests write nothing.
+
+    Encoding needs Pillow (pip install Pillow). Without it the frames are
+    written as numbered JPEGs and the last one is attached instead.
+
+Environment:
+    SELENIUM_SCREENCAST            1 = record (default: off)
+    SELENIUM_SCREENCAST_FPS        Frames per second at most (default 5)
+    SELENIUM_SCREENCAST_MEMORY_MB  Frame buffer per browser (default 20)
+    SELENIUM_SCREENCAST_SIZE       Longest frame side in pixels (default 800)
+    SELENIUM_SCREENCAST_QUALITY    JPEG quality of the frames (default 60)
+    SELENIUM_SCREENCAST_FORMAT     webp (default) | gif
+    SELENIUM_SCREENCAST_DIR        Where recordings go (default: reports/screencasts)
+"""
+
+import base64
+import collections
+import io
+import os
+import re
+import threading
+import time
+
+import trio
+
+from utils.screenshots import load_pillow
+
+
+FORMATS = ("webp", "gif")
+
+DEFAULT_FPS = 5.0
+DEFAULT_MEMORY_MB = 20.0
+DEFAULT_SIZE = 800
+DEFAULT_QUALITY = 60
+
+# Longest a single frame is shown in a recording; a page that did not
+# repaint for a minute should not make a minute-long video
+MAX_FRAME_MS = 2000
+
+EVENT_BUFFER = 100
+
+
+def recording_enabled():
+    return os.environ.get('SELENIUM_SCREENCAST') == '1'
+
+
+def get_fps():
+    """
+    Frame rate cap from SELENIUM_SCREENCAST_FPS
+
+    Raises:
+        ValueError: Not a positive number
+    """
+    fps = float(os.environ.get('SELENIUM_SCREENCAST_FPS', DEFAULT_FPS))
+    if fps <= 0:
+        raise ValueError(f"Screencast fps must be positive, got {fps}")
+    return fps
+
+
+def get_memory_limit():
+    """
+    Frame buffer per browser in bytes, from SELENIUM_SCREENCAST_MEMORY_MB
+
+    Raises:
+        ValueError: Not a positive number
+    """
+    megabytes = float(os.environ.get('SELENIUM_SCREENCAST_MEMORY_MB', DEFAULT_MEMORY_MB))
+    if megabytes <= 0:
+        raise ValueError(f"Screencast memory must be positive, got {megabytes} MB")
+    return int(megabytes * 2**20)
+
+
+def get_recording_format():
+    """
+    Recording format from SELENIUM_SCREENCAST_FORMAT
+
+    Raises:
+        ValueError: Unknown format
+    """
+    name = os.environ.get('SELENIUM_SCREENCAST_FORMAT', 'webp').lower()
+    if name not in FORMATS:
+        raise ValueError(f"Unknown screencast format '{name}'. Choose from: {', '.join(FORMATS)}")
+    return name
+
+
+def get_output_dir():
+    return os.environ.get('SELENIUM_SCREENCAST_DIR', os.path.join('reports', 'screencasts'))
+
+
+class ScreencastStats:
+    """Frames streamed and recordings written"""
+
+    def __init__(self):
+        self.frames = 0
+        self.frame_bytes = 0
+        self.evicted = 0           # dropped to stay under the memory cap
+        self.recordings = 0
+        self.recording_bytes = 0
+        self.encode_ms = 0.0
+        self._lock = threading.Lock()
+
+    def record_frame(self, size, evicted):
+        with self._lock:
+            self.frames += 1
+            self.frame_bytes += size
+            self.evicted += evicted
+
+    def record_recording(self, size, ms):
+        with self._lock:
+            self.recordings += 1
+            self.recording_bytes += size
+            self.encode_ms += ms
+
+    def as_dict(self):
+        """Counters as a plain dict (safe to send between xdist workers)"""
+        return {
+            'frames': self.frames,
+            'frame_bytes': self.frame_bytes,
+            'evicted': self.evicted,
+            'recordings': self.recordings,
+            'recording_bytes': self.recording_bytes,
+            'encode_ms': self.encode_ms,
+        }
+
+    def merge(self, data):
+        """Add counters from another ScreencastStats.as_dict() (xdist aggregation)"""
+        for name, value in data.items():
+            setattr(self, name, getattr(self, name) + value)
+
+    def summary_lines(self):
+        """Human-readable lines for the terminal summary"""
+        lines = [f"Frames streamed: {self.frames} ({self.frame_bytes / 2**20:.1f} MiB in memory over the run, "
+                 f"{self.evicted} evicted by the memory cap)"]
+        if self.recordings:
+            lines.append(f"Recordings of failing tests: {self.recordings} "
+                         f"({self.recording_bytes / 2**20:.1f} MiB, encoded in {self.encode_ms / 1000:.1f}s) "
+                         f"in {get_output_dir()}")
+        else:
+            lines.append("Recordings of failing tests: 0 (nothing written)")
+        return lines
+
+
+stats = ScreencastStats()
+
+_recorders = []
+_recorders_lock = threading.Lock()
+
+
+class ScreencastRecorder:
+    """
+    Page.startScreencast loop for one driver, in a background thread
+
+    Args:
+        driver: Chrome WebDriver instance
+        fps: Frame rate cap (default: SELENIUM_SCREENCAST_FPS)
+        memory_limit: Buffer size in bytes (default: SELENIUM_SCREENCAST_MEMORY_MB)
+    """
+
+    def __init__(self, driver, fps=None, memory_limit=None):
+        self.driver = driver
+        self.interval = 1 / (fps or get_fps())
+        self.memory_limit = memory_limit or get_memory_limit()
+        self.size = int(os.environ.get('SELENIUM_SCREENCAST_SIZE', DEFAULT_SIZE))
+        self.quality = int(os.environ.get('SELENIUM_SCREENCAST_QUALITY', DEFAULT_QUALITY))
+        self._frames = collections.deque()     # (timestamp, JPEG bytes) of self._test
+        self._bytes = 0
+        self._test = None
+        self._lock = threading.Lock()
+        self._thread = None
+        self._ready = threading.Event()
+        self._error = None
+        self._cancel_scope = None
+        self._trio_token = None
+
+    def start(self, timeout=10):
+        """
+        Start streaming; returns once Chrome accepted startScreencast
+
+        Raises:
+            RuntimeError: DevTools connection could not be set up
+        """
+        self._thread = threading.Thread(target=trio.run, args=(self._run,),
+                                        name="screencast", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout):
+            raise RuntimeError(f"Screencast not ready after {timeout}s")
+        if self._error is not None:
+            raise RuntimeError(f"Screencast failed: {self._error}")
+        return self
+
+    def stop(self):
+        """Stop streaming and drop the buffered frames"""
+        if self._trio_token is not None:
+            try:
+                trio.from_thread.run_sync(self._cancel_scope.cancel, trio_token=self._trio_token)
+            except trio.RunFinishedError:
+                pass  # loop already ended (browser gone)
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        with self._lock:
+            self._frames.clear()
+            self._bytes = 0
+
+    async def _run(self):
+        try:
+            async with self.driver.bidi_connection() as connection:
+                session, devtools = connection.session, connection.devtools
+                with trio.CancelScope() as scope:
+                    self._cancel_scope = scope
+                    self._trio_token = trio.lowlevel.current_trio_token()
+                    events = session.listen(devtools.page.ScreencastFrame, buffer_size=EVENT_BUFFER)
+                    await session.execute(devtools.page.start_screencast(
+                        format_="jpeg", quality=self.quality, max_width=self.size, max_height=self.size))
+                    self._ready.set()
+                    async for event in events:
+                        received = time.monotonic()
+                        timestamp = event.metadata.timestamp
+                        self.add_frame(base64.b64decode(event.data),
+                                       float(timestamp) if timestamp is not None else time.time())
+                        # Chrome sends the next frame only after the ack:
+                        # acking late is what caps the frame rate
+                        await trio.sleep(max(0.0, self.interval - (time.monotonic() - received)))
+                        await session.execute(devtools.page.screencast_frame_ack(event.session_id))
+        except Exception as e:
+            # Before ready: start() reports it. After: the browser went away.
+            self._error = e
+        finally:
+            self._ready.set()
+
+    def serve(self, test):
+        """
+        Buffer frames for `test` from now on (None = browser is idle)
+
+        The new buffer opens with the last frame from before - what the
+        screen showed when the test began.
+        """
+        with self._lock:
+            if test == self._test:
+                return
+            last = self._frames[-1] if self._frames else None
+            self._frames.clear()
+            self._bytes = 0
+            self._test = test
+            if last is not None:
+                self._frames.append(last)
+                self._bytes = len(last[1])
+
+    def add_frame(self, jpeg, timestamp):
+        """Buffer a frame for the test this browser serves"""
+        evicted = 0
+        with self._lock:
+            self._frames.append((timestamp, jpeg))
+            self._bytes += len(jpeg)
+            while self._bytes > self.memory_limit and len(self._frames) > 1:
+                self._bytes -= len(self._frames.popleft()[1])
+                evicted += 1
+        stats.record_frame(len(jpeg), evicted)
+
+    def frames(self, test):
+        """
+        Buffered frames of `test`, oldest first (empty if this browser did
+        not serve it)
+
+        If the page did not repaint during the test, that is the last
+        frame from before it.
+        """
+        with self._lock:
+            if test is not None and test == self._test:
+                return list(self._frames)
+            return []
+
+
+def attach(driver):
+    """
+    Record `driver`'s screen when recording is enabled
+
+    A browser that cannot stream (no DevTools) is used without recording.
+
+    Returns:
+        ScreencastRecorder or None
+    """
+    if not recording_enabled():
+        return None
+    try:
+        recorder = ScreencastRecorder(driver).start()
+    except RuntimeError as e:
+        print(f"⚠️  Not recording this browser: {e}")
+        return None
+    driver._screencast_recorder = recorder
+    with _recorders_lock:
+        _recorders.append(recorder)
+    return recorder
+
+
+def serve(driver, test):
+    """Attribute `driver`'s frames to `test` (None = back to idle); no-op if not recorded"""
+    recorder = getattr(driver, "_screencast_recorder", None)
+    if recorder is not None:
+        recorder.serve(test)
+
+
+def detach(driver):
+    """Stop recording `driver` (no-op if it never was)"""
+    recorder = getattr(driver, "_screencast_recorder", None)
+    if recorder is None:
+        return
+    driver._screencast_recorder = None
+    with _recorders_lock:
+        if recorder in _recorders:
+            _recorders.remove(recorder)
+    recorder.stop()
+
+
+def recordings_for(test):
+    """Frame lists of `test`, one per browser that served it"""
+    with _recorders_lock:
+        recorders = list(_recorders)
+    return [frames for frames in (recorder.frames(test) for recorder in recorders) if frames]
+
+
+def _frame_durations(frames):
+    durations = []
+    for (start, _), (end, _) in zip(frames, frames[1:]):
+        durations.append(int(min(max(end - start, 0.0) * 1000, MAX_FRAME_MS)) or 1)
+    return durations + [MAX_FRAME_MS // 2]
+
+
+def save_recording(frames, name, recording_format=None):
+    """
+    Encode frames into an animated image (frames as JPEGs without Pillow)
+
+    Args:
+        frames: (timestamp, JPEG bytes) list from recordings_for()
+        name: File name without extension
+        recording_format: Key of FORMATS (default: SELENIUM_SCREENCAST_FORMAT)
+
+    Returns:
+        tuple: (path to attach, its mime type)
+    """
+    recording_format = recording_format or get_recording_format()
+    directory = get_output_dir()
+    name = re.sub(r"[^\w.-]+", "_", name).strip("_")
+    os.makedirs(directory, exist_ok=True)
+    start = time.perf_counter()
+    Image = load_pillow()
+    if Image is None:
+        frame_dir = os.path.join(directory, name)
+        os.makedirs(frame_dir, exist_ok=True)
+        for index, (_, jpeg) in enumerate(frames):
+            path = os.path.join(frame_dir, f"frame-{index:04d}.jpg")
+            with open(path, 'wb') as f:
+                f.write(jpeg)
+        size = sum(len(jpeg) for _, jpeg in frames)
+        stats.record_recording(size, (time.perf_counter() - start) * 1000)
+        return path, "image/jpeg"
+
+    images = [Image.open(io.BytesIO(jpeg)) for _, jpeg in frames]
+    path = os.path.join(directory, f"{name}.{recording_format}")
+    images[0].save(path, format=recording_format.upper(), save_all=True, append_images=images[1:],
+                   duration=_frame_durations(frames), loop=0)
+    stats.record_recording(os.path.getsize(path), (time.perf_counter() - start) * 1000)
+    return path, f"image/{recording_format}"
@@ -0,0 +1,441 @@
+"""
+Screenshot Service - Capture Now, Encode and Write in the Background
+Keeps PNG decoding, re-encoding and disk writes off the test thread
+
+WHY:
+    driver.save_screenshot() makes the test wait for the capture, the
+    base64 decode and the file write - several times per test, since
+    page objects and script tests document every step. Only the capture
+    itself has to happen while the page is in that state.
+
+HOW:
+    save_screenshot(driver, path) asks Chrome for the capture (base64
+    PNG) and returns right away; a small thread pool decodes, optionally
+    downscales and re-encodes (JPEG / WebP) and writes the file.
+    flush() is the barrier: conftest calls it when a test finishes, so
+    every file exists before the report is built.
+
+    JPEG, WebP and downscaling need Pillow (pip install Pillow). Without
+    it screenshots are written as PNG, full size, with a warning.
+
+POLICY (SELENIUM_SCREENSHOTS or pytest --screenshots):
+    always      Write every screenshot (default)
+    on-step     Write screenshots taken inside a page-object step
+                (utils/steps.py, e.g. SecurePage.click_logout); treat
+                the others like on-failure
+    on-failure  Keep the last N captures of a test in memory and write
+                them only when the test fails
+
+    Captures that end up not written are counted; the summary shows the
+    bytes (as PNG) and the background time always-on would have spent.
+
+Environment:
+    SELENIUM_SCREENSHOTS          always (default) | on-step | on-failure
+    SELENIUM_SCREENSHOT_BUFFER    Captures kept per test when buffering (default 5)
+    SELENIUM_SCREENSHOT_FORMAT    png (default) | jpeg | webp
+    SELENIUM_SCREENSHOT_QUALITY   JPEG/WebP quality 1-100 (default 80)
+    SELENIUM_SCREENSHOT_SCALE     Downscale factor, e.g. 0.5 (default 1 = full size)
+    SELENIUM_SCREENSHOT_WORKERS   Background threads (default 2, 0 = write inline)
+"""
+
+import base64
+import collections
+import io
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils import network, steps
+
+
+FORMATS = {"png": ".png", "jpeg": ".jpg", "webp": ".webp"}
+
+POLICIES = ("always", "on-step", "on-failure")
+
+DEFAULT_QUALITY = 80
+DEFAULT_WORKERS = 2
+DEFAULT_BUFFER = 5
+
+
+def get_screenshot_policy():
+    """
+    Which screenshots are written, from SELENIUM_SCREENSHOTS
+
+    Raises:
+        ValueError: Unknown policy
+    """
+    policy = os.environ.get('SELENIUM_SCREENSHOTS', 'always')
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown screenshot policy '{policy}'. Choose from: {', '.join(POLICIES)}")
+    return policy
+
+
+def get_buffer_size():
+    """
+    Captures kept per test by the on-failure ring buffer (SELENIUM_SCREENSHOT_BUFFER)
+
+    Raises:
+        ValueError: Less than 1
+    """
+    size = int(os.environ.get('SELENIUM_SCREENSHOT_BUFFER', DEFAULT_BUFFER))
+    if size < 1:
+        raise ValueError(f"Screenshot buffer must hold at least 1 capture, got {size}")
+    return size
+
+
+def get_screenshot_format():
+    """
+    Image format from SELENIUM_SCREENSHOT_FORMAT
+
+    Raises:
+        ValueError: Unknown format
+    """
+    name = os.environ.get('SELENIUM_SCREENSHOT_FORMAT', 'png').lower()
+    if name == "jpg":
+        name = "jpeg"
+    if name not in FORMATS:
+        raise ValueError(f"Unknown screenshot format '{name}'. Choose from: {', '.join(FORMATS)}")
+    return name
+
+
+def get_screenshot_quality():
+    """
+    JPEG/WebP quality from SELENIUM_SCREENSHOT_QUALITY
+
+    Raises:
+        ValueError: Not a number from 1 to 100
+    """
+    quality = int(os.environ.get('SELENIUM_SCREENSHOT_QUALITY', DEFAULT_QUALITY))
+    if not 1 <= quality <= 100:
+        raise ValueError(f"Screenshot quality must be 1-100, got {quality}")
+    return quality
+
+
+def get_screenshot_scale():
+    """
+    Downscale factor from SELENIUM_SCREENSHOT_SCALE
+
+    Raises:
+        ValueError: Not a number in (0, 1]
+    """
+    scale = float(os.environ.get('SELENIUM_SCREENSHOT_SCALE', '1'))
+    if not 0 < scale <= 1:
+        raise ValueError(f"Screenshot scale must be in (0, 1], got {scale}")
+    return scale
+
+
+_pillow = None
+
+
+def load_pillow():
+    """PIL.Image, or None when Pillow is not installed"""
+    global _pillow
+    if _pillow is None:
+        try:
+            from PIL import Image
+            _pillow = Image
+        except ImportError:
+            _pillow = False
+    return _pillow or None
+
+
+def encode(png, image_format="png", quality=DEFAULT_QUALITY, scale=1.0):
+    """
+    Re-encode a PNG capture
+
+    Args:
+        png: PNG bytes from the browser
+        image_format: Key of FORMATS
+        quality: JPEG/WebP quality
+        scale: Downscale factor (1 = keep size)
+
+    Returns:
+        bytes: Encoded image (the PNG unchanged when nothing is to be done)
+    """
+    if image_format == "png" and scale == 1:
+        return png
+    Image = load_pillow()
+    if Image is None:
+        return png
+    image = Image.open(io.BytesIO(png))
+    if scale != 1:
+        size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        image = image.resize(size, getattr(Image, "Resampling", Image).LANCZOS)
+    if image_format == "jpeg":
+        image = image.convert("RGB")
+    output = io.BytesIO()
+    image.save(output, format=image_format.upper(), quality=quality)
+    return output.getvalue()
+
+
+class ScreenshotStats:
+    """Time the tests spent on screenshots and what was written"""
+
+    def __init__(self):
+        self.captures = 0
+        self.capture_ms = 0.0      # test thread: browser capture
+        self.encode_ms = 0.0       # background: decode, re-encode, write
+        self.writes = 0
+        self.png_bytes = 0         # size as captured, of the written ones
+        self.written_bytes = 0
+        self.errors = 0
+        self.discarded = 0         # captured but never written (policy)
+        self.discarded_bytes = 0   # their size as PNG
+        self.failure_writes = 0    # buffered captures written for failing tests
+        self._lock = threading.Lock()
+
+    def record_capture(self, ms):
+        with self._lock:
+            self.captures += 1
+            self.capture_ms += ms
+
+    def record_write(self, ms, png_bytes, written_bytes):
+        with self._lock:
+            self.writes += 1
+            self.encode_ms += ms
+            self.png_bytes += png_bytes
+            self.written_bytes += written_bytes
+
+    def record_error(self):
+        with self._lock:
+            self.errors += 1
+
+    def record_discard(self, png_bytes):
+        with self._lock:
+            self.discarded += 1
+            self.discarded_bytes += png_bytes
+
+    def record_failure_write(self):
+        with self._lock:
+            self.failure_writes += 1
+
+    @property
+    def saved_ms(self):
+        """Background time the discarded captures would have cost (estimated)"""
+        return self.discarded * self.encode_ms / self.writes if self.writes else None
+
+    def as_dict(self):
+        """Counters as a plain dict (safe to send between xdist workers)"""
+        return {
+            'captures': self.captures,
+            'capture_ms': self.capture_ms,
+            'encode_ms': self.encode_ms,
+            'writes': self.writes,
+            'png_bytes': self.png_bytes,
+            'written_bytes': self.written_bytes,
+            'errors': self.errors,
+            'discarded': self.discarded,
+            'discarded_bytes': self.discarded_bytes,
+            'failure_writes': self.failure_writes,
+        }
+
+    def merge(self, data):
+        """Add counters from another ScreenshotStats.as_dict() (xdist aggregation)"""
+        for name, value in data.items():
+            setattr(self, name, getattr(self, name) + value)
+
+    def summary_lines(self):
+        """Human-readable lines for the terminal summary"""
+        average = self.capture_ms / self.captures if self.captures else 0.0
+        lines = [
+            f"Screenshots: {self.captures}  |  test thread: {self.capture_ms / 1000:.1f}s "
+            f"(avg {average:.0f}ms)  |  background: {self.encode_ms / 1000:.1f}s",
+            f"Written: {self.written_bytes / 2**20:.1f} MiB (as PNG: {self.png_bytes / 2**20:.1f} MiB)",
+        ]
+        if self.discarded or self.failure_writes:
+            saved = f", ~{self.saved_ms / 1000:.1f}s of encoding/writing" if self.saved_ms is not None else ""
+            lines.append(
+                f"Policy {get_screenshot_policy()}: {self.discarded} not written "
+                f"(saved {self.discarded_bytes / 2**20:.1f} MiB as PNG{saved} vs. always), "
+                f"{self.failure_writes} written for failing tests"
+            )
+        if self.errors:
+            lines.append(f"Failed writes: {self.errors}")
+        return lines
+
+
+stats = ScreenshotStats()
+
+
+class ScreenshotService:
+    """
+    Captures on the calling thread, writes on a thread pool
+
+    Args:
+        image_format: Key of FORMATS (default: SELENIUM_SCREENSHOT_FORMAT)
+        quality: JPEG/WebP quality (default: SELENIUM_SCREENSHOT_QUALITY)
+        scale: Downscale factor (default: SELENIUM_SCREENSHOT_SCALE)
+        workers: Background threads, 0 = write on the calling thread
+    """
+
+    def __init__(self, image_format=None, quality=None, scale=None, workers=None,
+                 policy=None, buffer_size=None):
+        self.policy = policy or get_screenshot_policy()
+        self.image_format = image_format or get_screenshot_format()
+        self.quality = quality or get_screenshot_quality()
+        self.scale = scale or get_screenshot_scale()
+        if workers is None:
+            workers = int(os.environ.get('SELENIUM_SCREENSHOT_WORKERS', DEFAULT_WORKERS))
+        if (self.image_format != "png" or self.scale != 1) and load_pillow() is None:
+            print("⚠️  Pillow is not installed - screenshots are saved as full-size PNG")
+            self.image_format, self.scale = "png", 1.0
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="screenshot") if workers else None
+        self._pending = set()
+        self._errors = []
+        self._lock = threading.Lock()
+        # Ring buffer of (base64 PNG, path, test) for the running test
+        self._buffer = collections.deque(maxlen=buffer_size or get_buffer_size())
+        self._paths = {}           # test -> paths of its written screenshots
+
+    def path_for(self, path):
+        """`path` with the extension of the configured format"""
+        root, extension = os.path.splitext(path)
+        if extension.lower() in (".png", ".jpg", ".jpeg", ".webp"):
+            return root + FORMATS[self.image_format]
+        return path + FORMATS[self.image_format]
+
+    def save(self, driver, path):
+        """
+        Capture `driver`'s viewport now; the file is written in the background
+
+        Depending on the policy the capture is only buffered and written
+        if the test fails (see end_test()).
+
+        Returns:
+            str: Path the file will have (extension follows the format)
+        """
+        path = self.path_for(path)
+        start = time.perf_counter()
+        data = driver.get_screenshot_as_base64()
+        stats.record_capture((time.perf_counter() - start) * 1000)
+        test = network.current_test
+        if self.policy == "always" or (self.policy == "on-step" and steps.in_step()):
+            self._submit(data, path, test)
+            return path
+        if len(self._buffer) == self._buffer.maxlen:
+            stats.record_discard(_png_size(self._buffer[0][0]))
+        self._buffer.append((data, path, test))
+        return path
+
+    def end_test(self, failed):
+        """
+        Write (failed) or drop (passed) the captures buffered for this test
+
+        Returns:
+            int: Number of captures written
+        """
+        frames = list(self._buffer)
+        self._buffer.clear()
+        for data, path, test in frames:
+            if failed:
+                stats.record_failure_write()
+                self._submit(data, path, test)
+            else:
+                stats.record_discard(_png_size(data))
+        return len(frames) if failed else 0
+
+    def pop_paths(self, test):
+        """Paths of the screenshots written for `test` (forgotten afterwards)"""
+        with self._lock:
+            return self._paths.pop(test, [])
+
+    def _submit(self, data, path, test):
+        with self._lock:
+            self._paths.setdefault(test, []).append(path)
+        if self._executor is None:
+            self._write(data, path)
+            return
+        future = self._executor.submit(self._write, data, path)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+
+    def _write(self, data, path):
+        start = time.perf_counter()
+        try:
+            png = base64.b64decode(data)
+            image = encode(png, self.image_format, self.quality, self.scale)
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(image)
+        except Exception as e:
+            stats.record_error()
+            with self._lock:
+                self._errors.append(f"{path}: {e}")
+            return
+        stats.record_write((time.perf_counter() - start) * 1000, len(png), len(image))
+
+    def _done(self, future):
+        with self._lock:
+            self._pending.discard(future)
+
+    def flush(self, timeout=None):
+        """
+        Wait until every screenshot taken so far is on disk
+
+        Returns:
+            list: Error messages of writes that failed since the last flush
+        """
+        with self._lock:
+            pending = list(self._pending)
+        for future in pending:
+            future.result(timeout)
+        with self._lock:
+            errors, self._errors = self._errors, []
+        return errors
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+
+def _png_size(data):
+    """Decoded size of a base64 string"""
+    return len(data) * 3 // 4 - data.count('=', -2)
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_service():
+    """This process's ScreenshotService (created on first use)"""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = ScreenshotService()
+        return _service
+
+
+def save_screenshot(driver, path):
+    """
+    Drop-in for driver.save_screenshot(path) that does not wait for the write
+
+    Returns:
+        str: Path of the file (extension follows SELENIUM_SCREENSHOT_FORMAT)
+    """
+    return get_service().save(driver, path)
+
+
+def end_test(failed):
+    """Apply the policy to the finished test's buffered captures"""
+    if _service is None:
+        return 0
+    return _service.end_test(failed)
+
+
+def pop_paths(test):
+    """Paths of the screenshots written for `test` so far"""
+    if _service is None:
+        return []
+    return _service.pop_paths(test)
+
+
+def flush(timeout=None):
+    """Barrier: all screenshots taken so far are written (no-op before the first one)"""
+    if _service is None:
+        return []
+    return _service.flush(timeout)
@@ -0,0 +1,60 @@
+"""
+Site Under Test - One Base URL for Page Objects and Tests
+Everything that used to hard-code https://the-internet.herokuapp.com
+
+USAGE:
+    from utils.site import site_url
+    driver.get(site_url("/checkboxes"))
+
+    class LoginPage(BasePage):
+        URL = SiteUrl("/login")      # resolved every time it is read
+
+Environment:
+    SELENIUM_BASE_URL   Where the-internet lives (default: the public
+                        herokuapp). pytest --local-site sets it to the
+                        bundled server in utils/local_site.
+"""
+
+import os
+
+
+DEFAULT_BASE_URL = "https://the-internet.herokuapp.com"
+
+
+def get_base_url():
+    """
+    Base URL of the site under test, without trailing slash
+
+    Returns:
+        str: SELENIUM_BASE_URL or the public herokuapp
+    """
+    return os.environ.get('SELENIUM_BASE_URL', DEFAULT_BASE_URL).rstrip('/')
+
+
+def site_url(path="/"):
+    """
+    Absolute URL of a page on the site under test
+
+    Args:
+        path: Path starting with "/", e.g. "/login"
+
+    Returns:
+        str: e.g. "http://127.0.0.1:50123/login"
+    """
+    return get_base_url() + path
+
+
+class SiteUrl:
+    """
+    Class attribute that turns into site_url(path) when read
+
+    Page objects are imported long before pytest (or a user) decides
+    which site to run against, so the URL must not be baked in at
+    import time.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def __get__(self, instance, owner):
+        return site_url(self.path)
@@ -0,0 +1,307 @@
+"""
+Step Timing for Page Objects
+Which page-object method should we optimize first?
+
+WHY:
+    A test's duration says nothing about where inside the page objects
+    the time goes. Page-object methods decorated with @step record a
+    nested timeline per test: name, arguments, duration and outcome.
+
+    class LoginPage(BasePage):
+        @step(redact=("password",))
+        def login(self, username, password):
+            ...                     # nested BasePage.type / click steps
+
+    with measure("Close banner"):   # ad-hoc step inside a method or test
+        ...
+
+    Arguments named like a secret (password, token, ...) or listed in
+    redact= are shown as '***', and so are the same values when they are
+    passed on to nested steps (type(PASSWORD_INPUT, text)).
+
+    Steps are recorded with SELENIUM_TRACE_STEPS=1 (or pytest
+    --trace-steps). Otherwise a step only marks that it is running
+    (in_step(), step listeners) - no argument binding, no repr(), nothing
+    kept in memory.
+
+OUTPUT:
+    - pytest-html: the test's step tree with durations, in its row
+    - SELENIUM_STEP_TRACE_FILE (default: reports/steps_trace.json):
+      Chrome trace-event JSON, one track per test; open it in
+      chrome://tracing or https://ui.perfetto.dev
+    - terminal summary: steps by total time, with self time (minus
+      nested steps)
+"""
+
+import contextlib
+import functools
+import html
+import inspect
+import json
+import os
+import re
+import threading
+import time
+
+from utils import network
+
+
+SECRET_NAMES = re.compile(r"pass(word|wd)?|secret|token|api_?key|credential", re.IGNORECASE)
+
+REDACTED = "***"
+
+# Longest argument repr shown
+MAX_ARG_LENGTH = 80
+
+
+def steps_enabled():
+    return os.environ.get('SELENIUM_TRACE_STEPS') == '1'
+
+
+def get_trace_file():
+    return os.environ.get('SELENIUM_STEP_TRACE_FILE', os.path.join('reports', 'steps_trace.json'))
+
+
+class StepStats:
+    """Step trees per test and time per step name"""
+
+    def __init__(self):
+        self.by_test = {}          # nodeid -> [root step dicts]
+        self.by_name = {}          # step name -> [count, total ms, self ms]
+        self._lock = threading.Lock()
+
+    def record(self, test, root):
+        with self._lock:
+            self.by_test.setdefault(test or "(no test)", []).append(root)
+            self._count(root)
+
+    def _count(self, step):
+        children_ms = sum(child['ms'] for child in step['children'])
+        entry = self.by_name.setdefault(step['name'], [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += step['ms']
+        entry[2] += step['ms'] - children_ms
+        for child in step['children']:
+            self._count(child)
+
+    def as_dict(self):
+        """Counters as a plain dict (safe to send between xdist workers)"""
+        return {
+            'by_test': {test: list(roots) for test, roots in self.by_test.items()},
+            'by_name': {name: list(entry) for name, entry in self.by_name.items()},
+        }
+
+    def merge(self, data):
+        """Add counters from another StepStats.as_dict() (xdist aggregation)"""
+        for test, roots in data['by_test'].items():
+            self.by_test.setdefault(test, []).extend(roots)
+        for name, values in data['by_name'].items():
+            entry = self.by_name.setdefault(name, [0, 0.0, 0.0])
+            for i, value in enumerate(values):
+                entry[i] += value
+
+    def html_timeline(self, test):
+        """Nested step list of one test for the pytest-html report ('' if none)"""
+        roots = self.by_test.get(test)
+        if not roots:
+            return ""
+        longest = max(root['ms'] for root in roots) or 1.0
+        return ("<div class='steps'><b>Steps</b>"
+                + _html_steps(roots, longest) + "</div>")
+
+    def chrome_trace(self):
+        """
+        All steps as Chrome trace events
+
+        One process per xdist worker, one thread (track) per test.
+        """
+        events = []
+        pids = {}
+        for tid, (test, roots) in enumerate(sorted(self.by_test.items()), start=1):
+            worker = roots[0].get('worker', 'main')
+            if worker not in pids:
+                pids[worker] = len(pids) + 1
+                events.append({'name': 'process_name', 'ph': 'M', 'pid': pids[worker],
+                               'args': {'name': worker}})
+            pid = pids[worker]
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': test}})
+            stack = list(roots)
+            while stack:
+                step = stack.pop()
+                args = dict(step['args'])
+                args['outcome'] = step['outcome']
+                events.append({
+                    'name': step['name'], 'cat': 'step', 'ph': 'X',
+                    'ts': round(step['start'] * 1e6), 'dur': round(step['ms'] * 1000),
+                    'pid': pid, 'tid': tid, 'args': args,
+                })
+                stack.extend(step['children'])
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def summary_lines(self):
+        """Human-readable lines for the terminal summary"""
+        lines = [f"{'step':<44}{'count':>7}{'total':>10}{'avg':>10}{'self':>10}"]
+        ranked = sorted(self.by_name.items(), key=lambda item: -item[1][1])
+        for name, (count, total_ms, self_ms) in ranked[:15]:
+            lines.append(f"{name:<44}{count:>7}{total_ms / 1000:>9.1f}s"
+                         f"{total_ms / count:>8.0f}ms{self_ms / 1000:>9.1f}s")
+        lines.append(f"self = time not spent in nested steps  |  timeline: {get_trace_file()}")
+        return lines
+
+
+def _html_steps(steps, longest):
+    items = []
+    for step in steps:
+        args = ", ".join(f"{name}={value}" for name, value in step['args'].items())
+        width = max(1, round(100 * step['ms'] / longest))
+        failed = step['outcome'] != 'passed'
+        items.append(
+            f"<li><span style='display:inline-block;width:{width}px;height:8px;"
+            f"background:{'#c33' if failed else '#39c'}'></span> {step['ms']:.0f} ms "
+            f"<b>{html.escape(step['name'])}</b>({html.escape(args)})"
+            + (f" <i>{html.escape(step['outcome'])}</i>" if failed else "")
+            + (_html_steps(step['children'], longest) if step['children'] else "")
+            + "</li>"
+        )
+    return "<ul>" + "".join(items) + "</ul>"
+
+
+stats = StepStats()
+
+_local = threading.local()
+
+# Called with each finished top-level step (see add_listener)
+_listeners = []
+
+
+def _stack():
+    if not hasattr(_local, 'stack'):
+        _local.stack = []
+    return _local.stack
+
+
+def add_listener(callback):
+    """Call callback(step) whenever a top-level step has finished"""
+    if callback not in _listeners:
+        _listeners.append(callback)
+
+
+def remove_listener(callback):
+    if callback in _listeners:
+        _listeners.remove(callback)
+
+
+def in_step():
+    """True while a step is running on this thread"""
+    return bool(_stack())
+
+
+def _format_args(arguments, redact, secrets):
+    shown = {}
+    for name, value in arguments.items():
+        if name in redact or SECRET_NAMES.search(name) or (isinstance(value, str) and value in secrets):
+            shown[name] = REDACTED
+            continue
+        text = repr(value)
+        shown[name] = text if len(text) <= MAX_ARG_LENGTH else text[:MAX_ARG_LENGTH - 3] + "..."
+    return shown
+
+
+def measure(name, redact=(), **arguments):
+    """
+    Record the code in the with-block as a step
+
+    Args:
+        name: Step name shown in the timeline
+        redact: Argument names to hide
+        **arguments: Values shown with the step
+    """
+    return _record_step(name, arguments, redact)
+
+
+@contextlib.contextmanager
+def _record_step(name, arguments, redact):
+    record = steps_enabled()
+    stack = _stack()
+    parent = stack[-1] if stack else None
+    secrets = set(parent['secrets']) if parent else set()
+    if record:
+        secrets.update(value for key, value in arguments.items()
+                       if isinstance(value, str) and value and (key in redact or SECRET_NAMES.search(key)))
+    current = {
+        'name': name,
+        'args': _format_args(arguments, redact, secrets) if record else {},
+        'start': time.time(),
+        'ms': 0.0,
+        'outcome': 'passed',
+        'children': [],
+        'secrets': secrets,
+    }
+    stack.append(current)
+    started = time.perf_counter()
+    try:
+        yield current
+    except BaseException as e:
+        current['outcome'] = f"failed: {type(e).__name__}"
+        raise
+    finally:
+        current['ms'] = (time.perf_counter() - started) * 1000
+        stack.pop()
+        del current['secrets']
+        if parent is not None:
+            if record:
+                parent['children'].append(current)
+        else:
+            if record:
+                current['worker'] = os.environ.get('PYTEST_XDIST_WORKER', 'main')
+                stats.record(network.current_test, current)
+            for listener in list(_listeners):
+                listener(current)
+
+
+def step(name=None, redact=()):
+    """
+    Decorator: record every call of a page-object method as a step
+
+    Args:
+        name: Step name (default: "<PageClass>.<method>" of the instance)
+        redact: Argument names to hide in the report
+    """
+    def decorate(func):
+        signature = inspect.signature(func)
+        is_method = next(iter(signature.parameters), None) == 'self'
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not steps_enabled():
+                owner = args[0] if is_method and args else None
+                label = name or (f"{type(owner).__name__}.{func.__name__}" if owner is not None else func.__qualname__)
+                with _record_step(label, None, redact):
+                    return func(*args, **kwargs)
+            try:
+                bound = signature.bind(*args, **kwargs)
+            except TypeError:
+                return func(*args, **kwargs)     # let Python raise the usual error
+            arguments = dict(bound.arguments)
+            owner = arguments.pop('self', None)
+            label = name or (f"{type(owner).__name__}.{func.__name__}" if owner is not None else func.__qualname__)
+            with _record_step(label, arguments, redact):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def write_chrome_trace(step_stats, path=None):
+    """
+    Write the steps as Chrome trace-event JSON
+
+    Returns:
+        str: Path written
+    """
+    path = path or get_trace_file()
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(step_stats.chrome_trace(), f)
+    return path
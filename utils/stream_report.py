@@ -0,0 +1,247 @@
+"""
+Streaming HTML Report - Rows Are Written as Tests Finish
+A report whose size and build time do not grow with the screenshots in it
+
+WHY:
+    pytest-html with --self-contained-html keeps every row in memory,
+    base64-inlines every image and writes the whole file at session end:
+    tens of megabytes that take long to build and long to open.
+
+HOW:
+    With SELENIUM_REPORT_MODE=stream (or pytest --report-mode stream)
+    pytest-html is switched off and this report is written instead:
+        - the page header is written when the run starts, then one row per
+          test as soon as its teardown finished, on a background thread
+          (the file can be opened while the run is going)
+        - screenshots stay where they were written and are linked; the
+          row shows a small JPEG thumbnail (needs Pillow, otherwise the
+          full image scaled down) with loading="lazy", so the browser
+          only fetches what is scrolled into view
+        - other attachments (pytest-html extras such as screencasts) are
+          written as files next to the report instead of being inlined
+
+    Only the tests' own artifacts are ever held in memory, so building the
+    report costs the same per test whether the run has 10 tests or 10000.
+
+Environment:
+    SELENIUM_REPORT_MODE    html (default: pytest-html) | stream
+    SELENIUM_STREAM_REPORT  Report file (default: reports/stream/index.html);
+                            thumbs/ and artifacts/ are created next to it
+"""
+
+import base64
+import html
+import io
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.screenshots import load_pillow
+
+
+REPORT_MODES = ("html", "stream")
+
+THUMBNAIL_SIZE = (320, 200)
+
+_HEADER = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title>
+<style>
+body {{ font-family: sans-serif; font-size: 14px; margin: 1em 2em; }}
+.test {{ border-left: 6px solid #39c; margin: .4em 0; padding: .3em .6em; background: #f6f6f6; }}
+.test.failed, .test.error {{ border-color: #c33; }}
+.test.skipped, .test.xfailed {{ border-color: #aaa; }}
+.test h3 {{ font-size: 14px; margin: 0; font-weight: normal; }}
+.test .outcome {{ display: inline-block; width: 5em; font-weight: bold; }}
+.test img {{ max-width: 320px; max-height: 200px; margin: .3em .3em 0 0; border: 1px solid #ccc; }}
+.test pre {{ white-space: pre-wrap; background: #fff; padding: .5em; }}
+body.only-failed .test:not(.failed):not(.error) {{ display: none; }}
+</style></head>
+<body><h1>{title}</h1>
+<p>Started {started}. Rows appear as tests finish.
+<label><input type="checkbox" onchange="document.body.classList.toggle('only-failed', this.checked)">
+only failures</label></p>
+"""
+
+_FOOTER = "</body></html>\n"
+
+
+def get_report_mode():
+    """
+    Report mode from SELENIUM_REPORT_MODE
+
+    Raises:
+        ValueError: Unknown mode
+    """
+    mode = os.environ.get('SELENIUM_REPORT_MODE', 'html')
+    if mode not in REPORT_MODES:
+        raise ValueError(f"Unknown report mode '{mode}'. Choose from: {', '.join(REPORT_MODES)}")
+    return mode
+
+
+def get_report_file():
+    return os.environ.get('SELENIUM_STREAM_REPORT', os.path.join('reports', 'stream', 'index.html'))
+
+
+def outcome_of(reports):
+    """Outcome of a test from its setup/call/teardown reports"""
+    for report in reports:
+        if report.failed:
+            return "failed" if report.when == "call" else "error"
+    for report in reports:
+        if report.skipped:
+            return "xfailed" if hasattr(report, "wasxfail") else "skipped"
+    call = next((report for report in reports if report.when == "call"), None)
+    if call is not None and hasattr(call, "wasxfail"):
+        return "xpassed"
+    return "passed"
+
+
+class StreamReport:
+    """
+    HTML report written one test at a time
+
+    Args:
+        path: Report file
+        title: Page title
+    """
+
+    def __init__(self, path, title="Test Report"):
+        self.path = path
+        self.directory = os.path.dirname(os.path.abspath(path))
+        self.title = title
+        self.counts = {}
+        self.artifacts = 0
+        self.busy_ms = 0.0         # time the writer thread spent (row HTML, thumbnails, I/O)
+        self._reports = {}         # nodeid -> reports of the running test
+        self._rows = 0
+        self._file = None
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="stream-report")
+        self._lock = threading.Lock()
+
+    def start(self):
+        os.makedirs(os.path.join(self.directory, "thumbs"), exist_ok=True)
+        os.makedirs(os.path.join(self.directory, "artifacts"), exist_ok=True)
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._file.write(_HEADER.format(title=html.escape(self.title),
+                                        started=time.strftime("%Y-%m-%d %H:%M:%S")))
+        self._file.flush()
+        return self
+
+    def add_report(self, report):
+        """Collect a phase report; the row is written once the test's teardown is in"""
+        reports = self._reports.setdefault(report.nodeid, [])
+        reports.append(report)
+        if report.when == "teardown":
+            del self._reports[report.nodeid]
+            self._executor.submit(self._write_row, reports)
+
+    def finish(self, summary_html=""):
+        """Write the summary and close the file (waits for pending rows)"""
+        self._executor.submit(self._write_footer, summary_html)
+        self._executor.shutdown(wait=True)
+        self._file.close()
+
+    def _write_row(self, reports):
+        start = time.perf_counter()
+        try:
+            row = self._row(reports)
+        except Exception as e:
+            row = f"<div class='test error'><pre>{html.escape(reports[0].nodeid)}: {html.escape(repr(e))}</pre></div>"
+        self._file.write(row)
+        self._file.flush()
+        self.busy_ms += (time.perf_counter() - start) * 1000
+
+    def _write_footer(self, summary_html):
+        counts = ", ".join(f"{count} {outcome}" for outcome, count in sorted(self.counts.items()))
+        self._file.write(f"<h2>Summary</h2><p>{sum(self.counts.values())} tests: {counts}. "
+                         f"Finished {time.strftime('%Y-%m-%d %H:%M:%S')}.</p>{summary_html}{_FOOTER}")
+        self._file.flush()
+
+    def _row(self, reports):
+        self._rows += 1
+        outcome = outcome_of(reports)
+        self.counts[outcome] = self.counts.get(outcome, 0) + 1
+        nodeid = reports[0].nodeid
+        duration = sum(report.duration for report in reports)
+        parts = [f"<div class='test {outcome}'><h3><span class='outcome'>{outcome}</span> "
+                 f"{html.escape(nodeid)} <small>({duration:.2f}s)</small></h3>"]
+        properties = [prop for report in reports[-1:] for prop in report.user_properties]
+        if properties:
+            parts.append("<p>" + " | ".join(f"{html.escape(str(name))}: {html.escape(str(value))}"
+                                            for name, value in properties) + "</p>")
+        for report in reports:
+            if report.failed and report.longreprtext:
+                parts.append(f"<details open><summary>{report.when}</summary>"
+                             f"<pre>{html.escape(report.longreprtext)}</pre></details>")
+        for index, extra in enumerate(extra for report in reports for extra in getattr(report, "extras", [])):
+            parts.append(self._extra(extra, f"{self._rows}-{index}"))
+        screenshots = [path for report in reports for path in getattr(report, "screenshots", [])]
+        if screenshots:
+            parts.append("<div>" + "".join(self._image(path, f"{self._rows}-s{index}")
+                                           for index, path in enumerate(screenshots)) + "</div>")
+        parts.append("</div>\n")
+        return "".join(parts)
+
+    def _extra(self, extra, key):
+        format_type, content = extra.get("format_type"), extra.get("content", "")
+        name = html.escape(extra.get("name") or format_type or "")
+        if format_type == "html":
+            return content
+        if format_type == "url":
+            return f"<p><a href='{html.escape(content)}'>{name}</a></p>"
+        if format_type in ("text", "json"):
+            return f"<details><summary>{name}</summary><pre>{html.escape(str(content))}</pre></details>"
+        if format_type in ("image", "video"):
+            path = os.path.join(self.directory, "artifacts", f"{key}.{extra.get('extension', 'bin')}")
+            with open(path, 'wb') as f:
+                f.write(base64.b64decode(content))
+            self.artifacts += 1
+            if format_type == "video":
+                return (f"<p><video controls preload='none' width='320' "
+                        f"src='{html.escape(self._link(path))}'></video></p>")
+            return f"<div><b>{name}</b><br>{self._image(path, key)}</div>"
+        return ""
+
+    def _image(self, path, key):
+        """Thumbnail linking to the full image"""
+        if not os.path.exists(path):
+            return f"<span>missing: {html.escape(path)}</span>"
+        thumbnail = self._thumbnail(path, key) or path
+        return (f"<a href='{html.escape(self._link(path))}'><img loading='lazy' "
+                f"src='{html.escape(self._link(thumbnail))}' alt='{html.escape(os.path.basename(path))}'></a>")
+
+    def _thumbnail(self, path, key):
+        """Small JPEG of an image, or None without Pillow or for unreadable files"""
+        Image = load_pillow()
+        if Image is None:
+            return None
+        thumbnail = os.path.join(self.directory, "thumbs", f"{key}.jpg")
+        try:
+            with Image.open(path) as image:
+                image.thumbnail(THUMBNAIL_SIZE)
+                output = io.BytesIO()
+                image.convert("RGB").save(output, format="JPEG", quality=70)
+        except Exception:
+            return None
+        with open(thumbnail, 'wb') as f:
+            f.write(output.getvalue())
+        return thumbnail
+
+    def _link(self, path):
+        return os.path.relpath(os.path.abspath(path), self.directory).replace(os.sep, "/")
+
+    def summary_line(self):
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        return (f"{self.path} ({sum(self.counts.values())} tests, {size / 1024:.0f} KiB HTML, "
+                f"{self.artifacts} attachments as files, written in {self.busy_ms / 1000:.1f}s in the background)")
+
+
+reporter = None
+
+
+def open_report(path=None, title="Test Report"):
+    """Start this run's StreamReport (controller / plain run only)"""
+    global reporter
+    reporter = StreamReport(path or get_report_file(), title).start()
+    return reporter